@@ -1,40 +1,96 @@
 import argparse
+import importlib
 import logging
 import os
 import platform
 import sys
+from typing import List, Optional, Text
 
-from rasa_sdk import __version__ as rasa_sdk_version
-from rasa.constants import MINIMUM_COMPATIBLE_VERSION
-
-import rasa.telemetry
-import rasa.utils.io
-import rasa.utils.tensorflow.environment as tf_env
-from rasa import version
-from rasa.cli import (
-    data,
-    export,
-    interactive,
-    run,
-    scaffold,
-    shell,
-    telemetry,
-    test,
-    train,
-    visualize,
-    x,
+from rasa.utils.import_profiling import ImportProfiler
+
+# The import profiler has to be started before any other `rasa` module is imported.
+_import_profiler = ImportProfiler()
+if "--profile-imports" in sys.argv[1:]:
+    _import_profiler.start()
+
+from rasa.constants import MINIMUM_COMPATIBLE_VERSION  # noqa: E402
+
+from rasa import version  # noqa: E402
+from rasa.cli.arguments.default_arguments import add_logging_options  # noqa: E402
+from rasa.cli.utils import parse_last_positional_argument_as_model_path  # noqa: E402
+from rasa.shared.exceptions import RasaException  # noqa: E402
+from rasa.shared.utils.cli import print_error  # noqa: E402
+from rasa.utils.common import (  # noqa: E402
+    set_log_and_warnings_filters,
+    set_log_level,
 )
-from rasa.cli.arguments.default_arguments import add_logging_options
-from rasa.cli.utils import parse_last_positional_argument_as_model_path
-from rasa.shared.exceptions import RasaException
-from rasa.shared.utils.cli import print_error
-from rasa.utils.common import set_log_and_warnings_filters, set_log_level
 
 logger = logging.getLogger(__name__)
 
+# Maps the top level CLI commands to the modules which implement them. A module is
+# only imported if its command is run (or the help of all commands is printed) so
+# that commands don't pay for the (potentially slow) imports of other commands.
+CLI_COMMAND_MODULES = {
+    "init": "rasa.cli.scaffold",
+    "run": "rasa.cli.run",
+    "shell": "rasa.cli.shell",
+    "train": "rasa.cli.train",
+    "interactive": "rasa.cli.interactive",
+    "telemetry": "rasa.cli.telemetry",
+    "test": "rasa.cli.test",
+    "visualize": "rasa.cli.visualize",
+    "data": "rasa.cli.data",
+    "export": "rasa.cli.export",
+    "x": "rasa.cli.x",
+}
+
+
+def _commands_to_register(arguments: List[Text]) -> Optional[List[Text]]:
+    """Determines which CLI commands need to be added to the argument parser.
+
+    Args:
+        arguments: The command line arguments (without the program name).
+
+    Returns:
+        The names of the commands to register or `None` if all commands are needed
+        (e.g. to print the help or an error for an unknown command).
+    """
+    # the top level parser only has flags, so the first positional argument is the
+    # command
+    command = next((arg for arg in arguments if not arg.startswith("-")), None)
+    if command in CLI_COMMAND_MODULES:
+        return [command]
+
+    if command is None and "--version" in arguments:
+        is_help_requested = "-h" in arguments or "--help" in arguments
+        return None if is_help_requested else []
+
+    return None
+
+
+def _add_profile_imports_option(
+    parser: argparse.ArgumentParser, default: Optional[bool] = False
+) -> None:
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        default=default,
+        help="Print how long it took to import the slowest modules.",
+    )
+
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Parse all the command line arguments for the training script."""
+def create_argument_parser(
+    commands: Optional[List[Text]] = None,
+) -> argparse.ArgumentParser:
+    """Parse all the command line arguments for the training script.
+
+    Args:
+        commands: The CLI commands to add to the parser. Adds all commands if
+            `None`. Only the modules of the added commands are imported.
+
+    Returns:
+        The argument parser.
+    """
 
     parser = argparse.ArgumentParser(
         prog="rasa",
@@ -51,30 +107,27 @@ def create_argument_parser() -> argparse.ArgumentParser:
         default=argparse.SUPPRESS,
         help="Print installed Rasa version",
     )
+    _add_profile_imports_option(parser)
 
     parent_parser = argparse.ArgumentParser(add_help=False)
     add_logging_options(parent_parser)
+    # don't overwrite the value of the top level parser if the option isn't given
+    _add_profile_imports_option(parent_parser, default=argparse.SUPPRESS)
     parent_parsers = [parent_parser]
 
     subparsers = parser.add_subparsers(help="Rasa commands")
 
-    scaffold.add_subparser(subparsers, parents=parent_parsers)
-    run.add_subparser(subparsers, parents=parent_parsers)
-    shell.add_subparser(subparsers, parents=parent_parsers)
-    train.add_subparser(subparsers, parents=parent_parsers)
-    interactive.add_subparser(subparsers, parents=parent_parsers)
-    telemetry.add_subparser(subparsers, parents=parent_parsers)
-    test.add_subparser(subparsers, parents=parent_parsers)
-    visualize.add_subparser(subparsers, parents=parent_parsers)
-    data.add_subparser(subparsers, parents=parent_parsers)
-    export.add_subparser(subparsers, parents=parent_parsers)
-    x.add_subparser(subparsers, parents=parent_parsers)
+    for command, module_name in CLI_COMMAND_MODULES.items():
+        if commands is None or command in commands:
+            command_module = importlib.import_module(module_name)
+            command_module.add_subparser(subparsers, parents=parent_parsers)
 
     return parser
 
 
 def print_version() -> None:
     """Prints version information of rasa tooling and python."""
+    from rasa_sdk import __version__ as rasa_sdk_version
 
     try:
         from rasax.community.version import __version__
@@ -94,8 +147,17 @@ def print_version() -> None:
 
 def main() -> None:
     """Run as standalone python application."""
+    try:
+        _run_cli()
+    finally:
+        if _import_profiler in sys.meta_path:
+            _import_profiler.stop()
+            _import_profiler.print_report()
+
+
+def _run_cli() -> None:
     parse_last_positional_argument_as_model_path()
-    arg_parser = create_argument_parser()
+    arg_parser = create_argument_parser(_commands_to_register(sys.argv[1:]))
     cmdline_arguments = arg_parser.parse_args()
 
     log_level = (
@@ -103,6 +165,8 @@ def main() -> None:
     )
     set_log_level(log_level)
 
+    import rasa.utils.tensorflow.environment as tf_env
+
     tf_env.setup_tf_environment()
 
     # insert current path in syspath so custom modules are found
@@ -110,6 +174,9 @@ def main() -> None:
 
     try:
         if hasattr(cmdline_arguments, "func"):
+            import rasa.telemetry
+            import rasa.utils.io
+
             rasa.utils.io.configure_colored_logging(log_level)
             set_log_and_warnings_filters()
             rasa.telemetry.initialize_telemetry()
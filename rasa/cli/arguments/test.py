@@ -29,16 +29,19 @@ def set_test_arguments(parser: argparse.ArgumentParser) -> None:
         default=DEFAULT_RESULTS_PATH,
         help_text="Output path for any files created during the evaluation.",
     )
+    add_num_processes_params(parser)
 
 
 def set_test_core_arguments(parser: argparse.ArgumentParser) -> None:
     add_test_core_model_param(parser)
     add_test_core_argument_group(parser, include_e2e_argument=True)
+    add_num_processes_params(parser)
 
 
 def set_test_nlu_arguments(parser: argparse.ArgumentParser) -> None:
     add_model_param(parser, add_positional_arg=False)
     add_test_nlu_argument_group(parser)
+    add_num_processes_params(parser)
 
 
 def add_test_core_argument_group(
@@ -197,3 +200,29 @@ def add_errors_success_params(parser: argparse.ArgumentParser) -> None:
         default=False,
         help="If set prediction warnings will NOT be written to a file.",
     )
+
+
+def add_num_processes_params(parser: argparse.ArgumentParser) -> None:
+    """Specifies CLI arguments to run the evaluation in multiple processes.
+
+    Args:
+        parser: The parser to add the arguments to.
+    """
+    parser.add_argument(
+        "--num-processes",
+        required=False,
+        default=1,
+        type=int,
+        help="Number of processes which run the evaluation in parallel: the test "
+        "stories, the cross validation folds or the compared NLU models are "
+        "split between the processes.",
+    )
+    parser.add_argument(
+        "--num-threads-per-process",
+        required=False,
+        default=None,
+        type=int,
+        help="Maximum number of TensorFlow and BLAS threads per process when "
+        "running with '--num-processes' > 1. By default the CPU cores are split "
+        "evenly between the processes.",
+    )
@@ -218,6 +218,8 @@ async def run_nlu_test_async(
             output=output,
             runs=runs,
             exclusion_percentages=percentages,
+            num_processes=all_args.get("num_processes", 1),
+            num_threads_per_process=all_args.get("num_threads_per_process"),
         )
     elif cross_validation:
         logger.info("Test model using cross validation.")
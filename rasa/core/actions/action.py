@@ -1,7 +1,11 @@
+from collections import OrderedDict
 import copy
+import gzip
+import itertools
 import json
 import logging
-from typing import List, Text, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Text, Optional, Dict, Any, Tuple, TYPE_CHECKING
+import weakref
 
 import aiohttp
 
@@ -37,7 +41,7 @@ from rasa.shared.core.constants import (
     ACTION_BACK_NAME,
     REQUESTED_SLOT,
 )
-from rasa.shared.exceptions import RasaException
+from rasa.shared.exceptions import InvalidConfigException, RasaException
 from rasa.shared.nlu.constants import INTENT_NAME_KEY, INTENT_RANKING_KEY
 from rasa.shared.core.events import (
     UserUtteranceReverted,
@@ -51,6 +55,7 @@ from rasa.shared.core.events import (
     SessionStarted,
 )
 from rasa.shared.utils.schemas.events import EVENTS_SCHEMA
+import rasa.shared.utils.validation
 from rasa.utils.endpoints import EndpointConfig, ClientResponseError
 from rasa.shared.core.domain import Domain
 
@@ -63,6 +68,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Options of the action endpoint which control the payload sent to the action server
+SEND_DOMAIN_KEY = "send_domain"
+SEND_EVENTS_KEY = "send_events"
+COMPRESS_KEY = "compress"
+
+# send the complete domain with every request
+SEND_DOMAIN_FULL = "full"
+# send the domain only once per model and otherwise just its fingerprint
+SEND_DOMAIN_DIGEST = "digest"
+
+# send all events of the conversation
+SEND_EVENTS_ALL = "all"
+# send the events of the current conversation session
+SEND_EVENTS_SESSION = "session"
+# send only the events which were added since the last request for the conversation
+SEND_EVENTS_DELTA = "delta"
+
+# Status code an action server responds with if it doesn't know the domain or the
+# previous events of a request. The request is then retried with the full payload.
+ACTION_SERVER_CONTEXT_MISSING_STATUS = 412
+
+# Max. number of conversations for which the events sent to an action server are
+# remembered
+MAX_CONVERSATIONS_WITH_EVENT_DELTAS = 10_000
+
+# Expected response schema for an Action endpoint
+ACTION_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "events": EVENTS_SCHEMA,
+        "responses": {"type": "array", "items": {"type": "object"}},
+    },
+}
+
 
 def default_actions(action_endpoint: Optional[EndpointConfig] = None) -> List["Action"]:
     """List default actions."""
@@ -562,49 +601,259 @@ class ActionDeactivateLoop(Action):
         return [ActiveLoop(None), SlotSet(REQUESTED_SLOT, None)]
 
 
+class _ActionServerPayloadCache:
+    """Remembers which parts of the payload action servers already received."""
+
+    def __init__(self) -> None:
+        # maps action server URLs to the fingerprint of the domain they received
+        self._received_domains: Dict[Text, Text] = {}
+        # maps action server URLs and sender IDs to the number of events which were
+        # sent and the timestamp of the last sent event
+        self._received_events: "OrderedDict[Tuple[Text, Text], Tuple[int, float]]" = (
+            OrderedDict()
+        )
+        self._domain: Optional["weakref.ReferenceType[Domain]"] = None
+        self._domain_fingerprint: Optional[Text] = None
+
+    def domain_fingerprint(self, domain: Domain) -> Text:
+        """Returns the fingerprint of a domain without recalculating it every time."""
+        if self._domain is None or self._domain() is not domain:
+            self._domain = weakref.ref(domain)
+            self._domain_fingerprint = domain.fingerprint()
+        return self._domain_fingerprint
+
+    def has_received_domain(self, url: Text, fingerprint: Text) -> bool:
+        return self._received_domains.get(url) == fingerprint
+
+    def received_domain(self, url: Text, fingerprint: Text) -> None:
+        self._received_domains[url] = fingerprint
+
+    def number_of_received_events(
+        self, url: Text, tracker: "DialogueStateTracker"
+    ) -> int:
+        """Returns how many events of the conversation the action server received.
+
+        Args:
+            url: URL of the action server.
+            tracker: The tracker of the conversation.
+
+        Returns:
+            The number of events at the beginning of the tracker's events which the
+            action server received in previous requests.
+        """
+        if tracker.events.maxlen is not None:
+            # the events of the tracker are cut off so we can't rely on their index
+            return 0
+
+        number_of_events, latest_timestamp = self._received_events.get(
+            (url, tracker.sender_id), (0, None)
+        )
+        if not number_of_events or number_of_events > len(tracker.events):
+            return 0
+
+        if tracker.events[number_of_events - 1].timestamp != latest_timestamp:
+            # the tracker changed in the meantime (e.g. it was deleted)
+            return 0
+
+        self._received_events.move_to_end((url, tracker.sender_id))
+        return number_of_events
+
+    def received_events(self, url: Text, tracker: "DialogueStateTracker") -> None:
+        if not tracker.events:
+            return
+
+        self._received_events[(url, tracker.sender_id)] = (
+            len(tracker.events),
+            tracker.events[-1].timestamp,
+        )
+        self._received_events.move_to_end((url, tracker.sender_id))
+        while len(self._received_events) > MAX_CONVERSATIONS_WITH_EVENT_DELTAS:
+            self._received_events.popitem(last=False)
+
+    def forget(self, url: Text, sender_id: Text) -> None:
+        self._received_domains.pop(url, None)
+        self._received_events.pop((url, sender_id), None)
+
+
+_action_server_payload_cache = _ActionServerPayloadCache()
+
+
+def _events_of_current_session(events: List[Event]) -> List[Event]:
+    """Returns the events of the latest conversation session."""
+    for index in range(len(events) - 1, -1, -1):
+        if isinstance(events[index], SessionStarted):
+            # include the `action_session_start` which started the session
+            previous_event = events[index - 1] if index > 0 else None
+            if (
+                isinstance(previous_event, ActionExecuted)
+                and previous_event.action_name == ACTION_SESSION_START_NAME
+            ):
+                index -= 1
+            return events[index:]
+
+    return events
+
+
 class RemoteAction(Action):
     def __init__(self, name: Text, action_endpoint: Optional[EndpointConfig]) -> None:
 
         self._name = name
         self.action_endpoint = action_endpoint
 
+    def _payload_option(self, key: Text, default: Text, valid: List[Text]) -> Text:
+        option = (
+            self.action_endpoint.kwargs.get(key, default)
+            if self.action_endpoint
+            else default
+        )
+        if option not in valid:
+            raise InvalidConfigException(
+                f"Invalid value '{option}' for the option '{key}' of the action "
+                f"endpoint. Valid values are: {', '.join(valid)}."
+            )
+        return option
+
     def _action_call_format(
-        self, tracker: "DialogueStateTracker", domain: "Domain"
+        self,
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        send_full_payload: bool = False,
     ) -> Dict[Text, Any]:
-        """Create the request json send to the action server."""
+        """Create the request json send to the action server.
+
+        Args:
+            tracker: The tracker of the conversation.
+            domain: The domain of the model.
+            send_full_payload: If `True`, the domain and the events are sent even if
+                the action server already received them.
+
+        Returns:
+            The payload of the request to the action server.
+        """
         from rasa.shared.core.trackers import EventVerbosity
 
-        tracker_state = tracker.current_state(EventVerbosity.ALL)
+        send_domain = self._payload_option(
+            SEND_DOMAIN_KEY, SEND_DOMAIN_FULL, [SEND_DOMAIN_FULL, SEND_DOMAIN_DIGEST]
+        )
+        send_events = self._payload_option(
+            SEND_EVENTS_KEY,
+            SEND_EVENTS_ALL,
+            [SEND_EVENTS_ALL, SEND_EVENTS_SESSION, SEND_EVENTS_DELTA],
+        )
 
-        return {
+        if send_events == SEND_EVENTS_ALL:
+            tracker_state = tracker.current_state(EventVerbosity.ALL)
+        else:
+            tracker_state = tracker.current_state(EventVerbosity.NONE)
+
+        payload = {
             "next_action": self._name,
             "sender_id": tracker.sender_id,
             "tracker": tracker_state,
-            "domain": domain.as_dict(),
             "version": rasa.__version__,
         }
 
+        if send_events == SEND_EVENTS_SESSION:
+            tracker_state["events"] = [
+                event.as_dict()
+                for event in _events_of_current_session(list(tracker.events))
+            ]
+        elif send_events == SEND_EVENTS_DELTA:
+            number_of_received_events = (
+                0
+                if send_full_payload
+                else _action_server_payload_cache.number_of_received_events(
+                    self.action_endpoint.url, tracker
+                )
+            )
+            # the action server has to prepend the events it received previously
+            payload["events_offset"] = number_of_received_events
+            tracker_state["events"] = [
+                event.as_dict()
+                for event in itertools.islice(
+                    tracker.events, number_of_received_events, None
+                )
+            ]
+
+        if send_domain == SEND_DOMAIN_DIGEST:
+            fingerprint = _action_server_payload_cache.domain_fingerprint(domain)
+            payload["domain_digest"] = fingerprint
+            has_received_domain = _action_server_payload_cache.has_received_domain(
+                self.action_endpoint.url, fingerprint
+            )
+            if send_full_payload or not has_received_domain:
+                payload["domain"] = domain.as_dict()
+        else:
+            payload["domain"] = domain.as_dict()
+
+        return payload
+
+    async def _call_action_server(
+        self, tracker: "DialogueStateTracker", domain: "Domain"
+    ) -> Dict[Text, Any]:
+        """Sends the action call to the action server.
+
+        If the action server misses the domain or previous events of a slim
+        request, the request is repeated with the full payload.
+        """
+        json_body = self._action_call_format(tracker, domain)
+        try:
+            response = await self._send_request(json_body)
+        except ClientResponseError as e:
+            if e.status != ACTION_SERVER_CONTEXT_MISSING_STATUS:
+                raise
+
+            logger.debug(
+                f"Action server is missing context to run action '{self.name()}'. "
+                f"Retrying with the full domain and all events."
+            )
+            _action_server_payload_cache.forget(
+                self.action_endpoint.url, tracker.sender_id
+            )
+            json_body = self._action_call_format(
+                tracker, domain, send_full_payload=True
+            )
+            response = await self._send_request(json_body)
+
+        if "domain_digest" in json_body:
+            _action_server_payload_cache.received_domain(
+                self.action_endpoint.url, json_body["domain_digest"]
+            )
+        if "events_offset" in json_body:
+            _action_server_payload_cache.received_events(
+                self.action_endpoint.url, tracker
+            )
+
+        return response
+
+    async def _send_request(self, json_body: Dict[Text, Any]) -> Dict[Text, Any]:
+        if not self.action_endpoint.kwargs.get(COMPRESS_KEY, False):
+            return await self.action_endpoint.request(
+                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+
+        return await self.action_endpoint.request(
+            data=gzip.compress(json.dumps(json_body).encode("utf-8")),
+            headers={"Content-Encoding": "gzip"},
+            method="post",
+            timeout=DEFAULT_REQUEST_TIMEOUT,
+        )
+
     @staticmethod
     def action_response_format_spec() -> Dict[Text, Any]:
         """Expected response schema for an Action endpoint.
 
         Used for validation of the response returned from the
-        Action endpoint."""
-        schema = {
-            "type": "object",
-            "properties": {
-                "events": EVENTS_SCHEMA,
-                "responses": {"type": "array", "items": {"type": "object"}},
-            },
-        }
-        return schema
+        Action endpoint. The returned schema must not be modified."""
+        return ACTION_RESPONSE_SCHEMA
 
     def _validate_action_result(self, result: Dict[Text, Any]) -> bool:
-        from jsonschema import validate
         from jsonschema import ValidationError
 
         try:
-            validate(result, self.action_response_format_spec())
+            rasa.shared.utils.validation.validate_json(
+                result, self.action_response_format_spec()
+            )
             return True
         except ValidationError as e:
             e.message += (
@@ -656,7 +905,6 @@ class RemoteAction(Action):
         domain: "Domain",
     ) -> List[Event]:
         """Runs action. Please see parent class for the full docstring."""
-        json_body = self._action_call_format(tracker, domain)
         if not self.action_endpoint:
             raise RasaException(
                 f"Failed to execute custom action '{self.name()}' "
@@ -671,9 +919,7 @@ class RemoteAction(Action):
             logger.debug(
                 "Calling action endpoint to run action '{}'.".format(self.name())
             )
-            response = await self.action_endpoint.request(
-                json=json_body, method="post", timeout=DEFAULT_REQUEST_TIMEOUT
-            )
+            response = await self._call_action_server(tracker, domain)
 
             self._validate_action_result(response)
 
@@ -1,4 +1,6 @@
+import asyncio
 from asyncio import CancelledError
+import gc
 import logging
 import os
 import shutil
@@ -6,6 +8,7 @@ import tempfile
 from pathlib import Path
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     Dict,
     List,
@@ -18,12 +21,16 @@ import uuid
 
 import aiohttp
 from aiohttp import ClientError
+from async_generator import asynccontextmanager
 
 import rasa
 import rasa.utils
 from rasa.core import jobs, training
 from rasa.core.channels.channel import OutputChannel, UserMessage
-from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.core.constants import (
+    DEFAULT_MODEL_DRAINING_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 from rasa.shared.core.domain import Domain
 from rasa.core.exceptions import AgentNotReady
 import rasa.core.interpreter
@@ -44,6 +51,8 @@ from rasa.core.tracker_store import (
     InMemoryTrackerStore,
     TrackerStore,
 )
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.events import ActionExecuted, UserUttered
 from rasa.shared.core.trackers import DialogueStateTracker
 import rasa.core.utils
 from rasa.exceptions import ModelNotFound
@@ -64,10 +73,24 @@ from rasa.shared.core.generator import TrackerWithCachedStates
 
 logger = logging.getLogger(__name__)
 
+# user message which is used to warm up newly loaded models
+WARM_UP_MESSAGE = "hello"
+
+
+async def load_from_server(
+    agent: "Agent", model_server: EndpointConfig, pull_model_periodically: bool = True
+) -> "Agent":
+    """Load a persisted model from a server.
 
-async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Agent":
-    """Load a persisted model from a server."""
+    Args:
+        agent: The agent which should use the model.
+        model_server: Configuration of the model server.
+        pull_model_periodically: If `True`, the model server is queried for new
+            models in regular intervals.
 
+    Returns:
+        The agent.
+    """
     # We are going to pull the model once first, and then schedule a recurring
     # job. the benefit of this approach is that we can be sure that there
     # is a model after this function completes -> allows to do proper
@@ -76,14 +99,27 @@ async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Age
     # a model.
     await _update_model_from_server(model_server, agent)
 
+    if pull_model_periodically:
+        await start_periodic_model_pulling(model_server, agent)
+
+    return agent
+
+
+async def start_periodic_model_pulling(
+    model_server: EndpointConfig, agent: "Agent"
+) -> None:
+    """Queries the model server for new models in the configured interval.
+
+    Args:
+        model_server: Configuration of the model server.
+        agent: The agent which should be updated with new models.
+    """
     wait_time_between_pulls = model_server.kwargs.get("wait_time_between_pulls", 100)
 
     if wait_time_between_pulls:
         # continuously pull the model every `wait_time_between_pulls` seconds
         await schedule_model_pulling(model_server, int(wait_time_between_pulls), agent)
 
-    return agent
-
 
 def _load_interpreter(
     agent: "Agent", nlu_path: Optional[Text]
@@ -126,10 +162,70 @@ def _load_domain_and_policy_ensemble(
     return domain, policy_ensemble
 
 
-def _load_and_set_updated_model(
+def _load_and_warm_up_model(
+    agent: "Agent", model_directory: Text
+) -> Tuple[Optional[Domain], Optional[PolicyEnsemble], NaturalLanguageInterpreter]:
+    """Load the persisted model into memory and run a dummy prediction with it.
+
+    Args:
+        agent: Instance of `Agent` which is going to use the model.
+        model_directory: Rasa model directory.
+
+    Returns:
+        The domain, policy ensemble, and NLU interpreter of the model.
+    """
+    core_path, nlu_path = get_model_subdirectories(model_directory)
+
+    interpreter = _load_interpreter(agent, nlu_path)
+    domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
+
+    _warm_up_model(domain, policy_ensemble, interpreter)
+
+    return domain, policy_ensemble, interpreter
+
+
+def _warm_up_model(
+    domain: Optional[Domain],
+    policy_ensemble: Optional[PolicyEnsemble],
+    interpreter: NaturalLanguageInterpreter,
+) -> None:
+    """Run a dummy prediction so that the first request doesn't pay for it.
+
+    Many components only finish their setup (e.g. building TensorFlow graphs)
+    when they make their first prediction.
+
+    Args:
+        domain: Domain of the model.
+        policy_ensemble: Policy ensemble of the model.
+        interpreter: NLU interpreter of the model.
+    """
+    import rasa.utils.common
+
+    logger.debug("Warming up model with a dummy prediction.")
+
+    # this runs in an executor thread which doesn't have a running event loop
+    parse_data = rasa.utils.common.run_in_loop(interpreter.parse(WARM_UP_MESSAGE))
+
+    if domain is None or policy_ensemble is None:
+        return
+
+    tracker = DialogueStateTracker.from_events(
+        "warm_up",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered(
+                WARM_UP_MESSAGE, parse_data.get("intent"), parse_data=parse_data
+            ),
+        ],
+        slots=domain.slots,
+    )
+    policy_ensemble.probabilities_using_best_policy(tracker, domain, interpreter)
+
+
+async def _load_and_set_updated_model(
     agent: "Agent", model_directory: Text, fingerprint: Text
 ) -> None:
-    """Load the persisted model into memory and set the model on the agent.
+    """Load the persisted model in the background and switch the agent to it.
 
     Args:
         agent: Instance of `Agent` to update with the new model.
@@ -138,12 +234,14 @@ def _load_and_set_updated_model(
     """
     logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
 
-    core_path, nlu_path = get_model_subdirectories(model_directory)
-
-    interpreter = _load_interpreter(agent, nlu_path)
-    domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
+    # Loading a model takes a while. Load it in a separate thread so that the agent
+    # can keep handling requests with the old model in the meantime.
+    loop = asyncio.get_event_loop()
+    domain, policy_ensemble, interpreter = await loop.run_in_executor(
+        None, _load_and_warm_up_model, agent, model_directory
+    )
 
-    agent.update_model(
+    await agent.switch_model(
         domain, policy_ensemble, fingerprint, interpreter, model_directory
     )
 
@@ -167,7 +265,7 @@ async def _update_model_from_server(
         )
 
         if new_fingerprint:
-            _load_and_set_updated_model(agent, model_directory, new_fingerprint)
+            await _load_and_set_updated_model(agent, model_directory, new_fingerprint)
             remove_dir = False
         else:
             logger.debug(f"No new model found at URL {model_server.url}")
@@ -315,6 +413,7 @@ async def load_agent(
     tracker_store: Optional[TrackerStore] = None,
     lock_store: Optional[LockStore] = None,
     action_endpoint: Optional[EndpointConfig] = None,
+    pull_model_periodically: bool = True,
 ) -> Optional["Agent"]:
     """Loads agent from server, remote storage or disk.
 
@@ -328,6 +427,8 @@ async def load_agent(
         lock_store: LockStore to avoid that a conversation is modified by concurrent
             actors.
         action_endpoint: Action server configuration for executing custom actions.
+        pull_model_periodically: If `True` and a `model_server` is given, the model
+            server is queried for new models in regular intervals.
 
     Returns:
         The instantiated `Agent` or `None`.
@@ -345,6 +446,7 @@ async def load_agent(
                     remote_storage=remote_storage,
                 ),
                 model_server,
+                pull_model_periodically,
             )
 
         elif remote_storage is not None:
@@ -425,6 +527,13 @@ class Agent:
         self.remote_storage = remote_storage
         self.path_to_model_archive = path_to_model_archive
 
+        # number of requests which are currently using the model
+        self._requests_in_flight = 0
+        # set once all requests which use the current model finished
+        self._requests_drained: Optional[asyncio.Event] = None
+        # set once a pending model switch finished
+        self._model_switch_finished: Optional[asyncio.Event] = None
+
     def update_model(
         self,
         domain: Optional[Domain],
@@ -448,6 +557,101 @@ class Agent:
 
         self.model_directory = model_directory
 
+    def set_stores(
+        self, tracker_store: Optional[TrackerStore], lock_store: Optional[LockStore]
+    ) -> None:
+        """Replaces the tracker store and lock store of the agent.
+
+        This is e.g. required if the agent was loaded in a different process than
+        the one it's used in, since connections to the stores can't be shared
+        between processes.
+
+        Args:
+            tracker_store: The new tracker store.
+            lock_store: The new lock store.
+        """
+        self.tracker_store = self.create_tracker_store(tracker_store, self.domain)
+        self.lock_store = self._create_lock_store(lock_store)
+
+    async def switch_model(
+        self,
+        domain: Optional[Domain],
+        policy_ensemble: Optional[PolicyEnsemble],
+        fingerprint: Optional[Text],
+        interpreter: Optional[NaturalLanguageInterpreter] = None,
+        model_directory: Optional[Text] = None,
+        draining_timeout: float = DEFAULT_MODEL_DRAINING_TIMEOUT,
+    ) -> None:
+        """Switches the agent to an already loaded model.
+
+        Requests which are already being handled finish with the old model. Requests
+        which arrive while these are drained wait for the switch and are then
+        handled with the new model. Hence, no request ever uses a mix of both models.
+
+        Args:
+            domain: Domain of the new model.
+            policy_ensemble: Policy ensemble of the new model.
+            fingerprint: Fingerprint of the new model.
+            interpreter: NLU interpreter of the new model.
+            model_directory: Directory of the new model.
+            draining_timeout: Maximum time in seconds to wait for requests which
+                use the old model. The model is switched anyway after this time.
+        """
+        # only one switch at a time
+        while self._model_switch_finished is not None:
+            await self._model_switch_finished.wait()
+
+        self._model_switch_finished = asyncio.Event()
+        try:
+            await self._drain_requests(draining_timeout)
+
+            self.update_model(
+                domain, policy_ensemble, fingerprint, interpreter, model_directory
+            )
+        finally:
+            self._requests_drained = None
+            model_switch_finished, self._model_switch_finished = (
+                self._model_switch_finished,
+                None,
+            )
+            model_switch_finished.set()
+
+        # Nothing references the old model anymore. Collect it right away to free
+        # the memory of its TensorFlow graphs.
+        gc.collect()
+
+    async def _drain_requests(self, timeout: float) -> None:
+        if not self._requests_in_flight:
+            return
+
+        logger.debug(
+            f"Waiting for {self._requests_in_flight} request(s) to finish before "
+            f"switching the model."
+        )
+        self._requests_drained = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._requests_drained.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"{self._requests_in_flight} request(s) didn't finish within "
+                f"{timeout} seconds. Switching the model anyway."
+            )
+
+    @asynccontextmanager
+    async def _use_model(self) -> AsyncGenerator[None, None]:
+        """Marks the current model as in use while handling a request."""
+        # requests mustn't start with the old model once a switch is pending
+        while self._model_switch_finished is not None:
+            await self._model_switch_finished.wait()
+
+        self._requests_in_flight += 1
+        try:
+            yield
+        finally:
+            self._requests_in_flight -= 1
+            if not self._requests_in_flight and self._requests_drained is not None:
+                self._requests_drained.set()
+
     @classmethod
     def load(
         cls,
@@ -558,9 +762,10 @@ class Agent:
 
         """
 
-        processor = self.create_processor()
-        message = UserMessage(message_data)
-        return await processor.parse_message(message, tracker)
+        async with self._use_model():
+            processor = self.create_processor()
+            message = UserMessage(message_data)
+            return await processor.parse_message(message, tracker)
 
     async def handle_message(
         self,
@@ -573,10 +778,11 @@ class Agent:
             logger.info("Ignoring message as there is no agent to handle it.")
             return None
 
-        processor = self.create_processor(message_preprocessor)
+        async with self._use_model():
+            processor = self.create_processor(message_preprocessor)
 
-        async with self.lock_store.lock(message.sender_id):
-            return await processor.handle_message(message)
+            async with self.lock_store.lock(message.sender_id):
+                return await processor.handle_message(message)
 
     # noinspection PyUnusedLocal
     async def predict_next(
@@ -584,8 +790,9 @@ class Agent:
     ) -> Optional[Dict[Text, Any]]:
         """Handle a single message."""
 
-        processor = self.create_processor()
-        return await processor.predict_next(sender_id)
+        async with self._use_model():
+            processor = self.create_processor()
+            return await processor.predict_next(sender_id)
 
     # noinspection PyUnusedLocal
     async def log_message(
@@ -595,9 +802,10 @@ class Agent:
         **kwargs: Any,
     ) -> DialogueStateTracker:
         """Append a message to a dialogue - does not predict actions."""
-        processor = self.create_processor(message_preprocessor)
+        async with self._use_model():
+            processor = self.create_processor(message_preprocessor)
 
-        return await processor.log_message(message)
+            return await processor.log_message(message)
 
     async def execute_action(
         self,
@@ -608,13 +816,14 @@ class Agent:
         confidence: Optional[float],
     ) -> Optional[DialogueStateTracker]:
         """Handle a single message."""
-        processor = self.create_processor()
-        prediction = PolicyPrediction.for_action_name(
-            self.domain, action, policy, confidence or 0.0
-        )
-        return await processor.execute_action(
-            sender_id, action, output_channel, self.nlg, prediction
-        )
+        async with self._use_model():
+            processor = self.create_processor()
+            prediction = PolicyPrediction.for_action_name(
+                self.domain, action, policy, confidence or 0.0
+            )
+            return await processor.execute_action(
+                sender_id, action, output_channel, self.nlg, prediction
+            )
 
     async def trigger_intent(
         self,
@@ -625,10 +834,11 @@ class Agent:
     ) -> None:
         """Trigger a user intent, e.g. triggered by an external event."""
 
-        processor = self.create_processor()
-        await processor.trigger_external_user_uttered(
-            intent_name, entities, tracker, output_channel
-        )
+        async with self._use_model():
+            processor = self.create_processor()
+            await processor.trigger_external_user_uttered(
+                intent_name, entities, tracker, output_channel
+            )
 
     async def handle_text(
         self,
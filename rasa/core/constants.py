@@ -22,6 +22,9 @@ DEFAULT_RESPONSE_TIMEOUT = 60 * 60  # 1 hour
 
 DEFAULT_LOCK_LIFETIME = 60  # in seconds
 
+# maximum time a model switch waits for requests which are still using the old model
+DEFAULT_MODEL_DRAINING_TIMEOUT = 60  # in seconds
+
 BEARER_TOKEN_PREFIX = "Bearer "
 
 # The lowest priority is intended to be used by machine learning policies.
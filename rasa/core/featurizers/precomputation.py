@@ -1,4 +1,5 @@
 from __future__ import annotations
+from pathlib import Path
 import typing
 from typing import Optional, Text, Dict, List, Union, Iterable, Any
 from collections.abc import ValuesView, KeysView
@@ -18,8 +19,9 @@ from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.nlu.training_data.features import Features
 import rasa.shared.utils.io
+import rasa.shared.nlu.training_data.util
 
-# TODO: make precomputations (MessageContainerForCoreFeaturization) cacheable
+MESSAGE_KEYS_FILE_NAME = "message_keys.json"
 
 
 class MessageContainerForCoreFeaturization:
@@ -83,6 +85,53 @@ class MessageContainerForCoreFeaturization:
     def __repr__(self) -> Text:
         return f"{self.__class__.__name__}({self._table})"
 
+    def to_cache(self, directory: Path, model_storage: ModelStorage) -> None:
+        """Persists the container to the cache.
+
+        Args:
+            directory: The directory which receives the persisted container.
+            model_storage: The current model storage (unused).
+        """
+        keys = [
+            [key_attribute, key]
+            for key_attribute, key_attribute_table in self._table.items()
+            for key in key_attribute_table.keys()
+        ]
+        rasa.shared.nlu.training_data.util.persist_messages(
+            self.all_messages(), directory
+        )
+        rasa.shared.utils.io.dump_obj_as_json_to_file(
+            directory / MESSAGE_KEYS_FILE_NAME,
+            {"keys": keys, "num_collisions_ignored": self._num_collisions_ignored},
+        )
+
+    @classmethod
+    def from_cache(
+        cls, node_name: Text, directory: Path, model_storage: ModelStorage
+    ) -> MessageContainerForCoreFeaturization:
+        """Loads a container which was persisted to the cache.
+
+        Args:
+            node_name: The name of the graph node which wants to use the container.
+            directory: Directory containing the persisted container.
+            model_storage: The current model storage (unused).
+
+        Returns:
+            The loaded container.
+        """
+        persisted_keys = rasa.shared.utils.io.read_json_file(
+            directory / MESSAGE_KEYS_FILE_NAME
+        )
+        messages = rasa.shared.nlu.training_data.util.load_messages(directory)
+
+        container = cls()
+        # `all_messages` returns the messages in the order of the persisted keys
+        for (key_attribute, key), message in zip(persisted_keys["keys"], messages):
+            container._table[key_attribute][key] = message
+        container._num_collisions_ignored = persisted_keys["num_collisions_ignored"]
+
+        return container
+
     def __len__(self) -> int:
         return sum(
             len(key_attribute_table) for key_attribute_table in self._table.values()
@@ -2,19 +2,35 @@ from __future__ import annotations
 from pathlib import Path
 from collections import defaultdict
 from abc import abstractmethod
+import functools
 import jsonpickle
 import logging
+import math
+import os
 
 from tqdm import tqdm
-from typing import Tuple, List, Optional, Dict, Text, Union, Any, Iterator, Set
+from typing import (
+    Tuple,
+    List,
+    Optional,
+    Dict,
+    Text,
+    Union,
+    Any,
+    Iterator,
+    Set,
+    Callable,
+)
 import numpy as np
 
 
 from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
 from rasa.core.featurizers.precomputation import MessageContainerForCoreFeaturization
 from rasa.core.exceptions import InvalidTrackerFeaturizerUsageError
+from rasa.constants import ENV_NUM_FEATURIZATION_PROCESSES
 import rasa.shared.core.trackers
 import rasa.shared.utils.io
+import rasa.utils.common
 from rasa.shared.nlu.constants import TEXT, INTENT, ENTITIES, ACTION_NAME
 from rasa.shared.nlu.training_data.features import Features
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -31,6 +47,10 @@ from rasa.core.featurizers import _tracker_featurizers
 
 FEATURIZER_FILE = "featurizer.json"
 
+# Featurizing fewer trackers in a worker process isn't worth the overhead of
+# starting the process.
+MIN_TRACKERS_PER_PROCESS = 500
+
 logger = logging.getLogger(__name__)
 
 # All code outside this module will continue to use the old `tracker_featurizer` module
@@ -117,6 +137,16 @@ class TrackerFeaturizer2:
         Returns:
             Featurized tracker states.
         """
+        return _map_in_worker_processes(
+            functools.partial(self._encode_states, precomputations=precomputations),
+            trackers_as_states,
+        )
+
+    def _encode_states(
+        self,
+        trackers_as_states: List[List[State]],
+        precomputations: Optional[MessageContainerForCoreFeaturization],
+    ) -> List[List[Dict[Text, List[Features]]]]:
         return [
             [
                 self.state_featurizer.encode_state(state, precomputations)
@@ -125,6 +155,85 @@ class TrackerFeaturizer2:
             for tracker_states in trackers_as_states
         ]
 
+    def _examples_per_tracker(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        ignore_action_unlikely_intent: bool = False,
+    ) -> Iterator[List[Tuple[List[State], List[Text], List[Dict[Text, Any]]]]]:
+        """Lazily extracts the training examples of each tracker.
+
+        The trackers are processed in worker processes if configured via the
+        `RASA_NUM_FEATURIZATION_PROCESSES` environment variable.
+
+        Args:
+            trackers: The trackers to transform.
+            domain: The domain.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
+                from training states.
+
+        Returns:
+            An iterator over the examples of each tracker in the same order as the
+            trackers.
+        """
+        # The domain and the trackers are sent to the worker processes together, so
+        # that the trackers still reference the same domain instance there.
+        return _imap_in_worker_processes(
+            functools.partial(
+                self._extract_examples_of_trackers,
+                domain=domain,
+                omit_unset_slots=omit_unset_slots,
+                ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+            ),
+            trackers,
+        )
+
+    def _extract_examples_of_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        omit_unset_slots: bool,
+        ignore_action_unlikely_intent: bool,
+    ) -> List[List[Tuple[List[State], List[Text], List[Dict[Text, Any]]]]]:
+        return [
+            list(
+                self._extract_examples(
+                    tracker,
+                    domain,
+                    omit_unset_slots=omit_unset_slots,
+                    ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+                )
+            )
+            for tracker in trackers
+        ]
+
+    @abstractmethod
+    def _extract_examples(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        ignore_action_unlikely_intent: bool = False,
+    ) -> Iterator[Tuple[List[State], List[Text], List[Dict[Text, Any]]]]:
+        """Creates an iterator over training examples from a tracker.
+
+        Args:
+            tracker: The tracker from which to extract training examples.
+            domain: The domain of the training data.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
+                from training states.
+
+        Returns:
+            An iterator over example states, labels, and entity data.
+        """
+        raise NotImplementedError(
+            f"`{self.__class__.__name__}` should implement how to "
+            f"extract training examples from a tracker"
+        )
+
     @staticmethod
     def _convert_labels_to_ids(
         trackers_as_actions: List[List[Text]], domain: Domain
@@ -600,59 +709,87 @@ class FullDialogueTrackerFeaturizer2(TrackerFeaturizer2):
             "".format(type(self).__name__, type(self.state_featurizer).__name__)
         )
         pbar = tqdm(
-            trackers,
+            self._examples_per_tracker(
+                trackers,
+                domain,
+                omit_unset_slots=omit_unset_slots,
+                ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+            ),
             desc="Processed trackers",
+            total=len(trackers),
             disable=rasa.shared.utils.io.is_logging_disabled(),
         )
-        for tracker in pbar:
-            states = self._create_states(
-                tracker, domain, omit_unset_slots=omit_unset_slots
-            )
-            events = tracker.applied_events()
+        for tracker_examples in pbar:
+            for states, actions, entities in tracker_examples:
+                trackers_as_states.append(states)
+                trackers_as_actions.append(actions)
+                trackers_as_entities.append(entities)
 
-            if ignore_action_unlikely_intent:
-                states = self._remove_action_unlikely_intent_from_states(states)
-                events = self._remove_action_unlikely_intent_from_events(events)
+        self._remove_user_text_if_intent(trackers_as_states)
 
-            delete_first_state = False
-            actions = []
-            entities = []
-            entity_data = {}
-            for event in events:
-                if isinstance(event, UserUttered):
-                    entity_data = self._entity_data(event)
+        return trackers_as_states, trackers_as_actions, trackers_as_entities
 
-                if not isinstance(event, ActionExecuted):
-                    continue
+    def _extract_examples(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        ignore_action_unlikely_intent: bool = False,
+    ) -> Iterator[Tuple[List[State], List[Optional[Text]], List[Dict[Text, Any]]]]:
+        """Creates an iterator over training examples from a tracker.
 
-                if not event.unpredictable:
-                    # only actions which can be
-                    # predicted at a stories start
-                    actions.append(event.action_name or event.action_text)
-                    entities.append(entity_data)
-                else:
-                    # unpredictable actions can be
-                    # only the first in the story
-                    if delete_first_state:
-                        raise InvalidStory(
-                            f"Found two unpredictable actions in one story "
-                            f"'{tracker.sender_id}'. Check your story files."
-                        )
-                    delete_first_state = True
+        The full dialogue of a tracker is a single training example.
 
-                # reset entity_data for the the next turn
-                entity_data = {}
+        Args:
+            tracker: The tracker from which to extract training examples.
+            domain: The domain of the training data.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_action_unlikely_intent: Whether to remove `action_unlikely_intent`
+                from training states.
 
-            if delete_first_state:
-                states = states[1:]
+        Returns:
+            An iterator over example states, labels, and entity data.
+        """
+        states = self._create_states(tracker, domain, omit_unset_slots=omit_unset_slots)
+        events = tracker.applied_events()
 
-            trackers_as_states.append(states[:-1])
-            trackers_as_actions.append(actions)
-            trackers_as_entities.append(entities)
+        if ignore_action_unlikely_intent:
+            states = self._remove_action_unlikely_intent_from_states(states)
+            events = self._remove_action_unlikely_intent_from_events(events)
 
-        self._remove_user_text_if_intent(trackers_as_states)
+        delete_first_state = False
+        actions = []
+        entities = []
+        entity_data = {}
+        for event in events:
+            if isinstance(event, UserUttered):
+                entity_data = self._entity_data(event)
 
-        return trackers_as_states, trackers_as_actions, trackers_as_entities
+            if not isinstance(event, ActionExecuted):
+                continue
+
+            if not event.unpredictable:
+                # only actions which can be
+                # predicted at a stories start
+                actions.append(event.action_name or event.action_text)
+                entities.append(entity_data)
+            else:
+                # unpredictable actions can be
+                # only the first in the story
+                if delete_first_state:
+                    raise InvalidStory(
+                        f"Found two unpredictable actions in one story "
+                        f"'{tracker.sender_id}'. Check your story files."
+                    )
+                delete_first_state = True
+
+            # reset entity_data for the the next turn
+            entity_data = {}
+
+        if delete_first_state:
+            states = states[1:]
+
+        yield states[:-1], actions, entities
 
     def prediction_states(
         self,
@@ -802,18 +939,19 @@ class MaxHistoryTrackerFeaturizer2(TrackerFeaturizer2):
             f"(by {type(self).__name__}({type(self.state_featurizer).__name__}))..."
         )
         pbar = tqdm(
-            trackers,
+            self._examples_per_tracker(
+                trackers,
+                domain,
+                omit_unset_slots=omit_unset_slots,
+                ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+            ),
             desc="Processed trackers",
+            total=len(trackers),
             disable=rasa.shared.utils.io.is_logging_disabled(),
         )
-        for tracker in pbar:
+        for tracker_examples in pbar:
 
-            for states, label, entities in self._extract_examples(
-                tracker,
-                domain,
-                omit_unset_slots=omit_unset_slots,
-                ignore_action_unlikely_intent=ignore_action_unlikely_intent,
-            ):
+            for states, label, entities in tracker_examples:
 
                 if self.remove_duplicates:
                     hashed = self._hash_example(states, label)
@@ -1041,18 +1179,19 @@ class IntentMaxHistoryTrackerFeaturizer2(MaxHistoryTrackerFeaturizer2):
             f"(by {type(self).__name__}({type(self.state_featurizer).__name__}))..."
         )
         pbar = tqdm(
-            trackers,
+            self._examples_per_tracker(
+                trackers,
+                domain,
+                omit_unset_slots=omit_unset_slots,
+                ignore_action_unlikely_intent=ignore_action_unlikely_intent,
+            ),
             desc="Processed trackers",
+            total=len(trackers),
             disable=rasa.shared.utils.io.is_logging_disabled(),
         )
-        for tracker in pbar:
+        for tracker_examples in pbar:
 
-            for states, label, entities in self._extract_examples(
-                tracker,
-                domain,
-                omit_unset_slots=omit_unset_slots,
-                ignore_action_unlikely_intent=ignore_action_unlikely_intent,
-            ):
+            for states, label, entities in tracker_examples:
 
                 if self.remove_duplicates:
                     hashed = self._hash_example(states, label)
@@ -1224,3 +1363,57 @@ class IntentMaxHistoryTrackerFeaturizer2(MaxHistoryTrackerFeaturizer2):
 def _is_prev_action_unlikely_intent_in_state(state: State) -> bool:
     prev_action_name = state.get(PREVIOUS_ACTION, {}).get(ACTION_NAME)
     return prev_action_name == ACTION_UNLIKELY_INTENT_NAME
+
+
+def _map_in_worker_processes(
+    function: Callable[[List[Any]], List[Any]], items: List[Any]
+) -> List[Any]:
+    """Applies a function to contiguous chunks of items in worker processes.
+
+    See `_imap_in_worker_processes` for details.
+
+    Args:
+        function: Function which transforms a list of items into a list of results.
+        items: The items.
+
+    Returns:
+        The concatenated results of all chunks in the order of the items. This is the
+        same as the result of `function(items)`.
+    """
+    return list(_imap_in_worker_processes(function, items))
+
+
+def _imap_in_worker_processes(
+    function: Callable[[List[Any]], List[Any]], items: List[Any]
+) -> Iterator[Any]:
+    """Lazily applies a function to contiguous chunks of items in worker processes.
+
+    The number of worker processes is configured via the
+    `RASA_NUM_FEATURIZATION_PROCESSES` environment variable. Each worker process
+    handles at least `MIN_TRACKERS_PER_PROCESS` items. Without worker processes the
+    function is applied to one item at a time.
+
+    Args:
+        function: Function which transforms a list of items into a list of results.
+        items: The items.
+
+    Returns:
+        An iterator over the results in the order of the items. The results of a
+        chunk are available as soon as the chunk was processed.
+    """
+    num_processes = min(
+        int(os.environ.get(ENV_NUM_FEATURIZATION_PROCESSES, 1)),
+        len(items) // MIN_TRACKERS_PER_PROCESS,
+    )
+    if num_processes <= 1:
+        for item in items:
+            yield from function([item])
+        return
+
+    chunk_size = math.ceil(len(items) / num_processes)
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    logger.debug(f"Processing {len(items)} items in {len(chunks)} worker processes.")
+    with rasa.utils.common.create_process_pool(len(chunks)) as pool:
+        for chunk_results in pool.map(function, chunks):
+            yield from chunk_results
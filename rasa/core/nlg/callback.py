@@ -5,26 +5,32 @@ from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
 from rasa.core.nlg.generator import NaturalLanguageGenerator
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.shared.exceptions import RasaException
+import rasa.shared.utils.validation
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
 
 
+# Expected response schema for an NLG endpoint
+NLG_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "text": {"type": "string"},
+        "buttons": {"type": ["array", "null"], "items": {"type": "object"}},
+        "elements": {"type": ["array", "null"], "items": {"type": "object"}},
+        "attachment": {"type": ["object", "null"]},
+        "image": {"type": ["string", "null"]},
+        "custom": {"type": "object"},
+    },
+}
+
+
 def nlg_response_format_spec() -> Dict[Text, Any]:
     """Expected response schema for an NLG endpoint.
 
-    Used for validation of the response returned from the NLG endpoint."""
-    return {
-        "type": "object",
-        "properties": {
-            "text": {"type": "string"},
-            "buttons": {"type": ["array", "null"], "items": {"type": "object"}},
-            "elements": {"type": ["array", "null"], "items": {"type": "object"}},
-            "attachment": {"type": ["object", "null"]},
-            "image": {"type": ["string", "null"]},
-            "custom": {"type": "object"},
-        },
-    }
+    Used for validation of the response returned from the NLG endpoint. The
+    returned schema must not be modified."""
+    return NLG_RESPONSE_SCHEMA
 
 
 def nlg_request_format(
@@ -85,7 +91,6 @@ class CallbackNaturalLanguageGenerator(NaturalLanguageGenerator):
     @staticmethod
     def validate_response(content: Optional[Dict[Text, Any]]) -> bool:
         """Validate the NLG response. Raises exception on failure."""
-        from jsonschema import validate
         from jsonschema import ValidationError
 
         try:
@@ -93,7 +98,9 @@ class CallbackNaturalLanguageGenerator(NaturalLanguageGenerator):
                 # means the endpoint did not want to respond with anything
                 return True
             else:
-                validate(content, nlg_response_format_spec())
+                rasa.shared.utils.validation.validate_json(
+                    content, nlg_response_format_spec()
+                )
                 return True
         except ValidationError as e:
             raise RasaException(
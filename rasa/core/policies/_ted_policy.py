@@ -81,6 +81,8 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    USE_TF_DATA_PIPELINE,
+    DIALOGUE_CACHE_SIZE,
     ENCODING_DIMENSION,
     UNIDIRECTIONAL_ENCODER,
     SEQUENCE,
@@ -280,8 +282,18 @@ class TEDPolicy(Policy):
         TENSORBOARD_LOG_LEVEL: "epoch",
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # If 'True' the training data is fed to the model by a `tf.data` pipeline,
+        # which creates the batches in parallel and groups examples of similar
+        # length into the same batch to reduce padding.
+        USE_TF_DATA_PIPELINE: False,
         # Only pick e2e prediction if the policy is confident enough
         E2E_CONFIDENCE_THRESHOLD: 0.5,
+        # Memory budget in MB for caching the dialogue transformer states of
+        # conversations during inference. If the budget is greater than 0 and
+        # `max_history` is not set, only the dialogue turns which were added since
+        # the last prediction are passed through the dialogue transformer.
+        # Set to 0 to disable the cache.
+        DIALOGUE_CACHE_SIZE: 0,
         # Specify what features to use as sequence and sentence features.
         # By default all features in the pipeline are used.
         FEATURIZERS: [],
@@ -645,6 +657,7 @@ class TEDPolicy(Policy):
             self.config[BATCH_STRATEGY],
             self.config[EVAL_NUM_EXAMPLES],
             self.config[RANDOM_SEED],
+            use_tf_data_pipeline=self.config[USE_TF_DATA_PIPELINE],
         )
         callbacks = rasa.utils.train_utils.create_common_callbacks(
             self.config[EPOCHS],
@@ -797,7 +810,9 @@ class TEDPolicy(Policy):
             tracker, domain, interpreter
         )
         model_data = self._create_model_data(tracker_state_features)
-        outputs: Dict[Text, np.ndarray] = self.model.run_inference(model_data)
+        outputs: Dict[Text, np.ndarray] = self.model.run_inference_with_dialogue_cache(
+            model_data, tracker.sender_id
+        )
 
         # take the last prediction in the sequence
         similarities = outputs["similarities"][:, -1, :]
@@ -77,6 +77,7 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    USE_TF_DATA_PIPELINE,
     FEATURIZERS,
     ENTITY_RECOGNITION,
     IGNORE_INTENTS_LIST,
@@ -240,6 +241,10 @@ class UnexpecTEDIntentPolicy(TEDPolicy):
         TENSORBOARD_LOG_LEVEL: "epoch",
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # If 'True' the training data is fed to the model by a `tf.data` pipeline,
+        # which creates the batches in parallel and groups examples of similar
+        # length into the same batch to reduce padding.
+        USE_TF_DATA_PIPELINE: False,
         # Specify what features to use as sequence and sentence features.
         # By default all features in the pipeline are used.
         FEATURIZERS: [],
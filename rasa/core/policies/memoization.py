@@ -2,11 +2,25 @@ from __future__ import annotations
 import zlib
 
 import base64
+import hashlib
 import json
 import logging
+import mmap
+import struct
 
 from tqdm import tqdm
-from typing import Optional, Any, Dict, List, Text
+from typing import (
+    Optional,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Text,
+    Tuple,
+    Union,
+)
 from pathlib import Path
 
 import rasa.utils.io
@@ -15,7 +29,21 @@ from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.core.domain import State, Domain
-from rasa.shared.core.events import ActionExecuted
+from rasa.shared.core.constants import (
+    ACTION_UNLIKELY_INTENT_NAME,
+    ACTIVE_LOOP,
+    PREVIOUS_ACTION,
+    SLOTS,
+    USER,
+)
+from rasa.shared.core.events import (
+    ActionExecuted,
+    ActiveLoop,
+    Event,
+    SlotSet,
+    UserUttered,
+)
+from rasa.shared.nlu.constants import ACTION_NAME, ACTION_TEXT
 from rasa.core.featurizers.tracker_featurizers import (
     TrackerFeaturizer2 as TrackerFeaturizer,
 )
@@ -46,6 +74,10 @@ AugmentedMemoizationPolicy = AugmentedMemoizationPolicy
 
 logger = logging.getLogger(__name__)
 
+# Number of bytes of a hashed feature key
+HASHED_FEATURE_KEY_SIZE = 16
+LOOKUP_TABLE_FILE = "memorized_turns.table"
+
 
 class MemoizationPolicyGraphComponent(PolicyGraphComponent):
     """A policy that follows exact examples of `max_history` turns in training stories.
@@ -73,6 +105,9 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
         # please make sure to update the docs when changing a default parameter
         return {
             "enable_feature_string_compression": True,
+            # If `True`, the states are memorized as 128 bit hashes and the
+            # persisted examples are memory-mapped when the policy is loaded.
+            "enable_hashed_feature_keys": False,
             "use_nlu_confidence_as_score": False,
             POLICY_PRIORITY: MEMOIZATION_POLICY_PRIORITY,
             POLICY_MAX_HISTORY: DEFAULT_MAX_HISTORY,
@@ -100,6 +135,11 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
         )
         self.lookup = lookup or {}
 
+    @property
+    def _uses_hashed_feature_keys(self) -> bool:
+        # policies which inherit from this policy don't necessarily have this option
+        return self.config.get("enable_hashed_feature_keys", False)
+
     def _create_lookup_from_states(
         self,
         trackers_as_states: List[List[State]],
@@ -125,6 +165,8 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
         )
 
         ambiguous_feature_keys = set()
+        # the states of every hashed feature key to detect hash collisions
+        feature_strings = {}
 
         pbar = tqdm(
             zip(trackers_as_states, trackers_as_actions),
@@ -138,6 +180,19 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
             if not feature_key:
                 continue
 
+            if self._uses_hashed_feature_keys:
+                feature_string = self._canonical_feature_string(states)
+                known_feature_string = feature_strings.setdefault(
+                    feature_key, feature_string
+                )
+                if known_feature_string != feature_string:
+                    logger.warning(
+                        f"Different states have the same hashed feature key "
+                        f"'{feature_key}'. These examples won't be memorized."
+                    )
+                    ambiguous_feature_keys.add(feature_key)
+                    lookup.pop(feature_key, None)
+
             if feature_key not in ambiguous_feature_keys:
                 if feature_key in lookup.keys():
                     if lookup[feature_key] != action:
@@ -151,7 +206,19 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
 
         return lookup
 
+    @staticmethod
+    def _canonical_feature_string(states: List[State]) -> Text:
+        return json.dumps(states, sort_keys=True, separators=(",", ":"))
+
     def _create_feature_key(self, states: List[State]) -> Text:
+        if self._uses_hashed_feature_keys:
+            return hashlib.blake2b(
+                self._canonical_feature_string(states).encode(
+                    rasa.shared.utils.io.DEFAULT_ENCODING
+                ),
+                digest_size=HASHED_FEATURE_KEY_SIZE,
+            ).hexdigest()
+
         # we sort keys to make sure that the same states
         # represented as dictionaries have the same json strings
         # quotes are removed for aesthetic reasons
@@ -263,6 +330,8 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
         return self._prediction(result)
 
     def _metadata(self) -> Dict[Text, Any]:
+        if self._uses_hashed_feature_keys:
+            return {"lookup_table": LOOKUP_TABLE_FILE}
         return {"lookup": self.lookup}
 
     @classmethod
@@ -281,6 +350,26 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
             rasa.shared.utils.io.create_directory_for_file(file)
             rasa.shared.utils.io.dump_obj_as_json_to_file(file, self._metadata())
 
+            if self._uses_hashed_feature_keys:
+                MemoryMappedLookup.write(Path(path) / LOOKUP_TABLE_FILE, self.lookup)
+
+    @classmethod
+    def _kwargs_from_metadata(
+        cls, metadata: Dict[Text, Any], path: Path
+    ) -> Dict[Text, Any]:
+        """Returns the keyword arguments to create the policy from its metadata.
+
+        Args:
+            metadata: The persisted metadata of the policy.
+            path: The directory which contains the persisted policy.
+
+        Returns:
+            The keyword arguments.
+        """
+        if "lookup_table" in metadata:
+            return {"lookup": MemoryMappedLookup.load(path / metadata["lookup_table"])}
+        return {"lookup": metadata["lookup"]}
+
     @classmethod
     def load(
         cls,
@@ -292,13 +381,13 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
     ) -> MemoizationPolicyGraphComponent:
         """Loads a trained policy (see parent class for full docstring)."""
         featurizer = None
-        lookup = None
+        kwargs = {}
 
         try:
             with model_storage.read_from(resource) as path:
                 metadata_file = Path(path) / cls._metadata_filename()
                 metadata = rasa.shared.utils.io.read_json_file(metadata_file)
-                lookup = metadata["lookup"]
+                kwargs = cls._kwargs_from_metadata(metadata, Path(path))
 
                 if (Path(path) / FEATURIZER_FILE).is_file():
                     featurizer = TrackerFeaturizer.load(path)
@@ -315,10 +404,246 @@ class MemoizationPolicyGraphComponent(PolicyGraphComponent):
             resource,
             execution_context,
             featurizer=featurizer,
-            lookup=lookup,
+            **kwargs,
         )
 
 
+class MemoryMappedLookup(Mapping):
+    """A read-only lookup of hashed feature keys which is backed by a mapped file.
+
+    The file contains the examples sorted by their feature key so that an example
+    is found with a binary search. As the operating system shares the pages of
+    mapped files, processes which load the same policy don't need their own copy
+    of the lookup.
+    """
+
+    _MAGIC = b"RMLT"
+    _VERSION = 1
+    # magic, version, number of examples, length of the encoded action names
+    _HEADER = struct.Struct("<4sIQQ")
+    # feature key, index of the action name
+    _RECORD = struct.Struct(f"<{HASHED_FEATURE_KEY_SIZE}sI")
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]) -> None:
+        """Creates lookup.
+
+        Args:
+            buffer: The content of a file which was created with `write`.
+
+        Raises:
+            ValueError: If the buffer doesn't contain a lookup.
+        """
+        if len(buffer) < self._HEADER.size:
+            raise ValueError("The lookup table is truncated.")
+
+        magic, version, num_examples, actions_size = self._HEADER.unpack_from(buffer)
+        if magic != self._MAGIC or version != self._VERSION:
+            raise ValueError("The file doesn't contain a supported lookup table.")
+
+        self._records_offset = self._HEADER.size + actions_size
+        if len(buffer) != self._records_offset + num_examples * self._RECORD.size:
+            raise ValueError("The lookup table is truncated.")
+
+        self._buffer = buffer
+        self._num_examples = num_examples
+        self._actions = json.loads(
+            bytes(buffer[self._HEADER.size : self._records_offset]).decode(
+                rasa.shared.utils.io.DEFAULT_ENCODING
+            )
+        )
+
+    @classmethod
+    def write(cls, path: Path, lookup: Mapping[Text, Text]) -> None:
+        """Writes a lookup with hashed feature keys to a file.
+
+        Args:
+            path: The file to write to.
+            lookup: Maps the hex encoded feature keys to action names.
+        """
+        actions = sorted(set(lookup.values()))
+        action_indices = {action: index for index, action in enumerate(actions)}
+        encoded_actions = json.dumps(actions).encode(
+            rasa.shared.utils.io.DEFAULT_ENCODING
+        )
+        records = sorted(
+            (bytes.fromhex(feature_key), action_indices[action])
+            for feature_key, action in lookup.items()
+        )
+
+        with open(path, "wb") as f:
+            f.write(
+                cls._HEADER.pack(
+                    cls._MAGIC, cls._VERSION, len(records), len(encoded_actions)
+                )
+            )
+            f.write(encoded_actions)
+            for record in records:
+                f.write(cls._RECORD.pack(*record))
+
+    @classmethod
+    def load(cls, path: Path) -> MemoryMappedLookup:
+        """Maps a lookup which was written with `write` into memory.
+
+        Args:
+            path: The file which contains the lookup.
+
+        Returns:
+            The lookup.
+        """
+        with open(path, "rb") as f:
+            # the mapping stays valid after the file is closed
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _feature_key(self, index: int) -> bytes:
+        start = self._records_offset + index * self._RECORD.size
+        return self._buffer[start : start + HASHED_FEATURE_KEY_SIZE]
+
+    def __getitem__(self, feature_key: Text) -> Text:
+        try:
+            target = bytes.fromhex(feature_key)
+        except (TypeError, ValueError):
+            raise KeyError(feature_key)
+
+        low, high = 0, self._num_examples
+        while low < high:
+            middle = (low + high) // 2
+            key = self._feature_key(middle)
+            if key < target:
+                low = middle + 1
+            elif key > target:
+                high = middle
+            else:
+                _, action_index = self._RECORD.unpack_from(
+                    self._buffer, self._records_offset + middle * self._RECORD.size
+                )
+                return self._actions[action_index]
+
+        raise KeyError(feature_key)
+
+    def __iter__(self) -> Iterator[Text]:
+        for index in range(self._num_examples):
+            yield self._feature_key(index).hex()
+
+    def __len__(self) -> int:
+        return self._num_examples
+
+
+class ReversedStatesTrie:
+    """A trie over the memorized state sequences, starting with the latest state.
+
+    The trie is keyed by the feature strings of the single states which make up the
+    feature strings of the lookup. Hence it can be built from the lookup and
+    doesn't need to be persisted. Walking the trie from the latest state backwards
+    allows to recall variants of the states which differ in their older states
+    without serializing (and compressing) the whole state sequence for every
+    variant.
+    """
+
+    def __init__(self) -> None:
+        """Creates an empty trie."""
+        # every node is a dictionary with the child nodes keyed by their state and
+        # optionally the action of the example ending in this node
+        self.root: Dict[Text, Any] = {"children": {}}
+
+    @staticmethod
+    def state_key(state: State) -> Text:
+        """Creates the feature string of a single state.
+
+        Args:
+            state: The state.
+
+        Returns:
+            The feature string of the state as it is part of the feature string of a
+            sequence of states.
+        """
+        return json.dumps(state, sort_keys=True).replace('"', "")
+
+    @staticmethod
+    def split_feature_string(feature_str: Text) -> Optional[List[Text]]:
+        """Splits the feature string of a sequence of states into its states.
+
+        Args:
+            feature_str: The feature string of a sequence of states.
+
+        Returns:
+            The feature strings of the single states or `None` if the feature string
+            can't be split unambiguously, e.g. because a text contains braces.
+        """
+        if not feature_str.startswith("[") or not feature_str.endswith("]"):
+            return None
+
+        state_keys = []
+        depth = 0
+        start = 1
+        for index in range(1, len(feature_str) - 1):
+            character = feature_str[index]
+            if character == "{":
+                depth += 1
+            elif character == "}":
+                depth -= 1
+                if depth == 0:
+                    state_keys.append(feature_str[start : index + 1])
+                    # skip the separator between two states
+                    start = index + 3
+            elif depth < 0:
+                return None
+
+        if f"[{', '.join(state_keys)}]" != feature_str:
+            return None
+
+        return state_keys
+
+    def add(self, state_keys: List[Text], action: Text) -> None:
+        """Memorizes an example.
+
+        Args:
+            state_keys: The feature strings of the states of the example.
+            action: The action which follows the states.
+        """
+        node = self.root
+        for state_key in reversed(state_keys):
+            node = node["children"].setdefault(state_key, {"children": {}})
+        node["action"] = action
+
+    def child(self, node: Dict[Text, Any], state: State) -> Optional[Dict[Text, Any]]:
+        """Finds the node which follows a node for an older state.
+
+        Args:
+            node: A node of the trie.
+            state: The state which precedes the states of the node.
+
+        Returns:
+            The child node or `None` if no memorized example contains the states.
+        """
+        return node["children"].get(self.state_key(state))
+
+    def get(self, states: List[State]) -> Optional[Text]:
+        """Finds the action which follows the states.
+
+        Args:
+            states: The states.
+
+        Returns:
+            The memorized action or `None` if the states weren't memorized.
+        """
+        node = self.root
+        for state in reversed(states):
+            node = self.child(node, state)
+            if node is None:
+                return None
+        return node.get("action")
+
+
+class _Cut(NamedTuple):
+    """A point in the past before which the conversation is forgotten."""
+
+    # position of the first state after the cut within the states, `-1` if the
+    # first state after the cut isn't part of the states
+    position: int
+    # index of the action at which the conversation is cut within the applied events
+    action_index: int
+
+
 class AugmentedMemoizationPolicyGraphComponent(MemoizationPolicyGraphComponent):
     """The policy that remembers examples from training stories for `max_history` turns.
 
@@ -335,13 +660,150 @@ class AugmentedMemoizationPolicyGraphComponent(MemoizationPolicyGraphComponent):
     for current dialogue.
     """
 
+    def __init__(
+        self,
+        config: Dict[Text, Any],
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+        featurizer: Optional[TrackerFeaturizer] = None,
+        lookup: Optional[Dict] = None,
+    ) -> None:
+        """Initialize the policy."""
+        super().__init__(
+            config, model_storage, resource, execution_context, featurizer, lookup
+        )
+        self._states_trie: Optional[ReversedStatesTrie] = None
+        self._states_trie_is_created = False
+
+    @property
+    def states_trie(self) -> Optional[ReversedStatesTrie]:
+        """The trie of the memorized examples.
+
+        The trie is created from the lookup when it's needed for the first time.
+        """
+        if not self._states_trie_is_created:
+            self._states_trie = self._create_states_trie(self.lookup)
+            self._states_trie_is_created = True
+        return self._states_trie
+
+    def _create_states_trie(
+        self, lookup: Mapping[Text, Text]
+    ) -> Optional[ReversedStatesTrie]:
+        """Creates the trie of the memorized examples from the lookup.
+
+        No trie is created if the feature keys are hashed, as the states can't be
+        restored from their hashes, or if one of the feature keys can't be split
+        into the keys of its states. In this case the examples are recalled from
+        the lookup.
+
+        Args:
+            lookup: The lookup of the memorized examples.
+
+        Returns:
+            The trie or `None` if the examples can't be stored in a trie.
+        """
+        if self._uses_hashed_feature_keys:
+            return None
+
+        states_trie = ReversedStatesTrie()
+        for feature_key, action in lookup.items():
+            state_keys = ReversedStatesTrie.split_feature_string(
+                self._feature_string(feature_key)
+            )
+            if state_keys is None:
+                logger.debug(
+                    "Can't split the memorized states into single states. "
+                    "The variants of the states will be recalled from the lookup."
+                )
+                return None
+            states_trie.add(state_keys, action)
+
+        return states_trie
+
+    def _feature_string(self, feature_key: Text) -> Text:
+        if not self.config["enable_feature_string_compression"]:
+            return feature_key
+
+        return zlib.decompress(base64.b64decode(feature_key)).decode(
+            rasa.shared.utils.io.DEFAULT_ENCODING
+        )
+
+    def train(
+        self,
+        training_trackers: List[TrackerWithCachedStates],
+        domain: Domain,
+        **kwargs: Any,
+    ) -> None:
+        """Trains the policy (see parent class for full docstring)."""
+        super().train(training_trackers, domain, **kwargs)
+        self._states_trie = None
+        self._states_trie_is_created = False
+
+    def _recall_using_delorean(
+        self,
+        old_states: List[State],
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        rule_only_data: Optional[Dict[Text, Any]],
+    ) -> Optional[Text]:
+        """Applies to the future idea to change the past and get the new future.
+
+        Go to the past to correctly forget slots, and then back to the future to
+        recall. Every variant of the past cuts the conversation at one of the
+        actions of the states and forgets the slots, the user input and the active
+        loop which were set before this action. The variant which forgets the least
+        is recalled. Conversations with turns which are hidden from the states are
+        replayed from every cut instead.
+
+        Args:
+            old_states: List of states.
+            tracker: The tracker.
+            domain: The Domain.
+            rule_only_data: Slots and loops which are specific to rules and hence
+                should be ignored by this policy.
+
+        Returns:
+            The name of the action.
+        """
+        logger.debug("Launch DeLorean...")
+
+        past_turns = _past_turns(
+            old_states, tracker.applied_events(), self.config[POLICY_MAX_HISTORY]
+        )
+        if past_turns is None:
+            return self._recall_by_replaying(
+                old_states, tracker, domain, rule_only_data=rule_only_data
+            )
+        cuts, set_at = past_turns
+
+        initial_states = self._prediction_states(
+            tracker.init_copy(), domain, rule_only_data=rule_only_data
+        )
+        initial_state = initial_states[-1] if initial_states else {}
+
+        if self.states_trie is None:
+            return self._recall_cuts_from_lookup(
+                old_states, cuts, set_at, initial_state
+            )
+        return self._recall_cuts_from_states_trie(
+            old_states, cuts, set_at, initial_state
+        )
+
     @staticmethod
     def _back_to_the_future(
         tracker: DialogueStateTracker, again: bool = False
     ) -> Optional[DialogueStateTracker]:
-        """Send Marty to the past to get
-        the new featurization for the future"""
+        """Send Marty to the past to get the new featurization for the future.
 
+        Args:
+            tracker: The tracker.
+            again: Whether to cut the tracker at its second instead of its first
+                action.
+
+        Returns:
+            The tracker replayed from the cut or `None` if there is no such action.
+        """
         idx_of_first_action = None
         idx_of_second_action = None
 
@@ -373,17 +835,14 @@ class AugmentedMemoizationPolicyGraphComponent(MemoizationPolicyGraphComponent):
 
         return mcfly_tracker
 
-    def _recall_using_delorean(
+    def _recall_by_replaying(
         self,
         old_states: List[State],
         tracker: DialogueStateTracker,
         domain: Domain,
         rule_only_data: Optional[Dict[Text, Any]],
     ) -> Optional[Text]:
-        """Applies to the future idea to change the past and get the new future.
-
-        Recursively go to the past to correctly forget slots,
-        and then back to the future to recall.
+        """Recalls the variants of the past by replaying the tracker from every cut.
 
         Args:
             old_states: List of states.
@@ -395,8 +854,6 @@ class AugmentedMemoizationPolicyGraphComponent(MemoizationPolicyGraphComponent):
         Returns:
             The name of the action.
         """
-        logger.debug("Launch DeLorean...")
-
         # Truncate the tracker based on `max_history`
         mcfly_tracker = _trim_tracker_by_max_history(
             tracker, self.config[POLICY_MAX_HISTORY]
@@ -422,6 +879,122 @@ class AugmentedMemoizationPolicyGraphComponent(MemoizationPolicyGraphComponent):
         logger.debug(f"Current tracker state {old_states}")
         return None
 
+    def _includes_initial_state(self, states: List[State], cut: _Cut) -> bool:
+        """Checks if the initial state is within `max_history` of the states of a cut.
+
+        Args:
+            states: The states of the conversation.
+            cut: The point at which the conversation is cut.
+
+        Returns:
+            `True` if the initial state precedes the states after the cut.
+        """
+        if cut.position < 0:
+            # the first state after the cut was dropped due to `max_history`
+            return False
+
+        max_history = (
+            self.featurizer.max_history
+            if isinstance(self.featurizer, MaxHistoryTrackerFeaturizer)
+            else None
+        )
+        number_of_states = len(states) - cut.position + 1
+        return max_history is None or number_of_states <= max_history
+
+    def _recall_cuts_from_lookup(
+        self,
+        states: List[State],
+        cuts: List[_Cut],
+        set_at: List[Dict[Tuple[Text, Optional[Text]], int]],
+        initial_state: State,
+    ) -> Optional[Text]:
+        """Recalls the states of the cuts one after the other from the lookup.
+
+        Args:
+            states: The states of the conversation.
+            cuts: The points at which the conversation is cut, starting with the
+                earliest one.
+            set_at: For every state, the indices of the events which last set its
+                slots and sub-states.
+            initial_state: The state of the conversation before any action.
+
+        Returns:
+            The action which follows the states of the earliest cut which were
+            memorized.
+        """
+        for cut in cuts:
+            states_after_cut = [
+                _forget_set_before(state, set_at[position], cut, initial_state)
+                for position, state in enumerate(states)
+                if position >= cut.position
+            ]
+            if self._includes_initial_state(states, cut):
+                states_after_cut.insert(0, initial_state)
+
+            memorised = self._recall_states(states_after_cut)
+            if memorised is not None:
+                logger.debug(f"Current tracker state {states_after_cut}")
+                return memorised
+
+        logger.debug(f"Current tracker state {states}")
+        return None
+
+    def _recall_cuts_from_states_trie(
+        self,
+        states: List[State],
+        cuts: List[_Cut],
+        set_at: List[Dict[Tuple[Text, Optional[Text]], int]],
+        initial_state: State,
+    ) -> Optional[Text]:
+        """Recalls the states of all cuts in a single walk over the states trie.
+
+        The states are walked once from the latest to the earliest state. For every
+        cut, the walk follows the node of the states which are left after the cut
+        and stops following it as soon as no memorized example contains them.
+
+        Args:
+            states: The states of the conversation.
+            cuts: The points at which the conversation is cut, starting with the
+                earliest one.
+            set_at: For every state, the indices of the events which last set its
+                slots and sub-states.
+            initial_state: The state of the conversation before any action.
+
+        Returns:
+            The action which follows the states of the earliest cut which were
+            memorized.
+        """
+        nodes = [(cut, self.states_trie.root) for cut in cuts]
+        recalled = {}
+
+        for position in reversed(range(len(states))):
+            nodes_of_earlier_states = []
+            for cut, node in nodes:
+                state = _forget_set_before(
+                    states[position], set_at[position], cut, initial_state
+                )
+                node = self.states_trie.child(node, state)
+                if node is None:
+                    continue
+
+                if position > max(cut.position, 0):
+                    nodes_of_earlier_states.append((cut, node))
+                    continue
+
+                # all states after the cut were walked
+                if self._includes_initial_state(states, cut):
+                    node = self.states_trie.child(node, initial_state)
+                if node is not None and "action" in node:
+                    recalled[cut] = node["action"]
+
+            nodes = nodes_of_earlier_states
+
+        logger.debug(f"Current tracker state {states}")
+        if not recalled:
+            return None
+
+        return recalled[min(recalled)]
+
     def recall(
         self,
         states: List[State],
@@ -503,3 +1076,159 @@ def _trim_tracker_by_max_history(
     for event in applied_events:
         new_tracker.update(event)
     return new_tracker
+
+
+def _is_hidden_from_states(event: Event) -> bool:
+    return isinstance(event, ActionExecuted) and (
+        event.hide_rule_turn or event.action_name == ACTION_UNLIKELY_INTENT_NAME
+    )
+
+
+def _is_previous_action(event: Event, state: State) -> bool:
+    previous_action = state.get(PREVIOUS_ACTION, {})
+    return (
+        isinstance(event, ActionExecuted)
+        and event.action_name == previous_action.get(ACTION_NAME)
+        and event.action_text == previous_action.get(ACTION_TEXT)
+    )
+
+
+def _set_by(event: Event) -> Optional[Tuple[Text, Optional[Text]]]:
+    if isinstance(event, SlotSet):
+        return SLOTS, event.key
+    if isinstance(event, UserUttered):
+        return USER, None
+    if isinstance(event, ActiveLoop):
+        return ACTIVE_LOOP, None
+    return None
+
+
+def _past_turns(
+    states: List[State], applied_events: List[Event], max_history: Optional[int]
+) -> Optional[Tuple[List[_Cut], List[Dict[Tuple[Text, Optional[Text]], int]]]]:
+    """Finds the points at which the conversation can be cut for the states.
+
+    The conversation can be cut at every one of its last `max_history + 1`
+    actions. The actions are matched with the states which follow them, starting
+    with the latest state. This requires that the featurizer created a state for
+    every action, i.e. that there are neither hidden rule turns nor
+    `action_unlikely_intent`s. Forgetting the events before a cut can change which
+    turns are hidden, so these conversations have to be replayed.
+
+    Args:
+        states: The states of the conversation.
+        applied_events: The applied events of the conversation.
+        max_history: The number of actions after the earliest cut.
+
+    Returns:
+        The points at which the conversation can be cut, starting with the
+        earliest one, and for every state the indices of the events which last set
+        its slots and sub-states. `None` if the conversation contains turns which
+        are hidden from the states or if the states don't match the events.
+    """
+    if any(_is_hidden_from_states(event) for event in applied_events):
+        return None
+
+    all_action_indices = [
+        index
+        for index, event in enumerate(applied_events)
+        if isinstance(event, ActionExecuted)
+    ]
+    # the state before the first action doesn't follow an action
+    number_of_initial_states = int(bool(states) and PREVIOUS_ACTION not in states[0])
+    number_of_states_with_action = len(states) - number_of_initial_states
+    if number_of_states_with_action > len(all_action_indices):
+        return None
+
+    action_indices = [-1] * number_of_initial_states + all_action_indices[
+        len(all_action_indices) - number_of_states_with_action :
+    ]
+    for state, action_index in zip(states, action_indices):
+        if action_index >= 0 and not _is_previous_action(
+            applied_events[action_index], state
+        ):
+            return None
+
+    positions = {
+        action_index: position for position, action_index in enumerate(action_indices)
+    }
+    if max_history:
+        all_action_indices = all_action_indices[-max_history - 1 :]
+    # actions which precede the states cut the conversation as well
+    cuts = [
+        _Cut(positions.get(action_index, -1), action_index)
+        for action_index in all_action_indices
+    ]
+
+    # everything which was set before the earliest cut is forgotten anyway
+    events_applied = cuts[0].action_index + 1 if cuts else len(applied_events)
+    last_set_at: Dict[Tuple[Text, Optional[Text]], int] = {}
+    set_at = []
+    for action_index in action_indices:
+        # a state contains the events up to the next action
+        next_action_index = next(
+            (
+                index
+                for index in range(action_index + 1, len(applied_events))
+                if isinstance(applied_events[index], ActionExecuted)
+            ),
+            len(applied_events),
+        )
+        for index in range(events_applied, next_action_index):
+            set_by = _set_by(applied_events[index])
+            if set_by is not None:
+                last_set_at[set_by] = index
+        events_applied = max(events_applied, next_action_index)
+        set_at.append(dict(last_set_at))
+
+    return cuts, set_at
+
+
+def _forget_set_before(
+    state: State,
+    set_at: Dict[Tuple[Text, Optional[Text]], int],
+    cut: _Cut,
+    initial_state: State,
+) -> State:
+    """Resets the slots and sub-states which were set before a cut.
+
+    Args:
+        state: A state of the conversation after the cut.
+        set_at: The indices of the events which last set the slots and sub-states
+            of the state.
+        cut: The point at which the conversation is cut.
+        initial_state: The state of the conversation before any action.
+
+    Returns:
+        The state as if the conversation started at the cut.
+    """
+
+    def is_forgotten(set_by: Tuple[Text, Optional[Text]]) -> bool:
+        return set_at.get(set_by, -1) <= cut.action_index
+
+    state_after_cut = {}
+    for sub_state_name, sub_state in state.items():
+        if sub_state_name == SLOTS:
+            initial_slots = initial_state.get(SLOTS, {})
+            slots = {
+                slot_name: initial_slots.get(slot_name)
+                if is_forgotten((SLOTS, slot_name))
+                else slot_state
+                for slot_name, slot_state in sub_state.items()
+            }
+            slots = {
+                slot_name: slot_state
+                for slot_name, slot_state in slots.items()
+                if slot_state is not None
+            }
+            if slots:
+                state_after_cut[SLOTS] = slots
+        elif sub_state_name in (USER, ACTIVE_LOOP) and is_forgotten(
+            (sub_state_name, None)
+        ):
+            if sub_state_name in initial_state:
+                state_after_cut[sub_state_name] = initial_state[sub_state_name]
+        else:
+            state_after_cut[sub_state_name] = sub_state
+
+    return state_after_cut
@@ -4,12 +4,13 @@ from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.core.domain import Domain
 import shutil
 from pathlib import Path
-from collections import defaultdict
-from typing import Any, List, Optional, Text, Dict, Tuple, Union, Type
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, List, Optional, Text, Dict, Tuple, Union, Type
 
 import numpy as np
 import tensorflow as tf
 import tensorflow_addons as tfa
+from tensorflow.python.keras.utils import tf_utils
 
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
@@ -56,6 +57,7 @@ import rasa.utils.io
 import rasa.utils.train_utils
 from rasa.utils.tensorflow.models import RasaModel, TransformerRasaModel
 from rasa.utils.tensorflow import rasa_layers
+from rasa.utils.tensorflow.transformer import TransformerEncoder
 from rasa.utils.tensorflow.model_data import (
     RasaModelData,
     FeatureSignature,
@@ -101,6 +103,7 @@ from rasa.utils.tensorflow.constants import (
     TENSORBOARD_LOG_DIR,
     TENSORBOARD_LOG_LEVEL,
     CHECKPOINT_MODEL,
+    USE_TF_DATA_PIPELINE,
     ENCODING_DIMENSION,
     UNIDIRECTIONAL_ENCODER,
     SEQUENCE,
@@ -120,6 +123,7 @@ from rasa.utils.tensorflow.constants import (
     SOFTMAX,
     BILOU_FLAG,
     EPOCH_OVERRIDE,
+    DIALOGUE_CACHE_SIZE,
 )
 from rasa.core.policies._ted_policy import TEDPolicy
 
@@ -146,6 +150,9 @@ LABEL_FEATURES_TO_ENCODE = [
 ]
 STATE_LEVEL_FEATURES = [ENTITIES, SLOTS, ACTIVE_LOOP]
 PREDICTION_FEATURES = STATE_LEVEL_FEATURES + SENTENCE_FEATURES_TO_ENCODE + [DIALOGUE]
+DIALOGUE_CACHE_INPUTS = "dialogue_cache_inputs"
+DIALOGUE_CACHE_KEYS = "dialogue_cache_keys"
+DIALOGUE_CACHE_VALUES = "dialogue_cache_values"
 
 
 class TEDPolicyGraphComponent(PolicyGraphComponent):
@@ -313,8 +320,18 @@ class TEDPolicyGraphComponent(PolicyGraphComponent):
             TENSORBOARD_LOG_LEVEL: "epoch",
             # Perform model checkpointing
             CHECKPOINT_MODEL: False,
+            # If 'True' the training data is fed to the model by a `tf.data` pipeline,
+            # which creates the batches in parallel and groups examples of similar
+            # length into the same batch to reduce padding.
+            USE_TF_DATA_PIPELINE: False,
             # Only pick e2e prediction if the policy is confident enough
             E2E_CONFIDENCE_THRESHOLD: 0.5,
+            # Memory budget in MB for caching the dialogue transformer states of
+            # conversations during inference. If the budget is greater than 0 and
+            # `max_history` is not set, only the dialogue turns which were added
+            # since the last prediction are passed through the dialogue
+            # transformer. Set to 0 to disable the cache.
+            DIALOGUE_CACHE_SIZE: 0,
             # Specify what features to use as sequence and sentence features.
             # By default all features in the pipeline are used.
             FEATURIZERS: [],
@@ -662,6 +679,7 @@ class TEDPolicyGraphComponent(PolicyGraphComponent):
             self.config[BATCH_STRATEGY],
             self.config[EVAL_NUM_EXAMPLES],
             self.config[RANDOM_SEED],
+            use_tf_data_pipeline=self.config[USE_TF_DATA_PIPELINE],
         )
         callbacks = rasa.utils.train_utils.create_common_callbacks(
             self.config[EPOCHS],
@@ -809,7 +827,9 @@ class TEDPolicyGraphComponent(PolicyGraphComponent):
             tracker, domain, precomputations, rule_only_data=rule_only_data
         )
         model_data = self._create_model_data(tracker_state_features)
-        outputs: Dict[Text, np.ndarray] = self.model.run_inference(model_data)
+        outputs: Dict[Text, np.ndarray] = self.model.run_inference_with_dialogue_cache(
+            model_data, tracker.sender_id
+        )
 
         # take the last prediction in the sequence
         similarities = outputs["similarities"][:, -1, :]
@@ -1139,6 +1159,68 @@ class TEDPolicyGraphComponent(PolicyGraphComponent):
         return meta
 
 
+class DialogueCache:
+    """Caches the dialogue transformer states of conversations during inference.
+
+    For every conversation, the inputs of the dialogue transformer are stored
+    together with the keys and values of its attention layers. The least recently
+    used conversations are evicted once the cache exceeds its memory budget.
+    """
+
+    def __init__(self, max_size_in_bytes: int) -> None:
+        """Creates cache.
+
+        Args:
+            max_size_in_bytes: The memory budget of the cache.
+        """
+        self.max_size_in_bytes = max_size_in_bytes
+        self.size_in_bytes = 0
+        self._entries: "OrderedDict[Text, Tuple[np.ndarray, ...]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, conversation_id: Text) -> Optional[Tuple[np.ndarray, ...]]:
+        """Returns the cached states of a conversation.
+
+        Args:
+            conversation_id: The ID of the conversation.
+
+        Returns:
+            The dialogue transformer inputs and the attention keys and values or
+            `None` if the conversation is not cached.
+        """
+        entry = self._entries.get(conversation_id)
+        if entry is not None:
+            self._entries.move_to_end(conversation_id)
+
+        return entry
+
+    def put(self, conversation_id: Text, entry: Tuple[np.ndarray, ...]) -> None:
+        """Caches the states of a conversation.
+
+        Args:
+            conversation_id: The ID of the conversation.
+            entry: The dialogue transformer inputs and the attention keys and values.
+        """
+        self._remove(conversation_id)
+
+        entry_size = sum(array.nbytes for array in entry)
+        if entry_size > self.max_size_in_bytes:
+            return
+
+        self._entries[conversation_id] = entry
+        self.size_in_bytes += entry_size
+
+        while self.size_in_bytes > self.max_size_in_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, conversation_id: Text) -> None:
+        entry = self._entries.pop(conversation_id, None)
+        if entry is not None:
+            self.size_in_bytes -= sum(array.nbytes for array in entry)
+
+
 class TED(TransformerRasaModel):
     """TED model architecture from https://arxiv.org/abs/1910.00486."""
 
@@ -1184,6 +1266,12 @@ class TED(TransformerRasaModel):
         # needed for efficient prediction
         self.all_labels_embed: Optional[tf.Tensor] = None
 
+        # caches the dialogue transformer states of conversations during inference
+        self._dialogue_cache = DialogueCache(
+            int(self.config.get(DIALOGUE_CACHE_SIZE, 0) * 1024 * 1024)
+        )
+        self._tf_predict_step_with_cache: Optional[Callable] = None
+
         self._prepare_layers()
 
     def _check_data(self) -> None:
@@ -2018,6 +2106,27 @@ class TED(TransformerRasaModel):
             dialogue_transformer_output,
             attention_weights,
         ) = self._embed_dialogue(dialogue_in, tf_batch_data)
+
+        return self._predictions_from_dialogue_embeddings(
+            tf_batch_data,
+            dialogue_embed,
+            dialogue_mask,
+            dialogue_transformer_output,
+            attention_weights,
+            text_output,
+            text_sequence_lengths,
+        )
+
+    def _predictions_from_dialogue_embeddings(
+        self,
+        tf_batch_data: Dict[Text, Dict[Text, List[tf.Tensor]]],
+        dialogue_embed: tf.Tensor,
+        dialogue_mask: tf.Tensor,
+        dialogue_transformer_output: tf.Tensor,
+        attention_weights: tf.Tensor,
+        text_output: Optional[tf.Tensor],
+        text_sequence_lengths: Optional[tf.Tensor],
+    ) -> Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]:
         dialogue_mask = tf.squeeze(dialogue_mask, axis=-1)
 
         sim_all, scores = self._tf_layers[
@@ -2051,6 +2160,197 @@ class TED(TransformerRasaModel):
 
         return predictions
 
+    def uses_dialogue_cache(self) -> bool:
+        """Checks if the dialogue transformer states are cached during inference.
+
+        Caching requires a unidirectional dialogue transformer without relative
+        position embeddings, i.e. a model which is used without `max_history`.
+        Models which extract entities from the text of the user messages need the
+        outputs of all dialogue turns and are therefore not supported either.
+        """
+        transformer = self._tf_layers[f"transformer.{DIALOGUE}"]
+        return (
+            self._dialogue_cache.max_size_in_bytes > 0
+            and not self.max_history_featurizer_is_used
+            and isinstance(transformer, TransformerEncoder)
+            and not self.config[KEY_RELATIVE_ATTENTION]
+            and not self.config[VALUE_RELATIVE_ATTENTION]
+            and not self._extracts_entities()
+        )
+
+    def _extracts_entities(self) -> bool:
+        return self.config[ENTITY_RECOGNITION] and TEXT in self.data_signature
+
+    def run_inference_with_dialogue_cache(
+        self, model_data: RasaModelData, conversation_id: Text
+    ) -> Dict[Text, Union[np.ndarray, Dict[Text, Any]]]:
+        """Predicts the next action of a conversation re-using cached states.
+
+        The keys and values of the dialogue transformer are cached per
+        conversation. Dialogue turns whose inputs didn't change since the last
+        prediction for the conversation are not passed through the dialogue
+        transformer again. This gives the same predictions as `run_inference`.
+        In the attention weights of the diagnostic data, the rows of the re-used
+        dialogue turns are zero.
+
+        Args:
+            model_data: The featurized conversation.
+            conversation_id: The ID of the conversation.
+
+        Returns:
+            Model outputs corresponding to the inputs fed.
+        """
+        if not self.uses_dialogue_cache():
+            return self.run_inference(model_data)
+
+        outputs = {}
+        (data_generator, _,) = rasa.utils.train_utils.create_data_generators(
+            model_data=model_data, batch_sizes=1, epochs=1, shuffle=False,
+        )
+        data_iterator = iter(data_generator)
+        while True:
+            try:
+                batch_in = next(data_iterator)[0]
+            except StopIteration:
+                break
+
+            batch_out = self._rasa_predict_with_dialogue_cache(
+                batch_in, conversation_id
+            )
+            outputs = self._merge_batch_outputs(outputs, batch_out)
+
+        return outputs
+
+    def _rasa_predict_with_dialogue_cache(
+        self, batch_in: Tuple[np.ndarray], conversation_id: Text
+    ) -> Dict[Text, Union[np.ndarray, Dict[Text, Any]]]:
+        self._training = False
+        if not self.prepared_for_prediction:
+            self.prepare_for_predict()
+            self.prepared_for_prediction = True
+
+        cached = self._dialogue_cache.get(conversation_id)
+        if cached is None:
+            transformer = self._tf_layers[f"transformer.{DIALOGUE}"]
+            cached = (
+                np.zeros((1, 0, 0), dtype=np.float32),
+                transformer.empty_cache(batch_size=1),
+                transformer.empty_cache(batch_size=1),
+            )
+
+        if self._run_eagerly:
+            outputs = self._predict_step_with_dialogue_cache(batch_in, *cached)
+        else:
+            if self._tf_predict_step_with_cache is None:
+                self._tf_predict_step_with_cache = tf.function(
+                    self._predict_step_with_dialogue_cache,
+                    input_signature=self._dynamic_signature(batch_in)
+                    + [
+                        tf.TensorSpec([None, None, None], tf.float32),
+                        tf.TensorSpec([None] * 5, tf.float32),
+                        tf.TensorSpec([None] * 5, tf.float32),
+                    ],
+                )
+            outputs = self._tf_predict_step_with_cache(batch_in, *cached)
+
+        outputs = tf_utils.to_numpy_or_python_type(outputs)
+        self._dialogue_cache.put(
+            conversation_id,
+            (
+                outputs.pop(DIALOGUE_CACHE_INPUTS),
+                outputs.pop(DIALOGUE_CACHE_KEYS),
+                outputs.pop(DIALOGUE_CACHE_VALUES),
+            ),
+        )
+        if DIAGNOSTIC_DATA in outputs:
+            outputs[DIAGNOSTIC_DATA] = self._empty_lists_to_none_in_dict(
+                outputs[DIAGNOSTIC_DATA]
+            )
+
+        return outputs
+
+    def _predict_step_with_dialogue_cache(
+        self,
+        batch_in: Union[Tuple[tf.Tensor], Tuple[np.ndarray]],
+        cached_dialogue_in: tf.Tensor,
+        past_keys: tf.Tensor,
+        past_values: tf.Tensor,
+    ) -> Dict[Text, Union[tf.Tensor, Dict[Text, tf.Tensor]]]:
+        """Predicts the output of a batch with a single conversation.
+
+        Args:
+            batch_in: The batch.
+            cached_dialogue_in: The cached inputs of the dialogue transformer.
+            past_keys: The cached keys of the dialogue transformer.
+            past_values: The cached values of the dialogue transformer.
+
+        Returns:
+            The output to predict and the inputs, keys and values of the dialogue
+            transformer which should be cached.
+        """
+        tf_batch_data = self.batch_to_model_data_format(
+            batch_in, self.predict_data_signature
+        )
+        self._compute_dialogue_indices(tf_batch_data)
+
+        dialogue_in, text_output, text_sequence_lengths = self._process_batch_data(
+            tf_batch_data
+        )
+        dialogue_lengths = tf.cast(tf_batch_data[DIALOGUE][LENGTH][0], tf.int32)
+        dialogue_in = dialogue_in[:, : dialogue_lengths[0]]
+
+        # Re-use the cached states of the leading dialogue turns whose inputs didn't
+        # change. At least the last turn is always computed.
+        num_comparable = tf.minimum(
+            tf.shape(cached_dialogue_in)[1], tf.shape(dialogue_in)[1] - 1
+        )
+        comparable_dialogue_in = dialogue_in[:, :num_comparable]
+        # the reshape is a no-op unless the cache is empty
+        comparable_cached_dialogue_in = tf.reshape(
+            cached_dialogue_in[:, :num_comparable], tf.shape(comparable_dialogue_in)
+        )
+        is_same_turn = tf.reduce_all(
+            tf.equal(comparable_dialogue_in, comparable_cached_dialogue_in),
+            axis=[0, 2],
+        )
+        num_reused = tf.reduce_sum(tf.math.cumprod(tf.cast(is_same_turn, tf.int32)))
+
+        dialogue_transformer = self._tf_layers[f"transformer.{DIALOGUE}"]
+        (
+            dialogue_transformed,
+            attention_weights,
+            keys,
+            values,
+        ) = dialogue_transformer.call_with_cache(
+            dialogue_in[:, num_reused:],
+            past_keys[:, :, :, :num_reused],
+            past_values[:, :, :, :num_reused],
+        )
+        # pad the attention weights to the shape which `_embed_dialogue` returns
+        attention_weights = tf.pad(
+            attention_weights, [[0, 0], [0, 0], [0, 0], [num_reused, 0], [0, 0]]
+        )
+        dialogue_transformed = tfa.activations.gelu(dialogue_transformed)
+        # only the last dialogue turn is used for the prediction
+        dialogue_transformed = dialogue_transformed[:, -1:, :]
+        dialogue_mask = tf.ones((tf.shape(dialogue_in)[0], 1, 1))
+        dialogue_embed = self._tf_layers[f"embed.{DIALOGUE}"](dialogue_transformed)
+
+        predictions = self._predictions_from_dialogue_embeddings(
+            tf_batch_data,
+            dialogue_embed,
+            dialogue_mask,
+            dialogue_transformed,
+            attention_weights,
+            text_output,
+            text_sequence_lengths,
+        )
+        predictions[DIALOGUE_CACHE_INPUTS] = dialogue_in
+        predictions[DIALOGUE_CACHE_KEYS] = keys
+        predictions[DIALOGUE_CACHE_VALUES] = values
+
+        return predictions
+
     def _batch_predict_entities(
         self,
         tf_batch_data: Dict[Text, Dict[Text, List[tf.Tensor]]],
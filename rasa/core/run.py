@@ -1,8 +1,11 @@
 import asyncio
+import gc
 import logging
+import multiprocessing
 import uuid
 import os
 import shutil
+import sys
 from functools import partial
 from typing import Any, List, Optional, Text, Union, Dict
 
@@ -13,7 +16,7 @@ import rasa.utils
 import rasa.utils.common
 import rasa.utils.io
 from rasa import model, server, telemetry
-from rasa.constants import ENV_SANIC_BACKLOG
+from rasa.constants import ENV_SANIC_BACKLOG, ENV_SANIC_PRELOAD_MODEL
 from rasa.core import agent, channels, constants
 from rasa.core.agent import Agent
 from rasa.core.brokers.broker import EventBroker
@@ -23,6 +26,7 @@ import rasa.core.interpreter
 from rasa.core.lock_store import LockStore
 from rasa.core.tracker_store import TrackerStore
 from rasa.core.utils import AvailableEndpoints
+from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 import rasa.shared.utils.io
 from sanic import Sanic
 from asyncio import AbstractEventLoop
@@ -194,8 +198,22 @@ def serve_application(
 
     logger.info(f"Starting Rasa server on {protocol}://{interface}:{port}")
 
+    number_of_workers = rasa.core.utils.number_of_sanic_workers(
+        endpoints.lock_store if endpoints else None
+    )
+
+    preloaded_agent = None
+    if number_of_workers > 1 and _should_preload_model():
+        preloaded_agent = _preload_agent(model_path, endpoints, remote_storage)
+
     app.register_listener(
-        partial(load_agent_on_start, model_path, endpoints, remote_storage),
+        partial(
+            load_agent_on_start,
+            model_path,
+            endpoints,
+            remote_storage,
+            preloaded_agent=preloaded_agent,
+        ),
         "before_server_start",
     )
     app.register_listener(close_resources, "after_server_stop")
@@ -203,11 +221,10 @@ def serve_application(
     # noinspection PyUnresolvedReferences
     async def clear_model_files(_app: Sanic, _loop: Text) -> None:
         if app.agent.model_directory:
-            shutil.rmtree(_app.agent.model_directory)
-
-    number_of_workers = rasa.core.utils.number_of_sanic_workers(
-        endpoints.lock_store if endpoints else None
-    )
+            # the workers share the model directory if the model was preloaded
+            shutil.rmtree(
+                _app.agent.model_directory, ignore_errors=preloaded_agent is not None
+            )
 
     telemetry.track_server_start(
         input_channels, endpoints, model_path, number_of_workers, enable_api
@@ -216,6 +233,12 @@ def serve_application(
     app.register_listener(clear_model_files, "after_server_stop")
 
     rasa.utils.common.update_sanic_log_level(log_file)
+
+    if preloaded_agent is not None:
+        # Move the preloaded model to the permanent generation so that the garbage
+        # collector of the workers doesn't write to (and hence copy) its memory.
+        gc.freeze()
+
     app.run(
         host=interface,
         port=port,
@@ -225,6 +248,108 @@ def serve_application(
     )
 
 
+def _should_preload_model() -> bool:
+    """Checks if the model should be loaded before the Sanic workers are forked."""
+    if os.environ.get(ENV_SANIC_PRELOAD_MODEL, "false").lower() != "true":
+        return False
+
+    if multiprocessing.get_start_method() != "fork":
+        rasa.shared.utils.io.raise_warning(
+            f"The model can only be preloaded ('{ENV_SANIC_PRELOAD_MODEL}') if the "
+            f"Sanic workers are forked. Each worker will load the model separately."
+        )
+        return False
+
+    return True
+
+
+def _preload_agent(
+    model_path: Optional[Text],
+    endpoints: AvailableEndpoints,
+    remote_storage: Optional[Text],
+) -> Optional[Agent]:
+    """Loads the model in the main process before the Sanic workers are forked.
+
+    The forked workers share the memory of the model with the main process
+    (copy-on-write) instead of each loading their own copy of it. The stores are
+    created separately by each worker (see `load_agent_on_start`).
+
+    Args:
+        model_path: Path to the model.
+        endpoints: Endpoint configuration.
+        remote_storage: Remote storage which contains the model.
+
+    Returns:
+        The loaded agent or `None` if the model could not be loaded. In this case
+        every worker tries to load the model on its own.
+
+    Raises:
+        RasaException: If loading the model initialized TensorFlow.
+    """
+    logger.info("Preloading model before starting the Sanic workers.")
+    model_server = endpoints.model if endpoints and endpoints.model else None
+
+    try:
+        preloaded_agent = rasa.utils.common.run_in_loop(
+            agent.load_agent(
+                model_path,
+                model_server=model_server,
+                remote_storage=remote_storage,
+                interpreter=_create_interpreter(model_path, endpoints),
+                generator=endpoints.nlg,
+                action_endpoint=endpoints.action,
+                # every worker pulls new models on its own
+                pull_model_periodically=False,
+            )
+        )
+    except Exception as e:
+        logger.debug(f"Failed to preload model. Error: {type(e)}: {e}")
+        preloaded_agent = None
+
+    if _is_tensorflow_initialized():
+        # TensorFlow's thread pools don't survive forking the process, which means
+        # that the workers would hang as soon as they used TensorFlow.
+        raise RasaException(
+            f"The model uses TensorFlow and can hence not be preloaded before the "
+            f"Sanic workers are started, since TensorFlow doesn't support forking "
+            f"processes. Please unset the '{ENV_SANIC_PRELOAD_MODEL}' environment "
+            f"variable."
+        )
+
+    if not preloaded_agent or not preloaded_agent.is_ready():
+        logger.debug("Failed to preload model. Each worker will load it separately.")
+        return None
+
+    return preloaded_agent
+
+
+def _is_tensorflow_initialized() -> bool:
+    """Checks if the TensorFlow runtime of this process was initialized."""
+    if "tensorflow" not in sys.modules:
+        return False
+
+    from tensorflow.python.eager import context
+
+    tensorflow_context = context.context_safe()
+    return (
+        tensorflow_context is not None
+        and tensorflow_context._context_handle is not None
+    )
+
+
+def _create_interpreter(
+    model_path: Text, endpoints: AvailableEndpoints
+) -> Optional[NaturalLanguageInterpreter]:
+    # noinspection PyBroadException
+    try:
+        with model.get_model(model_path) as unpacked_model:
+            _, nlu_model = model.get_model_subdirectories(unpacked_model)
+            return rasa.core.interpreter.create_interpreter(endpoints.nlu or nlu_model)
+    except Exception:
+        logger.debug(f"Could not load interpreter from '{model_path}'.")
+        return None
+
+
 # noinspection PyUnusedLocal
 async def load_agent_on_start(
     model_path: Text,
@@ -232,29 +357,34 @@ async def load_agent_on_start(
     remote_storage: Optional[Text],
     app: Sanic,
     loop: AbstractEventLoop,
+    preloaded_agent: Optional[Agent] = None,
 ) -> Agent:
     """Load an agent.
 
     Used to be scheduled on server start
     (hence the `app` and `loop` arguments).
-    """
-    # noinspection PyBroadException
-    try:
-        with model.get_model(model_path) as unpacked_model:
-            _, nlu_model = model.get_model_subdirectories(unpacked_model)
-            _interpreter = rasa.core.interpreter.create_interpreter(
-                endpoints.nlu or nlu_model
-            )
-    except Exception:
-        logger.debug(f"Could not load interpreter from '{model_path}'.")
-        _interpreter = None
 
+    If the model was already loaded by the main process before the Sanic workers
+    were forked (`preloaded_agent`), the worker only creates its own connections to
+    the stores and uses the preloaded model.
+    """
     _broker = await EventBroker.create(endpoints.event_broker, loop=loop)
     _tracker_store = TrackerStore.create(endpoints.tracker_store, event_broker=_broker)
     _lock_store = LockStore.create(endpoints.lock_store)
 
     model_server = endpoints.model if endpoints and endpoints.model else None
 
+    if preloaded_agent is not None:
+        preloaded_agent.set_stores(_tracker_store, _lock_store)
+        if model_server:
+            await agent.start_periodic_model_pulling(model_server, preloaded_agent)
+
+        app.agent = preloaded_agent
+        logger.info("Rasa server is up and running.")
+        return app.agent
+
+    _interpreter = _create_interpreter(model_path, endpoints)
+
     try:
         app.agent = await agent.load_agent(
             model_path,
@@ -1,9 +1,12 @@
+import asyncio
+import functools
 import logging
+import math
 import os
 import warnings as pywarnings
 import typing
 from collections import defaultdict, namedtuple
-from typing import Any, Dict, List, Optional, Text, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Text, Tuple
 
 from rasa import telemetry
 from rasa.core.constants import (
@@ -27,7 +30,7 @@ from rasa.shared.core.training_data.story_writer.yaml_story_writer import (
     YAMLStoryWriter,
 )
 from rasa.shared.core.training_data.structures import StoryStep
-from rasa.shared.core.domain import Domain
+from rasa.shared.core.domain import Domain, PriorTrackerState, State
 from rasa.nlu.constants import (
     RESPONSE_SELECTOR_DEFAULT_INTENT,
     RESPONSE_SELECTOR_RETRIEVAL_INTENTS,
@@ -50,13 +53,20 @@ from rasa.shared.nlu.constants import (
     ENTITY_ATTRIBUTE_TEXT,
 )
 from rasa.constants import RESULTS_FILE, PERCENTAGE_KEY
-from rasa.shared.core.events import ActionExecuted, EntitiesAdded, UserUttered
+from rasa.shared.core.events import (
+    ActionExecuted,
+    DefinePrevUserUtteredFeaturization,
+    EntitiesAdded,
+    Event,
+    UserUttered,
+)
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.training_data.formats.readerwriter import TrainingDataWriter
 from rasa.shared.importers.importer import TrainingDataImporter
 from rasa.shared.utils.io import DEFAULT_ENCODING
 from rasa.utils.tensorflow.constants import QUERY_INTENT_KEY, SEVERITY_KEY
 from rasa.exceptions import ActionLimitReached
+import rasa.utils.common
 
 if typing.TYPE_CHECKING:
     from rasa.core.agent import Agent
@@ -80,6 +90,17 @@ StoryEvaluation = namedtuple(
 
 PredictionList = List[Optional[Text]]
 
+TrackerPrediction = Tuple[
+    "EvaluationStore",
+    DialogueStateTracker,
+    List[Dict[Text, Any]],
+    List[EntityEvaluationResult],
+]
+
+# number of story shards per worker process when evaluating stories in parallel;
+# using more shards than processes balances stories of different lengths
+STORY_SHARDS_PER_PROCESS = 4
+
 
 class WrongPredictionException(RasaException, ValueError):
     """Raised if a wrong prediction is encountered."""
@@ -405,6 +426,137 @@ class WronglyClassifiedUserUtterance(UserUttered):
         )
 
 
+class _PriorTrackerStatesCache:
+    """Caches the states of the prior trackers of a tracker's applied events."""
+
+    def __init__(self, tracker: DialogueStateTracker, domain: Domain) -> None:
+        # tracker which is updated with the applied events like the trackers
+        # generated by `DialogueStateTracker.generate_all_prior_trackers`
+        self._tracker = tracker.init_copy()
+        self.domain = domain
+        self._events: List[Event] = []
+        self._prior_tracker_states: List[PriorTrackerState] = []
+
+    def is_continued_by(self, applied_events: List[Event]) -> bool:
+        """Checks if the cached states can be reused for the given applied events.
+
+        Args:
+            applied_events: The current applied events of the tracker.
+
+        Returns:
+            `True` if the applied events start with the already processed events and
+            the new events don't modify already processed events.
+        """
+        if len(applied_events) < len(self._events):
+            return False
+
+        # `EntitiesAdded` and `DefinePrevUserUtteredFeaturization` modify the
+        # latest `UserUttered` event in place which might invalidate cached states
+        return all(
+            cached is current for cached, current in zip(self._events, applied_events)
+        ) and not any(
+            isinstance(event, (EntitiesAdded, DefinePrevUserUtteredFeaturization))
+            for event in applied_events[len(self._events) :]
+        )
+
+    def prior_tracker_states(
+        self, applied_events: List[Event], omit_unset_slots: bool
+    ) -> List[PriorTrackerState]:
+        """Computes the states for the new applied events and returns all states.
+
+        Args:
+            applied_events: The current applied events of the tracker.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+
+        Returns:
+            The states of all prior trackers of the applied events.
+        """
+        for event in applied_events[len(self._events) :]:
+            if isinstance(event, ActionExecuted):
+                self._prior_tracker_states.append(
+                    self.domain.prior_tracker_state(
+                        self._tracker, event.hide_rule_turn, omit_unset_slots
+                    )
+                )
+            self._tracker.update(event)
+            self._events.append(event)
+
+        # the state after the latest event changes with the next events and is hence
+        # not cached
+        return self._prior_tracker_states + [
+            self.domain.prior_tracker_state(self._tracker, False, omit_unset_slots)
+        ]
+
+
+class _IncrementalStatesTracker(DialogueStateTracker):
+    """Tracker which reuses the states of its history between predictions.
+
+    During the evaluation the test stories are replayed event by event. Instead of
+    replaying the whole history for every predicted action, the states of the
+    history are computed once and reused as long as the tracker's history only
+    grows.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._prior_tracker_states_caches: Dict[bool, _PriorTrackerStatesCache] = {}
+
+    def past_states(
+        self,
+        domain: Domain,
+        omit_unset_slots: bool = False,
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> List[State]:
+        """Generates the past states of this tracker based on the history.
+
+        Args:
+            domain: The Domain.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+            ignore_rule_only_turns: If True ignore dialogue turns that are present
+                only in rules.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+
+        Returns:
+            A list of states
+        """
+        applied_events = self.applied_events()
+
+        cache = self._prior_tracker_states_caches.get(omit_unset_slots)
+        if (
+            cache is None
+            or cache.domain is not domain
+            or not cache.is_continued_by(applied_events)
+        ):
+            cache = _PriorTrackerStatesCache(self, domain)
+            self._prior_tracker_states_caches[omit_unset_slots] = cache
+
+        prior_tracker_states = [
+            # policies and featurizers modify the states in place, hence the cached
+            # states need to be copied
+            prior_tracker_state._replace(
+                state={
+                    state_type: dict(sub_state)
+                    for state_type, sub_state in prior_tracker_state.state.items()
+                }
+            )
+            for prior_tracker_state in cache.prior_tracker_states(
+                applied_events, omit_unset_slots
+            )
+        ]
+
+        return domain.states_for_prior_tracker_states(
+            prior_tracker_states,
+            ignore_rule_only_turns=ignore_rule_only_turns,
+            rule_only_data=rule_only_data,
+        )
+
+    def clear_states_cache(self) -> None:
+        """Frees the cached states once no more predictions are made."""
+        self._prior_tracker_states_caches = {}
+
+
 def _create_data_generator(
     resource_name: Text,
     agent: "Agent",
@@ -758,7 +910,7 @@ async def _predict_tracker_actions(
 
     events = list(tracker.events)
 
-    partial_tracker = DialogueStateTracker.from_events(
+    partial_tracker = _IncrementalStatesTracker.from_events(
         tracker.sender_id,
         events[:1],
         agent.domain.slots,
@@ -810,9 +962,114 @@ async def _predict_tracker_actions(
         else:
             partial_tracker.update(event)
 
+    partial_tracker.clear_states_cache()
+
     return tracker_eval_store, partial_tracker, tracker_actions, policy_entity_results
 
 
+async def _predict_trackers(
+    trackers: List[DialogueStateTracker],
+    agent: "Agent",
+    fail_on_prediction_errors: bool = False,
+    use_e2e: bool = False,
+) -> AsyncIterator[TrackerPrediction]:
+    """Predicts the actions of the trackers one after another."""
+    from tqdm import tqdm
+
+    for tracker in tqdm(trackers):
+        yield await _predict_tracker_actions(
+            tracker, agent, fail_on_prediction_errors, use_e2e
+        )
+
+
+async def _predict_trackers_in_parallel(
+    trackers: List[DialogueStateTracker],
+    model_path: Text,
+    num_processes: int,
+    num_threads_per_process: Optional[int] = None,
+    fail_on_prediction_errors: bool = False,
+    use_e2e: bool = False,
+) -> AsyncIterator[TrackerPrediction]:
+    """Predicts the actions of the trackers in a pool of worker processes.
+
+    The trackers are split into contiguous shards. The predictions are yielded in the
+    same order as the trackers, independent of which worker finishes first.
+
+    Args:
+        trackers: The trackers of the test stories.
+        model_path: Path to the unpacked model which each worker loads.
+        num_processes: The number of worker processes.
+        num_threads_per_process: The maximum number of TensorFlow / BLAS threads per
+            worker process.
+        fail_on_prediction_errors: Whether to raise at the first wrong prediction.
+        use_e2e: Whether to run an end-to-end evaluation.
+
+    Yields:
+        The predictions for each tracker.
+    """
+    from tqdm import tqdm
+
+    if not trackers:
+        return
+
+    num_shards = min(len(trackers), num_processes * STORY_SHARDS_PER_PROCESS)
+    shard_size = math.ceil(len(trackers) / num_shards)
+    shards = [
+        trackers[start : start + shard_size]
+        for start in range(0, len(trackers), shard_size)
+    ]
+
+    loop = asyncio.get_event_loop()
+    with rasa.utils.common.create_process_pool(
+        num_processes, num_threads_per_process
+    ) as pool:
+        predictions = [
+            loop.run_in_executor(
+                pool,
+                _predict_tracker_shard,
+                model_path,
+                shard,
+                fail_on_prediction_errors,
+                use_e2e,
+            )
+            for shard in shards
+        ]
+
+        with tqdm(total=len(trackers)) as progress:
+            for shard_predictions in predictions:
+                for tracker_prediction in await shard_predictions:
+                    progress.update()
+                    yield tracker_prediction
+
+
+@functools.lru_cache(maxsize=1)
+def _load_agent(model_path: Text) -> "Agent":
+    """Loads the agent once per worker process."""
+    from rasa.core.agent import Agent
+
+    return Agent.load(model_path)
+
+
+def _predict_tracker_shard(
+    model_path: Text,
+    trackers: List[DialogueStateTracker],
+    fail_on_prediction_errors: bool,
+    use_e2e: bool,
+) -> List[TrackerPrediction]:
+    """Predicts the actions of a shard of trackers in a worker process."""
+    agent = _load_agent(model_path)
+
+    async def predict() -> List[TrackerPrediction]:
+        return [
+            await _predict_tracker_actions(
+                tracker, agent, fail_on_prediction_errors, use_e2e
+            )
+            for tracker in trackers
+        ]
+
+    return rasa.utils.common.run_in_loop(predict())
+
+
 def _in_training_data_fraction(action_list: List[Dict[Text, Any]]) -> float:
     """Given a list of action items, returns the fraction of actions
 
@@ -871,10 +1128,11 @@ async def _collect_story_predictions(
     agent: "Agent",
     fail_on_prediction_errors: bool = False,
     use_e2e: bool = False,
+    num_processes: int = 1,
+    num_threads_per_process: Optional[int] = None,
 ) -> Tuple[StoryEvaluation, int, List[EntityEvaluationResult]]:
     """Test the stories from a file, running them through the stored model."""
     from sklearn.metrics import accuracy_score
-    from tqdm import tqdm
 
     story_eval_store = EvaluationStore()
     failed_stories = []
@@ -888,16 +1146,33 @@ async def _collect_story_predictions(
     action_list = []
     entity_results = []
 
-    for tracker in tqdm(completed_trackers):
-        (
-            tracker_results,
-            predicted_tracker,
-            tracker_actions,
-            tracker_entity_results,
-        ) = await _predict_tracker_actions(
-            tracker, agent, fail_on_prediction_errors, use_e2e
+    if num_processes > 1 and not agent.model_directory:
+        logger.warning(
+            "Evaluating the stories one after another as the agent wasn't loaded "
+            "from a model directory which the worker processes could load."
+        )
+        num_processes = 1
+
+    if num_processes > 1:
+        tracker_predictions = _predict_trackers_in_parallel(
+            completed_trackers,
+            agent.model_directory,
+            num_processes,
+            num_threads_per_process,
+            fail_on_prediction_errors,
+            use_e2e,
+        )
+    else:
+        tracker_predictions = _predict_trackers(
+            completed_trackers, agent, fail_on_prediction_errors, use_e2e
         )
 
+    async for (
+        tracker_results,
+        predicted_tracker,
+        tracker_actions,
+        tracker_entity_results,
+    ) in tracker_predictions:
         entity_results.extend(tracker_entity_results)
 
         story_eval_store.merge_store(tracker_results)
@@ -992,6 +1267,8 @@ async def test(
     successes: bool = False,
     errors: bool = True,
     warnings: bool = True,
+    num_processes: int = 1,
+    num_threads_per_process: Optional[int] = None,
 ) -> Dict[Text, Any]:
     """Run the evaluation of the stories, optionally plot the results.
 
@@ -1008,6 +1285,11 @@ async def test(
             not
         errors: boolean indicating whether to write down incorrect predictions or not
         warnings: boolean indicating whether to write down prediction warnings or not
+        num_processes: number of worker processes which evaluate the stories in
+            parallel. Each worker loads the model once.
+        num_threads_per_process: maximum number of TensorFlow / BLAS threads per
+            worker process. If `None`, the CPU cores are split evenly between
+            the workers.
 
     Returns:
         Evaluation summary.
@@ -1018,7 +1300,12 @@ async def test(
     completed_trackers = generator.generate_story_trackers()
 
     story_evaluation, _, entity_results = await _collect_story_predictions(
-        completed_trackers, agent, fail_on_prediction_errors, use_e2e=e2e
+        completed_trackers,
+        agent,
+        fail_on_prediction_errors,
+        use_e2e=e2e,
+        num_processes=num_processes,
+        num_threads_per_process=num_threads_per_process,
     )
 
     evaluation_store = story_evaluation.evaluation_store
@@ -60,6 +60,9 @@ logger = logging.getLogger(__name__)
 POSTGRESQL_DEFAULT_MAX_OVERFLOW = 100
 POSTGRESQL_DEFAULT_POOL_SIZE = 50
 
+# number of rows which are fetched at once when streaming events from SQL databases
+SQL_EVENT_BATCH_SIZE = 1000
+
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
 
@@ -227,6 +230,42 @@ class TrackerStore:
             body.update(event.as_dict())
             self.event_broker.publish(body)
 
+    def retrieve_events(
+        self,
+        conversation_id: Text,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        since: Optional[float] = None,
+        event_types: Optional[List[Text]] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialized events of a conversation across all sessions.
+
+        In contrast to `retrieve_full_tracker` no tracker is created from the events.
+        This method may be overridden by the specific tracker store to apply the
+        filters when querying the events.
+
+        Args:
+            conversation_id: The conversation ID to retrieve the events for.
+            offset: Number of (matching) events to skip.
+            limit: Maximum number of events to return. `None` returns all events.
+            since: Only return events with a timestamp after this timestamp.
+            event_types: Only return events of these types (e.g. `user`).
+
+        Returns:
+            The matching events in the order in which they happened.
+        """
+        tracker = self.retrieve_full_tracker(conversation_id)
+        if not tracker:
+            return iter([])
+
+        return _filter_serialized_events(
+            (event.as_dict() for event in tracker.events),
+            offset,
+            limit,
+            since,
+            event_types,
+        )
+
     def number_of_existing_events(self, sender_id: Text) -> int:
         """Return number of stored events for a given sender id."""
         old_tracker = self.retrieve(sender_id)
@@ -646,6 +685,25 @@ class MongoTrackerStore(TrackerStore):
             conversation_id, events, self.domain.slots
         )
 
+    def retrieve_events(
+        self,
+        conversation_id: Text,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        since: Optional[float] = None,
+        event_types: Optional[List[Text]] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialized events of a conversation across all sessions.
+
+        The stored events are filtered without creating a tracker from them (see
+        parent class for full docstring).
+        """
+        events = self._retrieve(conversation_id, fetch_events_from_all_sessions=True)
+
+        return _filter_serialized_events(
+            events or [], offset, limit, since, event_types
+        )
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
         return [c["sender_id"] for c in self.conversations.find()]
@@ -989,6 +1047,41 @@ class SQLTrackerStore(TrackerStore):
                 )
                 return None
 
+    def retrieve_events(
+        self,
+        conversation_id: Text,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        since: Optional[float] = None,
+        event_types: Optional[List[Text]] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialized events of a conversation across all sessions.
+
+        The filters are applied by the database. Events are fetched in batches
+        while they are consumed (see parent class for full docstring).
+        """
+        with self.session_scope() as session:
+            event_query = session.query(self.SQLEvent.data).filter(
+                self.SQLEvent.sender_id == conversation_id
+            )
+            if since is not None:
+                event_query = event_query.filter(self.SQLEvent.timestamp > since)
+            if event_types:
+                event_query = event_query.filter(
+                    self.SQLEvent.type_name.in_(event_types)
+                )
+
+            # the id is used as tie-breaker to keep the pagination stable
+            event_query = (
+                event_query.order_by(self.SQLEvent.timestamp, self.SQLEvent.id)
+                .offset(offset)
+                .limit(limit)
+                .yield_per(SQL_EVENT_BATCH_SIZE)
+            )
+
+            for (data,) in event_query:
+                yield json.loads(data)
+
     def _event_query(
         self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> "Query":
@@ -1137,6 +1230,26 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             return None
 
+    def retrieve_events(
+        self,
+        conversation_id: Text,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        since: Optional[float] = None,
+        event_types: Optional[List[Text]] = None,
+    ) -> Iterator[Dict[Text, Any]]:
+        """Retrieves the serialized events of a conversation across all sessions.
+
+        Events are retrieved from the primary tracker store. In case of errors,
+        no further events are returned (see parent class for full docstring).
+        """
+        try:
+            yield from self._tracker_store.retrieve_events(
+                conversation_id, offset, limit, since, event_types
+            )
+        except Exception as e:
+            self.on_tracker_store_error(e)
+
     def keys(self) -> Iterable[Text]:
         try:
             return self._tracker_store.keys()
@@ -1152,6 +1265,23 @@ class FailSafeTrackerStore(TrackerStore):
             self.fallback_tracker_store.save(tracker)
 
 
+def _filter_serialized_events(
+    events: Iterable[Dict[Text, Any]],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    since: Optional[float] = None,
+    event_types: Optional[List[Text]] = None,
+) -> Iterator[Dict[Text, Any]]:
+    """Filters serialized events (see `TrackerStore.retrieve_events`)."""
+    if since is not None:
+        events = (e for e in events if e.get("timestamp", 0) > since)
+    if event_types:
+        events = (e for e in events if e.get("event") in event_types)
+
+    stop = offset + limit if limit is not None else None
+    return itertools.islice(events, offset, stop)
+
+
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
     domain: Optional[Domain] = None,
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import abc
 import logging
+import hashlib
 import os
 import shutil
 import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Text, Any, Optional, Tuple, List
+from typing import Text, Any, Optional, Tuple, List, Dict
 
 from packaging import version
 from sqlalchemy.engine import URL
@@ -19,6 +21,7 @@ import rasa
 import rasa.model
 import rasa.utils.common
 import rasa.shared.utils.common
+import rasa.shared.utils.io
 from rasa.constants import MINIMUM_COMPATIBLE_VERSION
 import sqlalchemy as sa
 import sqlalchemy.orm
@@ -35,6 +38,7 @@ DEFAULT_CACHE_SIZE_MB = 1000
 CACHE_LOCATION_ENV = "RASA_CACHE_DIRECTORY"
 CACHE_DB_NAME_ENV = "RASA_CACHE_NAME"
 CACHE_SIZE_ENV = "RASA_MAX_CACHE_SIZE"
+SHARED_CACHE_LOCATION_ENV = "RASA_SHARED_CACHE_DIRECTORY"
 
 
 class TrainingCache(abc.ABC):
@@ -152,10 +156,11 @@ class LocalTrainingCache(TrainingCache):
 
         fingerprint_key = sa.Column(sa.String(), primary_key=True)
         output_fingerprint_key = sa.Column(sa.String(), nullable=False, index=True)
-        last_used = sa.Column(sa.DateTime(timezone=True), nullable=False)
+        last_used = sa.Column(sa.DateTime(timezone=True), nullable=False, index=True)
         rasa_version = sa.Column(sa.String(255), nullable=False)
         result_location = sa.Column(sa.String())
         result_type = sa.Column(sa.String())
+        size_in_mb = sa.Column(sa.Float(), nullable=False, default=0.0)
 
     def __init__(self) -> None:
         """Creates cache.
@@ -184,6 +189,11 @@ class LocalTrainingCache(TrainingCache):
 
         self._drop_cache_entries_from_incompatible_versions()
 
+        # Running total of the size of the cache directory. It is only calculated
+        # from disk once so that it also includes content which is not tracked in the
+        # database.
+        self._cache_size = self._calculate_cache_size()
+
     def _create_database(self) -> sqlalchemy.orm.sessionmaker:
         if self._is_disabled():
             # Use in-memory database as mock to avoid having to check `_is_disabled`
@@ -196,10 +206,41 @@ class LocalTrainingCache(TrainingCache):
         engine = sa.create_engine(
             URL.create(drivername="sqlite", database=database), future=True
         )
+        self._drop_cache_table_if_outdated(engine)
         self.Base.metadata.create_all(engine)
 
         return sa.orm.sessionmaker(engine)
 
+    def _drop_cache_table_if_outdated(self, engine: sa.engine.Engine) -> None:
+        """Drops the cache table if it was created without all required columns.
+
+        Caches which were created by previous Rasa versions don't track the size of
+        the cache entries. As their size can't be accounted for, the whole cache is
+        reset.
+        """
+        inspector = sa.inspect(engine)
+        if not inspector.has_table(self.CacheEntry.__tablename__):
+            return
+
+        existing_columns = {
+            column["name"]
+            for column in inspector.get_columns(self.CacheEntry.__tablename__)
+        }
+        if set(self.CacheEntry.__table__.columns.keys()).issubset(existing_columns):
+            return
+
+        logger.debug("Resetting the cache as it was created by an older Rasa version.")
+        self.CacheEntry.__table__.drop(engine)
+        self._purge_cache_dir_content()
+
+    def _calculate_cache_size(self) -> float:
+        if self._is_disabled():
+            return 0.0
+
+        return rasa.utils.common.directory_size_in_mb(
+            self._cache_location, filenames_to_exclude=[self._cache_database_name]
+        )
+
     def _drop_cache_entries_from_incompatible_versions(self) -> None:
         incompatible_entries = self._find_incompatible_cache_entries()
 
@@ -256,17 +297,20 @@ class LocalTrainingCache(TrainingCache):
         if self._is_disabled():
             return
 
-        cache_dir, output_type = None, None
+        cache_dir, output_type, output_size = None, None, 0.0
         if isinstance(output, Cacheable):
-            cache_dir, output_type = self._cache_output_to_disk(output, model_storage)
+            cache_dir, output_type, output_size = self._cache_output_to_disk(
+                output, model_storage
+            )
 
         try:
             self._add_cache_entry(
-                cache_dir, fingerprint_key, output_fingerprint, output_type
+                cache_dir, fingerprint_key, output_fingerprint, output_type, output_size
             )
         except OperationalError:
             if cache_dir:
                 shutil.rmtree(cache_dir)
+                self._cache_size -= output_size
 
             raise
 
@@ -276,8 +320,16 @@ class LocalTrainingCache(TrainingCache):
         fingerprint_key: Text,
         output_fingerprint: Text,
         output_type: Text,
+        output_size: float,
     ) -> None:
         with self._sessionmaker.begin() as session:
+            existing_entry = session.get(self.CacheEntry, fingerprint_key)
+            if existing_entry and existing_entry.result_location != cache_dir:
+                # The new entry replaces the previous one, so the previously cached
+                # result wouldn't be reachable anymore.
+                self._delete_cached_result(existing_entry)
+                self._cache_size -= existing_entry.size_in_mb
+
             cache_entry = self.CacheEntry(
                 fingerprint_key=fingerprint_key,
                 output_fingerprint_key=output_fingerprint,
@@ -285,6 +337,7 @@ class LocalTrainingCache(TrainingCache):
                 rasa_version=rasa.__version__,
                 result_location=cache_dir,
                 result_type=output_type,
+                size_in_mb=output_size,
             )
             session.merge(cache_entry)
 
@@ -293,7 +346,7 @@ class LocalTrainingCache(TrainingCache):
 
     def _cache_output_to_disk(
         self, output: Cacheable, model_storage: ModelStorage
-    ) -> Tuple[Optional[Text], Optional[Text]]:
+    ) -> Tuple[Optional[Text], Optional[Text], float]:
         # Use `TempDirectoryPath` instead of `tempfile.TemporaryDirectory` as this
         # leads to errors on Windows when the context manager tries to delete an
         # already deleted temporary directory (e.g. https://bugs.python.org/issue29982)
@@ -309,7 +362,7 @@ class LocalTrainingCache(TrainingCache):
                     f"Caching output of type '{type(output)}' failed with the "
                     f"following error:\n{e}"
                 )
-                return None, None
+                return None, None, 0.0
 
             output_size = rasa.utils.common.directory_size_in_mb(tmp_path)
             if output_size > self._max_cache_size:
@@ -318,50 +371,78 @@ class LocalTrainingCache(TrainingCache):
                     f"because it exceeds the maximum cache size of "
                     f"{self._max_cache_size} MiB."
                 )
-                return None, None
+                return None, None, 0.0
 
-            while (
-                rasa.utils.common.directory_size_in_mb(
-                    self._cache_location,
-                    filenames_to_exclude=[self._cache_database_name],
-                )
-                + output_size
-                > self._max_cache_size
-            ):
-                self._drop_least_recently_used_item()
+            required_space = self._cache_size + output_size - self._max_cache_size
+            if required_space > 0:
+                self._drop_least_recently_used_items(required_space)
 
             output_type = rasa.shared.utils.common.module_path_from_instance(output)
             cache_path = shutil.move(temp_dir, self._cache_location)
+            self._cache_size += output_size
+
+            return cache_path, output_type, output_size
 
-            return cache_path, output_type
+    def _drop_least_recently_used_items(self, required_space: float) -> None:
+        """Drops the least recently used cache entries to free the required space.
 
-    def _drop_least_recently_used_item(self) -> None:
+        Args:
+            required_space: The space (in MiB) which needs to be freed.
+        """
         with self._sessionmaker.begin() as session:
-            query_for_least_recently_used_entry = sa.select(self.CacheEntry).order_by(
-                self.CacheEntry.last_used.asc()
-            )
-            oldest_cache_item = (
-                session.execute(query_for_least_recently_used_entry).scalars().first()
-            )
+            query_for_least_recently_used_entries = sa.select(
+                self.CacheEntry.fingerprint_key,
+                self.CacheEntry.result_location,
+                self.CacheEntry.size_in_mb,
+            ).order_by(self.CacheEntry.last_used.asc())
+
+            entries_to_drop = []
+            freed_space = 0.0
+            for entry in session.execute(query_for_least_recently_used_entries):
+                entries_to_drop.append(entry)
+                freed_space += entry.size_in_mb
+                if freed_space >= required_space:
+                    break
+
+            purge_cache_dir = freed_space < required_space
+            if purge_cache_dir:
+                # Not even dropping all entries frees enough space, e.g. because the
+                # cache directory contains content which isn't tracked by the database.
+                session.execute(sa.delete(self.CacheEntry))
+            else:
+                for entry in entries_to_drop:
+                    self._delete_cached_result(entry)
+
+                fingerprint_keys_to_drop = [
+                    entry.fingerprint_key for entry in entries_to_drop
+                ]
+                session.execute(
+                    sa.delete(self.CacheEntry).where(
+                        self.CacheEntry.fingerprint_key.in_(fingerprint_keys_to_drop)
+                    )
+                )
+                self._cache_size -= freed_space
 
-            if not oldest_cache_item:
-                self._purge_cache_dir_content()
-                return
+                logger.debug(
+                    f"Deleted {len(entries_to_drop)} least recently used items with "
+                    f"fingerprints {fingerprint_keys_to_drop} to free space."
+                )
 
-            self._delete_cached_result(oldest_cache_item)
-            delete_query = sa.delete(self.CacheEntry).where(
-                self.CacheEntry.fingerprint_key == oldest_cache_item.fingerprint_key
-            )
-            session.execute(delete_query)
+        if purge_cache_dir:
+            # The directory is purged after the transaction was committed as the
+            # database keeps temporary files (e.g. its journal) in it until then.
+            self._purge_cache_dir_content()
+            self._cache_size = 0.0
 
             logger.debug(
-                f"Deleted item with fingerprint "
-                f"'{oldest_cache_item.fingerprint_key}' to free space."
+                f"Deleted all {len(entries_to_drop)} items and purged the cache "
+                f"directory to free space."
             )
 
     def _purge_cache_dir_content(self) -> None:
         for item in self._cache_location.glob("*"):
-            if item.name == self._cache_database_name:
+            # skips the database and its temporary files (e.g. `-journal` or `-wal`)
+            if item.name.startswith(self._cache_database_name):
                 continue
 
             if item.is_dir():
@@ -401,9 +482,7 @@ class LocalTrainingCache(TrainingCache):
             )
             return None
 
-        return self._load_from_cache(
-            result_location, result_type, node_name, model_storage
-        )
+        return _load_from_cache(result_location, result_type, node_name, model_storage)
 
     def _get_cached_result(
         self, output_fingerprint_key: Text
@@ -423,28 +502,229 @@ class LocalTrainingCache(TrainingCache):
 
             return None, None
 
-    @staticmethod
-    def _load_from_cache(
-        path_to_cached: Path,
-        result_type: Text,
-        node_name: Text,
+
+class SharedTrainingCache(TrainingCache):
+    """Caches training results in a location which is shared between machines.
+
+    This allows multiple machines (e.g. CI runners and developer machines) to re-use
+    each other's training results, e.g. by pointing the cache to a network file
+    system or a mounted object store. In contrast to `LocalTrainingCache`, no
+    database is used and all entries are plain files:
+
+    - `keys/<fingerprint key>.json` maps a fingerprint key to an output fingerprint.
+    - `outputs/<output fingerprint>.json` maps an output fingerprint to the content
+        hash and the type of the cached result.
+    - `objects/<content hash>/` contains the persisted `Cacheable`. Identical
+        results are only stored once, even if they were produced by different
+        graph nodes.
+
+    All files and directories are first written to a staging area and then moved
+    to their final location with an atomic rename. Concurrent training runs can
+    hence never observe (or corrupt) partially written cache entries.
+    """
+
+    KEYS_DIRECTORY = "keys"
+    OUTPUTS_DIRECTORY = "outputs"
+    OBJECTS_DIRECTORY = "objects"
+    STAGING_DIRECTORY = "tmp"
+
+    def __init__(self, location: Optional[Path] = None) -> None:
+        """Creates cache.
+
+        Args:
+            location: The shared cache location. Defaults to the value of the
+                `RASA_SHARED_CACHE_DIRECTORY` environment variable.
+        """
+        location = location or os.environ.get(SHARED_CACHE_LOCATION_ENV)
+        if not location:
+            raise ValueError(
+                f"No location for the shared cache was given. Please specify it "
+                f"using the '{SHARED_CACHE_LOCATION_ENV}' environment variable."
+            )
+
+        self._location = Path(location)
+        for directory in [
+            self.KEYS_DIRECTORY,
+            self.OUTPUTS_DIRECTORY,
+            self.OBJECTS_DIRECTORY,
+            self.STAGING_DIRECTORY,
+        ]:
+            (self._location / directory).mkdir(parents=True, exist_ok=True)
+
+    def cache_output(
+        self,
+        fingerprint_key: Text,
+        output: Any,
+        output_fingerprint: Text,
         model_storage: ModelStorage,
-    ) -> Optional[Cacheable]:
+    ) -> None:
+        """Adds the output to the cache (see parent class for full docstring)."""
+        if isinstance(output, Cacheable):
+            self._cache_output_to_shared_location(
+                output, output_fingerprint, model_storage
+            )
+
+        self._write_entry(
+            self._location / self.KEYS_DIRECTORY / f"{fingerprint_key}.json",
+            {"output_fingerprint_key": output_fingerprint},
+        )
+
+    def _cache_output_to_shared_location(
+        self, output: Cacheable, output_fingerprint: Text, model_storage: ModelStorage
+    ) -> None:
+        staging_directory = self._new_staging_path()
+        staging_directory.mkdir()
         try:
-            module = rasa.shared.utils.common.class_from_module_path(result_type)
+            output.to_cache(staging_directory, model_storage)
+            logger.debug(f"Caching output of type '{type(output)}' succeeded.")
+        except Exception as e:
+            logger.error(
+                f"Caching output of type '{type(output)}' failed with the "
+                f"following error:\n{e}"
+            )
+            shutil.rmtree(staging_directory, ignore_errors=True)
+            return
 
-            if not isinstance(module, Cacheable):
-                logger.warning(
-                    "Failed to restore a non cacheable module from cache. "
-                    "Please implement the 'Cacheable' interface for module "
-                    f"'{result_type}'."
-                )
-                return None
+        content_hash = _directory_content_hash(staging_directory)
+        object_directory = self._location / self.OBJECTS_DIRECTORY / content_hash
+        try:
+            # Renaming a directory is atomic and fails if the target directory
+            # already exists and isn't empty.
+            staging_directory.rename(object_directory)
+        except OSError:
+            if not object_directory.is_dir():
+                shutil.rmtree(staging_directory, ignore_errors=True)
+                raise
 
-            return module.from_cache(node_name, path_to_cached, model_storage)
+            logger.debug(
+                f"Result with content hash '{content_hash}' is already cached. "
+                f"Re-using the existing result."
+            )
+            shutil.rmtree(staging_directory, ignore_errors=True)
+
+        self._write_entry(
+            self._location / self.OUTPUTS_DIRECTORY / f"{output_fingerprint}.json",
+            {
+                "content_hash": content_hash,
+                "result_type": rasa.shared.utils.common.module_path_from_instance(
+                    output
+                ),
+            },
+        )
+
+    def _new_staging_path(self) -> Path:
+        return self._location / self.STAGING_DIRECTORY / uuid.uuid4().hex
+
+    def _write_entry(self, path: Path, entry: Dict[Text, Any]) -> None:
+        staging_file = self._new_staging_path()
+        rasa.shared.utils.io.dump_obj_as_json_to_file(
+            staging_file, {**entry, "rasa_version": rasa.__version__}
+        )
+        # `os.replace` atomically overwrites potentially existing entries.
+        os.replace(staging_file, path)
+
+    @staticmethod
+    def _read_entry(path: Path) -> Optional[Dict[Text, Any]]:
+        if not path.is_file():
+            return None
+
+        try:
+            entry = rasa.shared.utils.io.read_json_file(path)
         except Exception as e:
+            logger.debug(f"Failed to read cache entry '{path}'. Error:\n{e}")
+            return None
+
+        if version.parse(entry.get("rasa_version", "0.0.0")) < version.parse(
+            MINIMUM_COMPATIBLE_VERSION
+        ):
+            logger.debug(
+                f"Ignoring cache entry '{path}' as it was created by the "
+                f"incompatible Rasa version '{entry.get('rasa_version')}'."
+            )
+            return None
+
+        return entry
+
+    def get_cached_output_fingerprint(self, fingerprint_key: Text) -> Optional[Text]:
+        """Returns cached output fingerprint (see parent class for full docstring)."""
+        entry = self._read_entry(
+            self._location / self.KEYS_DIRECTORY / f"{fingerprint_key}.json"
+        )
+        if not entry:
+            return None
+
+        return entry["output_fingerprint_key"]
+
+    def get_cached_result(
+        self, output_fingerprint_key: Text, node_name: Text, model_storage: ModelStorage
+    ) -> Optional[Cacheable]:
+        """Returns a potentially cached output (see parent class for full docstring)."""
+        entry = self._read_entry(
+            self._location / self.OUTPUTS_DIRECTORY / f"{output_fingerprint_key}.json"
+        )
+        if not entry:
+            logger.debug(f"No cached output found for '{output_fingerprint_key}'")
+            return None
+
+        object_directory = (
+            self._location / self.OBJECTS_DIRECTORY / entry["content_hash"]
+        )
+        if not object_directory.is_dir():
+            logger.debug(
+                f"Cached output for '{output_fingerprint_key}' can't be found on disk."
+            )
+            return None
+
+        return _load_from_cache(
+            object_directory, entry["result_type"], node_name, model_storage
+        )
+
+
+def _directory_content_hash(directory: Path) -> Text:
+    """Calculates a hash of the content of a directory.
+
+    Args:
+        directory: The directory.
+
+    Returns:
+        A hash which only depends on the relative paths and the content of the files
+        within the directory.
+    """
+    content_hash = hashlib.sha256()
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+
+        content_hash.update(path.relative_to(directory).as_posix().encode())
+        content_hash.update(f":{path.stat().st_size}:".encode())
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1_048_576), b""):
+                content_hash.update(chunk)
+
+    return content_hash.hexdigest()
+
+
+def _load_from_cache(
+    path_to_cached: Path,
+    result_type: Text,
+    node_name: Text,
+    model_storage: ModelStorage,
+) -> Optional[Cacheable]:
+    try:
+        module = rasa.shared.utils.common.class_from_module_path(result_type)
+
+        if not isinstance(module, Cacheable):
             logger.warning(
-                f"Failed to restore cached output of type '{result_type}' from "
-                f"cache. Error:\n{e}"
+                "Failed to restore a non cacheable module from cache. "
+                "Please implement the 'Cacheable' interface for module "
+                f"'{result_type}'."
             )
             return None
+
+        return module.from_cache(node_name, path_to_cached, model_storage)
+    except Exception as e:
+        logger.warning(
+            f"Failed to restore cached output of type '{result_type}' from "
+            f"cache. Error:\n{e}"
+        )
+        return None
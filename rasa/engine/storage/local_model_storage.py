@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import io
+import json
 import logging
+import os
 import shutil
 import tarfile
 import tempfile
+import threading
+import time
 import uuid
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Text, ContextManager, Tuple, Union
+from typing import Text, ContextManager, Tuple, Union, Optional, Dict, List
 
 import rasa.utils.common
 import rasa.shared.utils.io
@@ -26,13 +32,41 @@ MODEL_ARCHIVE_TRAIN_SCHEMA_FILE = "train_schema.yml"
 MODEL_ARCHIVE_PREDICT_SCHEMA_FILE = "predict_schema.yml"
 MODEL_ARCHIVE_METADATA_FILE = "metadata.json"
 
+# Allows to configure the compression of model archives. Uncompressed model archives
+# are larger but don't need to be fully extracted when loading the model. Instead,
+# the data of each resource is only extracted once it's requested.
+MODEL_ARCHIVE_COMPRESSION_ENV = "RASA_MODEL_ARCHIVE_COMPRESSION"
+MODEL_ARCHIVE_COMPRESSION_GZ = "gz"
+MODEL_ARCHIVE_COMPRESSION_NONE = "none"
+DEFAULT_MODEL_ARCHIVE_COMPRESSION = MODEL_ARCHIVE_COMPRESSION_GZ
+SUPPORTED_MODEL_ARCHIVE_COMPRESSIONS = {
+    MODEL_ARCHIVE_COMPRESSION_GZ: "w:gz",
+    MODEL_ARCHIVE_COMPRESSION_NONE: "w:",
+}
+
 
 class LocalModelStorage(ModelStorage):
     """Stores and provides output of `GraphComponents` on local disk."""
 
-    def __init__(self, storage_path: Path) -> None:
-        """Creates storage (see parent class for full docstring)."""
+    def __init__(
+        self,
+        storage_path: Path,
+        model_archive_path: Optional[Union[Text, Path]] = None,
+        archived_resources: Optional[Dict[Text, List[tarfile.TarInfo]]] = None,
+    ) -> None:
+        """Creates storage (see parent class for full docstring).
+
+        Args:
+            storage_path: Directory which will contain the persisted graph components.
+            model_archive_path: An uncompressed model archive whose resources are
+                extracted on demand.
+            archived_resources: The archive members of each resource which wasn't
+                extracted from `model_archive_path` yet.
+        """
         self._storage_path = storage_path
+        self._model_archive_path = model_archive_path
+        self._archived_resources = archived_resources or {}
+        self._extraction_lock = threading.Lock()
 
     @classmethod
     def create(cls, storage_path: Path) -> ModelStorage:
@@ -51,6 +85,11 @@ class LocalModelStorage(ModelStorage):
                 f"empty model storage."
             )
 
+        if cls._is_uncompressed_archive(model_archive_path):
+            return cls._from_uncompressed_model_archive(
+                storage_path, model_archive_path
+            )
+
         with tempfile.TemporaryDirectory() as temporary_directory:
             temporary_directory = Path(temporary_directory)
 
@@ -68,11 +107,53 @@ class LocalModelStorage(ModelStorage):
                 metadata,
             )
 
+    @staticmethod
+    def _is_uncompressed_archive(model_archive_path: Union[Text, Path]) -> bool:
+        try:
+            with tarfile.open(model_archive_path, mode="r:"):
+                return True
+        except tarfile.ReadError:
+            return False
+
+    @classmethod
+    def _from_uncompressed_model_archive(
+        cls, storage_path: Path, model_archive_path: Union[Text, Path]
+    ) -> Tuple[LocalModelStorage, ModelMetadata]:
+        archived_resources = defaultdict(list)
+        metadata = None
+
+        # Reading the member headers of an uncompressed archive only requires seeking
+        # through the file and doesn't read any of the actual resource data.
+        with tarfile.open(model_archive_path, mode="r:") as tar:
+            for member in tar:
+                parts = Path(member.name).parts
+                if len(parts) > 1 and parts[0] == MODEL_ARCHIVE_COMPONENTS_DIR:
+                    archived_resources[parts[1]].append(member)
+                elif member.name == MODEL_ARCHIVE_METADATA_FILE:
+                    serialized_metadata = json.load(tar.extractfile(member))
+                    metadata = ModelMetadata.from_dict(serialized_metadata)
+
+        if not metadata:
+            raise ValueError(
+                f"The model archive '{model_archive_path}' does not contain the "
+                f"model metadata."
+            )
+
+        logger.debug(
+            f"Indexed {len(archived_resources)} resources of model archive "
+            f"'{model_archive_path}'. They will be extracted when they are requested."
+        )
+
+        return (
+            cls(storage_path, model_archive_path, dict(archived_resources)),
+            metadata,
+        )
+
     @staticmethod
     def _extract_archive_to_directory(
         model_archive_path: Union[Text, Path], temporary_directory: Union[Text, Path],
     ) -> None:
-        with tarfile.open(model_archive_path, mode="r:gz") as tar:
+        with tarfile.open(model_archive_path, mode="r:*") as tar:
             tar.extractall(temporary_directory)
 
     @staticmethod
@@ -96,6 +177,7 @@ class LocalModelStorage(ModelStorage):
     def write_to(self, resource: Resource) -> ContextManager[Path]:
         """Persists data for a resource (see parent class for full docstring)."""
         logger.debug(f"Resource '{resource.name}' was requested for writing.")
+        self._extract_archived_resource(resource.name)
         directory = self._directory_for_resource(resource)
 
         if not directory.exists():
@@ -108,10 +190,37 @@ class LocalModelStorage(ModelStorage):
     def _directory_for_resource(self, resource: Resource) -> Path:
         return self._storage_path / resource.name
 
+    def _extract_archived_resource(self, resource_name: Text) -> None:
+        if resource_name not in self._archived_resources:
+            return
+
+        with self._extraction_lock:
+            members = self._archived_resources.pop(resource_name, None)
+            if members is None:
+                # Another thread extracted the resource in the meantime.
+                return
+
+            # Extract to a temporary directory first so that the resource directory
+            # never contains partially extracted data.
+            with tempfile.TemporaryDirectory(dir=self._storage_path) as temp_dir:
+                with tarfile.open(self._model_archive_path, mode="r:") as tar:
+                    tar.extractall(temp_dir, members=members)
+
+                os.replace(
+                    Path(temp_dir, MODEL_ARCHIVE_COMPONENTS_DIR, resource_name),
+                    self._storage_path / resource_name,
+                )
+
+        logger.debug(
+            f"Extracted resource '{resource_name}' from model archive "
+            f"'{self._model_archive_path}'."
+        )
+
     @contextmanager
     def read_from(self, resource: Resource) -> ContextManager[Path]:
         """Provides the data of a `Resource` (see parent class for full docstring)."""
         logger.debug(f"Resource '{resource.name}' was requested for reading.")
+        self._extract_archived_resource(resource.name)
         directory = self._directory_for_resource(resource)
 
         if not directory.exists():
@@ -136,31 +245,49 @@ class LocalModelStorage(ModelStorage):
         """Creates model package (see parent class for full docstring)."""
         logger.debug(f"Start to created model package for path '{model_archive_path}'.")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temporary_directory = Path(temp_dir)
+        # Resources which are still archived need to be packaged as well
+        for resource_name in list(self._archived_resources.keys()):
+            self._extract_archived_resource(resource_name)
 
-            shutil.copytree(
-                self._storage_path, temporary_directory / MODEL_ARCHIVE_COMPONENTS_DIR
-            )
-
-            model_metadata = self._create_model_metadata(
-                domain, predict_schema, train_schema
-            )
-            self._persist_metadata(model_metadata, temporary_directory)
+        model_metadata = self._create_model_metadata(
+            domain, predict_schema, train_schema
+        )
 
-            with tarfile.open(model_archive_path, "w:gz") as tar:
-                tar.add(temporary_directory, arcname="")
+        # Resources are streamed into the archive directly from the model storage
+        # without creating an intermediate copy.
+        with tarfile.open(model_archive_path, self._archive_write_mode()) as tar:
+            self._persist_metadata(model_metadata, tar)
+            tar.add(self._storage_path, arcname=MODEL_ARCHIVE_COMPONENTS_DIR)
 
         logger.debug(f"Model package created in path '{model_archive_path}'.")
 
         return model_metadata
 
     @staticmethod
-    def _persist_metadata(metadata: ModelMetadata, temporary_directory: Path,) -> None:
+    def _archive_write_mode() -> Text:
+        compression = os.environ.get(
+            MODEL_ARCHIVE_COMPRESSION_ENV, DEFAULT_MODEL_ARCHIVE_COMPRESSION
+        ).lower()
 
-        rasa.shared.utils.io.dump_obj_as_json_to_file(
-            temporary_directory / MODEL_ARCHIVE_METADATA_FILE, metadata.as_dict()
-        )
+        if compression not in SUPPORTED_MODEL_ARCHIVE_COMPRESSIONS:
+            raise ValueError(
+                f"Invalid model archive compression '{compression}'. Please set the "
+                f"environment variable '{MODEL_ARCHIVE_COMPRESSION_ENV}' to one of "
+                f"{sorted(SUPPORTED_MODEL_ARCHIVE_COMPRESSIONS.keys())}."
+            )
+
+        return SUPPORTED_MODEL_ARCHIVE_COMPRESSIONS[compression]
+
+    @staticmethod
+    def _persist_metadata(metadata: ModelMetadata, tar: tarfile.TarFile) -> None:
+        serialized_metadata = rasa.shared.utils.io.json_to_string(
+            metadata.as_dict()
+        ).encode(rasa.shared.utils.io.DEFAULT_ENCODING)
+
+        member = tarfile.TarInfo(MODEL_ARCHIVE_METADATA_FILE)
+        member.size = len(serialized_metadata)
+        member.mtime = int(time.time())
+        tar.addfile(member, io.BytesIO(serialized_metadata))
 
     @staticmethod
     def _create_model_metadata(
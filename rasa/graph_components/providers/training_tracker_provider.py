@@ -1,4 +1,6 @@
 from __future__ import annotations
+from pathlib import Path
+import pickle
 from typing import Dict, Text, Any, List
 
 from rasa.engine.graph import GraphComponent, ExecutionContext
@@ -8,6 +10,77 @@ from rasa.shared.core.domain import Domain
 from rasa.shared.core.generator import TrackerWithCachedStates, TrainingDataGenerator
 from rasa.shared.core.training_data.structures import StoryGraph
 
+TRACKERS_FILE_NAME = "trackers.pkl"
+
+
+class TrainingTrackers(List[TrackerWithCachedStates]):
+    """A list of training trackers which can be stored in the training cache.
+
+    This allows skipping the tracker generation if only nodes which consume the
+    trackers (e.g. policies) need to re-run.
+    """
+
+    def to_cache(self, directory: Path, model_storage: ModelStorage) -> None:
+        """Persists the trackers to the cache.
+
+        Only the events of the trackers are persisted. Trackers which were created
+        from the same story share their event objects, which are pickled only once.
+
+        Args:
+            directory: The directory which receives the persisted trackers.
+            model_storage: The current model storage (unused).
+        """
+        persisted = {
+            "slots": list(self[0].slots.values()) if self else [],
+            "trackers": [
+                {
+                    "sender_id": tracker.sender_id,
+                    "max_event_history": tracker._max_event_history,
+                    "is_augmented": tracker.is_augmented,
+                    "is_rule_tracker": tracker.is_rule_tracker,
+                    "events": list(tracker.events),
+                }
+                for tracker in self
+            ],
+        }
+        with open(directory / TRACKERS_FILE_NAME, "wb") as f:
+            pickle.dump(persisted, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_cache(
+        cls, node_name: Text, directory: Path, model_storage: ModelStorage
+    ) -> TrainingTrackers:
+        """Loads trackers which were persisted to the cache.
+
+        The trackers are restored without a domain. They adopt the domain which
+        is used to featurize them.
+
+        Args:
+            node_name: The name of the graph node which wants to use the trackers.
+            directory: Directory containing the persisted trackers.
+            model_storage: The current model storage (unused).
+
+        Returns:
+            The restored trackers.
+        """
+        with open(directory / TRACKERS_FILE_NAME, "rb") as f:
+            persisted = pickle.load(f)
+
+        trackers = cls()
+        for persisted_tracker in persisted["trackers"]:
+            tracker = TrackerWithCachedStates(
+                persisted_tracker["sender_id"],
+                persisted["slots"],
+                persisted_tracker["max_event_history"],
+                is_augmented=persisted_tracker["is_augmented"],
+                is_rule_tracker=persisted_tracker["is_rule_tracker"],
+            )
+            for event in persisted_tracker["events"]:
+                tracker.update(event, skip_states=True)
+            trackers.append(tracker)
+
+        return trackers
+
 
 class TrainingTrackerProvider(GraphComponent):
     """Provides training trackers to policies based on training stories."""
@@ -52,4 +125,4 @@ class TrainingTrackerProvider(GraphComponent):
             The trackers which can be used to train dialogue policies.
         """
         generator = TrainingDataGenerator(story_graph, domain, **self._config)
-        return generator.generate()
+        return TrainingTrackers(generator.generate())
@@ -228,6 +228,8 @@ async def compare_nlu_models(
     output: Text,
     runs: int,
     exclusion_percentages: List[int],
+    num_processes: int = 1,
+    num_threads_per_process: Optional[int] = None,
 ) -> None:
     """Trains multiple models, compares them and saves the results."""
 
@@ -255,6 +257,8 @@ async def compare_nlu_models(
         model_names,
         output,
         runs,
+        num_processes=num_processes,
+        num_threads_per_process=num_threads_per_process,
     )
 
     f1_path = os.path.join(output, RESULTS_FILE)
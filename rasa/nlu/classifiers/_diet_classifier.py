@@ -97,6 +97,7 @@ from rasa.utils.tensorflow.constants import (
     CONCAT_DIMENSION,
     FEATURIZERS,
     CHECKPOINT_MODEL,
+    USE_TF_DATA_PIPELINE,
     SEQUENCE,
     SENTENCE,
     SEQUENCE_LENGTH,
@@ -249,6 +250,10 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         TENSORBOARD_LOG_LEVEL: "epoch",
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # If 'True' the training data is fed to the model by a `tf.data` pipeline,
+        # which creates the batches in parallel and groups examples of similar
+        # length into the same batch to reduce padding.
+        USE_TF_DATA_PIPELINE: False,
         # Specify what features to use as sequence and sentence features
         # By default all features in the pipeline are used.
         FEATURIZERS: [],
@@ -876,6 +881,7 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
             self.component_config[BATCH_STRATEGY],
             self.component_config[EVAL_NUM_EXAMPLES],
             self.component_config[RANDOM_SEED],
+            use_tf_data_pipeline=self.component_config[USE_TF_DATA_PIPELINE],
         )
         callbacks = train_utils.create_common_callbacks(
             self.component_config[EPOCHS],
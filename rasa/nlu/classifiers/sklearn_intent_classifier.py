@@ -118,14 +118,7 @@ class SklearnIntentClassifierGraphComponent(GraphComponent):
             return self._resource
 
         y = self.transform_labels_str2num(labels)
-        X = np.stack(
-            [
-                self._get_sentence_features(example)
-                for example in training_data.intent_examples
-            ]
-        )
-        # reduce dimensionality
-        X = np.reshape(X, (len(X), -1))
+        X = self._get_sentence_features_matrix(training_data.intent_examples)
 
         self.clf = self._create_classifier(num_threads, y)
 
@@ -149,6 +142,20 @@ class SklearnIntentClassifierGraphComponent(GraphComponent):
             "No sentence features present. Not able to train sklearn policy."
         )
 
+    @classmethod
+    def _get_sentence_features_matrix(cls, messages: List[Message]) -> np.ndarray:
+        """Stacks the sentence features of multiple messages.
+
+        Args:
+            messages: The messages to get the sentence features for.
+
+        Returns:
+            A matrix of shape `(len(messages), number of features)`.
+        """
+        X = np.stack([cls._get_sentence_features(message) for message in messages])
+        # reduce dimensionality
+        return np.reshape(X, (len(X), -1))
+
     def _num_cv_splits(self, y: np.ndarray) -> int:
         folds = self.component_config["max_cross_validation_folds"]
         return max(2, min(folds, np.min(np.bincount(y)) // 5))
@@ -183,35 +190,44 @@ class SklearnIntentClassifierGraphComponent(GraphComponent):
 
     def process(self, messages: List[Message]) -> List[Message]:
         """Return the most likely intent and its probability for a message."""
-        for message in messages:
-            if not self.clf:
-                # component is either not trained or didn't
-                # receive enough training data
-                intent = None
-                intent_ranking = []
-            else:
-                X = self._get_sentence_features(message).reshape(1, -1)
-
-                intent_ids, probabilities = self.predict(X)
-                intents = self.transform_labels_num2str(np.ravel(intent_ids))
-                # `predict` returns a matrix as it is supposed
-                # to work for multiple examples as well, hence we need to flatten
-                probabilities = probabilities.flatten()
-
-                if intents.size > 0 and probabilities.size > 0:
-                    ranking = list(zip(list(intents), list(probabilities)))[
-                        :LABEL_RANKING_LENGTH
-                    ]
-
-                    intent = {"name": intents[0], "confidence": probabilities[0]}
+        if not self.clf or not messages:
+            # component is either not trained or didn't
+            # receive enough training data
+            for message in messages:
+                message.set("intent", None, add_to_output=True)
+                message.set("intent_ranking", [], add_to_output=True)
+            return messages
+
+        # predict all messages at once as this is a lot faster than predicting
+        # them one by one
+        X = self._get_sentence_features_matrix(messages)
+        intent_ids, probabilities = self.predict(X)
+
+        intent_ids = intent_ids[:, :LABEL_RANKING_LENGTH]
+        probabilities = probabilities[:, :LABEL_RANKING_LENGTH].tolist()
+        intents = (
+            self.transform_labels_num2str(intent_ids.ravel())
+            .reshape(intent_ids.shape)
+            .tolist()
+        )
 
-                    intent_ranking = [
-                        {"name": intent_name, "confidence": score}
-                        for intent_name, score in ranking
-                    ]
-                else:
-                    intent = {"name": None, "confidence": 0.0}
-                    intent_ranking = []
+        for message, message_intents, message_probabilities in zip(
+            messages, intents, probabilities
+        ):
+            if message_intents and message_probabilities:
+                intent = {
+                    "name": message_intents[0],
+                    "confidence": message_probabilities[0],
+                }
+                intent_ranking = [
+                    {"name": intent_name, "confidence": score}
+                    for intent_name, score in zip(
+                        message_intents, message_probabilities
+                    )
+                ]
+            else:
+                intent = {"name": None, "confidence": 0.0}
+                intent_ranking = []
 
             message.set("intent", intent, add_to_output=True)
             message.set("intent_ranking", intent_ranking, add_to_output=True)
@@ -233,15 +249,18 @@ class SklearnIntentClassifierGraphComponent(GraphComponent):
 
         Return only the most likely label.
 
-        :param X: bow of input text
-        :return: tuple of first, the most probable label and second,
-                 its probability.
+        :param X: bow of input texts
+        :return: tuple of first, the labels sorted by their probability and
+                 second, their probabilities. Both have one row per input text.
         """
         pred_result = self.predict_prob(X)
         # sort the probabilities retrieving the indices of
         # the elements in sorted order
         sorted_indices = np.fliplr(np.argsort(pred_result, axis=1))
-        return sorted_indices, pred_result[:, sorted_indices]
+        return (
+            sorted_indices,
+            np.take_along_axis(pred_result, sorted_indices, axis=1),
+        )
 
     def persist(self) -> None:
         """Persist this model into the passed directory."""
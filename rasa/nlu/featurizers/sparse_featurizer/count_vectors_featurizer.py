@@ -1,13 +1,14 @@
 import logging
 import os
 import re
+import numpy as np
 import scipy.sparse
-from typing import Any, Dict, List, Optional, Text, Type, Tuple, Set
+from typing import Any, Dict, List, Optional, Text, Type, Tuple, Set, Union
 
 import rasa.shared.utils.io
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 import rasa.utils.io as io_utils
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.tokenizers.tokenizer import Tokenizer
 from rasa.nlu.components import Component
@@ -91,6 +92,9 @@ class CountVectorsFeaturizer(SparseFeaturizer):
         "use_lemma": True,
         # Additional vocabulary size to be kept reserved for finetuning
         "additional_vocabulary_size": {TEXT: None, RESPONSE: None, ACTION_TEXT: None},
+        # if set, use sklearn's `HashingVectorizer` with this number of features
+        # instead of building a vocabulary (useful for very large vocabularies)
+        "hashing_n_features": None,  # int or None
     }
 
     @classmethod
@@ -131,6 +135,9 @@ class CountVectorsFeaturizer(SparseFeaturizer):
         # use the lemma of the words or not
         self.use_lemma = self.component_config["use_lemma"]
 
+        # hash tokens into a fixed number of features instead of using a vocabulary
+        self.hashing_n_features = self.component_config["hashing_n_features"]
+
     def _load_vocabulary_params(self) -> None:
         self.OOV_token = self.component_config["OOV_token"]
 
@@ -172,6 +179,27 @@ class CountVectorsFeaturizer(SparseFeaturizer):
         except (AttributeError, TypeError, KeyError):
             return None
 
+    def _uses_hashing(self) -> bool:
+        return self.hashing_n_features is not None
+
+    def _is_vectorizer_trained(self, attribute: Text) -> bool:
+        if self._uses_hashing():
+            # Hashing vectorizers don't need to be trained. A vectorizer is only
+            # created for attributes which were present in the training data.
+            return attribute in self.vectorizers
+        return self._get_attribute_vocabulary(attribute) is not None
+
+    def _check_hashing_parameters(self) -> None:
+        if not self._uses_hashing():
+            return
+
+        if self.max_features is not None or self.min_df != 1 or self.max_df != 1.0:
+            logger.warning(
+                "The parameter 'hashing_n_features' is set. Since no vocabulary "
+                "is built, the parameters 'min_df', 'max_df', and 'max_features' "
+                "will be ignored."
+            )
+
     def _check_analyzer(self) -> None:
         if self.analyzer != "word":
             if self.OOV_token is not None:
@@ -218,6 +246,7 @@ class CountVectorsFeaturizer(SparseFeaturizer):
 
         # warn that some of config parameters might be ignored
         self._check_analyzer()
+        self._check_hashing_parameters()
 
         # set which attributes to featurize
         self._attributes = self._attributes_for(self.analyzer)
@@ -445,6 +474,7 @@ class CountVectorsFeaturizer(SparseFeaturizer):
                     "min_df": self.min_df,
                     "max_features": self.max_features,
                     "analyzer": self.analyzer,
+                    "hashing_n_features": self.hashing_n_features,
                 }
             )
             self._fit_vectorizer_from_scratch(TEXT, combined_cleaned_texts)
@@ -468,6 +498,7 @@ class CountVectorsFeaturizer(SparseFeaturizer):
                     "min_df": self.min_df,
                     "max_features": self.max_features,
                     "analyzer": self.analyzer,
+                    "hashing_n_features": self.hashing_n_features,
                 }
             )
         for attribute in self._attributes:
@@ -485,6 +516,10 @@ class CountVectorsFeaturizer(SparseFeaturizer):
                     f"No text provided for {attribute} attribute in any messages of "
                     f"training data. Skipping training a CountVectorizer for it."
                 )
+                if self._uses_hashing() and not self.finetune_mode:
+                    # Hashing vectorizers would featurize the attribute even though
+                    # it's not part of the training data.
+                    del self.vectorizers[attribute]
 
     def _log_vocabulary_stats(self, attribute: Text) -> None:
         """Logs number of vocabulary items that were created for a specified attribute.
@@ -492,7 +527,12 @@ class CountVectorsFeaturizer(SparseFeaturizer):
         Args:
             attribute: Message attribute for which vocabulary stats are logged.
         """
-        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+        if self._uses_hashing():
+            logger.info(
+                f"Tokens of {attribute} attribute are hashed into "
+                f"{self.hashing_n_features} features."
+            )
+        elif attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
             vocabulary_size = len(self.vectorizers[attribute].vocabulary_)
             logger.info(
                 f"{vocabulary_size} vocabulary items "
@@ -511,6 +551,10 @@ class CountVectorsFeaturizer(SparseFeaturizer):
             attribute: Message attribute for which the vectorizer is to be trained.
             attribute_texts: Training texts for the attribute
         """
+        if self._uses_hashing():
+            # Hashing vectorizers don't have a vocabulary which needs to be updated.
+            return
+
         # Get vocabulary words by the preprocessor
         new_vocabulary = self._construct_vocabulary_from_texts(
             self.vectorizers[attribute], attribute_texts
@@ -545,49 +589,96 @@ class CountVectorsFeaturizer(SparseFeaturizer):
         if not self.vectorizers.get(attribute):
             return [None], [None]
 
-        sequence_features = []
-        sentence_features = []
-
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        # messages without tokens (e.g. attribute is not set) aren't featurized
+        sequence_features = [None] * len(all_tokens)
+        sentence_features = [None] * len(all_tokens)
 
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
+        message_indices = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not message_indices:
+            return sequence_features, sentence_features
 
-            seq_vec = self.vectorizers[attribute].transform(tokens)
-            seq_vec.sort_indices()
+        message_tokens = [all_tokens[i] for i in message_indices]
+        token_boundaries = np.cumsum([0] + [len(tokens) for tokens in message_tokens])
 
-            sequence_features.append(seq_vec.tocoo())
+        # Transform the tokens of all messages with a single call. The result is a
+        # sparse matrix of size [total number of tokens, n_features] whose rows are
+        # split up into the sequence features of the individual messages.
+        all_sequence_vectors = self.vectorizers[attribute].transform(
+            [token for tokens in message_tokens for token in tokens]
+        )
+        all_sequence_vectors.sort_indices()
 
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
-                sentence_vec.sort_indices()
+        for i, start, end in zip(
+            message_indices, token_boundaries[:-1], token_boundaries[1:]
+        ):
+            sequence_features[i] = all_sequence_vectors[start:end].tocoo()
 
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            all_sentence_vectors = self._create_sentence_vectors(
+                attribute, message_tokens, all_sequence_vectors, token_boundaries
+            )
+            for row, i in enumerate(message_indices):
+                sentence_features[i] = all_sentence_vectors[row].tocoo()
 
         return sequence_features, sentence_features
 
+    def _sentence_vectors_are_sum_of_token_vectors(self) -> bool:
+        # Word unigrams never span multiple tokens. Hence, the counts of a
+        # message are the sum of the counts of its tokens. This doesn't hold for
+        # n-grams or character analyzers as these can include neighbouring tokens.
+        return self.analyzer == "word" and self.max_ngram == 1
+
+    def _create_sentence_vectors(
+        self,
+        attribute: Text,
+        message_tokens: List[List[Text]],
+        all_sequence_vectors: scipy.sparse.csr_matrix,
+        token_boundaries: np.ndarray,
+    ) -> scipy.sparse.csr_matrix:
+        """Creates the sentence features for multiple messages.
+
+        Args:
+            attribute: The message attribute which is featurized.
+            message_tokens: The tokens of each message.
+            all_sequence_vectors: The sequence features of all messages.
+            token_boundaries: The start and end row of each message in
+                `all_sequence_vectors`.
+
+        Returns:
+            A sparse matrix with the sentence features of each message as row.
+        """
+        if self._sentence_vectors_are_sum_of_token_vectors():
+            # Sum up the rows of each message using a sparse matrix which maps
+            # each token to its message.
+            num_tokens = token_boundaries[-1]
+            token_to_message = scipy.sparse.csr_matrix(
+                (
+                    np.ones(num_tokens, dtype=all_sequence_vectors.dtype),
+                    (
+                        np.repeat(
+                            np.arange(len(message_tokens)), np.diff(token_boundaries)
+                        ),
+                        np.arange(num_tokens),
+                    ),
+                ),
+                shape=(len(message_tokens), num_tokens),
+            )
+            all_sentence_vectors = token_to_message.dot(all_sequence_vectors)
+        else:
+            all_sentence_vectors = self.vectorizers[attribute].transform(
+                [" ".join(tokens) for tokens in message_tokens]
+            )
+
+        all_sentence_vectors.sort_indices()
+        return all_sentence_vectors
+
     def _get_featurized_attribute(
         self, attribute: Text, all_tokens: List[List[Text]]
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
         """Returns features of a particular attribute for complete data."""
-        if self._get_attribute_vocabulary(attribute) is not None:
+        if self._is_vectorizer_trained(attribute):
             # count vectorizer was trained
             return self._create_features(attribute, all_tokens)
         else:
@@ -721,7 +812,12 @@ class CountVectorsFeaturizer(SparseFeaturizer):
 
         file_name = file_name + ".pkl"
 
-        if self.vectorizers:
+        if self.vectorizers and self._uses_hashing():
+            # Hashing vectorizers don't have a vocabulary. Only persist for which
+            # attributes they were created.
+            featurizer_file = os.path.join(model_dir, file_name)
+            io_utils.json_pickle(featurizer_file, sorted(self.vectorizers.keys()))
+        elif self.vectorizers:
             # vectorizer instance was not None, some models could have been trained
             attribute_vocabularies = self._collect_vectorizer_vocabularies()
             if self._is_any_model_trained(attribute_vocabularies):
@@ -739,14 +835,30 @@ class CountVectorsFeaturizer(SparseFeaturizer):
 
         return {"file": file_name}
 
-    @classmethod
-    def _create_shared_vocab_vectorizers(
-        cls, parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
-    ) -> Dict[Text, CountVectorizer]:
-        """Create vectorizers for all attributes with shared vocabulary"""
+    @staticmethod
+    def _create_vectorizer(
+        parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
+    ) -> Union[CountVectorizer, HashingVectorizer]:
+        """Creates a single vectorizer with the given parameters."""
+        token_pattern = r"(?u)\b\w+\b" if parameters["analyzer"] == "word" else None
+
+        if parameters.get("hashing_n_features") is not None:
+            return HashingVectorizer(
+                token_pattern=token_pattern,
+                strip_accents=parameters["strip_accents"],
+                lowercase=parameters["lowercase"],
+                stop_words=parameters["stop_words"],
+                ngram_range=(parameters["min_ngram"], parameters["max_ngram"]),
+                analyzer=parameters["analyzer"],
+                n_features=parameters["hashing_n_features"],
+                # return plain token counts like the `CountVectorizer`
+                norm=None,
+                alternate_sign=False,
+                dtype=np.int64,
+            )
 
-        shared_vectorizer = CountVectorizer(
-            token_pattern=r"(?u)\b\w+\b" if parameters["analyzer"] == "word" else None,
+        return CountVectorizer(
+            token_pattern=token_pattern,
             strip_accents=parameters["strip_accents"],
             lowercase=parameters["lowercase"],
             stop_words=parameters["stop_words"],
@@ -758,6 +870,18 @@ class CountVectorsFeaturizer(SparseFeaturizer):
             vocabulary=vocabulary,
         )
 
+    @classmethod
+    def _create_shared_vocab_vectorizers(
+        cls, parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
+    ) -> Dict[Text, Union[CountVectorizer, HashingVectorizer]]:
+        """Create vectorizers for all attributes with shared vocabulary"""
+
+        if parameters.get("hashing_n_features") is not None:
+            # the persisted "vocabulary" is the list of featurized attributes
+            vocabulary = None
+
+        shared_vectorizer = cls._create_vectorizer(parameters, vocabulary)
+
         attribute_vectorizers = {}
 
         for attribute in cls._attributes_for(parameters["analyzer"]):
@@ -768,30 +892,26 @@ class CountVectorsFeaturizer(SparseFeaturizer):
     @classmethod
     def _create_independent_vocab_vectorizers(
         cls, parameters: Dict[Text, Any], vocabulary: Optional[Any] = None
-    ) -> Dict[Text, CountVectorizer]:
+    ) -> Dict[Text, Union[CountVectorizer, HashingVectorizer]]:
         """Create vectorizers for all attributes with independent vocabulary"""
 
         attribute_vectorizers = {}
 
         for attribute in cls._attributes_for(parameters["analyzer"]):
 
+            if parameters.get("hashing_n_features") is not None:
+                # the persisted "vocabulary" is the list of featurized attributes
+                if vocabulary is None or attribute in vocabulary:
+                    attribute_vectorizers[attribute] = cls._create_vectorizer(
+                        parameters
+                    )
+                continue
+
             attribute_vocabulary = vocabulary[attribute] if vocabulary else None
 
-            attribute_vectorizer = CountVectorizer(
-                token_pattern=r"(?u)\b\w+\b"
-                if parameters["analyzer"] == "word"
-                else None,
-                strip_accents=parameters["strip_accents"],
-                lowercase=parameters["lowercase"],
-                stop_words=parameters["stop_words"],
-                ngram_range=(parameters["min_ngram"], parameters["max_ngram"]),
-                max_df=parameters["max_df"],
-                min_df=parameters["min_df"],
-                max_features=parameters["max_features"],
-                analyzer=parameters["analyzer"],
-                vocabulary=attribute_vocabulary,
+            attribute_vectorizers[attribute] = cls._create_vectorizer(
+                parameters, attribute_vocabulary
             )
-            attribute_vectorizers[attribute] = attribute_vectorizer
 
         return attribute_vectorizers
 
@@ -829,6 +949,7 @@ class CountVectorsFeaturizer(SparseFeaturizer):
 
         # make sure the vocabulary has been loaded correctly
         for attribute in vectorizers:
-            ftr.vectorizers[attribute]._validate_vocabulary()
+            if isinstance(ftr.vectorizers[attribute], CountVectorizer):
+                ftr.vectorizers[attribute]._validate_vocabulary()
 
         return ftr
@@ -23,8 +23,11 @@ from rasa.nlu.classifiers.diet_classifier import (
     SENTENCE,
     SEQUENCE,
 )
+from rasa.nlu.classifiers import LABEL_RANKING_LENGTH
 from rasa.nlu.extractors.extractor import EntityTagSpec
+from rasa.utils import train_utils
 from rasa.utils.tensorflow import rasa_layers
+from rasa.utils.tensorflow.label_index import LabelIndex
 from rasa.utils.tensorflow.constants import (
     LABEL,
     HIDDEN_LAYERS_SIZES,
@@ -73,10 +76,16 @@ from rasa.utils.tensorflow.constants import (
     CONCAT_DIMENSION,
     FEATURIZERS,
     CHECKPOINT_MODEL,
+    USE_TF_DATA_PIPELINE,
     DENSE_DIMENSION,
     CONSTRAIN_SIMILARITIES,
     MODEL_CONFIDENCE,
     SOFTMAX,
+    LABEL_INDEX,
+    LABEL_INDEX_NUM_CLUSTERS,
+    LABEL_INDEX_NUM_PROBES,
+    EXACT,
+    IVF,
 )
 from rasa.nlu.constants import (
     RESPONSE_SELECTOR_PROPERTY_NAME,
@@ -238,6 +247,10 @@ class ResponseSelector(DIETClassifier):
         FEATURIZERS: [],
         # Perform model checkpointing
         CHECKPOINT_MODEL: False,
+        # If 'True' the training data is fed to the model by a `tf.data` pipeline,
+        # which creates the batches in parallel and groups examples of similar
+        # length into the same batch to reduce padding.
+        USE_TF_DATA_PIPELINE: False,
         # if 'True' applies sigmoid on all similarity terms and adds it
         # to the loss function to ensure that similarity values are
         # approximately bounded. Used inside softmax loss only.
@@ -245,6 +258,17 @@ class ResponseSelector(DIETClassifier):
         # Model confidence to be returned during inference. Possible values -
         # 'softmax' and 'linear_norm'.
         MODEL_CONFIDENCE: SOFTMAX,
+        # Index to search the most similar responses during inference instead of
+        # ranking all of them. Possible values - 'None' (rank all responses),
+        # 'exact' (exact search in blocks of responses) and 'ivf' (approximate
+        # search in clusters of responses).
+        LABEL_INDEX: None,
+        # Number of clusters of the 'ivf' index. Set to 0 to use the square root
+        # of the number of responses.
+        LABEL_INDEX_NUM_CLUSTERS: 0,
+        # Number of clusters which the 'ivf' index searches. Higher values
+        # increase the recall but make the search slower.
+        LABEL_INDEX_NUM_PROBES: 10,
     }
 
     # The `transformer_size` to use as a default when the transformer is enabled.
@@ -286,6 +310,10 @@ class ResponseSelector(DIETClassifier):
         self.all_retrieval_intents = all_retrieval_intents or []
         self.retrieval_intent = None
         self.use_text_as_label = False
+        self._label_index: Optional[LabelIndex] = None
+        self._label_index_model: Optional[RasaModel] = None
+        self._response_keys_by_label_id: Dict[int, Text] = {}
+        self._response_keys_for: Optional[Dict[Text, List[Dict[Text, Any]]]] = None
 
         super().__init__(
             component_config,
@@ -397,6 +425,14 @@ class ResponseSelector(DIETClassifier):
         # Once general DIET-related parameters have been checked, check also the ones
         # specific to ResponseSelector.
         self._check_config_params_when_transformer_enabled()
+        self._check_label_index_config()
+
+    def _check_label_index_config(self) -> None:
+        if self.component_config.get(LABEL_INDEX) not in [None, EXACT, IVF]:
+            raise InvalidConfigException(
+                f"{LABEL_INDEX}={self.component_config[LABEL_INDEX]} is not a valid "
+                f"setting. Possible values: `None`, `{EXACT}`, `{IVF}`."
+            )
 
     def _set_message_property(
         self, message: Message, prediction_dict: Dict[Text, Any], selector_key: Text
@@ -476,19 +512,104 @@ class ResponseSelector(DIETClassifier):
             It is always guaranteed to have a match, otherwise that case should have
             been caught earlier and a warning should have been raised.
         """
+        if self._response_keys_for is not self.responses:
+            self._response_keys_by_label_id = self._map_label_ids_to_response_keys()
+            self._response_keys_for = self.responses
 
-        for key, responses in self.responses.items():
+        return self._response_keys_by_label_id.get(label.get("id"))
 
-            # First check if the predicted label was the key itself
+    def _map_label_ids_to_response_keys(self) -> Dict[int, Text]:
+        """Maps the possible label ids to the intent response keys.
+
+        The first match wins, i.e. a label id which matches the key of a response
+        is mapped to this key, even if it matches the text of an earlier response.
+        """
+        response_keys_by_label_id: Dict[int, Text] = {}
+        for key, responses in self.responses.items():
             search_key = util.template_key_to_intent_response_key(key)
-            if hash(search_key) == label.get("id"):
-                return search_key
+            # First check if the predicted label was the key itself
+            response_keys_by_label_id.setdefault(hash(search_key), search_key)
 
-            # Otherwise loop over the responses to check if the text has a direct match
+            # Otherwise check if the text of a response is a direct match
             for response in responses:
-                if hash(response.get(TEXT, "")) == label.get("id"):
-                    return search_key
-        return None
+                response_keys_by_label_id.setdefault(
+                    hash(response.get(TEXT, "")), search_key
+                )
+
+        return response_keys_by_label_id
+
+    def _get_label_index(self) -> LabelIndex:
+        """Returns the index over the embeddings of the responses.
+
+        The index is created once the first message is processed with a model.
+        """
+        if self._label_index is None or self._label_index_model is not self.model:
+            self._label_index = LabelIndex.create(
+                self.component_config[LABEL_INDEX],
+                self.model.all_labels_embed.numpy(),
+                self.component_config[SIMILARITY_TYPE],
+                self.component_config[MODEL_CONFIDENCE],
+                num_clusters=self.component_config[LABEL_INDEX_NUM_CLUSTERS],
+                num_probes=self.component_config[LABEL_INDEX_NUM_PROBES],
+                random_seed=self.component_config[RANDOM_SEED],
+            )
+            self._label_index_model = self.model
+
+        return self._label_index
+
+    def _predict_label(
+        self, predict_out: Optional[Dict[Text, tf.Tensor]]
+    ) -> Tuple[Dict[Text, Any], List[Dict[Text, Any]]]:
+        """Predicts the response of the provided message.
+
+        If a label index is configured, only the most similar responses are
+        searched with the index instead of ranking all responses.
+        """
+        if predict_out is None or "i_embed" not in predict_out:
+            return super()._predict_label(predict_out)
+
+        label: Dict[Text, Any] = {"name": None, "id": None, "confidence": 0.0}
+        label_ranking = []
+
+        ranking_length = self.component_config[RANKING_LENGTH]
+        if ranking_length and 0 < ranking_length < LABEL_RANKING_LENGTH:
+            output_length = ranking_length
+        else:
+            output_length = LABEL_RANKING_LENGTH
+
+        # TODO: This should be removed in 3.0 when softmax as
+        #  model confidence and normalization is completely deprecated.
+        normalize = (
+            ranking_length > 0 and self.component_config[MODEL_CONFIDENCE] == SOFTMAX
+        )
+        # normalization requires the confidences of the top `ranking_length` labels
+        num_labels = max(output_length, ranking_length) if normalize else output_length
+
+        label_ids, confidences = self._get_label_index().search(
+            predict_out["i_embed"].flatten(), num_labels
+        )
+        if normalize:
+            confidences = train_utils.normalize(confidences, ranking_length)
+        confidences = confidences.tolist()
+
+        if label_ids.size > 0:
+            label = {
+                "id": hash(self.index_label_id_mapping[label_ids[0]]),
+                "name": self.index_label_id_mapping[label_ids[0]],
+                "confidence": confidences[0],
+            }
+            label_ranking = [
+                {
+                    "id": hash(self.index_label_id_mapping[label_idx]),
+                    "name": self.index_label_id_mapping[label_idx],
+                    "confidence": score,
+                }
+                for label_idx, score in list(zip(label_ids, confidences))[
+                    :output_length
+                ]
+            ]
+
+        return label, label_ranking
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Selects most like response for message.
@@ -644,6 +765,22 @@ class ResponseSelector(DIETClassifier):
 
 
 class DIET2BOW(DIET):
+    def _batch_predict_intents(
+        self,
+        combined_sequence_sentence_feature_lengths: tf.Tensor,
+        text_transformed: tf.Tensor,
+    ) -> Dict[Text, tf.Tensor]:
+        if not self.config.get(LABEL_INDEX):
+            return super()._batch_predict_intents(
+                combined_sequence_sentence_feature_lengths, text_transformed
+            )
+
+        # the responses are searched with a `LabelIndex` outside of the model
+        sentence_vector = self._last_token(
+            text_transformed, combined_sequence_sentence_feature_lengths
+        )
+        return {"i_embed": self._tf_layers[f"embed.{TEXT}"](sentence_vector)}
+
     def _create_metrics(self) -> None:
         # self.metrics preserve order
         # output losses first
@@ -932,6 +1069,11 @@ class DIET2DIET(DIET):
         sentence_vector = self._last_token(text_transformed, sequence_feature_lengths)
         sentence_vector_embed = self._tf_layers[f"embed.{TEXT}"](sentence_vector)
 
+        if self.config.get(LABEL_INDEX):
+            # the responses are searched with a `LabelIndex` outside of the model
+            predictions["i_embed"] = sentence_vector_embed
+            return predictions
+
         _, scores = self._tf_layers[
             f"loss.{LABEL}"
         ].get_similarities_and_confidences_from_embeddings(
@@ -1,3 +1,4 @@
+import asyncio
 import itertools
 import os
 import logging
@@ -1492,6 +1493,36 @@ def combine_result(
 
     Returns: intent, entity, and response selection metrics
     """
+    return _accumulate_metrics(
+        compute_metrics(interpreter, data),
+        intent_metrics,
+        entity_metrics,
+        response_selection_metrics,
+        intent_results,
+        entity_results,
+        response_selection_results,
+    )
+
+
+def _accumulate_metrics(
+    current_metrics: Tuple[
+        IntentMetrics,
+        EntityMetrics,
+        ResponseSelectionMetrics,
+        List[IntentEvaluationResult],
+        List[EntityEvaluationResult],
+        List[ResponseSelectionEvaluationResult],
+    ],
+    intent_metrics: IntentMetrics,
+    entity_metrics: EntityMetrics,
+    response_selection_metrics: ResponseSelectionMetrics,
+    intent_results: Optional[List[IntentEvaluationResult]] = None,
+    entity_results: Optional[List[EntityEvaluationResult]] = None,
+    response_selection_results: Optional[
+        List[ResponseSelectionEvaluationResult]
+    ] = None,
+) -> Tuple[IntentMetrics, EntityMetrics, ResponseSelectionMetrics]:
+    """Adds the output of `compute_metrics` for one fold to the collected metrics."""
     (
         intent_current_metrics,
         entity_current_metrics,
@@ -1499,7 +1530,7 @@ def combine_result(
         current_intent_results,
         current_entity_results,
         current_response_selection_results,
-    ) = compute_metrics(interpreter, data)
+    ) = current_metrics
 
     if intent_results is not None:
         intent_results += current_intent_results
@@ -1541,6 +1572,8 @@ def cross_validate(
     errors: bool = False,
     disable_plotting: bool = False,
     report_as_dict: Optional[bool] = None,
+    num_processes: int = 1,
+    num_threads_per_process: Optional[int] = None,
 ) -> Tuple[CVEvaluationResult, CVEvaluationResult, CVEvaluationResult]:
     """Stratified cross validation on data.
 
@@ -1556,6 +1589,12 @@ def cross_validate(
             If `False` the report is returned in a human-readable text format. If `None`
             `report_as_dict` is considered as `True` in case an `output_directory` is
             given.
+        num_processes: number of worker processes which train and evaluate the folds
+            in parallel. If `1`, the folds are processed one after another in the
+            current process.
+        num_threads_per_process: maximum number of TensorFlow / BLAS threads per
+            worker process. If `None`, the CPU cores are split evenly between
+            the workers.
 
     Returns:
         dictionary with key, list structure, where each entry in list
@@ -1569,8 +1608,6 @@ def cross_validate(
     if output:
         rasa.shared.utils.io.create_directory(output)
 
-    trainer = Trainer(nlu_config)
-
     intent_train_metrics: IntentMetrics = defaultdict(list)
     intent_test_metrics: IntentMetrics = defaultdict(list)
     entity_train_metrics: EntityMetrics = defaultdict(lambda: defaultdict(list))
@@ -1582,28 +1619,58 @@ def cross_validate(
     entity_test_results: List[EntityEvaluationResult] = []
     response_selection_test_results: List[ResponseSelectionEvaluationResult] = []
 
-    for train, test in generate_folds(n_folds, data):
-        interpreter = trainer.train(train)
-
-        # calculate train accuracy
-        combine_result(
-            intent_train_metrics,
-            entity_train_metrics,
-            response_selection_train_metrics,
-            interpreter,
-            train,
-        )
-        # calculate test accuracy
-        combine_result(
-            intent_test_metrics,
-            entity_test_metrics,
-            response_selection_test_metrics,
-            interpreter,
-            test,
-            intent_test_results,
-            entity_test_results,
-            response_selection_test_results,
-        )
+    if num_processes > 1:
+        with rasa.utils.common.create_process_pool(
+            num_processes, num_threads_per_process
+        ) as pool:
+            futures = [
+                pool.submit(_train_and_evaluate_fold, nlu_config, train, test)
+                for train, test in generate_folds(n_folds, data)
+            ]
+
+            # collect the results in the order of the folds to keep the merged
+            # results independent of which worker finishes first
+            for future in futures:
+                train_metrics, test_metrics = future.result()
+                _accumulate_metrics(
+                    train_metrics,
+                    intent_train_metrics,
+                    entity_train_metrics,
+                    response_selection_train_metrics,
+                )
+                _accumulate_metrics(
+                    test_metrics,
+                    intent_test_metrics,
+                    entity_test_metrics,
+                    response_selection_test_metrics,
+                    intent_test_results,
+                    entity_test_results,
+                    response_selection_test_results,
+                )
+    else:
+        trainer = Trainer(nlu_config)
+        for train, test in generate_folds(n_folds, data):
+            interpreter = trainer.train(train)
+
+            # calculate train accuracy
+            combine_result(
+                intent_train_metrics,
+                entity_train_metrics,
+                response_selection_train_metrics,
+                interpreter,
+                train,
+            )
+            # calculate test accuracy
+            combine_result(
+                intent_test_metrics,
+                entity_test_metrics,
+                response_selection_test_metrics,
+                interpreter,
+                test,
+                intent_test_results,
+                entity_test_results,
+                response_selection_test_results,
+            )
 
     if intent_test_results:
         logger.info("Accumulated test folds intent evaluation results:")
@@ -1657,6 +1724,44 @@ def cross_validate(
     )
 
 
+def _train_and_evaluate_fold(
+    nlu_config: RasaNLUModelConfig, train: TrainingData, test: TrainingData
+) -> Tuple[Tuple, Tuple]:
+    """Trains a model on one cross validation fold and evaluates it.
+
+    This runs in a worker process of the process pool created in `cross_validate`.
+    Only the metrics and prediction results are sent back to the main process since
+    the trained interpreter can't be pickled.
+
+    Args:
+        nlu_config: the NLU model configuration
+        train: the training data of the fold
+        test: the test data of the fold
+
+    Returns:
+        The output of `compute_metrics` on the training and on the test data.
+    """
+    interpreter = Trainer(nlu_config).train(train)
+
+    return (
+        _picklable_metrics(compute_metrics(interpreter, train)),
+        _picklable_metrics(compute_metrics(interpreter, test)),
+    )
+
+
+def _picklable_metrics(metrics: Tuple) -> Tuple:
+    """Converts the nested `defaultdict` of the entity metrics into a plain `dict`.
+
+    The default factory of the entity metrics is a `lambda` which can't be pickled.
+    """
+    intent_metrics, entity_metrics, *other_metrics = metrics
+    entity_metrics = {
+        extractor: dict(extractor_metrics)
+        for extractor, extractor_metrics in entity_metrics.items()
+    }
+    return (intent_metrics, entity_metrics, *other_metrics)
+
+
 def _targets_predictions_from(
     results: Union[
         List[IntentEvaluationResult], List[ResponseSelectionEvaluationResult]
@@ -1732,6 +1837,8 @@ async def compare_nlu(
     model_names: List[Text],
     output: Text,
     runs: int,
+    num_processes: int = 1,
+    num_threads_per_process: Optional[int] = None,
 ) -> List[int]:
     """
     Trains and compares multiple NLU models.
@@ -1748,81 +1855,137 @@ async def compare_nlu(
         model_names: names of the models to train
         output: the output directory
         runs: number of comparison runs
+        num_processes: number of worker processes which train and evaluate the models
+            in parallel. If `1`, the models are processed one after another in the
+            current process.
+        num_threads_per_process: maximum number of TensorFlow / BLAS threads per
+            worker process. If `None`, the CPU cores are split evenly between
+            the workers.
 
     Returns: training examples per run
     """
-
-    from rasa.model_training import train_nlu_async
-
     training_examples_per_run = []
 
-    for run in range(runs):
+    pool = None
+    if num_processes > 1:
+        pool = rasa.utils.common.create_process_pool(
+            num_processes, num_threads_per_process
+        )
+    pending_evaluations = []
 
-        logger.info("Beginning comparison run {}/{}".format(run + 1, runs))
+    try:
+        for run in range(runs):
 
-        run_path = os.path.join(output, "run_{}".format(run + 1))
-        io_utils.create_path(run_path)
+            logger.info("Beginning comparison run {}/{}".format(run + 1, runs))
 
-        test_path = os.path.join(run_path, TEST_DATA_FILE)
-        io_utils.create_path(test_path)
+            run_path = os.path.join(output, "run_{}".format(run + 1))
+            io_utils.create_path(run_path)
 
-        train, test = data.train_test_split()
-        rasa.shared.utils.io.write_text_file(test.nlu_as_yaml(), test_path)
+            test_path = os.path.join(run_path, TEST_DATA_FILE)
+            io_utils.create_path(test_path)
 
-        for percentage in exclusion_percentages:
-            percent_string = f"{percentage}%_exclusion"
+            train, test = data.train_test_split()
+            rasa.shared.utils.io.write_text_file(test.nlu_as_yaml(), test_path)
 
-            _, train_included = train.train_test_split(percentage / 100)
-            # only count for the first run and ignore the others
-            if run == 0:
-                training_examples_per_run.append(len(train_included.nlu_examples))
+            for percentage in exclusion_percentages:
+                percent_string = f"{percentage}%_exclusion"
 
-            model_output_path = os.path.join(run_path, percent_string)
-            train_split_path = os.path.join(model_output_path, "train")
-            train_nlu_split_path = os.path.join(train_split_path, TRAIN_DATA_FILE)
-            train_nlg_split_path = os.path.join(train_split_path, NLG_DATA_FILE)
-            io_utils.create_path(train_nlu_split_path)
-            rasa.shared.utils.io.write_text_file(
-                train_included.nlu_as_yaml(), train_nlu_split_path
-            )
-            rasa.shared.utils.io.write_text_file(
-                train_included.nlg_as_yaml(), train_nlg_split_path
-            )
+                _, train_included = train.train_test_split(percentage / 100)
+                # only count for the first run and ignore the others
+                if run == 0:
+                    training_examples_per_run.append(len(train_included.nlu_examples))
 
-            for nlu_config, model_name in zip(configs, model_names):
-                logger.info(
-                    "Evaluating configuration '{}' with {} training data.".format(
-                        model_name, percent_string
-                    )
+                model_output_path = os.path.join(run_path, percent_string)
+                train_split_path = os.path.join(model_output_path, "train")
+                train_nlu_split_path = os.path.join(train_split_path, TRAIN_DATA_FILE)
+                train_nlg_split_path = os.path.join(train_split_path, NLG_DATA_FILE)
+                io_utils.create_path(train_nlu_split_path)
+                rasa.shared.utils.io.write_text_file(
+                    train_included.nlu_as_yaml(), train_nlu_split_path
+                )
+                rasa.shared.utils.io.write_text_file(
+                    train_included.nlg_as_yaml(), train_nlg_split_path
                 )
 
-                try:
-                    model_path = await train_nlu_async(
+                for nlu_config, model_name in zip(configs, model_names):
+                    logger.info(
+                        "Evaluating configuration '{}' with {} training data.".format(
+                            model_name, percent_string
+                        )
+                    )
+                    arguments = (
                         nlu_config,
+                        model_name,
                         train_split_path,
                         model_output_path,
-                        fixed_model_name=model_name,
+                        test_path,
                     )
-                except Exception as e:  # skipcq: PYL-W0703
-                    # general exception catching needed to continue evaluating other
-                    # model configurations
-                    logger.warning(f"Training model '{model_name}' failed. Error: {e}")
-                    f_score_results[model_name][run].append(0.0)
-                    continue
-
-                model_path = os.path.join(get_model(model_path), "nlu")
-
-                output_path = os.path.join(model_output_path, f"{model_name}_report")
-                result = run_evaluation(
-                    test_path, model_path, output_directory=output_path, errors=True
-                )
 
-                f1 = result["intent_evaluation"]["f1_score"]
-                f_score_results[model_name][run].append(f1)
+                    if pool:
+                        evaluation = asyncio.get_event_loop().run_in_executor(
+                            pool, _train_and_evaluate_nlu_config_in_worker, *arguments
+                        )
+                        pending_evaluations.append((model_name, run, evaluation))
+                    else:
+                        f1 = await _train_and_evaluate_nlu_config(*arguments)
+                        f_score_results[model_name][run].append(f1)
+
+        # the evaluations are awaited in the order they were scheduled so that the
+        # f-scores per run are ordered by exclusion percentage
+        for model_name, run, evaluation in pending_evaluations:
+            f_score_results[model_name][run].append(await evaluation)
+    finally:
+        if pool:
+            pool.shutdown()
 
     return training_examples_per_run
 
 
+async def _train_and_evaluate_nlu_config(
+    nlu_config: Text,
+    model_name: Text,
+    train_split_path: Text,
+    model_output_path: Text,
+    test_path: Text,
+) -> float:
+    """Trains a model for one comparison configuration and evaluates it.
+
+    Args:
+        nlu_config: config file of the model
+        model_name: name of the model to train
+        train_split_path: path to the training data of the model
+        model_output_path: the output directory for the model and its reports
+        test_path: path to the test data of the current run
+
+    Returns: the intent f1-score of the model or `0.0` if the training failed
+    """
+    from rasa.model_training import train_nlu_async
+
+    try:
+        model_path = await train_nlu_async(
+            nlu_config, train_split_path, model_output_path, fixed_model_name=model_name
+        )
+    except Exception as e:  # skipcq: PYL-W0703
+        # general exception catching needed to continue evaluating other
+        # model configurations
+        logger.warning(f"Training model '{model_name}' failed. Error: {e}")
+        return 0.0
+
+    model_path = os.path.join(get_model(model_path), "nlu")
+
+    output_path = os.path.join(model_output_path, f"{model_name}_report")
+    result = run_evaluation(
+        test_path, model_path, output_directory=output_path, errors=True
+    )
+
+    return result["intent_evaluation"]["f1_score"]
+
+
+def _train_and_evaluate_nlu_config_in_worker(*args: Any) -> float:
+    """Runs `_train_and_evaluate_nlu_config` in a worker process of a process pool."""
+    return rasa.utils.common.run_in_loop(_train_and_evaluate_nlu_config(*args))
+
+
 def _compute_metrics(
     results: Union[
         List[IntentEvaluationResult], List[ResponseSelectionEvaluationResult]
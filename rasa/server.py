@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import json
 import logging
 import multiprocessing
 import os
@@ -37,6 +38,7 @@ from rasa.nlu.emulators.emulator import Emulator
 import rasa.utils.common
 import rasa.shared.utils.common
 import rasa.shared.utils.io
+import rasa.shared.utils.validation
 import rasa.utils.endpoints
 import rasa.utils.io
 from rasa.shared.core.training_data.story_writer.yaml_story_writer import (
@@ -89,6 +91,7 @@ logger = logging.getLogger(__name__)
 
 JSON_CONTENT_TYPE = "application/json"
 YAML_CONTENT_TYPE = "application/x-yaml"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
 
 OUTPUT_CHANNEL_QUERY_KEY = "output_channel"
 USE_LATEST_INPUT_CHANNEL_AS_OUTPUT_CHANNEL = "latest"
@@ -278,6 +281,46 @@ def requires_auth(
     return decorator
 
 
+def _non_negative_int_parameter(
+    request: Request, name: Text, default: Optional[int] = None
+) -> Optional[int]:
+    """Returns the value of an integer query parameter which must not be negative."""
+    value = request.args.get(name)
+    if value is None:
+        return default
+
+    try:
+        value = int(value)
+    except ValueError:
+        value = -1
+
+    if value < 0:
+        raise ErrorResponse(
+            HTTPStatus.BAD_REQUEST,
+            "BadRequest",
+            f"Invalid parameter value for '{name}'. Should be a non-negative integer.",
+            {"parameter": name, "in": "query"},
+        )
+
+    return value
+
+
+def _event_types_parameter(request: Request) -> Optional[List[Text]]:
+    """Returns the event types which were passed using the `type` query parameter.
+
+    Multiple event types can either be passed as comma-separated list or by
+    repeating the parameter.
+    """
+    event_types = [
+        event_type.strip()
+        for value in request.args.getlist("type", [])
+        for event_type in value.split(",")
+        if event_type.strip()
+    ]
+
+    return event_types or None
+
+
 def event_verbosity_parameter(
     request: Request, default_verbosity: EventVerbosity
 ) -> EventVerbosity:
@@ -389,7 +432,7 @@ def validate_events_in_request_body(request: Request) -> None:
         events = request.json
 
     try:
-        jsonschema.validate(events, EVENTS_SCHEMA)
+        rasa.shared.utils.validation.validate_json(events, EVENTS_SCHEMA)
     except jsonschema.ValidationError as error:
         raise ErrorResponse(
             HTTPStatus.BAD_REQUEST,
@@ -757,6 +800,50 @@ def create_app(
                 f"An unexpected error occurred. Error: {e}",
             )
 
+    @app.get("/conversations/<conversation_id:path>/tracker/events")
+    @requires_auth(app, auth_token)
+    @ensure_loaded_agent(app)
+    async def retrieve_events(request: Request, conversation_id: Text) -> HTTPResponse:
+        """Get the events of a conversation without creating its tracker.
+
+        The events can be paginated and filtered by timestamp and event type. If the
+        client accepts newline-delimited JSON, the events are streamed while they
+        are read from the tracker store.
+        """
+        offset = _non_negative_int_parameter(request, "offset", 0)
+        limit = _non_negative_int_parameter(request, "limit")
+        since = rasa.utils.endpoints.float_arg(request, "since")
+        event_types = _event_types_parameter(request)
+
+        events = app.agent.tracker_store.retrieve_events(
+            conversation_id, offset, limit, since, event_types
+        )
+
+        if NDJSON_CONTENT_TYPE in request.headers.get("Accept", ""):
+
+            async def stream(resp: Any) -> None:
+                for event in events:
+                    await resp.write(json.dumps(event) + "\n")
+
+            return response.stream(stream, content_type=NDJSON_CONTENT_TYPE)
+
+        try:
+            return response.json(
+                {
+                    "sender_id": conversation_id,
+                    "events": list(events),
+                    "offset": offset,
+                    "limit": limit,
+                }
+            )
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                "ConversationError",
+                f"An unexpected error occurred. Error: {e}",
+            )
+
     @app.post("/conversations/<conversation_id:path>/tracker/events")
     @requires_auth(app, auth_token)
     @ensure_loaded_agent(app)
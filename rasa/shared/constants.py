@@ -55,6 +55,7 @@ TEST_STORIES_FILE_PREFIX = "test_"
 
 DEFAULT_LOG_LEVEL = "INFO"
 ENV_LOG_LEVEL = "LOG_LEVEL"
+ENV_NUM_YAML_PARSING_PROCESSES = "RASA_NUM_YAML_PARSING_PROCESSES"
 
 DEFAULT_SENDER_ID = "default"
 UTTER_PREFIX = "utter_"
@@ -99,6 +99,51 @@ def _mark_conditional_response_variations_warning(
                 break
 
 
+class PriorTrackerState(NamedTuple):
+    """The state of a tracker before one of its actions was executed.
+
+    Contains everything which `Domain.states_for_prior_tracker_states` needs to
+    derive the featurized state, so that it can be computed once and reused.
+    """
+
+    state: State
+    prev_action_sub_state: Optional[SubState]
+    hide_rule_turn: bool
+    keeps_hidden_status: bool
+
+
+class _LazyPriorTrackerState:
+    """The state of a tracker before one of its actions, computed only if needed.
+
+    Hidden rule turns are dropped by `Domain.states_for_prior_tracker_states` without
+    ever accessing their state. The state is only valid until the tracker is
+    updated with the next event.
+    """
+
+    def __init__(
+        self,
+        domain: "Domain",
+        tracker: "DialogueStateTracker",
+        hide_rule_turn: bool,
+        omit_unset_slots: bool,
+    ) -> None:
+        self._domain = domain
+        self._tracker = tracker
+        self._omit_unset_slots = omit_unset_slots
+        self.hide_rule_turn = hide_rule_turn
+        self.keeps_hidden_status = Domain._keeps_hidden_status(tracker)
+
+    @property
+    def state(self) -> State:
+        return self._domain.get_active_state(
+            self._tracker, omit_unset_slots=self._omit_unset_slots
+        )
+
+    @property
+    def prev_action_sub_state(self) -> Optional[SubState]:
+        return self._domain._get_prev_action_sub_state(self._tracker)
+
+
 class InvalidDomain(RasaException):
     """Exception that can be raised when domain is not valid."""
 
@@ -178,9 +223,20 @@ class Domain:
     def from_yaml(cls, yaml: Text, original_filename: Text = "") -> "Domain":
         """Loads the `Domain` from YAML text after validating it."""
         try:
-            rasa.shared.utils.validation.validate_yaml_schema(yaml, DOMAIN_SCHEMA_FILE)
+            data = rasa.shared.utils.validation.parse_and_validate_yaml(
+                yaml, DOMAIN_SCHEMA_FILE
+            )
+        except YamlException as e:
+            e.filename = original_filename
+            raise e
+
+        return cls._from_validated_yaml(data, original_filename)
 
-            data = rasa.shared.utils.io.read_yaml(yaml)
+    @classmethod
+    def _from_validated_yaml(
+        cls, data: Dict[Text, Any], original_filename: Text = ""
+    ) -> "Domain":
+        try:
             if not rasa.shared.utils.validation.validate_training_data_format_version(
                 data, original_filename
             ):
@@ -238,13 +294,25 @@ class Domain:
     def from_directory(cls, path: Text) -> "Domain":
         """Loads and merges multiple domain files recursively from a directory tree."""
 
-        domain = Domain.empty()
+        domain_files = []
         for root, _, files in os.walk(path, followlinks=True):
-            for file in files:
+            # we sort the files here to ensure that the domain is always merged in
+            # the same order
+            for file in sorted(files):
                 full_path = os.path.join(root, file)
                 if Domain.is_domain_file(full_path):
-                    other = Domain.from_file(full_path)
-                    domain = other.merge(domain)
+                    domain_files.append(
+                        (full_path, rasa.shared.utils.io.read_file(full_path))
+                    )
+
+        parsed_files = rasa.shared.utils.validation.parse_and_validate_yaml_files(
+            domain_files, DOMAIN_SCHEMA_FILE
+        )
+
+        domain = Domain.empty()
+        for (full_path, _), data in zip(domain_files, parsed_files):
+            other = cls._from_validated_yaml(data, full_path)
+            domain = other.merge(domain)
 
         return domain
 
@@ -1164,31 +1232,93 @@ class Domain:
             rule_only_data: Slots and loops,
                 which only occur in rules but not in stories.
 
+        Return:
+            A list of states.
+        """
+        # the states are only computed for the turns which aren't hidden
+        prior_tracker_states = (
+            _LazyPriorTrackerState(self, tr, hide_rule_turn, omit_unset_slots)
+            for tr, hide_rule_turn in tracker.generate_all_prior_trackers()
+        )
+        return self.states_for_prior_tracker_states(
+            prior_tracker_states,
+            ignore_rule_only_turns=ignore_rule_only_turns,
+            rule_only_data=rule_only_data,
+        )
+
+    def prior_tracker_state(
+        self,
+        tracker: "DialogueStateTracker",
+        hide_rule_turn: bool,
+        omit_unset_slots: bool = False,
+    ) -> PriorTrackerState:
+        """Extracts the state of one of the trackers of a tracker's history.
+
+        Args:
+            tracker: A tracker as generated by `generate_all_prior_trackers`.
+            hide_rule_turn: Whether the following action should be hidden in the
+                dialogue history created for ML-based policies.
+            omit_unset_slots: If `True` do not include the initial values of slots.
+
+        Returns:
+            The state of the tracker.
+        """
+        return PriorTrackerState(
+            state=self.get_active_state(tracker, omit_unset_slots=omit_unset_slots),
+            prev_action_sub_state=self._get_prev_action_sub_state(tracker),
+            hide_rule_turn=hide_rule_turn,
+            keeps_hidden_status=self._keeps_hidden_status(tracker),
+        )
+
+    @staticmethod
+    def _keeps_hidden_status(tracker: "DialogueStateTracker") -> bool:
+        # followup action or happy path loop prediction
+        # don't change the fact whether dialogue turn should be hidden
+        return (
+            bool(tracker.followup_action)
+            or tracker.latest_action_name == tracker.active_loop_name
+        )
+
+    def states_for_prior_tracker_states(
+        self,
+        prior_tracker_states: Iterable[
+            Union[PriorTrackerState, _LazyPriorTrackerState]
+        ],
+        ignore_rule_only_turns: bool = False,
+        rule_only_data: Optional[Dict[Text, Any]] = None,
+    ) -> List[State]:
+        """List of states for the states of the trackers of a tracker's history.
+
+        The passed states are modified in place.
+
+        Args:
+            prior_tracker_states: The states of the trackers generated by
+                `generate_all_prior_trackers`.
+            ignore_rule_only_turns: If True ignore dialogue turns that are present
+                only in rules.
+            rule_only_data: Slots and loops,
+                which only occur in rules but not in stories.
+
         Return:
             A list of states.
         """
         states = []
         last_ml_action_sub_state = None
         turn_was_hidden = False
-        for tr, hide_rule_turn in tracker.generate_all_prior_trackers():
+        for prior_tracker_state in prior_tracker_states:
             if ignore_rule_only_turns:
                 # remember previous ml action based on the last non hidden turn
                 # we need this to override previous action in the ml state
                 if not turn_was_hidden:
-                    last_ml_action_sub_state = self._get_prev_action_sub_state(tr)
+                    last_ml_action_sub_state = prior_tracker_state.prev_action_sub_state
 
-                # followup action or happy path loop prediction
-                # don't change the fact whether dialogue turn should be hidden
-                if (
-                    not tr.followup_action
-                    and not tr.latest_action_name == tr.active_loop_name
-                ):
-                    turn_was_hidden = hide_rule_turn
+                if not prior_tracker_state.keeps_hidden_status:
+                    turn_was_hidden = prior_tracker_state.hide_rule_turn
 
                 if turn_was_hidden:
                     continue
 
-            state = self.get_active_state(tr, omit_unset_slots=omit_unset_slots)
+            state = prior_tracker_state.state
 
             if ignore_rule_only_turns:
                 # clean state from only rule features
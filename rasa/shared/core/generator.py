@@ -5,7 +5,18 @@ import logging
 import random
 
 from tqdm import tqdm
-from typing import Optional, List, Text, Set, Dict, Tuple, Deque, Any
+from typing import (
+    Optional,
+    List,
+    Text,
+    Set,
+    Dict,
+    Tuple,
+    Any,
+    Iterable,
+    Iterator,
+    Union,
+)
 
 from rasa.shared.constants import DOCS_URL_STORIES
 from rasa.shared.core.constants import SHOULD_NOT_BE_SET
@@ -46,6 +57,117 @@ ExtractorConfig = namedtuple(
 )
 
 
+class SharedPrefixSequence:
+    """Append-only sequence whose copies share their common prefix.
+
+    The items are stored as a chain of nodes where every node points to its
+    predecessor. Copying the sequence only copies the pointer to the last node, and
+    appending to a copy adds a new node which is only visible to this copy. This
+    makes copies O(1) and the memory of many copies only grows with their
+    differing items.
+
+    Many `TrackerWithCachedStates` are copies of each other which only differ in the
+    events of the last story steps. Storing their events and states in this
+    sequence avoids duplicating the common part of their histories.
+    """
+
+    __slots__ = ("_last_node", "_length", "maxlen")
+
+    def __init__(self, items: Iterable[Any] = (), maxlen: Optional[int] = None):
+        """Creates sequence.
+
+        Args:
+            items: Initial items of the sequence.
+            maxlen: Like for a `deque`, only the last `maxlen` items are accessible
+                if this is set.
+        """
+        self._last_node: Optional[Tuple[Any, Any]] = None
+        self._length = 0
+        self.maxlen = maxlen
+        self.extend(items)
+
+    def copy(self) -> "SharedPrefixSequence":
+        """Creates a copy which shares all current items with this sequence."""
+        duplicate = SharedPrefixSequence(maxlen=self.maxlen)
+        duplicate._last_node = self._last_node
+        duplicate._length = self._length
+        return duplicate
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "SharedPrefixSequence":
+        return SharedPrefixSequence(copy.deepcopy(list(self), memo), self.maxlen)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickle a flat list as the nested nodes could exceed the recursion limit.
+        return SharedPrefixSequence, (list(self), self.maxlen)
+
+    def append(self, item: Any) -> None:
+        """Adds an item to the end of the sequence."""
+        self._last_node = (item, self._last_node)
+        self._length += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Adds multiple items to the end of the sequence."""
+        for item in items:
+            self.append(item)
+
+    def pop(self) -> Any:
+        """Removes and returns the last item of the sequence."""
+        if not len(self):
+            raise IndexError("pop from an empty sequence")
+
+        item, self._last_node = self._last_node
+        self._length -= 1
+        return item
+
+    def clear(self) -> None:
+        """Removes all items from the sequence."""
+        self._last_node = None
+        self._length = 0
+
+    def __len__(self) -> int:
+        if self.maxlen is None:
+            return self._length
+        return min(self._length, self.maxlen)
+
+    def __reversed__(self) -> Iterator[Any]:
+        node = self._last_node
+        for _ in range(len(self)):
+            item, node = node
+            yield item
+
+    def __iter__(self) -> Iterator[Any]:
+        items = list(reversed(self))
+        items.reverse()
+        return iter(items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return list(self)[index]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("sequence index out of range")
+
+        node = self._last_node
+        for _ in range(length - 1 - index):
+            node = node[1]
+        return node[0]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (SharedPrefixSequence, deque, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    def __repr__(self) -> Text:
+        return f"{self.__class__.__name__}({list(self)!r}, maxlen={self.maxlen})"
+
+
 class TrackerWithCachedStates(DialogueStateTracker):
     """A tracker wrapper that caches the state creation of the tracker."""
 
@@ -86,7 +208,7 @@ class TrackerWithCachedStates(DialogueStateTracker):
 
     def past_states_for_hashing(
         self, domain: Domain, omit_unset_slots: bool = False,
-    ) -> Deque[FrozenState]:
+    ) -> SharedPrefixSequence:
         """Generates and caches the past states of this tracker based on the history.
 
         Args:
@@ -96,6 +218,12 @@ class TrackerWithCachedStates(DialogueStateTracker):
         Returns:
             A list of states
         """
+        if self.domain is None:
+            # trackers which were restored from the training cache don't reference a
+            # domain. They can only be restored for the same domain they were
+            # generated for.
+            self.domain = domain
+
         # we need to make sure this is the same domain, otherwise things will
         # go wrong. but really, the same tracker shouldn't be used across
         # domains
@@ -106,14 +234,16 @@ class TrackerWithCachedStates(DialogueStateTracker):
         states_for_hashing = self._states_for_hashing
         if states_for_hashing is None:
             states = super().past_states(domain, omit_unset_slots=omit_unset_slots)
-            states_for_hashing = deque(self.freeze_current_state(s) for s in states)
+            states_for_hashing = SharedPrefixSequence(
+                self.freeze_current_state(s) for s in states
+            )
 
         self._states_for_hashing = states_for_hashing
 
         return states_for_hashing
 
     @staticmethod
-    def _unfreeze_states(frozen_states: Deque[FrozenState]) -> List[State]:
+    def _unfreeze_states(frozen_states: Iterable[FrozenState]) -> List[State]:
         return [
             {key: dict(value) for key, value in dict(frozen_state).items()}
             for frozen_state in frozen_states
@@ -164,23 +294,32 @@ class TrackerWithCachedStates(DialogueStateTracker):
     ) -> "TrackerWithCachedStates":
         """Creates a duplicate of this tracker.
 
-        A new tracker will be created and all events
-        will be replayed."""
-
-        # This is an optimization, we could use the original copy, but
-        # the states would be lost and we would need to recalculate them
-
-        tracker = self.init_copy()
+        Instead of replaying all events, the duplicate shares the events and the
+        cached states with this tracker. Only the mutable parts of the tracker's
+        current state (e.g. the slots) are copied. Hence, the cost of copying
+        doesn't depend on the length of the dialogue.
+        """
+        tracker = copy.copy(self)
         tracker.sender_id = sender_id
         tracker.sender_source = sender_source
 
-        for event in self.events:
-            tracker.update(event, skip_states=True)
+        tracker.events = self.events.copy()
+        if self._states_for_hashing is not None:
+            tracker._states_for_hashing = self._states_for_hashing.copy()
 
-        tracker._states_for_hashing = copy.copy(self._states_for_hashing)
+        tracker.slots = copy.copy(self.slots)
+        tracker.slots.update(
+            (name, copy.copy(slot)) for name, slot in self.slots.items()
+        )
+        tracker.active_loop = copy.copy(self.active_loop)
 
         return tracker
 
+    def _create_events(self, evts: List[Event]) -> SharedPrefixSequence:
+        if evts and not isinstance(evts[0], Event):  # pragma: no cover
+            raise ValueError("events, if given, must be a list of events")
+        return SharedPrefixSequence(evts, self._max_event_history)
+
     def _append_current_state(self) -> None:
         if self._states_for_hashing is None:
             self._states_for_hashing = self.past_states_for_hashing(self.domain)
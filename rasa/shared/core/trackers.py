@@ -1,4 +1,5 @@
 import copy
+import itertools
 import logging
 import os
 import time
@@ -15,6 +16,7 @@ from typing import (
     List,
     Deque,
     Iterable,
+    Set,
     Union,
     FrozenSet,
     Tuple,
@@ -122,6 +124,93 @@ class AnySlotDict(dict):
         return True
 
 
+class _AppliedEventsCache:
+    """The applied events of a tracker's events (see `applied_events`).
+
+    The cache remembers which events it was computed for so that events which
+    were appended to the tracker afterwards can be applied incrementally.
+
+    Once the cache is shared by copies of the tracker, it is never modified again.
+    Updating a shared cache creates a new cache instead. The new cache shares the
+    list of applied events with the old one as long as events are only appended.
+    """
+
+    def __init__(self, tracker_events: Deque[Event]) -> None:
+        # the events of the tracker which the cache was computed for
+        self.tracker_events = tracker_events
+        self.number_of_processed_events = 0
+        self.last_processed_event: Optional[Event] = None
+        # the first `number_of_applied_events` events of the list are the applied
+        # events, the list might be longer if it's shared with other caches
+        self.applied_events: List[Event] = []
+        self.number_of_applied_events = 0
+        self.applied_events_are_shared = False
+        # names of the loops which were activated within the processed events
+        self.loop_names: Set[Text] = set()
+        self.is_shared = False
+
+    def is_valid_for(self, tracker_events: Deque[Event]) -> bool:
+        """Checks if the processed events are still the first events of the tracker.
+
+        This is not the case if events were removed, e.g. if the maximum event
+        history was reached.
+        """
+        if len(tracker_events) < self.number_of_processed_events:
+            return False
+
+        if self.number_of_processed_events == 0:
+            return True
+
+        # The cache is frozen as soon as the tracker is copied, hence the events of
+        # the tracker and of its copies can only differ after the processed events.
+        return (
+            tracker_events[self.number_of_processed_events - 1]
+            is self.last_processed_event
+        )
+
+    def copy_for(self, tracker_events: Deque[Event]) -> "_AppliedEventsCache":
+        """Copies the cache so that it can be updated for the events of a tracker."""
+        cache = copy.copy(self)
+        cache.tracker_events = tracker_events
+        cache.loop_names = set(self.loop_names)
+        cache.is_shared = False
+        self.applied_events_are_shared = cache.applied_events_are_shared = True
+
+        return cache
+
+    def applied_events_to_update(self, new_events: List[Event]) -> List[Event]:
+        """Returns the list of applied events which can be updated in place.
+
+        Args:
+            new_events: The events which will be applied.
+
+        Returns:
+            The list of applied events if the update doesn't affect other caches,
+            otherwise a copy of the applied events.
+        """
+        if not self.applied_events_are_shared:
+            return self.applied_events
+
+        # events can be appended to a shared list unless another cache appended
+        # events already
+        if len(self.applied_events) == self.number_of_applied_events and not any(
+            self._might_undo_applied_events(event) for event in new_events
+        ):
+            return self.applied_events
+
+        self.applied_events = self.applied_events[: self.number_of_applied_events]
+        self.applied_events_are_shared = False
+        return self.applied_events
+
+    def _might_undo_applied_events(self, event: Event) -> bool:
+        # see `DialogueStateTracker._apply_events`
+        return isinstance(
+            event, (Restarted, SessionStarted, ActionReverted, UserUtteranceReverted)
+        ) or (
+            isinstance(event, ActionExecuted) and event.action_name in self.loop_names
+        )
+
+
 class DialogueStateTracker:
     """Maintains the state of a conversation.
 
@@ -220,6 +309,7 @@ class DialogueStateTracker:
         self.latest_bot_utterance = None
         self._reset()
         self.active_loop: "TrackerActiveLoop" = {}
+        self._applied_events_cache: Optional[_AppliedEventsCache] = None
 
     ###
     # Public tracker interface
@@ -467,20 +557,77 @@ class DialogueStateTracker:
     def applied_events(self) -> List[Event]:
         """Returns all actions that should be applied - w/o reverted events.
 
+        The applied events are cached. Events which were added since the last call
+        are applied incrementally to the cached events.
+
         Returns:
             The events applied to the tracker.
         """
-        loop_names = [
-            event.name
-            for event in self.events
-            if isinstance(event, ActiveLoop) and event.name
-        ]
+        cache = getattr(self, "_applied_events_cache", None)
+        if cache is None or not cache.is_valid_for(self.events):
+            cache = _AppliedEventsCache(self.events)
+
+        number_of_new_events = len(self.events) - cache.number_of_processed_events
+        if number_of_new_events:
+            # only iterate over the new events at the end of the tracker's events
+            new_events = list(
+                itertools.islice(reversed(self.events), number_of_new_events)
+            )
+            new_events.reverse()
 
-        applied_events = []
+            new_loop_names = {
+                event.name
+                for event in new_events
+                if isinstance(event, ActiveLoop) and event.name
+            }
+            if cache.number_of_processed_events and not new_loop_names.issubset(
+                cache.loop_names
+            ):
+                # A loop which is activated for the first time changes how previous
+                # executions of its action are treated.
+                cache = _AppliedEventsCache(self.events)
+                new_events = list(self.events)
+            elif cache.is_shared or cache.tracker_events is not self.events:
+                cache = cache.copy_for(self.events)
+
+            cache.loop_names.update(new_loop_names)
+            applied_events = cache.applied_events_to_update(new_events)
+            self._apply_events(new_events, applied_events, cache.loop_names)
+            cache.number_of_applied_events = len(applied_events)
+            cache.number_of_processed_events += len(new_events)
+            cache.last_processed_event = new_events[-1]
+
+        self._applied_events_cache = cache
+
+        return cache.applied_events[: cache.number_of_applied_events]
+
+    def __copy__(self) -> "DialogueStateTracker":
+        tracker = self.__class__.__new__(self.__class__)
+        tracker.__dict__.update(self.__dict__)
+        # the copy shares the cache which hence mustn't be modified anymore
+        cache = getattr(self, "_applied_events_cache", None)
+        if cache is not None:
+            cache.is_shared = True
 
-        for event in self.events:
+        return tracker
+
+    def _apply_events(
+        self,
+        new_events: List[Event],
+        applied_events: List[Event],
+        loop_names: Set[Text],
+    ) -> None:
+        """Updates `applied_events` with `new_events` while undoing reverted events.
+
+        Args:
+            new_events: The events to apply.
+            applied_events: The events which are currently applied. The list is
+                modified in place.
+            loop_names: Names of all loops which are activated within the events.
+        """
+        for event in new_events:
             if isinstance(event, (Restarted, SessionStarted)):
-                applied_events = []
+                applied_events.clear()
             elif isinstance(event, ActionReverted):
                 self._undo_till_previous(ActionExecuted, applied_events)
             elif isinstance(event, UserUtteranceReverted):
@@ -503,8 +650,6 @@ class DialogueStateTracker:
             else:
                 applied_events.append(event)
 
-        return applied_events
-
     @staticmethod
     def _undo_till_previous(event_type: Type[Event], done_events: List[Event]) -> None:
         """Removes events from `done_events`.
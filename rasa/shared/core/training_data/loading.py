@@ -80,6 +80,22 @@ def load_data_from_files(
         steps = reader.read_from_file(story_file)
         story_steps.extend(steps)
 
+    return exclude_story_steps(story_steps, exclusion_percentage)
+
+
+def exclude_story_steps(
+    story_steps: List["StoryStep"], exclusion_percentage: Optional[int] = None
+) -> List["StoryStep"]:
+    """Randomly excludes a percentage of the story steps.
+
+    Args:
+        story_steps: Story steps from the training data.
+        exclusion_percentage: Identifies the percentage of training data that
+                              should be excluded from the training.
+
+    Returns:
+        The remaining story steps.
+    """
     if exclusion_percentage and exclusion_percentage != 100:
         import random
 
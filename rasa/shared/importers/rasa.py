@@ -1,17 +1,14 @@
 import logging
 from typing import Dict, List, Optional, Text, Union
 
-import rasa.shared.data
 from rasa.shared.core.training_data.structures import StoryGraph
 from rasa.shared.importers import utils
 from rasa.shared.importers import autoconfig
 from rasa.shared.importers.importer import TrainingDataImporter
 from rasa.shared.importers.autoconfig import TrainingType
+from rasa.shared.importers.scanner import ProjectScanner
 from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.shared.core.domain import InvalidDomain, Domain
-from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
-    YAMLStoryReader,
-)
 import rasa.shared.utils.io
 
 logger = logging.getLogger(__name__)
@@ -29,16 +26,13 @@ class RasaFileImporter(TrainingDataImporter):
     ):
 
         self._domain_path = domain_path
+        self._domain: Optional[Domain] = None
 
-        self._nlu_files = rasa.shared.data.get_data_files(
-            training_data_paths, rasa.shared.data.is_nlu_file
-        )
-        self._story_files = rasa.shared.data.get_data_files(
-            training_data_paths, YAMLStoryReader.is_stories_file
-        )
-        self._conversation_test_files = rasa.shared.data.get_data_files(
-            training_data_paths, YAMLStoryReader.is_test_stories_file
-        )
+        # every training data file is read (and parsed) only once
+        scanner = ProjectScanner(training_data_paths)
+        self._nlu_files = scanner.nlu_files
+        self._story_files = scanner.story_files
+        self._conversation_test_files = scanner.conversation_test_files
 
         self.config = autoconfig.get_configuration(config_file, training_type)
 
@@ -48,22 +42,28 @@ class RasaFileImporter(TrainingDataImporter):
 
     def get_stories(self, exclusion_percentage: Optional[int] = None,) -> StoryGraph:
         """Retrieves training stories / rules (see parent class for full docstring)."""
-        return utils.story_graph_from_paths(
+        return utils.story_graph_from_scanned_files(
             self._story_files, self.get_domain(), exclusion_percentage,
         )
 
     def get_conversation_tests(self) -> StoryGraph:
         """Retrieves conversation test stories (see parent class for full docstring)."""
-        return utils.story_graph_from_paths(
+        return utils.story_graph_from_scanned_files(
             self._conversation_test_files, self.get_domain(),
         )
 
     def get_nlu_data(self, language: Optional[Text] = "en") -> TrainingData:
         """Retrieves NLU training data (see parent class for full docstring)."""
-        return utils.training_data_from_paths(self._nlu_files, language)
+        return utils.training_data_from_scanned_files(self._nlu_files, language)
 
     def get_domain(self) -> Domain:
         """Retrieves model domain (see parent class for full docstring)."""
+        if self._domain is None:
+            self._domain = self._load_domain()
+
+        return self._domain
+
+    def _load_domain(self) -> Domain:
         domain = Domain.empty()
 
         # If domain path is None, return an empty domain
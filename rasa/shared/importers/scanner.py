@@ -0,0 +1,426 @@
+import hashlib
+import logging
+import os
+import pickle
+import time
+import uuid
+from pathlib import Path
+from typing import Any, List, Optional, Set, Text, Union
+
+from ruamel.yaml import YAMLError
+from ruamel.yaml.constructor import DuplicateKeyError
+
+import rasa.version
+import rasa.shared.data
+import rasa.shared.utils.io
+import rasa.shared.utils.validation
+from rasa.shared.constants import TEST_STORIES_FILE_PREFIX
+from rasa.shared.exceptions import YamlSyntaxException
+from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+    KEY_RULES,
+    KEY_STORIES,
+)
+from rasa.shared.nlu.training_data import loading as nlu_loading
+
+logger = logging.getLogger(__name__)
+
+PARSED_FILES_CACHE_LOCATION_ENV = "RASA_PARSED_FILES_CACHE_DIRECTORY"
+# the cache is shared by all projects of the user
+DEFAULT_PARSED_FILES_CACHE_LOCATION = Path("~", ".config", "rasa", "parsed_files")
+# Set this environment variable to `false` to disable the on-disk cache
+PARSED_FILES_CACHE_ENV = "RASA_PARSED_FILES_CACHE"
+# the least recently used entries are removed if the cache holds more entries
+DEFAULT_MAX_PARSED_FILES_CACHE_ENTRIES = 10000
+
+# Increase this whenever the format of the cache entries changes
+CACHE_FORMAT_VERSION = 3
+
+# file systems store modification times with a limited resolution (up to 2 seconds)
+MODIFICATION_TIME_RESOLUTION_NS = 2 * 10 ** 9
+
+
+class _CacheEntry:
+    """The cached information about a single file."""
+
+    def __init__(
+        self,
+        path: Text,
+        stat: os.stat_result,
+        read_at_ns: int,
+        content_hash: Text,
+        content: Text,
+        parsed_content: Optional[bytes] = None,
+        validated_schemas: Optional[Set[Text]] = None,
+    ) -> None:
+        self.path = path
+        self.mtime_ns = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.inode = stat.st_ino
+        # time at which the content was read from the file
+        self.read_at_ns = read_at_ns
+        self.content_hash = content_hash
+        self.content = content
+        # the parsed YAML is stored pickled so that every reader gets its own copy
+        self.parsed_content = parsed_content
+        # fingerprints of the schemas (see `schema_fingerprint`) which the content
+        # was successfully validated against
+        self.validated_schemas = validated_schemas or set()
+        self.version = CACHE_FORMAT_VERSION
+        # parsing and validation might change between Rasa versions
+        self.rasa_version = rasa.version.__version__
+
+    def is_up_to_date(self, stat: os.stat_result) -> bool:
+        """Checks if the file is unchanged without reading it.
+
+        A file which was modified within the modification time resolution of the
+        file system before its content was read might be modified again without
+        changing its modification time. The content of such files needs to be
+        compared by its hash.
+
+        Args:
+            stat: The current status of the file.
+
+        Returns:
+            `True` if the cached content is the current content of the file.
+        """
+        return (
+            self.mtime_ns == stat.st_mtime_ns
+            and self.size == stat.st_size
+            and self.inode == stat.st_ino
+            and stat.st_mtime_ns < self.read_at_ns - MODIFICATION_TIME_RESOLUTION_NS
+        )
+
+
+class ParsedFileCache:
+    """Caches the content of parsed YAML files on disk.
+
+    Entries are keyed by the path of the file and the Rasa version. An entry is used
+    if the modification time, size and inode of the file didn't change (see
+    `_CacheEntry.is_up_to_date`). Otherwise, the file is read again and the cached
+    parse result is still re-used if the content hash of the file matches.
+    Additionally, the cache remembers which schemas (identified by a hash of their
+    content) the file content was already successfully validated against.
+
+    The least recently used entries are removed when the cache is created if it holds
+    more than `max_entries` entries.
+    """
+
+    def __init__(
+        self,
+        location: Union[Text, Path],
+        max_entries: int = DEFAULT_MAX_PARSED_FILES_CACHE_ENTRIES,
+    ) -> None:
+        """Creates cache.
+
+        Args:
+            location: Directory where the cache entries are stored.
+            max_entries: Maximum number of entries which are kept in the cache.
+        """
+        self._location = Path(location)
+        self._max_entries = max_entries
+        self._prune()
+
+    def _prune(self) -> None:
+        """Removes the least recently used entries if there are too many."""
+        entries = []
+        try:
+            with os.scandir(self._location) as directory:
+                for entry in directory:
+                    if entry.name.endswith(".pkl"):
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+        except OSError:
+            # e.g. the cache directory doesn't exist yet
+            return
+
+        entries.sort()
+        for _, entry_path in entries[: max(len(entries) - self._max_entries, 0)]:
+            try:
+                os.remove(entry_path)
+            except OSError as e:
+                logger.debug(
+                    f"Failed to remove cache entry '{entry_path}'. Error:\n{e}"
+                )
+
+    @classmethod
+    def from_environment(cls) -> Optional["ParsedFileCache"]:
+        """Creates the cache as configured via environment variables.
+
+        Returns:
+            The cache or `None` if caching is disabled.
+        """
+        if os.environ.get(PARSED_FILES_CACHE_ENV, "true").lower() == "false":
+            return None
+
+        location = os.environ.get(
+            PARSED_FILES_CACHE_LOCATION_ENV, DEFAULT_PARSED_FILES_CACHE_LOCATION
+        )
+        return cls(Path(location).expanduser())
+
+    def _entry_path(self, path: Text) -> Path:
+        key = hashlib.sha256(
+            f"{rasa.version.__version__}:{os.path.abspath(path)}".encode()
+        ).hexdigest()
+        return self._location / f"{key}.pkl"
+
+    def get(self, path: Text) -> Optional[_CacheEntry]:
+        """Returns the cached entry for a file.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The cached entry or `None` if no (valid) entry exists.
+        """
+        entry_path = self._entry_path(path)
+        if not entry_path.is_file():
+            return None
+
+        try:
+            with entry_path.open("rb") as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logger.debug(f"Failed to read cache entry for '{path}'. Error:\n{e}")
+            return None
+
+        if (
+            not isinstance(entry, _CacheEntry)
+            or getattr(entry, "version", None) != CACHE_FORMAT_VERSION
+            or entry.rasa_version != rasa.version.__version__
+            or entry.path != os.path.abspath(path)
+        ):
+            return None
+
+        try:
+            # mark the entry as recently used so that it's not pruned
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return entry
+
+    def put(self, entry: _CacheEntry) -> None:
+        """Writes an entry to the cache.
+
+        Failing to write an entry is not an error as the cache is an optimization.
+
+        Args:
+            entry: The entry to store.
+        """
+        entry_path = self._entry_path(entry.path)
+        staging_path = entry_path.with_name(f"{entry_path.name}.{uuid.uuid4().hex}")
+        try:
+            self._location.mkdir(parents=True, exist_ok=True)
+            with staging_path.open("wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # `os.replace` atomically overwrites potentially existing entries.
+            os.replace(staging_path, entry_path)
+        except OSError as e:
+            logger.debug(f"Failed to cache parsed file '{entry.path}'. Error:\n{e}")
+            if staging_path.exists():
+                staging_path.unlink()
+
+
+class ScannedFile:
+    """A training data file which was read by the `ProjectScanner`."""
+
+    def __init__(
+        self, path: Text, entry: _CacheEntry, cache: Optional[ParsedFileCache] = None
+    ) -> None:
+        """Creates file.
+
+        Args:
+            path: Path of the file.
+            entry: Content (and potentially cached information) of the file.
+            cache: Cache which is updated when the file is parsed or validated.
+        """
+        self.path = path
+        self._entry = entry
+        self._cache = cache
+        self.nlu_format = nlu_loading.guess_format_from_content(entry.content, path)
+
+    @property
+    def content(self) -> Text:
+        """Returns the content of the file."""
+        return self._entry.content
+
+    def is_nlu_file(self) -> bool:
+        """Checks if the file contains NLU training data (see `is_nlu_file`)."""
+        return self.nlu_format != nlu_loading.UNK
+
+    def is_stories_file(self) -> bool:
+        """Checks if the file contains YAML stories or rules."""
+        return rasa.shared.data.is_likely_yaml_file(
+            self.path
+        ) and rasa.shared.utils.io.is_key_in_yaml_content(
+            self.content, KEY_STORIES, KEY_RULES
+        )
+
+    def is_test_stories_file(self) -> bool:
+        """Checks if the file contains test stories."""
+        return (
+            Path(self.path).name.startswith(TEST_STORIES_FILE_PREFIX)
+            and self.is_stories_file()
+        )
+
+    def parsed_content(self) -> Any:
+        """Parses the file as YAML.
+
+        The file is only parsed once. Every call returns a separate copy of the
+        parsed content so that callers can modify it.
+
+        Returns:
+            The parsed content.
+
+        Raises:
+            YamlSyntaxException: If the file can't be parsed.
+        """
+        if self._entry.parsed_content is None:
+            self._parse()
+            self._persist()
+
+        return pickle.loads(self._entry.parsed_content)
+
+    def _parse(self) -> None:
+        try:
+            parsed = rasa.shared.utils.io.read_yaml(self.content)
+        except (YAMLError, DuplicateKeyError) as e:
+            raise YamlSyntaxException(self.path, e)
+
+        self._entry.parsed_content = pickle.dumps(
+            parsed, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+    def is_validated(self, schema_path: Text) -> bool:
+        """Checks if the file was already successfully validated against a schema."""
+        return (
+            rasa.shared.utils.validation.schema_fingerprint(schema_path)
+            in self._entry.validated_schemas
+        )
+
+    def _set_validated(self, schema_path: Text, parsed_content: Any = None) -> None:
+        if parsed_content is not None and self._entry.parsed_content is None:
+            self._entry.parsed_content = pickle.dumps(
+                parsed_content, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        self._entry.validated_schemas.add(
+            rasa.shared.utils.validation.schema_fingerprint(schema_path)
+        )
+        self._persist()
+
+    def _persist(self) -> None:
+        # the result of parsing files which use environment variables depends on
+        # the current environment, hence they are not cached on disk
+        if self._cache and "${" not in self.content:
+            self._cache.put(self._entry)
+
+
+class ProjectScanner:
+    """Finds and classifies training data files while reading every file only once.
+
+    In contrast to calling `rasa.shared.data.get_data_files` once per file type,
+    every file is read a single time. The content is kept in memory so that the
+    readers don't have to read (and parse) it again. Parse and validation results
+    are additionally cached on disk (see `ParsedFileCache`).
+    """
+
+    def __init__(
+        self,
+        paths: Optional[Union[Text, List[Text]]],
+        cache: Optional[ParsedFileCache] = None,
+    ) -> None:
+        """Scans the training data paths.
+
+        Args:
+            paths: List of paths to training files or folders containing them.
+            cache: Cache for parsed files. Defaults to the cache which is
+                configured via environment variables.
+        """
+        self._cache = cache if cache is not None else ParsedFileCache.from_environment()
+        self.files = [self._scan_file(path) for path in self._find_files(paths)]
+
+    @staticmethod
+    def _find_files(paths: Optional[Union[Text, List[Text]]]) -> List[Text]:
+        if paths is None:
+            paths = []
+        elif isinstance(paths, str):
+            paths = [paths]
+
+        data_files = set()
+        for path in set(paths):
+            if not path:
+                continue
+
+            if rasa.shared.data.is_valid_filetype(path):
+                data_files.add(os.path.abspath(path))
+                continue
+
+            for root, _, files in os.walk(path, followlinks=True):
+                for f in files:
+                    full_path = os.path.join(root, f)
+                    if rasa.shared.data.is_valid_filetype(full_path):
+                        data_files.add(full_path)
+
+        return sorted(data_files)
+
+    def _scan_file(self, path: Text) -> ScannedFile:
+        stat = os.stat(path)
+        entry = self._cache.get(path) if self._cache else None
+
+        if entry and entry.is_up_to_date(stat):
+            return ScannedFile(path, entry, self._cache)
+
+        read_at_ns = time.time_ns()
+        content = rasa.shared.utils.io.read_file(path)
+        content_hash = hashlib.sha256(content.encode()).hexdigest()
+        if entry and entry.content_hash == content_hash:
+            # e.g. the file was touched but not modified
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+            entry.inode = stat.st_ino
+            entry.read_at_ns = read_at_ns
+            scanned_file = ScannedFile(path, entry, self._cache)
+            scanned_file._persist()
+            return scanned_file
+
+        entry = _CacheEntry(
+            os.path.abspath(path), stat, read_at_ns, content_hash, content
+        )
+        return ScannedFile(path, entry, self._cache)
+
+    @property
+    def nlu_files(self) -> List[ScannedFile]:
+        """Returns the files which contain NLU training data."""
+        return [f for f in self.files if f.is_nlu_file()]
+
+    @property
+    def story_files(self) -> List[ScannedFile]:
+        """Returns the files which contain stories or rules."""
+        return [f for f in self.files if f.is_stories_file()]
+
+    @property
+    def conversation_test_files(self) -> List[ScannedFile]:
+        """Returns the files which contain test stories."""
+        return [f for f in self.files if f.is_test_stories_file()]
+
+
+def validate_files(files: List[ScannedFile], schema_path: Text) -> None:
+    """Validates (and parses) files against a YAML schema.
+
+    Files which weren't validated before are validated concurrently if there are
+    enough of them (see `parse_and_validate_yaml_files` in
+    `rasa.shared.utils.validation`).
+
+    Args:
+        files: The files to validate.
+        schema_path: The schema to validate against.
+
+    Raises:
+        YamlException: If any of the files is not valid.
+    """
+    pending = [f for f in files if not f.is_validated(schema_path)]
+    parsed_contents = rasa.shared.utils.validation.parse_and_validate_yaml_files(
+        [(f.path, f.content) for f in pending], schema_path
+    )
+    for scanned_file, parsed_content in zip(pending, parsed_contents):
+        scanned_file._set_validated(schema_path, parsed_content)
@@ -1,9 +1,12 @@
-from typing import Iterable, Text, Optional, List
+from typing import Iterable, Text, Optional, List, TYPE_CHECKING
 
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.training_data.structures import StoryGraph
 from rasa.shared.nlu.training_data.training_data import TrainingData
 
+if TYPE_CHECKING:
+    from rasa.shared.importers.scanner import ScannedFile
+
 
 def training_data_from_paths(paths: Iterable[Text], language: Text) -> TrainingData:
     from rasa.shared.nlu.training_data import loading
@@ -12,6 +15,42 @@ def training_data_from_paths(paths: Iterable[Text], language: Text) -> TrainingD
     return TrainingData().merge(*training_data_sets)
 
 
+def training_data_from_scanned_files(
+    files: Iterable["ScannedFile"], language: Text
+) -> TrainingData:
+    """Returns the `TrainingData` from files which were read by a `ProjectScanner`."""
+    from rasa.shared.importers.scanner import validate_files
+    from rasa.shared.nlu.training_data import loading
+    from rasa.shared.nlu.training_data.formats.rasa_yaml import (
+        NLU_SCHEMA_FILE,
+        RasaYAMLReader,
+    )
+
+    files = list(files)
+    validate_files(
+        [f for f in files if f.nlu_format == loading.RASA_YAML], NLU_SCHEMA_FILE
+    )
+
+    training_data_sets = []
+    for scanned_file in files:
+        if scanned_file.nlu_format == loading.RASA_YAML:
+            reader = RasaYAMLReader()
+            reader.filename = scanned_file.path
+            training_data = reader.read_from_parsed_yaml(scanned_file.parsed_content())
+        else:
+            training_data = loading.load_data_from_content(
+                scanned_file.content,
+                scanned_file.path,
+                scanned_file.nlu_format,
+                language,
+            )
+
+        if training_data:
+            training_data_sets.append(training_data)
+
+    return TrainingData().merge(*training_data_sets)
+
+
 def story_graph_from_paths(
     files: List[Text], domain: Domain, exclusion_percentage: Optional[int] = None,
 ) -> StoryGraph:
@@ -20,3 +59,28 @@ def story_graph_from_paths(
 
     story_steps = loading.load_data_from_files(files, domain, exclusion_percentage)
     return StoryGraph(story_steps)
+
+
+def story_graph_from_scanned_files(
+    files: Iterable["ScannedFile"],
+    domain: Domain,
+    exclusion_percentage: Optional[int] = None,
+) -> StoryGraph:
+    """Returns the `StoryGraph` from files which were read by a `ProjectScanner`."""
+    from rasa.shared.core.training_data import loading
+    from rasa.shared.importers.scanner import validate_files
+    from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+        CORE_SCHEMA_FILE,
+        YAMLStoryReader,
+    )
+
+    files = list(files)
+    validate_files(files, CORE_SCHEMA_FILE)
+
+    story_steps = []
+    for scanned_file in files:
+        reader = YAMLStoryReader(domain, scanned_file.path)
+        story_steps.extend(reader.read_from_parsed_yaml(scanned_file.parsed_content()))
+
+    story_steps = loading.exclude_story_steps(story_steps, exclusion_percentage)
+    return StoryGraph(story_steps)
@@ -62,8 +62,11 @@ class RasaYAMLReader(TrainingDataReader):
         """Check if the string adheres to the NLU yaml data schema.
 
         If the string is not in the right format, an exception will be raised."""
+        self._parse_and_validate(string)
+
+    def _parse_and_validate(self, string: Text) -> Any:
         try:
-            validation.validate_yaml_schema(string, NLU_SCHEMA_FILE)
+            return validation.parse_and_validate_yaml(string, NLU_SCHEMA_FILE)
         except YamlException as e:
             e.filename = self.filename
             raise e
@@ -78,10 +81,19 @@ class RasaYAMLReader(TrainingDataReader):
         Returns:
             New `TrainingData` object with parsed training data.
         """
-        self.validate(string)
+        yaml_content = self._parse_and_validate(string)
+
+        return self.read_from_parsed_yaml(yaml_content)
 
-        yaml_content = rasa.shared.utils.io.read_yaml(string)
+    def read_from_parsed_yaml(self, yaml_content: Dict[Text, Any]) -> "TrainingData":
+        """Reads TrainingData from YAML which was already parsed and validated.
+
+        Args:
+            yaml_content: The parsed YAML as a dictionary.
 
+        Returns:
+            New `TrainingData` object with parsed training data.
+        """
         if not validation.validate_training_data_format_version(
             yaml_content, self.filename
         ):
@@ -4,6 +4,7 @@ import os
 import typing
 from typing import Optional, Text, Callable, Dict, Any
 
+import rasa.shared.data
 import rasa.shared.utils.io
 from rasa.shared.nlu.training_data.formats.dialogflow import (
     DIALOGFLOW_AGENT,
@@ -104,6 +105,28 @@ def _load(filename: Text, language: Optional[Text] = "en") -> Optional["Training
         return None
 
 
+def load_data_from_content(
+    content: Text, filename: Text, fformat: Text, language: Optional[Text] = "en"
+) -> Optional["TrainingData"]:
+    """Loads training data from the content of a file which was already read.
+
+    Args:
+        content: The content of the file.
+        filename: The name of the file (used in error messages and heuristics).
+        fformat: The format of the file as returned by `guess_format_from_content`.
+        language: The language of the training data.
+
+    Returns:
+        The loaded training data or `None` if the format is not supported.
+    """
+    reader = _reader_factory(fformat)
+    if not reader:
+        return None
+
+    reader.filename = filename
+    return reader.reads(content, language=language, fformat=fformat)
+
+
 def guess_format(filename: Text) -> Text:
     """Applies heuristics to guess the data format of a file.
 
@@ -113,18 +136,37 @@ def guess_format(filename: Text) -> Text:
     Returns:
         Guessed file format.
     """
-    from rasa.shared.nlu.training_data.formats import RasaYAMLReader
+    if not os.path.isfile(filename):
+        return UNK
 
-    guess = UNK
+    return guess_format_from_content(rasa.shared.utils.io.read_file(filename), filename)
 
-    if not os.path.isfile(filename):
-        return guess
+
+def guess_format_from_content(content: Text, filename: Text) -> Text:
+    """Applies heuristics to guess the data format of a file which was already read.
+
+    Args:
+        content: content of the file whose type should be guessed
+        filename: name of the file whose type should be guessed
+
+    Returns:
+        Guessed file format.
+    """
+    from rasa.shared.nlu.training_data.formats.rasa_yaml import (
+        KEY_NLU,
+        KEY_RESPONSES,
+    )
+
+    guess = UNK
 
     try:
-        content = rasa.shared.utils.io.read_file(filename)
         js = json.loads(content)
     except ValueError:
-        if RasaYAMLReader.is_yaml_nlu_file(filename):
+        if rasa.shared.data.is_likely_yaml_file(
+            filename
+        ) and rasa.shared.utils.io.is_key_in_yaml_content(
+            content, KEY_NLU, KEY_RESPONSES
+        ):
             guess = RASA_YAML
     else:
         for file_format, format_heuristic in _json_format_heuristics.items():
@@ -5,8 +5,19 @@ import random
 from collections import Counter, OrderedDict
 import copy
 from os.path import relpath
-from typing import Any, Dict, List, Optional, Set, Text, Tuple, Callable
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Text,
+    Tuple,
+    Callable,
+    TYPE_CHECKING,
+)
 import operator
+import pickle
 
 import rasa.shared.data
 from rasa.shared.utils.common import lazy_property
@@ -26,8 +37,11 @@ from rasa.shared.nlu.constants import (
 from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data import util
 
+if TYPE_CHECKING:
+    from rasa.engine.storage.storage import ModelStorage
 
 DEFAULT_TRAINING_DATA_OUTPUT_PATH = "training_data.yml"
+TRAINING_DATA_PROPERTIES_FILE_NAME = "training_data_properties.pkl"
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +123,52 @@ class TrainingData:
         }
         return rasa.shared.utils.io.deep_container_fingerprint(relevant_attributes)
 
+    def to_cache(self, directory: Path, model_storage: "ModelStorage") -> None:
+        """Persists the (potentially featurized) training data to the cache.
+
+        Args:
+            directory: The directory which receives the persisted training data.
+            model_storage: The current model storage (unused).
+        """
+        util.persist_messages(self.training_examples, directory)
+
+        properties = {
+            "entity_synonyms": self.entity_synonyms,
+            "regex_features": self.regex_features,
+            "lookup_tables": self.lookup_tables,
+            "responses": self.responses,
+        }
+        with open(directory / TRAINING_DATA_PROPERTIES_FILE_NAME, "wb") as f:
+            pickle.dump(properties, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_cache(
+        cls, node_name: Text, directory: Path, model_storage: "ModelStorage"
+    ) -> "TrainingData":
+        """Loads training data which was persisted to the cache.
+
+        Args:
+            node_name: The name of the graph node which wants to use the training data.
+            directory: Directory containing the persisted training data.
+            model_storage: The current model storage (unused).
+
+        Returns:
+            The loaded training data.
+        """
+        with open(directory / TRAINING_DATA_PROPERTIES_FILE_NAME, "rb") as f:
+            properties = pickle.load(f)
+
+        # the cached training data was already sanitized when it was created, hence
+        # we set the attributes directly instead of passing them to the constructor
+        training_data = cls()
+        training_data.training_examples = util.load_messages(directory)
+        training_data.entity_synonyms = properties["entity_synonyms"]
+        training_data.regex_features = properties["regex_features"]
+        training_data.lookup_tables = properties["lookup_tables"]
+        training_data.responses = properties["responses"]
+
+        return training_data
+
     def label_fingerprint(self) -> Text:
         """Fingerprints the labels in the training data.
 
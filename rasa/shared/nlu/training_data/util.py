@@ -1,9 +1,12 @@
 import json
 import logging
 import os
+import pickle
 import re
-from typing import Any, Dict, Optional, Text, Match, List
+from pathlib import Path
+from typing import Any, Dict, Optional, Text, Match, List, Tuple, TYPE_CHECKING
 
+import numpy as np
 import scipy.sparse
 from rasa.shared.nlu.constants import (
     ENTITIES,
@@ -20,6 +23,9 @@ from rasa.shared.constants import UTTER_PREFIX
 import rasa.shared.utils.io
 import rasa.shared.data
 
+if TYPE_CHECKING:
+    from rasa.shared.nlu.training_data.message import Message
+
 logger = logging.getLogger(__name__)
 
 ESCAPE_DCT = {"\b": "\\b", "\f": "\\f", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
@@ -29,6 +35,9 @@ UNESCAPE_DCT = {espaced_char: char for char, espaced_char in ESCAPE_DCT.items()}
 UNESCAPE = re.compile(f'[{"".join(UNESCAPE_DCT.values())}]')
 GROUP_COMPLETE_MATCH = 0
 
+MESSAGES_FILE_NAME = "messages.pkl"
+FEATURE_ARRAYS_FILE_NAME = "feature_arrays.npz"
+
 
 def transform_entity_synonyms(
     synonyms: List[Dict[Text, Any]], known_synonyms: Optional[Dict[Text, Any]] = None
@@ -225,3 +234,121 @@ def sparse_matrix_to_string(m: scipy.sparse.spmatrix) -> Text:
     m_coo = m.tocoo()
     triples = zip(list(zip(m_coo.row, m_coo.col)), m_coo.data)
     return "\n".join([("  %s\t%s" % t) for t in triples])
+
+
+def persist_messages(messages: List["Message"], directory: Path) -> None:
+    """Persists messages including their features to a directory.
+
+    The arrays of all features are concatenated into a few blocks per dtype and
+    stored in a single `npz` file (sparse features as CSR blocks). All remaining
+    message data is pickled.
+
+    Args:
+        messages: The messages to persist.
+        directory: The directory to persist the messages to.
+    """
+    blocks: Dict[Text, List[np.ndarray]] = {}
+    block_sizes: Dict[Text, int] = {}
+
+    def add_to_block(role: Text, array: np.ndarray) -> Tuple[Text, int, int]:
+        block_name = f"{role}_{array.dtype.str}"
+        offset = block_sizes.get(block_name, 0)
+        blocks.setdefault(block_name, []).append(array.ravel())
+        block_sizes[block_name] = offset + array.size
+        return block_name, offset, array.size
+
+    serialized_messages = []
+    for message in messages:
+        serialized_features = []
+        for features in message.features:
+            serialized = {
+                "type": features.type,
+                "attribute": features.attribute,
+                "origin": features.origin,
+                "shape": features.features.shape,
+            }
+            if features.is_sparse():
+                matrix = features.features.tocsr()
+                serialized["format"] = features.features.getformat()
+                serialized["data"] = add_to_block("data", matrix.data)
+                serialized["indices"] = add_to_block("indices", matrix.indices)
+                serialized["indptr"] = add_to_block("indptr", matrix.indptr)
+            else:
+                serialized["dense"] = add_to_block("dense", features.features)
+
+            serialized_features.append(serialized)
+
+        serialized_messages.append(
+            {
+                "data": message.data,
+                "output_properties": message.output_properties,
+                "time": message.time,
+                "features": serialized_features,
+            }
+        )
+
+    np.savez(
+        directory / FEATURE_ARRAYS_FILE_NAME,
+        **{name: np.concatenate(arrays) for name, arrays in blocks.items()},
+    )
+    with open(directory / MESSAGES_FILE_NAME, "wb") as f:
+        pickle.dump(serialized_messages, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_messages(directory: Path) -> List["Message"]:
+    """Loads messages which were persisted with `persist_messages`.
+
+    Args:
+        directory: The directory containing the persisted messages.
+
+    Returns:
+        The loaded messages.
+    """
+    from rasa.shared.nlu.training_data.features import Features
+    from rasa.shared.nlu.training_data.message import Message
+
+    with np.load(directory / FEATURE_ARRAYS_FILE_NAME, allow_pickle=False) as f:
+        blocks = {name: f[name] for name in f.files}
+    with open(directory / MESSAGES_FILE_NAME, "rb") as f:
+        serialized_messages = pickle.load(f)
+
+    def from_block(location: Tuple[Text, int, int]) -> np.ndarray:
+        block_name, offset, size = location
+        return blocks[block_name][offset : offset + size]
+
+    messages = []
+    for serialized in serialized_messages:
+        features = []
+        for serialized_features in serialized["features"]:
+            shape = serialized_features["shape"]
+            if "dense" in serialized_features:
+                array = from_block(serialized_features["dense"]).reshape(shape)
+            else:
+                array = scipy.sparse.csr_matrix(
+                    (
+                        from_block(serialized_features["data"]),
+                        from_block(serialized_features["indices"]),
+                        from_block(serialized_features["indptr"]),
+                    ),
+                    shape=shape,
+                ).asformat(serialized_features["format"])
+
+            features.append(
+                Features(
+                    array,
+                    serialized_features["type"],
+                    serialized_features["attribute"],
+                    serialized_features["origin"],
+                )
+            )
+
+        messages.append(
+            Message(
+                data=serialized["data"],
+                output_properties=serialized["output_properties"],
+                time=serialized["time"],
+                features=features,
+            )
+        )
+
+    return messages
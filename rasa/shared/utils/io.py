@@ -7,10 +7,11 @@ import json
 import os
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Text, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Text, Type, Union
 import warnings
 import random
 import string
+import threading
 
 from ruamel import yaml as yaml
 from ruamel.yaml import RoundTripRepresenter, YAMLError
@@ -337,6 +338,10 @@ replace_environment_variables()
 def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> Any:
     """Parses yaml from a text.
 
+    The default "safe" reader uses the C implementation of the parser if it is
+    available. Round-trip parsing (reader type "rt") is considerably slower and
+    should only be used if meta information such as line numbers is required.
+
     Args:
         content: A text containing yaml content.
         reader_type: Reader type to use. By default "safe" will be used.
@@ -344,7 +349,7 @@ def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> A
     Raises:
         ruamel.yaml.parser.ParserError: If there was an error when parsing the YAML.
     """
-    if _is_ascii(content):
+    if _has_unicode_escape_sequences(content):
         # Required to make sure emojis are correctly parsed
         content = (
             content.encode("utf-8")
@@ -353,15 +358,52 @@ def read_yaml(content: Text, reader_type: Union[Text, List[Text]] = "safe") -> A
             .decode("utf-16")
         )
 
-    yaml_parser = yaml.YAML(typ=reader_type)
-    yaml_parser.version = YAML_VERSION
-    yaml_parser.preserve_quotes = True
+    yaml_parser = _yaml_parser(reader_type)
+    try:
+        return yaml_parser.load(content) or {}
+    except Exception:
+        # don't re-use parsers which might be left in an inconsistent state
+        _yaml_parsers.parsers.clear()
+        raise
+
 
-    return yaml_parser.load(content) or {}
+def _has_unicode_escape_sequences(text: Text) -> bool:
+    # Only `\u` and `\U` escape sequences are changed by the `raw_unicode_escape`
+    # decoding. Any other ASCII text is left as is, so we can skip the conversion.
+    return _is_ascii(text) and ("\\u" in text or "\\U" in text)
 
 
 def _is_ascii(text: Text) -> bool:
-    return all(ord(character) < 128 for character in text)
+    return text.isascii()
+
+
+_yaml_parsers = threading.local()
+
+
+def _yaml_parser(reader_type: Union[Text, List[Text]]) -> yaml.YAML:
+    """Returns a YAML parser for the current thread.
+
+    Creating a parser is expensive, hence parsers are re-used. Parsers are not
+    thread-safe which is why every thread gets its own parsers.
+
+    Args:
+        reader_type: Reader type of the parser.
+
+    Returns:
+        The parser.
+    """
+    key = reader_type if isinstance(reader_type, str) else tuple(reader_type)
+    parsers = getattr(_yaml_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _yaml_parsers.parsers = {}
+
+    if key not in parsers:
+        yaml_parser = yaml.YAML(typ=reader_type)
+        yaml_parser.version = YAML_VERSION
+        yaml_parser.preserve_quotes = True
+        parsers[key] = yaml_parser
+
+    return parsers[key]
 
 
 def read_yaml_file(filename: Union[Text, Path]) -> Union[List[Any], Dict[Text, Any]]:
@@ -434,16 +476,33 @@ def is_key_in_yaml(file_path: Union[Text, Path], *keys: Text) -> bool:
     """
     try:
         with open(file_path, encoding=DEFAULT_ENCODING) as file:
-            return any(
-                any(line.lstrip().startswith(f"{key}:") for key in keys)
-                for line in file
-            )
+            return _is_key_in_lines(file, keys)
     except FileNotFoundError:
         raise FileNotFoundException(
             f"Failed to read file, " f"'{os.path.abspath(file_path)}' does not exist."
         )
 
 
+def is_key_in_yaml_content(content: Text, *keys: Text) -> bool:
+    """Checks if any of the keys is contained in the root object of a yaml text.
+
+    This is the equivalent of `is_key_in_yaml` for files which were already read.
+
+    Arguments:
+        content: the yaml text
+        keys: keys to look for
+
+    Returns:
+          `True` if at least one of the keys is found, `False` otherwise.
+    """
+    return _is_key_in_lines(content.splitlines(), keys)
+
+
+def _is_key_in_lines(lines: Iterable[Text], keys: Iterable[Text]) -> bool:
+    prefixes = tuple(f"{key}:" for key in keys)
+    return any(line.lstrip().startswith(prefixes) for line in lines)
+
+
 def convert_to_ordered_dict(obj: Any) -> Any:
     """Convert object to an `OrderedDict`.
 
@@ -570,8 +629,7 @@ def read_validated_yaml(filename: Union[Text, Path], schema: Text) -> Any:
     """
     content = read_file(filename)
 
-    rasa.shared.utils.validation.validate_yaml_schema(content, schema)
-    return read_yaml(content)
+    return rasa.shared.utils.validation.parse_and_validate_yaml(content, schema)
 
 
 def read_config_file(filename: Union[Path, Text]) -> Dict[Text, Any]:
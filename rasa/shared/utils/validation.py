@@ -1,11 +1,19 @@
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import json
 import logging
+import math
+import multiprocessing
 import os
-from typing import Text, Dict, List, Optional, Any
+from typing import Text, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 from packaging import version
 from packaging.version import LegacyVersion
 from pykwalify.errors import SchemaError
 
+from ruamel.yaml import YAMLError
 from ruamel.yaml.constructor import DuplicateKeyError
 
 import rasa.shared
@@ -21,12 +29,25 @@ from rasa.shared.constants import (
     LATEST_TRAINING_DATA_FORMAT_VERSION,
     SCHEMA_EXTENSIONS_FILE,
     RESPONSES_SCHEMA_FILE,
+    ENV_NUM_YAML_PARSING_PROCESSES,
 )
 
+if TYPE_CHECKING:
+    from jsonschema.validators import Draft4Validator
+    from pykwalify.core import Core
+
 logger = logging.getLogger(__name__)
 
 KEY_TRAINING_DATA_FORMAT_VERSION = "version"
 
+# Min. number of YAML files which are parsed by each worker process. Starting a
+# worker process is only worth it if it has enough files to parse.
+MIN_YAML_FILES_PER_PROCESS = 25
+
+# Max. number of compiled JSON schema validators which are cached. The least recently
+# used validators are compiled again if more schemas are used.
+MAX_CACHED_JSON_SCHEMA_VALIDATORS = 256
+
 
 class YamlValidationException(YamlException, ValueError):
     """Raised if a yaml file does not correspond to the expected schema."""
@@ -117,65 +138,310 @@ class YamlValidationException(YamlException, ValueError):
         return self._line_number_for_path(current, tail) or this_line
 
 
-def validate_yaml_schema(yaml_file_content: Text, schema_path: Text) -> None:
+def validate_yaml_schema(
+    yaml_file_content: Text, schema_path: Text, parsed_content: Any = None
+) -> None:
     """
     Validate yaml content.
 
+    The content is first validated using the fast "safe" YAML parser. Only if the
+    content is invalid, it's parsed again with the round-trip parser to point the
+    user to the lines which caused the errors.
+
     Args:
         yaml_file_content: the content of the yaml file to be validated
         schema_path: the schema of the yaml file
+        parsed_content: the content of the yaml file parsed with the "safe"
+            parser in case the caller already parsed it
+    """
+    if parsed_content is None:
+        try:
+            parsed_content = rasa.shared.utils.io.read_yaml(yaml_file_content)
+        except (YAMLError, DuplicateKeyError) as e:
+            raise YamlSyntaxException(underlying_yaml_exception=e)
+
+    if not _validate_against_schema(parsed_content, schema_path).errors:
+        return
+
+    # we need "rt" since
+    # it will add meta information to the parsed output. this meta information
+    # will include e.g. at which line an object was parsed. this is very
+    # helpful when we validate files later on and want to point the user to the
+    # right line
+    source_data = rasa.shared.utils.io.read_yaml(
+        yaml_file_content, reader_type=["safe", "rt"]
+    )
+    c = _validate_against_schema(source_data, schema_path)
+    raise YamlValidationException(
+        "Please make sure the file is correct and all "
+        "mandatory parameters are specified. Here are the errors "
+        "found during validation",
+        c.errors,
+        content=source_data,
+    )
+
+
+def _validate_against_schema(source_data: Any, schema_path: Text) -> "Core":
+    """Validates parsed YAML against a pykwalify schema.
+
+    Args:
+        source_data: The parsed YAML.
+        schema_path: The schema of the YAML.
+
+    Returns:
+        The pykwalify validator which holds the validation errors (if any).
     """
     from pykwalify.core import Core
-    from pykwalify.errors import SchemaError
-    from ruamel.yaml import YAMLError
     import pkg_resources
     import logging
 
     log = logging.getLogger("pykwalify")
     log.setLevel(logging.CRITICAL)
 
-    try:
-        # we need "rt" since
-        # it will add meta information to the parsed output. this meta information
-        # will include e.g. at which line an object was parsed. this is very
-        # helpful when we validate files later on and want to point the user to the
-        # right line
-        source_data = rasa.shared.utils.io.read_yaml(
-            yaml_file_content, reader_type=["safe", "rt"]
-        )
-    except (YAMLError, DuplicateKeyError) as e:
-        raise YamlSyntaxException(underlying_yaml_exception=e)
+    schema_extensions = pkg_resources.resource_filename(
+        PACKAGE_NAME, SCHEMA_EXTENSIONS_FILE
+    )
+
+    c = Core(
+        source_data=source_data,
+        # `pykwalify` might modify the schema, hence every validation gets a copy
+        schema_data=copy.deepcopy(_load_schema(schema_path)),
+        extensions=[schema_extensions],
+    )
+
+    c.validate(raise_exception=False)
+    return c
+
+
+@functools.lru_cache(maxsize=None)
+def _load_schema(schema_path: Text) -> Dict[Text, Any]:
+    """Loads a pykwalify schema including the shared response schema.
+
+    Args:
+        schema_path: The schema which should be loaded.
+
+    Returns:
+        The schema content.
+    """
+    import pkg_resources
 
     schema_file = pkg_resources.resource_filename(PACKAGE_NAME, schema_path)
     schema_utils_file = pkg_resources.resource_filename(
         PACKAGE_NAME, RESPONSES_SCHEMA_FILE
     )
-    schema_extensions = pkg_resources.resource_filename(
-        PACKAGE_NAME, SCHEMA_EXTENSIONS_FILE
-    )
 
     # Load schema content using our YAML loader as `pykwalify` uses a global instance
     # which can fail when used concurrently
     schema_content = rasa.shared.utils.io.read_yaml_file(schema_file)
     schema_utils_content = rasa.shared.utils.io.read_yaml_file(schema_utils_file)
-    schema_content = dict(schema_content, **schema_utils_content)
+    return dict(schema_content, **schema_utils_content)
 
-    c = Core(
-        source_data=source_data,
-        schema_data=schema_content,
-        extensions=[schema_extensions],
-    )
 
+@functools.lru_cache(maxsize=None)
+def schema_fingerprint(schema_path: Text) -> Text:
+    """Creates a fingerprint of a pykwalify schema and the files it depends on.
+
+    Args:
+        schema_path: The schema.
+
+    Returns:
+        A hash of the content of the schema files.
+    """
+    import pkg_resources
+
+    fingerprint = hashlib.sha256()
+    for file in [schema_path, RESPONSES_SCHEMA_FILE, SCHEMA_EXTENSIONS_FILE]:
+        with open(pkg_resources.resource_filename(PACKAGE_NAME, file), "rb") as f:
+            fingerprint.update(f.read())
+
+    return fingerprint.hexdigest()
+
+
+def parse_and_validate_yaml(yaml_file_content: Text, schema_path: Text) -> Any:
+    """Parses yaml content and validates it against a schema.
+
+    Args:
+        yaml_file_content: the content of the yaml file
+        schema_path: the schema of the yaml file
+
+    Returns:
+        The parsed content.
+
+    Raises:
+        YamlException: If the content can't be parsed or is invalid.
+    """
     try:
-        c.validate(raise_exception=True)
-    except SchemaError:
-        raise YamlValidationException(
-            "Please make sure the file is correct and all "
-            "mandatory parameters are specified. Here are the errors "
-            "found during validation",
-            c.errors,
-            content=source_data,
+        parsed_content = rasa.shared.utils.io.read_yaml(yaml_file_content)
+    except (YAMLError, DuplicateKeyError) as e:
+        raise YamlSyntaxException(underlying_yaml_exception=e)
+
+    validate_yaml_schema(yaml_file_content, schema_path, parsed_content)
+    return parsed_content
+
+
+def parse_and_validate_yaml_files(
+    files: List[Tuple[Text, Text]], schema_path: Text
+) -> List[Any]:
+    """Validates and parses the content of multiple YAML files.
+
+    If there are enough files, they are processed concurrently in worker processes.
+    The number of worker processes is configured via the
+    `RASA_NUM_YAML_PARSING_PROCESSES` environment variable (defaults to the number
+    of CPUs). Each worker process handles at least `MIN_YAML_FILES_PER_PROCESS`
+    files.
+
+    Args:
+        files: The names and contents of the files.
+        schema_path: The schema of the files.
+
+    Returns:
+        The parsed content of each file in the order of `files`.
+
+    Raises:
+        YamlException: If any of the files is invalid. The error refers to the
+            first invalid file in the order of `files`.
+    """
+    num_processes = min(
+        int(os.environ.get(ENV_NUM_YAML_PARSING_PROCESSES, os.cpu_count() or 1)),
+        len(files) // MIN_YAML_FILES_PER_PROCESS,
+    )
+
+    contents = [content for _, content in files]
+    if num_processes <= 1:
+        results = [None] * len(files)
+    else:
+        chunk_size = math.ceil(len(files) / num_processes)
+        chunks = [
+            contents[i : i + chunk_size] for i in range(0, len(contents), chunk_size)
+        ]
+        logger.debug(
+            f"Parsing {len(files)} YAML files in {len(chunks)} worker processes."
         )
+        worker = functools.partial(_parse_and_validate_yaml, schema_path=schema_path)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = [
+                result
+                for chunk_results in pool.map(worker, chunks)
+                for result in chunk_results
+            ]
+
+    for index, (filename, content) in enumerate(files):
+        if results[index] is not None:
+            continue
+
+        # Files which weren't processed in a worker or failed to validate are
+        # (re-)processed here to raise the error.
+        try:
+            results[index] = parse_and_validate_yaml(content, schema_path)
+        except YamlException as e:
+            e.filename = filename
+            raise e
+
+    return results
+
+
+def _parse_and_validate_yaml(
+    contents: List[Text], schema_path: Text
+) -> List[Optional[Any]]:
+    """Validates and parses YAML in a worker process.
+
+    Args:
+        contents: The contents of the YAML files.
+        schema_path: The schema of the files.
+
+    Returns:
+        The parsed contents. The result is `None` for invalid content.
+    """
+    results = []
+    for content in contents:
+        try:
+            results.append(parse_and_validate_yaml(content, schema_path))
+        except Exception:
+            results.append(None)
+
+    return results
+
+
+def compiled_json_schema_validator(schema: Dict[Text, Any]) -> "Draft4Validator":
+    """Returns a validator for a JSON schema which is compiled only once.
+
+    Checking the schema and creating a validator is a lot more expensive than the
+    actual validation. Validators are hence shared by all callers which use the same
+    schema. Looking up the validator is fastest if the same schema object is passed
+    every time (e.g. a module level constant) as the schema then doesn't need to be
+    serialized.
+
+    Args:
+        schema: The JSON schema. It must not be modified after it was passed.
+
+    Returns:
+        A validator for the schema.
+    """
+    return _validator_for_schema_object(_SchemaObject(schema))
+
+
+class _SchemaObject:
+    """Schema which is compared by identity when it is used as cache key.
+
+    The key keeps the schema alive, so that its `id` can't be reused by a different
+    object while it is cached.
+    """
+
+    __slots__ = ("schema",)
+
+    def __init__(self, schema: Dict[Text, Any]) -> None:
+        self.schema = schema
+
+    def __hash__(self) -> int:
+        return id(self.schema)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _SchemaObject) and other.schema is self.schema
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_JSON_SCHEMA_VALIDATORS)
+def _validator_for_schema_object(schema_object: _SchemaObject) -> "Draft4Validator":
+    return _validator_for_serialized_schema(
+        json.dumps(schema_object.schema, sort_keys=True)
+    )
+
+
+@functools.lru_cache(maxsize=MAX_CACHED_JSON_SCHEMA_VALIDATORS)
+def _validator_for_serialized_schema(serialized_schema: Text) -> "Draft4Validator":
+    from jsonschema.validators import validator_for
+
+    schema = json.loads(serialized_schema)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def validate_json(json_data: Any, schema: Dict[Text, Any]) -> None:
+    """Validates data against a JSON schema using a precompiled validator.
+
+    This behaves like `jsonschema.validate` but doesn't compile the schema again for
+    every call.
+
+    Args:
+        json_data: The data to validate.
+        schema: The JSON schema. It must not be modified after it was passed.
+
+    Raises:
+        jsonschema.ValidationError: If the data doesn't match the schema.
+    """
+    validator = compiled_json_schema_validator(schema)
+
+    # fast path: checking if the data is valid stops at the first error
+    if validator.is_valid(json_data):
+        return
+
+    from jsonschema.exceptions import best_match
+
+    error = best_match(validator.iter_errors(json_data))
+    if error is not None:
+        raise error
 
 
 def validate_training_data(json_data: Dict[Text, Any], schema: Dict[Text, Any]) -> None:
@@ -188,11 +454,10 @@ def validate_training_data(json_data: Dict[Text, Any], schema: Dict[Text, Any])
     Raises:
         SchemaValidationError if validation fails.
     """
-    from jsonschema import validate
     from jsonschema import ValidationError
 
     try:
-        validate(json_data, schema)
+        validate_json(json_data, schema)
     except ValidationError as e:
         e.message += (
             f". Failed to validate data, make sure your data "
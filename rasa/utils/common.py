@@ -1,5 +1,7 @@
 import asyncio
+import concurrent.futures
 import logging
+import multiprocessing
 import os
 import shutil
 import warnings
@@ -20,7 +22,12 @@ from typing import (
 )
 
 import rasa.utils.io
-from rasa.constants import DEFAULT_LOG_LEVEL_LIBRARIES, ENV_LOG_LEVEL_LIBRARIES
+from rasa.constants import (
+    DEFAULT_LOG_LEVEL_LIBRARIES,
+    ENV_LOG_LEVEL_LIBRARIES,
+    ENV_CPU_INTER_OP_CONFIG,
+    ENV_CPU_INTRA_OP_CONFIG,
+)
 from rasa.shared.constants import DEFAULT_LOG_LEVEL, ENV_LOG_LEVEL
 import rasa.shared.utils.io
 
@@ -28,6 +35,16 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Environment variables which limit the size of the thread pools of the
+# BLAS / OpenMP libraries used by `numpy`, `scipy` and `sklearn`.
+BLAS_THREADS_ENV_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
 
 class TempDirectoryPath(str, ContextManager):
     """Represents a path to an temporary directory.
@@ -402,3 +419,56 @@ def find_unavailable_packages(package_names: List[Text]) -> Set[Text]:
 def module_path_from_class(clazz: Type) -> Text:
     """Return the module path of an instance's class."""
     return clazz.__module__ + "." + clazz.__name__
+
+
+def create_process_pool(
+    num_processes: int, num_threads_per_process: Optional[int] = None
+) -> concurrent.futures.ProcessPoolExecutor:
+    """Creates a pool of worker processes to run independent jobs in parallel.
+
+    The workers are started with the `spawn` method since TensorFlow is not
+    fork-safe. Each worker limits the threads of TensorFlow and the BLAS libraries
+    so that the workers don't compete for the same CPU cores.
+
+    Args:
+        num_processes: The number of worker processes.
+        num_threads_per_process: The maximum number of threads each worker is allowed
+            to use for TensorFlow and BLAS operations. If `None`, the available
+            CPU cores are split evenly between the workers.
+
+    Returns:
+        The process pool. It should be used as a context manager so that the
+        workers are shut down when they are not needed anymore.
+    """
+    if num_threads_per_process is None:
+        num_threads_per_process = max(1, (os.cpu_count() or 1) // num_processes)
+
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_worker_process,
+        initargs=(num_threads_per_process,),
+    )
+
+
+def _initialize_worker_process(num_threads: int) -> None:
+    """Limits the threads of a worker process."""
+    # the environment variables apply to libraries which aren't loaded yet
+    for variable in BLAS_THREADS_ENV_VARIABLES + (
+        ENV_CPU_INTER_OP_CONFIG,
+        ENV_CPU_INTRA_OP_CONFIG,
+    ):
+        os.environ[variable] = str(num_threads)
+
+    # the BLAS / OpenMP libraries of e.g. `numpy` are already loaded when the
+    # worker unpickles its jobs and have to be limited at runtime
+    import threadpoolctl
+
+    threadpoolctl.threadpool_limits(limits=num_threads)
+
+    # the log level is inherited from the parent process via `ENV_LOG_LEVEL`
+    set_log_level()
+
+    import rasa.utils.tensorflow.environment
+
+    rasa.utils.tensorflow.environment.setup_tf_environment()
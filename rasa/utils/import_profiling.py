@@ -0,0 +1,132 @@
+import importlib.abc
+import importlib.machinery
+import sys
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Text, TextIO, Tuple
+
+# Number of modules which are listed in the import time report by default.
+DEFAULT_REPORT_LENGTH = 30
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Measures how long it takes to import modules.
+
+    The profiler is similar to Python's `-X importtime` option, but can be turned
+    on at runtime. Once `start` was called, the execution time of every newly
+    imported module is recorded. Already imported modules are not affected.
+    """
+
+    def __init__(self) -> None:
+        """Creates the profiler."""
+        # maps the name of each imported module to its self and cumulative time
+        self.timings: Dict[Text, Tuple[float, float]] = {}
+        # time spent importing nested modules of the modules currently imported
+        self._nested_import_times: List[float] = []
+        self._is_finding_spec = False
+
+    def start(self) -> None:
+        """Starts recording import times."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        """Stops recording import times."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: Text,
+        path: Optional[Sequence[Text]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        """Finds the spec of a module and wraps its loader to time the import."""
+        if self._is_finding_spec:
+            return None
+
+        # let the remaining finders find the module
+        self._is_finding_spec = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._is_finding_spec = False
+
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            # e.g. namespace packages which don't execute any code
+            return spec
+
+        spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _record(self, name: Text, loader: Any, module: ModuleType) -> None:
+        # restore the original loader so that the module can't tell the difference
+        module.__loader__ = loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = loader
+
+        self._nested_import_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            cumulative_time = time.perf_counter() - start
+            nested_time = self._nested_import_times.pop()
+            if self._nested_import_times:
+                self._nested_import_times[-1] += cumulative_time
+
+            self.timings[name] = (cumulative_time - nested_time, cumulative_time)
+
+    def total_time(self) -> float:
+        """Returns the total time which was spent importing modules in seconds."""
+        return sum(self_time for self_time, _ in self.timings.values())
+
+    def print_report(
+        self, length: int = DEFAULT_REPORT_LENGTH, file: Optional[TextIO] = None
+    ) -> None:
+        """Prints the modules which took the longest to import.
+
+        Args:
+            length: Number of modules to print.
+            file: Where to print the report to. Defaults to `stderr`.
+        """
+        file = file or sys.stderr
+        slowest_modules = sorted(
+            self.timings.items(), key=lambda item: item[1][1], reverse=True
+        )[:length]
+
+        print(
+            f"Imported {len(self.timings)} modules in "
+            f"{self.total_time():.3f} seconds. Slowest imports:",
+            file=file,
+        )
+        print(f"{'self [ms]':>10} | {'cumulative [ms]':>15} | module", file=file)
+        for name, (self_time, cumulative_time) in slowest_modules:
+            print(
+                f"{self_time * 1000:>10.1f} | {cumulative_time * 1000:>15.1f} | {name}",
+                file=file,
+            )
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a loader so that the execution time of a module can be measured."""
+
+    def __init__(self, loader: Any, profiler: ImportProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler._record(module.__name__, self._loader, module)
+
+    def __getattr__(self, name: Text) -> Any:
+        return getattr(self._loader, name)
@@ -91,6 +91,14 @@ SENTENCE_FEATURES = "sentence_features"
 
 FEATURIZERS = "featurizers"
 CHECKPOINT_MODEL = "checkpoint_model"
+USE_TF_DATA_PIPELINE = "use_tf_data_pipeline"
+DIALOGUE_CACHE_SIZE = "dialogue_cache_size"
+
+LABEL_INDEX = "label_index"
+LABEL_INDEX_NUM_CLUSTERS = "label_index_num_clusters"
+LABEL_INDEX_NUM_PROBES = "label_index_num_probes"
+EXACT = "exact"
+IVF = "ivf"
 
 MASK = "mask"
 
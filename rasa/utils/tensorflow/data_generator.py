@@ -1,4 +1,5 @@
-from typing import List, Union, Text, Optional, Any, Tuple, Dict
+from collections import defaultdict
+from typing import List, Union, Text, Optional, Any, Tuple, Dict, Iterator
 
 import logging
 import scipy.sparse
@@ -10,6 +11,11 @@ from rasa.utils.tensorflow.model_data import RasaModelData, Data, FeatureArray
 
 logger = logging.getLogger(__name__)
 
+# number of consecutive batches whose examples are sorted by sequence length
+BUCKET_POOL_SIZE = 10
+# key under which the example ids are balanced in `RasaDataPipeline`
+EXAMPLE_IDS = "example_ids"
+
 
 class RasaDataGenerator(tf.keras.utils.Sequence):
     """Abstract data generator."""
@@ -423,3 +429,264 @@ class RasaBatchDataGenerator(RasaDataGenerator):
             )
         else:
             return int(self.batch_size[0])
+
+
+class RasaDataPipeline:
+    """Creates a `tf.data` input pipeline for the model data.
+
+    In contrast to `RasaBatchDataGenerator` the batches are created inside a
+    parallel `tf.data` map and are prefetched while the model is training on the
+    previous batch. Sparse features are converted to `coo_matrix` once and reused in
+    every epoch. If `bucket_by_sequence_length` is set, examples of similar sequence
+    length are grouped into the same batch to minimize padding.
+    """
+
+    def __init__(
+        self,
+        model_data: RasaModelData,
+        batch_size: Union[List[int], int],
+        epochs: int = 1,
+        batch_strategy: Text = SEQUENCE,
+        shuffle: bool = True,
+        bucket_by_sequence_length: bool = True,
+        bucket_pool_size: int = BUCKET_POOL_SIZE,
+    ):
+        """Initializes the data pipeline.
+
+        Args:
+            model_data: The model data to use.
+            batch_size: The batch size(s).
+            epochs: The total number of epochs.
+            batch_strategy: The batch strategy.
+            shuffle: If 'True', data will be shuffled.
+            bucket_by_sequence_length: If 'True', examples of similar sequence length
+              are put into the same batch. Only used for the 'sequence' batch
+              strategy, as it would undo the label mix of the 'balanced' strategy.
+            bucket_pool_size: Number of consecutive batches whose examples are
+              sorted by sequence length.
+        """
+        self.model_data = model_data
+        self.batch_size = batch_size
+        self.epochs = epochs
+        self.batch_strategy = batch_strategy
+        self.shuffle = shuffle
+        self.bucket_by_sequence_length = (
+            bucket_by_sequence_length and batch_strategy == SEQUENCE
+        )
+        self.bucket_pool_size = bucket_pool_size
+
+        self._data = self._convert_sparse_features_to_coo(model_data.data)
+        self._sequence_lengths = self._max_sequence_lengths(
+            self._data, model_data.num_examples
+        )
+        # we use the start of every epoch to prepare the data for it
+        # set current epoch to `-1`, so that the first epoch will increase it to `0`
+        self._current_epoch = -1
+
+        first_batch = self.prepare_batch(np.arange(min(1, model_data.num_examples)))
+        self._output_types = [tf.as_dtype(x.dtype) for x in first_batch]
+        self._output_ranks = [x.ndim for x in first_batch]
+
+    def as_dataset(self) -> tf.data.Dataset:
+        """Creates the `tf.data.Dataset` which yields the batches of an epoch.
+
+        Every iteration over the dataset is a new epoch, e.g. the data is shuffled
+        and balanced again.
+
+        Returns:
+            The dataset.
+        """
+        dataset = tf.data.Dataset.from_generator(
+            self._batch_ids_for_next_epoch,
+            output_types=tf.int64,
+            output_shapes=tf.TensorShape([None]),
+        )
+        dataset = dataset.map(
+            self._prepare_batch_tensors,
+            num_parallel_calls=tf.data.experimental.AUTOTUNE,
+        )
+        return dataset.prefetch(tf.data.experimental.AUTOTUNE)
+
+    def prepare_batch(self, ids: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Creates the batch for the examples with the given ids.
+
+        Args:
+            ids: The ids of the examples in the batch.
+
+        Returns:
+            The features of the batch in the same format as
+            `RasaDataGenerator.prepare_batch`.
+        """
+        batch_data = []
+
+        for attribute_data in self._data.values():
+            for f_data in attribute_data.values():
+                # features which are not present are removed when they are added to
+                # the model data, so there is no need to propagate `None` values
+                for v in f_data:
+                    _data = v[ids]
+
+                    if _data.is_sparse:
+                        batch_data.extend(
+                            RasaDataGenerator._scipy_matrix_to_values(_data)
+                        )
+                    else:
+                        batch_data.append(RasaDataGenerator._pad_dense_data(_data))
+
+        return tuple(batch_data)
+
+    def _prepare_batch_tensors(self, ids: tf.Tensor) -> Tuple[Tuple[tf.Tensor, ...]]:
+        batch = tf.numpy_function(self.prepare_batch, [ids], self._output_types)
+        for tensor, rank in zip(batch, self._output_ranks):
+            tensor.set_shape([None] * rank)
+
+        # our target data is inside the input data, so the dataset only contains
+        # the input data
+        return (tuple(batch),)
+
+    def _batch_ids_for_next_epoch(self) -> Iterator[np.ndarray]:
+        self._current_epoch += 1
+        batch_size = self._linearly_increasing_batch_size()
+
+        ids = self._shuffled_and_balanced_ids(batch_size)
+
+        if self.bucket_by_sequence_length:
+            yield from self._bucketed_batches(ids, batch_size)
+        else:
+            for start in range(0, len(ids), batch_size):
+                yield ids[start : start + batch_size]
+
+    def _linearly_increasing_batch_size(self) -> int:
+        """Linearly increase batch size with every epoch.
+
+        The idea comes from https://arxiv.org/abs/1711.00489.
+
+        Returns:
+            The batch size to use in this epoch.
+        """
+        if not isinstance(self.batch_size, list):
+            return int(self.batch_size)
+
+        if self.epochs > 1:
+            return int(
+                self.batch_size[0]
+                + min(self._current_epoch, self.epochs - 1)
+                * (self.batch_size[1] - self.batch_size[0])
+                / (self.epochs - 1)
+            )
+        else:
+            return int(self.batch_size[0])
+
+    def _shuffled_and_balanced_ids(self, batch_size: int) -> np.ndarray:
+        num_examples = self.model_data.num_examples
+
+        if self.shuffle:
+            ids = np.random.permutation(num_examples)
+        else:
+            ids = np.arange(num_examples)
+
+        if self.batch_strategy != BALANCED or self.model_data.label_key is None:
+            return ids
+
+        # balance only the labels and the example ids instead of all the features
+        label_key = self.model_data.label_key
+        label_sub_key = self.model_data.label_sub_key
+        data = {
+            label_key: {label_sub_key: [self._data[label_key][label_sub_key][0][ids]]},
+            EXAMPLE_IDS: {EXAMPLE_IDS: [FeatureArray(ids, number_of_dimensions=1)]},
+        }
+        balanced_data = self.model_data.balanced_data(data, batch_size, self.shuffle)
+
+        return np.asarray(balanced_data[EXAMPLE_IDS][EXAMPLE_IDS][0], dtype=np.int64)
+
+    def _bucketed_batches(self, ids: np.ndarray, batch_size: int) -> List[np.ndarray]:
+        """Groups examples of similar sequence length into the same batch.
+
+        The examples are only sorted inside pools of consecutive batches, so that
+        the batches are still shuffled.
+
+        Args:
+            ids: The shuffled ids of the examples.
+            batch_size: The batch size.
+
+        Returns:
+            The ids of the examples per batch.
+        """
+        pool_size = batch_size * self.bucket_pool_size
+        batches = []
+
+        for pool_start in range(0, len(ids), pool_size):
+            pool = ids[pool_start : pool_start + pool_size]
+            pool = pool[np.argsort(self._sequence_lengths[pool], kind="stable")]
+            batches.extend(
+                pool[i : i + batch_size] for i in range(0, len(pool), batch_size)
+            )
+
+        if self.shuffle:
+            batches = [batches[i] for i in np.random.permutation(len(batches))]
+
+        return batches
+
+    @staticmethod
+    def _convert_sparse_features_to_coo(data: Data) -> Data:
+        """Converts all sparse features to `coo_matrix` once.
+
+        `RasaDataGenerator._scipy_matrix_to_values` needs `coo_matrix` features and
+        would otherwise convert them in every batch of every epoch.
+        """
+        converted_data: Data = defaultdict(lambda: defaultdict(list))
+
+        for key, attribute_data in data.items():
+            for sub_key, features in attribute_data.items():
+                for f in features:
+                    if f.is_sparse:
+                        f = RasaDataPipeline._to_coo(f)
+                    converted_data[key][sub_key].append(f)
+
+        return converted_data
+
+    @staticmethod
+    def _to_coo(array_of_sparse: FeatureArray) -> FeatureArray:
+        converted = np.empty(len(array_of_sparse), dtype=object)
+
+        for i, x in enumerate(array_of_sparse):
+            if array_of_sparse.number_of_dimensions == 4:
+                turns = np.empty(len(x), dtype=object)
+                for j, turn in enumerate(x):
+                    turns[j] = turn.tocoo()
+                converted[i] = turns
+            else:
+                converted[i] = x.tocoo()
+
+        return FeatureArray(
+            converted, number_of_dimensions=array_of_sparse.number_of_dimensions
+        )
+
+    @staticmethod
+    def _max_sequence_lengths(data: Data, num_examples: int) -> np.ndarray:
+        """Calculates the maximum sequence length of every example.
+
+        Args:
+            data: The model data.
+            num_examples: The number of examples in the data.
+
+        Returns:
+            The maximum sequence length over all sequence features per example.
+        """
+        lengths = np.zeros(num_examples, dtype=np.int64)
+
+        for attribute_data in data.values():
+            for features in attribute_data.values():
+                for f in features:
+                    if f.number_of_dimensions == 3:
+                        f_lengths = [x.shape[0] for x in f]
+                    elif f.number_of_dimensions == 4:
+                        f_lengths = [
+                            max([turn.shape[0] for turn in x], default=0) for x in f
+                        ]
+                    else:
+                        continue
+
+                    lengths = np.maximum(lengths, f_lengths)
+
+        return lengths
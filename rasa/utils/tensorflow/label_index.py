@@ -0,0 +1,271 @@
+import logging
+from typing import Optional, Text, Tuple
+
+import numpy as np
+
+from rasa.shared.exceptions import InvalidConfigException
+from rasa.utils.tensorflow.constants import (
+    COSINE,
+    EXACT,
+    IVF,
+    LINEAR_NORM,
+    SOFTMAX,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of labels whose similarities are computed at once.
+DEFAULT_BLOCK_SIZE = 4096
+# Number of k-means iterations used to cluster the labels of an `IVFLabelIndex`.
+NUM_CLUSTERING_ITERATIONS = 10
+
+
+class LabelIndex:
+    """Finds the labels which are most similar to an embedded input.
+
+    The similarities and confidences match the ones which the model computes over
+    all labels (see `DotProductLoss.get_similarities_and_confidences_from_embeddings`
+    in `rasa.utils.tensorflow.layers`), but only the top `k` labels are returned.
+    """
+
+    def __init__(
+        self,
+        label_embeddings: np.ndarray,
+        similarity_type: Text,
+        model_confidence: Text,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        """Creates index.
+
+        Args:
+            label_embeddings: The embeddings of all labels with shape
+                (number of labels, embedding dimension).
+            similarity_type: The similarity type of the model (`inner` or `cosine`).
+            model_confidence: The model confidence type (`softmax`, `linear_norm`
+                or `auto`).
+            block_size: Number of labels whose similarities are computed at once.
+        """
+        self.similarity_type = similarity_type
+        self.model_confidence = model_confidence
+        self.block_size = block_size
+        self.label_embeddings = self._prepare_embeddings(
+            np.asarray(label_embeddings, dtype=np.float32)
+        )
+
+    @classmethod
+    def create(
+        cls,
+        index_type: Text,
+        label_embeddings: np.ndarray,
+        similarity_type: Text,
+        model_confidence: Text,
+        num_clusters: int = 0,
+        num_probes: int = 1,
+        random_seed: Optional[int] = None,
+    ) -> "LabelIndex":
+        """Creates an index of the given type.
+
+        Args:
+            index_type: Either `exact` or `ivf`.
+            label_embeddings: The embeddings of all labels.
+            similarity_type: The similarity type of the model.
+            model_confidence: The model confidence type.
+            num_clusters: Number of clusters of an `ivf` index. `0` picks the square
+                root of the number of labels.
+            num_probes: Number of clusters which an `ivf` index searches.
+            random_seed: Seed for clustering the labels of an `ivf` index.
+
+        Returns:
+            The index.
+        """
+        if index_type == EXACT:
+            return LabelIndex(label_embeddings, similarity_type, model_confidence)
+        if index_type == IVF:
+            return IVFLabelIndex(
+                label_embeddings,
+                similarity_type,
+                model_confidence,
+                num_clusters=num_clusters,
+                num_probes=num_probes,
+                random_seed=random_seed,
+            )
+
+        raise InvalidConfigException(
+            f"Unknown label index type '{index_type}'. Possible values: "
+            f"`{EXACT}`, `{IVF}`."
+        )
+
+    def __len__(self) -> int:
+        return len(self.label_embeddings)
+
+    def _prepare_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
+        if self.similarity_type != COSINE:
+            return embeddings
+
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        # mirrors `tf.nn.l2_normalize`
+        return embeddings / np.sqrt(np.maximum(norms ** 2, 1e-12))
+
+    def search(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the `k` labels with the highest similarity to an embedded input.
+
+        Args:
+            query: The embedded input with shape (embedding dimension,).
+            k: Number of labels to return.
+
+        Returns:
+            The indices of the labels and their confidences, ordered by descending
+            confidence.
+        """
+        query = self._prepare_embeddings(np.asarray(query, dtype=np.float32))
+        return self._search_candidates(query, k, np.arange(len(self)))
+
+    def _search_candidates(
+        self, query: np.ndarray, k: int, candidate_ids: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        top_ids = np.zeros(0, dtype=np.int64)
+        top_similarities = np.zeros(0, dtype=np.float32)
+        # statistics to compute the confidences over all candidates
+        max_similarity = -np.inf
+        sum_exp = 0.0
+        sum_relu = 0.0
+
+        for start in range(0, len(candidate_ids), self.block_size):
+            block_ids = candidate_ids[start : start + self.block_size]
+            similarities = self.label_embeddings[block_ids] @ query
+
+            if self.model_confidence == SOFTMAX:
+                new_max = max(max_similarity, float(similarities.max()))
+                sum_exp = sum_exp * np.exp(max_similarity - new_max) + float(
+                    np.exp(similarities - new_max).sum()
+                )
+                max_similarity = new_max
+            elif self.model_confidence == LINEAR_NORM:
+                sum_relu += float(np.maximum(similarities, 0).sum())
+
+            top_ids = np.concatenate([top_ids, block_ids])
+            top_similarities = np.concatenate([top_similarities, similarities])
+            if len(top_ids) > k:
+                keep = np.argpartition(-top_similarities, k - 1)[:k]
+                top_ids = top_ids[keep]
+                top_similarities = top_similarities[keep]
+
+        order = np.argsort(-top_similarities, kind="stable")
+        top_ids = top_ids[order]
+        top_similarities = top_similarities[order]
+
+        if self.model_confidence == SOFTMAX:
+            confidences = np.exp(top_similarities - max_similarity) / sum_exp
+        elif self.model_confidence == LINEAR_NORM:
+            confidences = (
+                np.maximum(top_similarities, 0) / sum_relu
+                if sum_relu > 0
+                else np.zeros_like(top_similarities)
+            )
+        else:
+            # the model confidence is `auto`, i.e. the similarities are used
+            confidences = top_similarities
+
+        return top_ids, confidences.astype(np.float32)
+
+
+class IVFLabelIndex(LabelIndex):
+    """Approximately finds the most similar labels with an inverted file index.
+
+    The labels are clustered with k-means. A search only computes the similarities
+    to the labels of the `num_probes` clusters whose centroids are most similar to
+    the input. The confidences are normalized over these labels. Increasing
+    `num_probes` trades speed for recall. If all clusters are probed, the results
+    are exact.
+    """
+
+    def __init__(
+        self,
+        label_embeddings: np.ndarray,
+        similarity_type: Text,
+        model_confidence: Text,
+        num_clusters: int = 0,
+        num_probes: int = 1,
+        random_seed: Optional[int] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        """Creates index (see parent class for full docstring).
+
+        Args:
+            label_embeddings: The embeddings of all labels.
+            similarity_type: The similarity type of the model.
+            model_confidence: The model confidence type.
+            num_clusters: Number of clusters. `0` picks the square root of the
+                number of labels.
+            num_probes: Number of clusters which are searched.
+            random_seed: Seed for the initialization of the clusters.
+            block_size: Number of labels whose similarities are computed at once.
+        """
+        super().__init__(
+            label_embeddings, similarity_type, model_confidence, block_size
+        )
+        if num_clusters <= 0:
+            num_clusters = int(np.ceil(np.sqrt(len(self))))
+        self.num_clusters = max(1, min(num_clusters, len(self)))
+        self.num_probes = max(1, min(num_probes, self.num_clusters))
+
+        self.centroids, assignments = self._cluster(random_seed)
+        # the ids of the labels sorted by cluster so that the labels of cluster
+        # `i` are `self._label_ids[self._offsets[i] : self._offsets[i + 1]]`
+        self._label_ids = np.argsort(assignments, kind="stable")
+        self._offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(assignments, minlength=self.num_clusters))]
+        )
+        logger.debug(f"Clustered {len(self)} labels into {self.num_clusters} clusters.")
+
+    def _cluster(self, random_seed: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+        rng = np.random.RandomState(random_seed)
+        centroids = self.label_embeddings[
+            rng.choice(len(self), self.num_clusters, replace=False)
+        ].copy()
+        assignments = np.zeros(len(self), dtype=np.int64)
+
+        for _ in range(NUM_CLUSTERING_ITERATIONS):
+            assignments = self._closest_centroids(centroids)
+            counts = np.bincount(assignments, minlength=self.num_clusters)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, self.label_embeddings)
+            # empty clusters keep their previous centroid
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+
+        return centroids, self._closest_centroids(centroids)
+
+    def _closest_centroids(self, centroids: np.ndarray) -> np.ndarray:
+        assignments = np.empty(len(self), dtype=np.int64)
+        for start in range(0, len(self), self.block_size):
+            block = self.label_embeddings[start : start + self.block_size]
+            # squared euclidean distance without the constant norm of the labels
+            distances = (centroids ** 2).sum(axis=-1) - 2 * block @ centroids.T
+            assignments[start : start + self.block_size] = distances.argmin(axis=-1)
+
+        return assignments
+
+    def search(self, query: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds (approximately) the `k` most similar labels to an embedded input.
+
+        See parent class for full docstring.
+        """
+        query = self._prepare_embeddings(np.asarray(query, dtype=np.float32))
+
+        centroid_similarities = self.centroids @ query
+        if self.num_probes < self.num_clusters:
+            probed_clusters = np.argpartition(
+                -centroid_similarities, self.num_probes - 1
+            )[: self.num_probes]
+        else:
+            probed_clusters = np.arange(self.num_clusters)
+
+        candidate_ids = np.concatenate(
+            [
+                self._label_ids[self._offsets[cluster] : self._offsets[cluster + 1]]
+                for cluster in np.sort(probed_clusters)
+            ]
+        )
+
+        return self._search_candidates(query, k, candidate_ids)
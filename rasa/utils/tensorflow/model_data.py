@@ -689,70 +689,77 @@ class RasaModelData:
 
         label_ids = self._create_label_ids(data[self.label_key][self.label_sub_key][0])
 
-        unique_label_ids, counts_label_ids = np.unique(
-            label_ids, return_counts=True, axis=0
+        unique_label_ids, label_id_indices, counts_label_ids = np.unique(
+            label_ids, return_inverse=True, return_counts=True, axis=0
         )
         num_label_ids = len(unique_label_ids)
-
-        # group data points by their label
-        # need to call every time, so that the data is shuffled inside each class
-        data_by_label = self._split_by_label_ids(data, label_ids, unique_label_ids)
+        # number of data points which are taken from a label at once
+        label_fractions = counts_label_ids / self.num_examples
+        label_batch_sizes = (label_fractions * batch_size).astype(int) + 1
 
         # running index inside each data grouped by labels
-        data_idx = [0] * num_label_ids
+        data_idx = np.zeros(num_label_ids, dtype=int)
         # number of cycles each label was passed
-        num_data_cycles = [0] * num_label_ids
+        num_data_cycles = np.zeros(num_label_ids, dtype=int)
         # if a label was skipped in current batch
-        skipped = [False] * num_label_ids
+        skipped = np.zeros(num_label_ids, dtype=bool)
 
-        new_data = defaultdict(lambda: defaultdict(list))
+        # the labels and start indices of the slices which form the balanced data
+        slice_labels = []
+        slice_starts = []
 
-        while min(num_data_cycles) == 0:
+        while num_data_cycles.min() == 0:
             if shuffle:
                 indices_of_labels = np.random.permutation(num_label_ids)
             else:
-                indices_of_labels = range(num_label_ids)
+                indices_of_labels = np.arange(num_label_ids)
 
-            for index in indices_of_labels:
-                if num_data_cycles[index] > 0 and not skipped[index]:
-                    skipped[index] = True
-                    continue
+            # labels which were passed at least once are only used every other time
+            skip = (num_data_cycles[indices_of_labels] > 0) & ~skipped[
+                indices_of_labels
+            ]
+            used_labels = indices_of_labels[~skip]
+            next_data_idx = data_idx[used_labels] + label_batch_sizes[used_labels]
+            finished_cycle = next_data_idx >= counts_label_ids[used_labels]
 
-                skipped[index] = False
+            remaining_labels = np.flatnonzero(num_data_cycles == 0)
+            first_finished_labels = used_labels[
+                finished_cycle & (num_data_cycles[used_labels] == 0)
+            ]
+            if len(first_finished_labels) == len(remaining_labels):
+                # All labels were passed at least once after the last of the
+                # remaining labels, hence the labels after it aren't used anymore.
+                last_label = np.flatnonzero(used_labels == first_finished_labels[-1])
+                used_labels = used_labels[: last_label[0] + 1]
+                slice_labels.append(used_labels)
+                slice_starts.append(data_idx[used_labels])
+                break
 
-                index_batch_size = (
-                    int(counts_label_ids[index] / self.num_examples * batch_size) + 1
-                )
+            slice_labels.append(used_labels)
+            slice_starts.append(data_idx[used_labels])
 
-                for key, attribute_data in data_by_label[index].items():
-                    for sub_key, features in attribute_data.items():
-                        for i, f in enumerate(features):
-                            if len(new_data[key][sub_key]) < i + 1:
-                                new_data[key][sub_key].append([])
-                            new_data[key][sub_key][i].append(
-                                f[data_idx[index] : data_idx[index] + index_batch_size]
-                            )
-
-                data_idx[index] += index_batch_size
-                if data_idx[index] >= counts_label_ids[index]:
-                    num_data_cycles[index] += 1
-                    data_idx[index] = 0
-
-                if min(num_data_cycles) > 0:
-                    break
-
-        final_data: Data = defaultdict(lambda: defaultdict(list))
-        for key, attribute_data in new_data.items():
-            for sub_key, features in attribute_data.items():
-                for f in features:
-                    final_data[key][sub_key].append(
-                        FeatureArray(
-                            np.concatenate(np.array(f)),
-                            number_of_dimensions=f[0].number_of_dimensions,
-                        )
-                    )
+            skipped[indices_of_labels] = skip
+            data_idx[used_labels] = np.where(finished_cycle, 0, next_data_idx)
+            num_data_cycles[used_labels] += finished_cycle
+
+        slice_labels = np.concatenate(slice_labels)
+        slice_starts = np.concatenate(slice_starts)
+        slice_lengths = np.minimum(
+            label_batch_sizes[slice_labels],
+            counts_label_ids[slice_labels] - slice_starts,
+        )
 
-        return final_data
+        # ids of the data points grouped by their label (keeping their order)
+        ids_by_label = np.argsort(label_id_indices, kind="stable")
+        label_offsets = np.cumsum(counts_label_ids) - counts_label_ids
+
+        # expand the slices to the positions of their data points in `ids_by_label`
+        slice_offsets = np.cumsum(slice_lengths) - slice_lengths
+        positions = np.arange(slice_lengths.sum()) + np.repeat(
+            label_offsets[slice_labels] + slice_starts - slice_offsets, slice_lengths
+        )
+
+        return self._data_for_ids(data, ids_by_label[positions])
 
     def _check_train_test_sizes(
         self, number_of_test_examples: int, label_counts: Dict[Any, int]
@@ -800,31 +807,6 @@ class RasaModelData:
                     new_data[key][sub_key].append(f[ids])
         return new_data
 
-    def _split_by_label_ids(
-        self, data: Optional[Data], label_ids: np.ndarray, unique_label_ids: np.ndarray
-    ) -> List["RasaModelData"]:
-        """Reorganize model data into a list of model data with the same labels.
-
-        Args:
-            data: The data
-            label_ids: The label ids
-            unique_label_ids: The unique label ids
-
-        Returns:
-            Reorganized RasaModelData
-        """
-        label_data = []
-        for label_id in unique_label_ids:
-            matching_ids = np.array(label_ids) == label_id
-            label_data.append(
-                RasaModelData(
-                    self.label_key,
-                    self.label_sub_key,
-                    self._data_for_ids(data, matching_ids),
-                )
-            )
-        return label_data
-
     def _check_label_key(self) -> None:
         """Check if the label key exists.
 
@@ -255,14 +255,22 @@ class CustomDataHandler(DataHandler):
         # https://github.com/tensorflow/tensorflow/blob/v2.3.1/tensorflow/python/keras/engine/data_adapter.py#L1135-L1145
 
         with self._truncate_execution_to_epoch():
-            data_iterator = iter(self._dataset)
+            # the iterator is created lazily, as creating an iterator of a
+            # `tf.data.Dataset` already starts prefetching the data of an epoch
+            data_iterator = None
             for epoch in range(self._initial_epoch, self._epochs):
                 if self._insufficient_data:  # Set by `catch_stop_iteration`.
                     break
-                if self._adapter.should_recreate_iterator():
+                if data_iterator is None or self._adapter.should_recreate_iterator():
                     data_iterator = iter(self._dataset)
                     # update number of steps for epoch as we might have an increasing
                     # batch size
-                    self._inferred_steps = len(self._adapter._keras_sequence)
+                    if hasattr(self._adapter, "_keras_sequence"):
+                        self._inferred_steps = len(self._adapter._keras_sequence)
+                    else:
+                        # the size of a `tf.data.Dataset` created by
+                        # `RasaDataPipeline` is unknown, the epoch ends as soon as
+                        # the dataset is exhausted
+                        self._inferred_steps = None
                 yield epoch, data_iterator
                 self._adapter.on_epoch_end()
@@ -376,6 +376,54 @@ class MultiHeadAttention(tf.keras.layers.Layer):
 
         return output, attention_weights
 
+    def call_with_cache(
+        self,
+        query_input: tf.Tensor,
+        past_key: tf.Tensor,
+        past_value: tf.Tensor,
+        pad_mask: Optional[tf.Tensor] = None,
+    ) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Apply self-attention for new positions during inference.
+
+        The keys and values of the previous positions are taken from the cache
+        instead of being computed again. Relative position embeddings are not
+        supported.
+
+        Arguments:
+            query_input: A tensor with shape [batch_size, new_length, input_size].
+            past_key: Keys of previous positions with shape
+                [batch_size, num_heads, past_length, depth].
+            past_value: Values of previous positions with shape
+                [batch_size, num_heads, past_length, depth].
+            pad_mask: Float tensor with shape broadcastable
+                to (..., new_length, past_length + new_length). Defaults to None.
+
+        Returns:
+            Attention layer output with shape [batch_size, new_length, units],
+            the attention weights, and the keys and values of all positions.
+        """
+        if self.use_key_relative_position or self.use_value_relative_position:
+            raise ValueError(
+                "Cached self-attention is not supported with relative position "
+                "embeddings."
+            )
+
+        query = self._split_heads(self._query_dense_layer(query_input))
+        key = self._split_heads(self._key_dense_layer(query_input))
+        value = self._split_heads(self._value_dense_layer(query_input))
+
+        # (batch_size, num_heads, past_length + new_length, depth)
+        key = tf.concat([past_key, key], axis=2)
+        value = tf.concat([past_value, value], axis=2)
+
+        attention, attention_weights = self._scaled_dot_product_attention(
+            query, key, value, pad_mask, training=False
+        )
+        attention = self._combine_heads(attention)
+        output = self._output_dense_layer(attention)
+
+        return output, attention_weights, key, value
+
 
 class TransformerEncoderLayer(tf.keras.layers.Layer):
     """Transformer encoder layer.
@@ -479,6 +527,35 @@ class TransformerEncoderLayer(tf.keras.layers.Layer):
         # (batch_size, length, units), (batch_size, num_heads, length, length)
         return x, attn_weights
 
+    def call_with_cache(
+        self,
+        x: tf.Tensor,
+        past_key: tf.Tensor,
+        past_value: tf.Tensor,
+        pad_mask: Optional[tf.Tensor] = None,
+    ) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Apply transformer encoder layer to new positions during inference.
+
+        See `MultiHeadAttention.call_with_cache` for a description of the arguments.
+
+        Returns:
+            Transformer encoder layer output with shape
+            [batch_size, new_length, units], the attention weights, and the keys
+            and values of all positions.
+        """
+        x_norm = self._layer_norm(x)
+        attn_out, attn_weights, key, value = self._mha.call_with_cache(
+            x_norm, past_key, past_value, pad_mask=pad_mask
+        )
+        x += attn_out
+
+        ffn_out = x
+        for layer in self._ffn_layers:
+            ffn_out = layer(ffn_out, training=False)
+        x += ffn_out
+
+        return x, attn_weights, key, value
+
 
 class TransformerEncoder(tf.keras.layers.Layer):
     """Transformer encoder.
@@ -637,3 +714,86 @@ class TransformerEncoder(tf.keras.layers.Layer):
         # (batch_size, length, units),
         # (batch_size, num_layers, num_heads, length, length)
         return x, attention_weights_as_output
+
+    @property
+    def num_layers(self) -> int:
+        """Returns the number of encoder layers."""
+        return len(self._enc_layers)
+
+    def empty_cache(self, batch_size: int) -> np.ndarray:
+        """Returns keys (or values) without any positions for `call_with_cache`.
+
+        Args:
+            batch_size: The batch size.
+
+        Returns:
+            An empty array with shape [num_layers, batch_size, num_heads, 0, depth].
+        """
+        num_heads = self._enc_layers[0]._mha.num_heads if self._enc_layers else 0
+        depth = self.units // num_heads if num_heads else 0
+
+        return np.zeros(
+            (self.num_layers, batch_size, num_heads, 0, depth), dtype=np.float32
+        )
+
+    def call_with_cache(
+        self, x: tf.Tensor, past_keys: tf.Tensor, past_values: tf.Tensor
+    ) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Apply unidirectional transformer encoder to new positions during inference.
+
+        Since positions can't attend to later positions in a unidirectional encoder,
+        the outputs for the new positions only depend on the keys and values of the
+        previous positions. These are passed in from a cache instead of computing
+        them again. The outputs are the same as the outputs of `call` for the
+        new positions of the complete sequence.
+
+        Arguments:
+            x: A tensor with the new positions with shape
+                [batch_size, new_length, input_size].
+            past_keys: Keys of the previous positions for every layer with shape
+                [num_layers, batch_size, num_heads, past_length, depth].
+            past_values: Values of the previous positions for every layer with shape
+                [num_layers, batch_size, num_heads, past_length, depth].
+
+        Returns:
+            Transformer encoder output with shape [batch_size, new_length, units],
+            the attention weights of the new positions with shape
+            [batch_size, num_layers, num_heads, new_length, length], and the keys
+            and values of all positions for every layer.
+        """
+        if not self.unidirectional:
+            raise ValueError("Only unidirectional encoders can be used with a cache.")
+
+        past_length = tf.shape(past_keys)[3]
+        new_length = tf.shape(x)[1]
+
+        x = self._embedding(x)
+        x *= tf.math.sqrt(tf.cast(self.units, tf.float32))
+        x += self._positional_encoding(past_length + new_length)[:, past_length:]
+
+        # new positions can attend to all previous positions and to themselves
+        pad_mask = 1 - tf.linalg.band_part(
+            tf.ones((new_length, past_length + new_length)),
+            -1,
+            tf.cast(past_length, tf.int64),
+        )
+        pad_mask = pad_mask[tf.newaxis, tf.newaxis, :, :]
+
+        layer_attention_weights = []
+        keys = []
+        values = []
+        for i, layer in enumerate(self._enc_layers):
+            x, attn_weights, key, value = layer.call_with_cache(
+                x, past_keys[i], past_values[i], pad_mask=pad_mask
+            )
+            layer_attention_weights.append(attn_weights)
+            keys.append(key)
+            values.append(value)
+
+        x = self._layer_norm(x)
+
+        attention_weights_as_output = tf.transpose(
+            tf.stack(layer_attention_weights), (1, 0, 2, 3, 4)
+        )
+
+        return x, attention_weights_as_output, tf.stack(keys), tf.stack(values)
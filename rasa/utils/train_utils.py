@@ -37,7 +37,10 @@ from rasa.utils.tensorflow.constants import (
     CHECKPOINT_MODEL,
 )
 from rasa.utils.tensorflow.callback import RasaTrainingLogger, RasaModelCheckpoint
-from rasa.utils.tensorflow.data_generator import RasaBatchDataGenerator
+from rasa.utils.tensorflow.data_generator import (
+    RasaBatchDataGenerator,
+    RasaDataPipeline,
+)
 from rasa.utils.tensorflow.model_data import RasaModelData
 from rasa.shared.nlu.constants import (
     ACTION_NAME,
@@ -53,6 +56,7 @@ if TYPE_CHECKING:
     from rasa.nlu.extractors.extractor import EntityTagSpec
     from rasa.nlu.tokenizers.tokenizer import Token
     from tensorflow.keras.callbacks import Callback
+    import tensorflow as tf
 
 
 def normalize(values: np.ndarray, ranking_length: int = 0) -> np.ndarray:
@@ -413,7 +417,11 @@ def create_data_generators(
     eval_num_examples: int = 0,
     random_seed: Optional[int] = None,
     shuffle: bool = True,
-) -> Tuple[RasaBatchDataGenerator, Optional[RasaBatchDataGenerator]]:
+    use_tf_data_pipeline: bool = False,
+) -> Tuple[
+    Union[RasaBatchDataGenerator, "tf.data.Dataset"],
+    Optional[Union[RasaBatchDataGenerator, "tf.data.Dataset"]],
+]:
     """Create data generators for train and optional validation data.
 
     Args:
@@ -424,30 +432,41 @@ def create_data_generators(
         eval_num_examples: Number of examples to use for validation data.
         random_seed: The random seed.
         shuffle: Whether to shuffle data inside the data generator.
+        use_tf_data_pipeline: If 'True', the batches are created by a `tf.data`
+            pipeline (see `RasaDataPipeline`) instead of a `RasaBatchDataGenerator`.
 
     Returns:
         The training data generator and optional validation data generator.
     """
-    validation_data_generator = None
-    if eval_num_examples > 0:
-        model_data, evaluation_model_data = model_data.split(
-            eval_num_examples, random_seed,
-        )
-        validation_data_generator = RasaBatchDataGenerator(
-            evaluation_model_data,
+
+    def _create(
+        data: RasaModelData,
+    ) -> Union[RasaBatchDataGenerator, "tf.data.Dataset"]:
+        if use_tf_data_pipeline:
+            return RasaDataPipeline(
+                data,
+                batch_size=batch_sizes,
+                epochs=epochs,
+                batch_strategy=batch_strategy,
+                shuffle=shuffle,
+            ).as_dataset()
+
+        return RasaBatchDataGenerator(
+            data,
             batch_size=batch_sizes,
             epochs=epochs,
             batch_strategy=batch_strategy,
             shuffle=shuffle,
         )
 
-    data_generator = RasaBatchDataGenerator(
-        model_data,
-        batch_size=batch_sizes,
-        epochs=epochs,
-        batch_strategy=batch_strategy,
-        shuffle=shuffle,
-    )
+    validation_data_generator = None
+    if eval_num_examples > 0:
+        model_data, evaluation_model_data = model_data.split(
+            eval_num_examples, random_seed,
+        )
+        validation_data_generator = _create(evaluation_model_data)
+
+    data_generator = _create(model_data)
 
     return data_generator, validation_data_generator
 
@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import Callable
+import re
+from typing import Callable, List, Optional, Text
 from _pytest.pytester import RunResult, Testdir
 import pytest
 import sys
@@ -36,10 +37,57 @@ def test_cli_start_is_fast(testdir: Testdir):
     result.stderr.no_fnmatch_line("*tensorflow.python.eager")
 
 
+@pytest.mark.parametrize(
+    "command",
+    [
+        ["--version"],
+        ["init", "--help"],
+        ["telemetry", "--help"],
+        ["data", "validate", "--help"],
+        ["data", "split", "nlu", "--help"],
+        ["data", "convert", "nlu", "--help"],
+    ],
+)
+def test_non_ml_commands_do_not_import_ml_libraries(
+    testdir: Testdir, command: List[Text]
+):
+    """Checks that commands which don't need ML libraries don't import them.
+
+    CLI commands only import the module which implements them. If this is failing,
+    the command (or a module it imports) very likely has a global import of a slow
+    ML library. Run `rasa --profile-imports <command>` to find the slowest imports.
+    """
+    rasa_path = str(
+        (Path(__file__).parent / ".." / ".." / "rasa" / "__main__.py").absolute()
+    )
+    result = testdir.run(sys.executable, "-X", "importtime", rasa_path, *command)
+
+    assert result.ret == 0
+
+    imported_packages = {
+        match.group(1)
+        for match in re.finditer(
+            r"^import time:.*\|\s+([\w]+)(?:\.[\w.]+)?\s*$",
+            result.stderr.str(),
+            re.MULTILINE,
+        )
+    }
+    assert not imported_packages & {"tensorflow", "spacy", "transformers"}
+
+
+def test_profile_imports(run: Callable[..., RunResult]):
+    output = run("--profile-imports", "--version")
+
+    assert output.ret == 0
+    output.stderr.fnmatch_lines(
+        ["Imported * modules in * seconds. Slowest imports:", "*| module"]
+    )
+
+
 def test_data_convert_help(run: Callable[..., RunResult]):
     output = run("--help")
 
-    help_text = """usage: rasa [-h] [--version]
+    help_text = """usage: rasa [-h] [--version] [--profile-imports]
             {init,run,shell,train,interactive,telemetry,test,visualize,data,export,x}
             ..."""
 
@@ -60,3 +108,21 @@ def test_version_print_lines(run: Callable[..., RunResult]):
     assert "Python Version" in output_text
     assert "Operating System" in output_text
     assert "Python Path" in output_text
+
+
+@pytest.mark.parametrize(
+    "arguments, expected",
+    [
+        (["train", "--help"], ["train"]),
+        (["--profile-imports", "data", "validate"], ["data"]),
+        (["--version"], []),
+        (["--version", "--help"], None),
+        (["--help"], None),
+        ([], None),
+        (["unknown-command"], None),
+    ],
+)
+def test_commands_to_register(arguments: List[Text], expected: Optional[List[Text]]):
+    from rasa.__main__ import _commands_to_register
+
+    assert _commands_to_register(arguments) == expected
@@ -1,9 +1,11 @@
 import pytest
 import numpy as np
 import itertools
+from pathlib import Path
 from typing import List, Text, Optional, Dict
 
 
+from rasa.engine.caching import Cacheable
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
@@ -97,6 +99,30 @@ def test_container_fingerprint_differ_for_containers_with_different_insertion_or
     assert container2.fingerprint() != container1.fingerprint()
 
 
+def test_container_caching(tmp_path: Path, default_model_storage: ModelStorage):
+    container = MessageContainerForCoreFeaturization()
+    container.add_all(
+        [
+            Message(data={INTENT: "greet"}, features=[_dummy_features(1, INTENT)]),
+            Message(data={TEXT: "hi", "other": 3}),
+            Message(data={ACTION_NAME: "utter_greet"}),
+        ]
+    )
+
+    assert isinstance(container, Cacheable)
+
+    container.to_cache(tmp_path, default_model_storage)
+    restored = MessageContainerForCoreFeaturization.from_cache(
+        "node", tmp_path, default_model_storage
+    )
+
+    assert restored.fingerprint() == container.fingerprint()
+    assert set(restored.keys(INTENT)) == {"greet"}
+    assert set(restored.keys(TEXT)) == {"hi"}
+    assert set(restored.keys(ACTION_NAME)) == {"utter_greet"}
+    assert restored.num_collisions_ignored == container.num_collisions_ignored
+
+
 @pytest.mark.parametrize(
     "no_or_multiple_key_attributes",
     [list(), ["other"]]
@@ -2,6 +2,7 @@ from typing import Text, Dict, List, Optional
 
 import numpy as np
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from rasa.core.featurizers.single_state_featurizer import (
     SingleStateFeaturizer2 as SingleStateFeaturizer,
@@ -35,6 +36,8 @@ from rasa.shared.core.events import ActionExecuted
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.utils.tensorflow.constants import LABEL_PAD_ID
 from rasa.core.exceptions import InvalidTrackerFeaturizerUsageError
+from rasa.constants import ENV_NUM_FEATURIZATION_PROCESSES
+import rasa.core.featurizers.tracker_featurizers
 
 
 def test_fail_to_load_non_existent_featurizer():
@@ -2341,3 +2344,44 @@ def test_multilabels_with_intent_max_history_tracker_featurizer(
         actual_labels, expected_labels
     ):
         assert sorted(actual_label_indices) == sorted(expected_label_indices)
+
+
+@pytest.mark.parametrize(
+    "tracker_featurizer",
+    [
+        FullDialogueTrackerFeaturizer(SingleStateFeaturizer()),
+        MaxHistoryTrackerFeaturizer(SingleStateFeaturizer(), max_history=2),
+        IntentMaxHistoryTrackerFeaturizer(IntentTokenizerSingleStateFeaturizer()),
+    ],
+)
+def test_featurize_trackers_in_worker_processes(
+    tracker_featurizer: TrackerFeaturizer,
+    moodbot_tracker: DialogueStateTracker,
+    moodbot_domain: Domain,
+    monkeypatch: MonkeyPatch,
+):
+    trackers = [moodbot_tracker.copy() for _ in range(4)] + [
+        DialogueStateTracker.from_events("other", list(moodbot_tracker.events)[:4])
+    ]
+
+    expected = tracker_featurizer.training_states_labels_and_entities(
+        trackers, moodbot_domain
+    )
+
+    monkeypatch.setattr(
+        rasa.core.featurizers.tracker_featurizers, "MIN_TRACKERS_PER_PROCESS", 1
+    )
+    monkeypatch.setenv(ENV_NUM_FEATURIZATION_PROCESSES, "2")
+
+    actual = tracker_featurizer.training_states_labels_and_entities(
+        trackers, moodbot_domain
+    )
+
+    # Results are deterministic and identical to the ones of a single process
+    assert actual == expected
+
+    actual_features, actual_labels, _ = tracker_featurizer.featurize_trackers(
+        trackers, moodbot_domain, precomputations=None
+    )
+    assert len(actual_features) == len(expected[0])
+    assert actual_labels.shape[0] == len(expected[1])
@@ -1,9 +1,13 @@
+import functools
 from pathlib import Path
-from typing import Optional, List, Type, Dict, Text, Any
+import re
+from typing import Optional, List, Type, Dict, Text, Any, Tuple
 
 from unittest.mock import Mock
 import numpy as np
 import pytest
+import scipy.sparse
+import tensorflow as tf
 import tests.core.test_policies
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.logging import LogCaptureFixture
@@ -15,13 +19,20 @@ from rasa.core.featurizers.tracker_featurizers import (
 from rasa.core.featurizers.tracker_featurizers import (
     MaxHistoryTrackerFeaturizer2 as MaxHistoryTrackerFeaturizer,
 )
+from rasa.core.featurizers.tracker_featurizers import (
+    FullDialogueTrackerFeaturizer2 as FullDialogueTrackerFeaturizer,
+)
 from rasa.core.featurizers.single_state_featurizer import (
     SingleStateFeaturizer2 as SingleStateFeaturizer,
 )
+from rasa.core.featurizers.precomputation import MessageContainerForCoreFeaturization
 from rasa.core.policies.policy import PolicyGraphComponent as Policy
 from rasa.core.policies.ted_policy import TEDPolicyGraphComponent as TEDPolicy
 from rasa.core.policies.ted_policy import TEDPolicy as Rasa2TEDPolicy
+from rasa.core.policies.ted_policy import DialogueCache, TED
 from rasa.engine.graph import ExecutionContext
+from rasa.nlu.constants import TOKENS_NAMES
+from rasa.nlu.tokenizers.tokenizer import Token
 from rasa.engine.storage.resource import Resource
 from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.core.constants import ACTION_LISTEN_NAME, ACTION_UNLIKELY_INTENT_NAME
@@ -33,8 +44,14 @@ from rasa.shared.core.events import (
     EntitiesAdded,
     ActiveLoop,
 )
+from rasa.shared.core.generator import TrackerWithCachedStates
 from rasa.shared.exceptions import RasaException, InvalidConfigException
-from rasa.utils.tensorflow.data_generator import RasaBatchDataGenerator
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.nlu.training_data.message import Message
+from rasa.utils.tensorflow.data_generator import (
+    RasaBatchDataGenerator,
+    RasaDataPipeline,
+)
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.model_training import train_core
 from rasa.utils import train_utils
@@ -58,10 +75,25 @@ from rasa.utils.tensorflow.constants import (
     EVAL_NUM_EPOCHS,
     EPOCHS,
     EPOCH_OVERRIDE,
+    DIALOGUE_CACHE_SIZE,
+    ENTITY_RECOGNITION,
+    BATCH_SIZES,
+    BATCH_STRATEGY,
+    SEQUENCE,
+    USE_TF_DATA_PIPELINE,
+)
+from rasa.shared.nlu.constants import (
+    ACTION_NAME,
+    ENTITY_ATTRIBUTE_END,
+    ENTITY_ATTRIBUTE_START,
+    ENTITY_ATTRIBUTE_TYPE,
+    ENTITY_ATTRIBUTE_VALUE,
+    FEATURE_TYPE_SENTENCE,
+    FEATURE_TYPE_SEQUENCE,
+    TEXT,
 )
-from rasa.shared.nlu.constants import ACTION_NAME
 from rasa.utils.tensorflow import model_data_utils
-from tests.core.test_policies import PolicyTestCollection
+from tests.core.test_policies import PolicyTestCollection, train_trackers
 from rasa.shared.constants import DEFAULT_SENDER_ID, DEFAULT_CORE_SUBDIRECTORY_NAME
 
 UTTER_GREET_ACTION = "utter_greet"
@@ -589,6 +621,241 @@ class TestTEDPolicy(PolicyTestCollection):
         assert isinstance(featurizer.state_featurizer, state_featurizer)
 
 
+def test_predictions_with_dialogue_cache(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    stories_path: Text,
+    domain_path: Text,
+    monkeypatch: MonkeyPatch,
+):
+    domain = Domain.load(domain_path)
+    policy = TEDPolicy(
+        {**TEDPolicy.get_default_config(), EPOCHS: 1, DIALOGUE_CACHE_SIZE: 1},
+        default_model_storage,
+        Resource("TEDPolicy"),
+        default_execution_context,
+        featurizer=FullDialogueTrackerFeaturizer(SingleStateFeaturizer()),
+    )
+    policy.train(train_trackers(domain, stories_path, augmentation_factor=0), domain)
+
+    assert policy.model.uses_dialogue_cache()
+
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(text="hi", intent={"name": "greet"}),
+        ActionExecuted("utter_greet"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(text="bye", intent={"name": "goodbye"}),
+    ]
+    trackers = [
+        DialogueStateTracker.from_events("cached", evts=events[:number_of_events])
+        for number_of_events in range(1, len(events) + 1)
+    ]
+
+    cached_predictions = [
+        policy.predict_action_probabilities(tracker, domain).probabilities
+        for tracker in trackers
+    ]
+    assert len(policy.model._dialogue_cache) == 1
+
+    monkeypatch.setattr(policy.model, "_dialogue_cache", DialogueCache(0))
+    assert not policy.model.uses_dialogue_cache()
+
+    for tracker, cached_prediction in zip(trackers, cached_predictions):
+        prediction = policy.predict_action_probabilities(tracker, domain)
+        assert np.allclose(prediction.probabilities, cached_prediction, atol=1e-5)
+
+
+def test_dialogue_cache_is_not_used_to_extract_entities(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    monkeypatch: MonkeyPatch,
+):
+    domain = Domain(
+        intents=[],
+        entities=["name"],
+        slots=[],
+        responses={},
+        action_names=["utter_greet", "utter_goodbye"],
+        forms={},
+    )
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(
+            text="hi Peter",
+            entities=[
+                {
+                    ENTITY_ATTRIBUTE_TYPE: "name",
+                    ENTITY_ATTRIBUTE_VALUE: "Peter",
+                    ENTITY_ATTRIBUTE_START: 3,
+                    ENTITY_ATTRIBUTE_END: 8,
+                }
+            ],
+        ),
+        ActionExecuted("utter_greet"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered(text="bye"),
+        ActionExecuted("utter_goodbye"),
+    ]
+
+    precomputations = MessageContainerForCoreFeaturization()
+    precomputations.derive_messages_from_domain_and_add(domain)
+    for text in ["hi Peter", "bye"]:
+        tokens = [
+            Token(text=match.group(), start=match.start())
+            for match in re.finditer(r"\S+", text)
+        ]
+        precomputations.add(
+            Message(
+                data={TEXT: text, TOKENS_NAMES[TEXT]: tokens},
+                features=[
+                    Features(
+                        scipy.sparse.coo_matrix(np.ones((len(tokens), 5))),
+                        FEATURE_TYPE_SEQUENCE,
+                        TEXT,
+                        "whatever",
+                    ),
+                    Features(
+                        scipy.sparse.coo_matrix(np.ones((1, 5))),
+                        FEATURE_TYPE_SENTENCE,
+                        TEXT,
+                        "whatever",
+                    ),
+                ],
+            )
+        )
+
+    policy = TEDPolicy(
+        {**TEDPolicy.get_default_config(), EPOCHS: 1, DIALOGUE_CACHE_SIZE: 1},
+        default_model_storage,
+        Resource("TEDPolicy"),
+        default_execution_context,
+        featurizer=FullDialogueTrackerFeaturizer(SingleStateFeaturizer()),
+    )
+    policy.train(
+        [TrackerWithCachedStates.from_events("story", events, domain=domain)],
+        domain,
+        precomputations,
+    )
+
+    assert policy.config[ENTITY_RECOGNITION]
+    assert not policy.model.uses_dialogue_cache()
+
+    trackers = [
+        DialogueStateTracker.from_events("cached", evts=events[:number_of_events])
+        for number_of_events in range(1, len(events))
+    ]
+    cached_predictions = [
+        policy.predict_action_probabilities(tracker, domain, precomputations)
+        for tracker in trackers
+    ]
+    assert len(policy.model._dialogue_cache) == 0
+
+    monkeypatch.setattr(policy.model, "_dialogue_cache", DialogueCache(0))
+
+    for tracker, cached_prediction in zip(trackers, cached_predictions):
+        prediction = policy.predict_action_probabilities(
+            tracker, domain, precomputations
+        )
+        assert np.allclose(
+            prediction.probabilities, cached_prediction.probabilities, atol=1e-5
+        )
+        assert prediction.optional_events == cached_prediction.optional_events
+
+
+def test_dialogue_cache_evicts_least_recently_used_conversations():
+    entry = (np.zeros(10, dtype=np.float32),)
+    cache = DialogueCache(max_size_in_bytes=2 * entry[0].nbytes)
+
+    cache.put("1", entry)
+    cache.put("2", entry)
+    assert cache.get("1") is entry
+
+    cache.put("3", entry)
+
+    assert len(cache) == 2
+    assert cache.get("2") is None
+    assert cache.get("1") is entry
+    assert cache.get("3") is entry
+    assert cache.size_in_bytes == 2 * entry[0].nbytes
+
+
+def test_dialogue_cache_skips_entries_exceeding_budget():
+    cache = DialogueCache(max_size_in_bytes=8)
+
+    cache.put("1", (np.zeros(1, dtype=np.float32),))
+    cache.put("1", (np.zeros(10, dtype=np.float32),))
+
+    assert len(cache) == 0
+    assert cache.size_in_bytes == 0
+
+
+def test_training_with_tf_data_pipeline_matches_data_generator(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    stories_path: Text,
+    domain_path: Text,
+    monkeypatch: MonkeyPatch,
+):
+    domain = Domain.load(domain_path)
+    trackers = train_trackers(domain, stories_path, augmentation_factor=0)
+
+    # the batches can only be compared if both feed the examples in the same order
+    monkeypatch.setattr(
+        train_utils,
+        "create_data_generators",
+        functools.partial(train_utils.create_data_generators, shuffle=False),
+    )
+    monkeypatch.setattr(
+        train_utils,
+        "RasaDataPipeline",
+        functools.partial(RasaDataPipeline, bucket_by_sequence_length=False),
+    )
+    batch_loss = TED.batch_loss
+
+    def train_and_record_batches(use_tf_data_pipeline: bool) -> List[List[np.ndarray]]:
+        batches = []
+
+        def recording_batch_loss(
+            model: TED, batch_in: Tuple[tf.Tensor, ...]
+        ) -> tf.Tensor:
+            batches.append(
+                [x.numpy() for x in tf.nest.flatten(batch_in) if x is not None]
+            )
+            return batch_loss(model, batch_in)
+
+        monkeypatch.setattr(TED, "batch_loss", recording_batch_loss)
+        policy = TEDPolicy(
+            {
+                **TEDPolicy.get_default_config(),
+                EPOCHS: 3,
+                BATCH_SIZES: [2, 4],
+                BATCH_STRATEGY: SEQUENCE,
+                USE_TF_DATA_PIPELINE: use_tf_data_pipeline,
+            },
+            default_model_storage,
+            Resource("TEDPolicy"),
+            default_execution_context,
+        )
+        policy.train(trackers, domain)
+
+        return batches
+
+    # record the batches which are passed to the model in every train step
+    tf.config.run_functions_eagerly(True)
+    try:
+        expected_batches = train_and_record_batches(use_tf_data_pipeline=False)
+        batches = train_and_record_batches(use_tf_data_pipeline=True)
+    finally:
+        tf.config.run_functions_eagerly(False)
+
+    assert len(batches) == len(expected_batches)
+    for batch, expected_batch in zip(batches, expected_batches):
+        assert len(batch) == len(expected_batch)
+        for actual, expected in zip(batch, expected_batch):
+            np.testing.assert_array_equal(actual, expected)
+
+
 class TestTEDPolicyMargin(TestTEDPolicy):
     def _config(
         self, config_override: Optional[Dict[Text, Any]] = None
@@ -1,8 +1,11 @@
+import gzip
+import json
 import textwrap
 from datetime import datetime
 from typing import List, Text
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from aioresponses import aioresponses
 from jsonschema import ValidationError
 
@@ -79,6 +82,7 @@ from rasa.shared.core.constants import (
     SESSION_START_METADATA_SLOT,
 )
 from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.exceptions import InvalidConfigException
 from rasa.utils.endpoints import ClientResponseError, EndpointConfig
 from tests.utilities import json_of_latest_request, latest_request
 
@@ -617,6 +621,201 @@ async def test_remote_action_endpoint_responds_400(
     assert "Custom action 'my_action' rejected to run" in str(execinfo.value)
 
 
+@pytest.fixture
+def session_tracker(domain: Domain) -> DialogueStateTracker:
+    return DialogueStateTracker.from_events(
+        "my-sender",
+        [
+            ActionExecuted(ACTION_SESSION_START_NAME),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi"),
+            ActionExecuted(ACTION_SESSION_START_NAME),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hello"),
+        ],
+        slots=domain.slots,
+    )
+
+
+@pytest.fixture
+def payload_cache(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        action, "_action_server_payload_cache", action._ActionServerPayloadCache()
+    )
+
+
+async def test_remote_action_sends_domain_digest(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    session_tracker: DialogueStateTracker,
+    domain: Domain,
+    payload_cache: None,
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", send_domain="digest"
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+            repeat=True,
+        )
+
+        for _ in range(2):
+            await remote_action.run(
+                default_channel, default_nlg, session_tracker, domain
+            )
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    first_request, second_request = [call.kwargs["json"] for call in r]
+    assert first_request["domain_digest"] == domain.fingerprint()
+    assert first_request["domain"] == domain.as_dict()
+
+    assert second_request["domain_digest"] == domain.fingerprint()
+    assert "domain" not in second_request
+
+
+async def test_remote_action_sends_events_of_current_session(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    session_tracker: DialogueStateTracker,
+    domain: Domain,
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", send_events="session"
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+        )
+
+        await remote_action.run(default_channel, default_nlg, session_tracker, domain)
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    assert json_of_latest_request(r)["tracker"]["events"] == [
+        event.as_dict() for event in list(session_tracker.events)[4:]
+    ]
+
+
+async def test_remote_action_sends_event_deltas(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    session_tracker: DialogueStateTracker,
+    domain: Domain,
+    payload_cache: None,
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions", send_events="delta"
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+            repeat=True,
+        )
+
+        await remote_action.run(default_channel, default_nlg, session_tracker, domain)
+        number_of_events = len(session_tracker.events)
+
+        new_event = ActionExecuted("my_action")
+        session_tracker.update(new_event)
+        await remote_action.run(default_channel, default_nlg, session_tracker, domain)
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    first_request, second_request = [call.kwargs["json"] for call in r]
+    assert first_request["events_offset"] == 0
+    assert len(first_request["tracker"]["events"]) == number_of_events
+
+    assert second_request["events_offset"] == number_of_events
+    assert second_request["tracker"]["events"] == [new_event.as_dict()]
+
+
+async def test_remote_action_resends_full_payload_if_context_is_missing(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    session_tracker: DialogueStateTracker,
+    domain: Domain,
+    payload_cache: None,
+):
+    endpoint = EndpointConfig(
+        "https://example.com/webhooks/actions",
+        send_domain="digest",
+        send_events="delta",
+    )
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        url = "https://example.com/webhooks/actions"
+        mocked.post(url, payload={"events": [], "responses": []})
+        # e.g. the action server was restarted and lost its cache
+        mocked.post(url, status=action.ACTION_SERVER_CONTEXT_MISSING_STATUS)
+        mocked.post(url, payload={"events": [], "responses": []})
+
+        await remote_action.run(default_channel, default_nlg, session_tracker, domain)
+        await remote_action.run(default_channel, default_nlg, session_tracker, domain)
+
+        r = latest_request(mocked, "post", url)
+
+    _, slim_request, full_request = [call.kwargs["json"] for call in r]
+    assert "domain" not in slim_request
+    assert slim_request["tracker"]["events"] == []
+
+    assert full_request["domain"] == domain.as_dict()
+    assert full_request["events_offset"] == 0
+    assert len(full_request["tracker"]["events"]) == len(session_tracker.events)
+
+
+async def test_remote_action_compresses_payload(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    default_tracker: DialogueStateTracker,
+    domain: Domain,
+):
+    endpoint = EndpointConfig("https://example.com/webhooks/actions", compress=True)
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://example.com/webhooks/actions",
+            payload={"events": [], "responses": []},
+        )
+
+        await remote_action.run(default_channel, default_nlg, default_tracker, domain)
+
+        r = latest_request(mocked, "post", "https://example.com/webhooks/actions")
+
+    request = r[-1].kwargs
+    assert request["headers"]["Content-Encoding"] == "gzip"
+    payload = json.loads(gzip.decompress(request["data"]))
+    assert payload["next_action"] == "my_action"
+    assert payload["domain"] == domain.as_dict()
+
+
+async def test_remote_action_with_invalid_payload_option(
+    default_channel: OutputChannel,
+    default_nlg: NaturalLanguageGenerator,
+    default_tracker: DialogueStateTracker,
+    domain: Domain,
+):
+    endpoint = EndpointConfig("https://example.com/webhooks/actions", send_events="x")
+    remote_action = action.RemoteAction("my_action", endpoint)
+
+    with pytest.raises(InvalidConfigException):
+        await remote_action.run(default_channel, default_nlg, default_tracker, domain)
+
+
 async def test_action_utter_retrieved_response(
     default_channel, default_nlg, default_tracker, domain: Domain
 ):
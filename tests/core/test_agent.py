@@ -323,6 +323,51 @@ async def test_agent_update_model_none_domain(trained_rasa_model: Text):
     assert tracker.events[3].intent["name"] == "greet"
 
 
+async def test_agent_switch_model_drains_requests_in_flight():
+    agent = Agent(fingerprint="old")
+    request_started = asyncio.Event()
+    finish_request = asyncio.Event()
+    used_fingerprints = []
+
+    async def request() -> None:
+        async with agent._use_model():
+            used_fingerprints.append(agent.fingerprint)
+            request_started.set()
+            await finish_request.wait()
+            used_fingerprints.append(agent.fingerprint)
+
+    request_in_flight = asyncio.ensure_future(request())
+    await request_started.wait()
+
+    switch = asyncio.ensure_future(agent.switch_model(None, None, "new"))
+    await asyncio.sleep(0.1)
+    # requests which arrive during the switch wait for the new model
+    request_started.clear()
+    new_request = asyncio.ensure_future(request())
+    await asyncio.sleep(0.1)
+
+    assert not switch.done()
+    assert not request_started.is_set()
+    assert agent.fingerprint == "old"
+
+    finish_request.set()
+    await asyncio.gather(request_in_flight, switch, new_request)
+
+    assert used_fingerprints == ["old", "old", "new", "new"]
+    assert agent.fingerprint == "new"
+
+
+async def test_agent_switch_model_after_draining_timeout(caplog: LogCaptureFixture):
+    agent = Agent(fingerprint="old")
+
+    async with agent._use_model():
+        await agent.switch_model(None, None, "new", draining_timeout=0.1)
+
+        assert agent.fingerprint == "new"
+
+    assert "didn't finish within 0.1 seconds" in caplog.text
+
+
 async def test_load_agent_on_not_existing_path():
     agent = await load_agent(model_path="some-random-path")
 
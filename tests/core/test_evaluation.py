@@ -13,6 +13,7 @@ from rasa.core.test import (
     _collect_story_predictions,
     test as evaluate_stories,
     _clean_entity_results,
+    _IncrementalStatesTracker,
 )
 from rasa.core.constants import (
     CONFUSION_MATRIX_STORIES_FILE,
@@ -27,6 +28,7 @@ from rasa.core.policies.memoization import MemoizationPolicy
 # noinspection PyUnresolvedReferences
 from rasa.nlu.test import evaluate_entities, run_evaluation  # noqa: F401
 from rasa.core.agent import Agent
+from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.exceptions import RasaException
 
 
@@ -120,6 +122,54 @@ async def test_end_to_end_evaluation_script(
     assert num_stories == 3
 
 
+async def test_evaluation_in_parallel(default_agent: Agent, stories_path: Text):
+    generator = _create_data_generator(stories_path, default_agent)
+    completed_trackers = generator.generate_story_trackers()
+
+    story_evaluation, num_stories, _ = await _collect_story_predictions(
+        completed_trackers, default_agent
+    )
+    (
+        parallel_story_evaluation,
+        parallel_num_stories,
+        _,
+    ) = await _collect_story_predictions(
+        completed_trackers, default_agent, num_processes=2
+    )
+
+    assert parallel_num_stories == num_stories
+    assert (
+        parallel_story_evaluation.evaluation_store.serialise()
+        == story_evaluation.evaluation_store.serialise()
+    )
+    assert parallel_story_evaluation.action_list == story_evaluation.action_list
+    assert [
+        tracker.sender_id for tracker in parallel_story_evaluation.failed_stories
+    ] == [tracker.sender_id for tracker in story_evaluation.failed_stories]
+
+
+async def test_incremental_states_tracker(form_bot_agent: Agent):
+    generator = _create_data_generator(
+        "data/test_yaml_stories/stories_form.yml", form_bot_agent
+    )
+    domain = form_bot_agent.domain
+
+    for tracker in generator.generate_story_trackers():
+        incremental_tracker = _IncrementalStatesTracker(tracker.sender_id, domain.slots)
+        for event in tracker.events:
+            incremental_tracker.update(event)
+
+            expected_tracker = DialogueStateTracker.from_events(
+                tracker.sender_id, list(incremental_tracker.events), domain.slots
+            )
+            for ignore_rule_only_turns in [True, False]:
+                assert incremental_tracker.past_states(
+                    domain, ignore_rule_only_turns=ignore_rule_only_turns
+                ) == expected_tracker.past_states(
+                    domain, ignore_rule_only_turns=ignore_rule_only_turns
+                )
+
+
 async def test_end_to_end_evaluation_script_unknown_entity(
     default_agent: Agent, e2e_story_file_unknown_entity_path: Text
 ):
@@ -7,6 +7,7 @@ import numpy as np
 import pytest
 from _pytest.tmpdir import TempPathFactory
 
+import rasa.shared.utils.io
 from rasa.engine.graph import ExecutionContext, GraphSchema
 from rasa.engine.storage.local_model_storage import LocalModelStorage
 from rasa.engine.storage.resource import Resource
@@ -15,10 +16,13 @@ from rasa.shared.constants import DEFAULT_SENDER_ID
 from rasa.shared.core.constants import (
     ACTION_LISTEN_NAME,
     ACTION_UNLIKELY_INTENT_NAME,
+    RULE_ONLY_LOOPS,
+    RULE_ONLY_SLOTS,
 )
 from rasa.shared.core.domain import Domain
 from rasa.shared.core.events import (
     ActionExecuted,
+    ActiveLoop,
     Event,
     UserUttered,
     EntitiesAdded,
@@ -46,6 +50,8 @@ from rasa.core.policies.ted_policy import TEDPolicy
 from rasa.core.policies.memoization import (
     AugmentedMemoizationPolicyGraphComponent as AugmentedMemoizationPolicy,
     MemoizationPolicyGraphComponent as MemoizationPolicy,
+    MemoryMappedLookup,
+    _past_turns,
 )
 
 from rasa.shared.core.trackers import DialogueStateTracker
@@ -433,6 +439,37 @@ class TestMemoizationPolicy(PolicyTestCollection):
         recalled = trained_policy.recall(states, tracker, default_domain, None)
         assert recalled is not None
 
+    def test_hashed_feature_keys(
+        self,
+        featurizer: TrackerFeaturizer,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        resource = Resource(uuid.uuid4().hex)
+        config = {"enable_hashed_feature_keys": True}
+        policy = self.create_policy(
+            featurizer, model_storage, resource, execution_context, config
+        )
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        policy.train(trackers, default_domain)
+
+        loaded = policy.__class__.load(
+            self._config(config), model_storage, resource, execution_context
+        )
+
+        assert isinstance(loaded.lookup, MemoryMappedLookup)
+        assert loaded.lookup == policy.lookup
+        assert all(len(feature_key) == 32 for feature_key in loaded.lookup)
+
+        all_states, all_actions = policy.featurizer.training_states_and_labels(
+            trackers, default_domain
+        )
+        for tracker, states, actions in zip(trackers, all_states, all_actions):
+            recalled = loaded.recall(states, tracker, default_domain, None)
+            assert recalled == actions[0]
+
     def test_finetune_after_load(
         self,
         trained_policy: MemoizationPolicy,
@@ -649,10 +686,91 @@ class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
     def _policy_class_to_test() -> Type[PolicyGraphComponent]:
         return AugmentedMemoizationPolicy
 
+    def test_states_trie_matches_lookup(
+        self,
+        trained_policy: AugmentedMemoizationPolicy,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        all_states, _ = trained_policy.featurizer.training_states_and_labels(
+            trackers, default_domain
+        )
+
+        assert trained_policy.states_trie is not None
+        for states in all_states:
+            feature_key = trained_policy._create_feature_key(states)
+            expected = trained_policy.lookup.get(feature_key)
+            assert trained_policy.states_trie.get(states) == expected
+
+    def test_states_trie_is_not_created_for_states_which_cant_be_split(
+        self,
+        featurizer: TrackerFeaturizer,
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ):
+        policy = self.create_policy(
+            featurizer, model_storage, resource, execution_context
+        )
+        states = [{"user": {"text": "}"}}]
+        lookup = {policy._create_feature_key(states): "utter_greet"}
+
+        policy = AugmentedMemoizationPolicy(
+            policy.config,
+            model_storage,
+            resource,
+            execution_context,
+            featurizer=featurizer,
+            lookup=lookup,
+        )
+
+        # the examples are recalled from the lookup instead
+        assert policy.states_trie is None
+        assert policy._recall_states(states) == "utter_greet"
+
+    def test_load_states_trie(
+        self,
+        featurizer: TrackerFeaturizer,
+        model_storage: ModelStorage,
+        execution_context: ExecutionContext,
+        default_domain: Domain,
+        stories_path: Text,
+    ):
+        resource = Resource(uuid.uuid4().hex)
+        policy = self.create_policy(
+            featurizer, model_storage, resource, execution_context
+        )
+        trackers = train_trackers(default_domain, stories_path, augmentation_factor=0)
+        policy.train(trackers, default_domain)
+
+        with model_storage.read_from(resource) as path:
+            metadata = rasa.shared.utils.io.read_json_file(
+                Path(path) / policy._metadata_filename()
+            )
+        # the trie is built from the lookup instead of being persisted
+        assert list(metadata.keys()) == ["lookup"]
+
+        loaded = policy.__class__.load(
+            self._config(policy.config), model_storage, resource, execution_context
+        )
+
+        assert loaded.lookup == policy.lookup
+        assert loaded.states_trie.root == policy.states_trie.root
+
+        tracker = tracker_from_dialogue(TEST_DEFAULT_DIALOGUE, default_domain)
+        states = policy._prediction_states(tracker, default_domain)
+
+        assert loaded.recall(states, tracker, default_domain, None) == policy.recall(
+            states, tracker, default_domain, None
+        )
+
     @pytest.mark.parametrize("max_history", [1, 2, 3, 4, None])
+    @pytest.mark.parametrize("enable_hashed_feature_keys", [False, True])
     def test_augmented_prediction(
         self,
         max_history: Optional[int],
+        enable_hashed_feature_keys: bool,
         model_storage: ModelStorage,
         resource: Resource,
         execution_context: ExecutionContext,
@@ -662,6 +780,7 @@ class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
             model_storage=model_storage,
             resource=resource,
             execution_context=execution_context,
+            config={"enable_hashed_feature_keys": enable_hashed_feature_keys},
         )
 
         GREET_INTENT_NAME = "greet"
@@ -717,6 +836,9 @@ class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
             slots=domain.slots,
         )
         policy.train([training_story], domain)
+        # hashed feature keys are recalled without the states trie
+        assert (policy.states_trie is None) == enable_hashed_feature_keys
+
         prediction = policy.predict_action_probabilities(test_story, domain)
         assert (
             domain.action_names_or_texts[
@@ -725,6 +847,177 @@ class TestAugmentedMemoizationPolicy(TestMemoizationPolicy):
             == UTTER_BYE_ACTION
         )
 
+    @pytest.mark.parametrize(
+        "events, is_replayed",
+        [
+            # slots which are set before and after the cuts
+            (
+                [
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                    SlotSet("slot_1", False),
+                    ActionExecuted("utter_greet"),
+                    SlotSet("slot_2", True),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "inform"}),
+                    ActionExecuted("utter_greet"),
+                    SlotSet("slot_3", True),
+                    SlotSet("slot_2", False),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                ],
+                False,
+            ),
+            # an active loop which is set and reset
+            (
+                [
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                    ActionExecuted("some_form"),
+                    ActiveLoop("some_form"),
+                    SlotSet("slot_2", True),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "inform"}),
+                    ActionExecuted("some_form"),
+                    SlotSet("slot_3", True),
+                    ActiveLoop(None),
+                    ActionExecuted("utter_greet"),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                ],
+                False,
+            ),
+            # hidden rule turns
+            (
+                [
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                    ActionExecuted("utter_greet", hide_rule_turn=True),
+                    SlotSet("slot_2", True),
+                    ActionExecuted(ACTION_LISTEN_NAME, hide_rule_turn=True),
+                    UserUttered(intent={"name": "inform"}),
+                    ActionExecuted("some_form"),
+                    ActiveLoop("some_form"),
+                    SlotSet("slot_3", True),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                ],
+                True,
+            ),
+            # `action_unlikely_intent`
+            (
+                [
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "greet"}),
+                    ActionExecuted(ACTION_UNLIKELY_INTENT_NAME),
+                    ActionExecuted("utter_greet"),
+                    SlotSet("slot_2", True),
+                    ActionExecuted(ACTION_LISTEN_NAME),
+                    UserUttered(intent={"name": "inform"}),
+                ],
+                True,
+            ),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "rule_only_data",
+        [None, {RULE_ONLY_SLOTS: ["slot_2"], RULE_ONLY_LOOPS: ["some_form"]}],
+    )
+    @pytest.mark.parametrize("max_history", [1, 3, None])
+    @pytest.mark.parametrize("enable_hashed_feature_keys", [False, True])
+    def test_delorean_recalls_like_replaying_the_tracker(
+        self,
+        events: List[Event],
+        is_replayed: bool,
+        rule_only_data: Optional[Dict[Text, Any]],
+        max_history: Optional[int],
+        enable_hashed_feature_keys: bool,
+        model_storage: ModelStorage,
+        resource: Resource,
+        execution_context: ExecutionContext,
+    ):
+        domain = Domain.from_yaml(
+            """
+            intents:
+            - greet
+            - inform
+            actions:
+            - utter_greet
+            slots:
+                slot_1:
+                    type: bool
+                    initial_value: true
+                slot_2:
+                    type: bool
+                slot_3:
+                    type: bool
+            forms:
+                some_form: {}
+            """
+        )
+        config = self._config(
+            {
+                POLICY_MAX_HISTORY: max_history,
+                "enable_hashed_feature_keys": enable_hashed_feature_keys,
+            }
+        )
+        featurizer = MaxHistoryTrackerFeaturizer(max_history=max_history)
+        policy = self.create_policy(
+            featurizer, model_storage, resource, execution_context, config
+        )
+        tracker = DialogueStateTracker.from_events(
+            "test", evts=events, slots=domain.slots
+        )
+        states = policy._prediction_states(
+            tracker, domain, rule_only_data=rule_only_data
+        )
+        applied_events = tracker.applied_events()
+
+        assert (_past_turns(states, applied_events, max_history) is None) == is_replayed
+
+        # replay the tracker from each of the last `max_history + 1` actions
+        action_indices = [
+            index
+            for index, event in enumerate(applied_events)
+            if isinstance(event, ActionExecuted)
+        ]
+        if max_history:
+            action_indices = action_indices[-max_history - 1 :]
+        replayed_states = []
+        for action_index in action_indices:
+            replayed_tracker = tracker.init_copy()
+            for event in applied_events[action_index:]:
+                replayed_tracker.update(event)
+            replayed_states.append(
+                policy._prediction_states(
+                    replayed_tracker, domain, rule_only_data=rule_only_data
+                )
+            )
+
+        # the earliest memorized variant of the past is recalled
+        for earliest in range(len(replayed_states)):
+            lookup = {}
+            for number, variant in enumerate(replayed_states):
+                if number >= earliest:
+                    lookup.setdefault(
+                        policy._create_feature_key(variant), f"variant_{number}"
+                    )
+            expected = lookup.get(
+                policy._create_feature_key(states), f"variant_{earliest}"
+            )
+
+            memorizing_policy = AugmentedMemoizationPolicy(
+                config,
+                model_storage,
+                resource,
+                execution_context,
+                featurizer=featurizer,
+                lookup=lookup,
+            )
+            recalled = memorizing_policy.recall(states, tracker, domain, rule_only_data)
+
+            assert recalled == expected
+
 
 @pytest.mark.parametrize(
     "policy,supported_data",
@@ -1,16 +1,20 @@
 from unittest.mock import Mock
 
 import pytest
-from typing import Text
+from _pytest.monkeypatch import MonkeyPatch
+from typing import Optional, Text
 
 import rasa.shared.core.domain
 import rasa.shared.nlu.interpreter
 from sanic import Sanic
 from asyncio import AbstractEventLoop
 from pathlib import Path
+from rasa.constants import ENV_SANIC_PRELOAD_MODEL
 from rasa.core import run, interpreter, policies
+from rasa.core.agent import Agent
 from rasa.core.brokers.sql import SQLEventBroker
 from rasa.core.utils import AvailableEndpoints
+from rasa.shared.exceptions import RasaException
 
 CREDENTIALS_FILE = "data/test_moodbot/credentials.yml"
 
@@ -96,3 +100,65 @@ async def test_close_resources(loop: AbstractEventLoop):
         await run.close_resources(app, loop)
 
     assert len(warnings) == 0
+
+
+async def test_load_agent_on_start_with_preloaded_agent(
+    trained_rasa_model: Text, rasa_non_trained_server: Sanic, loop: AbstractEventLoop
+):
+    preloaded_agent = Agent.load(trained_rasa_model)
+
+    agent = await run.load_agent_on_start(
+        trained_rasa_model,
+        AvailableEndpoints(),
+        None,
+        rasa_non_trained_server,
+        loop,
+        preloaded_agent=preloaded_agent,
+    )
+
+    assert agent is preloaded_agent
+    assert rasa_non_trained_server.agent is preloaded_agent
+    assert agent.is_ready()
+
+
+def test_preload_agent(trained_rasa_model: Text, monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(run, "_is_tensorflow_initialized", lambda: False)
+
+    preloaded_agent = run._preload_agent(trained_rasa_model, AvailableEndpoints(), None)
+
+    assert preloaded_agent.is_ready()
+
+
+def test_preload_agent_with_tensorflow(
+    trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setattr(run, "_is_tensorflow_initialized", lambda: True)
+
+    with pytest.raises(RasaException):
+        run._preload_agent(trained_rasa_model, AvailableEndpoints(), None)
+
+
+@pytest.mark.parametrize(
+    "env_value, start_method, expected",
+    [
+        (None, "fork", False),
+        ("true", "fork", True),
+        ("True", "fork", True),
+        ("false", "fork", False),
+        ("true", "spawn", False),
+    ],
+)
+def test_should_preload_model(
+    env_value: Optional[Text],
+    start_method: Text,
+    expected: bool,
+    monkeypatch: MonkeyPatch,
+):
+    if env_value is None:
+        monkeypatch.delenv(ENV_SANIC_PRELOAD_MODEL, raising=False)
+    else:
+        monkeypatch.setenv(ENV_SANIC_PRELOAD_MODEL, env_value)
+    monkeypatch.setattr(run.multiprocessing, "get_start_method", lambda: start_method)
+
+    with pytest.warns(None):
+        assert run._should_preload_model() == expected
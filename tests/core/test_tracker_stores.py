@@ -617,6 +617,71 @@ def test_tracker_store_retrieve_with_session_started_events(
     assert all((event == tracker.events[i] for i, event in enumerate(events[2:])))
 
 
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+@pytest.mark.parametrize(
+    "filters,expected_texts",
+    [
+        ({}, ["Hola", "Hi", None, "Ciao", "Bye"]),
+        ({"offset": 1, "limit": 2}, ["Hi", None]),
+        ({"since": 2}, [None, "Ciao", "Bye"]),
+        ({"event_types": ["user"]}, ["Hola", "Ciao"]),
+        ({"since": 1, "event_types": ["user", "bot"], "offset": 1}, ["Ciao", "Bye"]),
+        ({"limit": 0}, []),
+    ],
+)
+def test_tracker_store_retrieve_events(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    domain: Domain,
+    filters: Dict,
+    expected_texts: List[Optional[Text]],
+):
+    tracker_store = tracker_store_type(domain, **tracker_store_kwargs)
+    events = [
+        UserUttered("Hola", {"name": "greet"}, timestamp=1),
+        BotUttered("Hi", timestamp=2),
+        SessionStarted(timestamp=3),
+        UserUttered("Ciao", {"name": "greet"}, timestamp=4),
+        BotUttered("Bye", timestamp=5),
+    ]
+    sender_id = "test_tracker_store_retrieve_events"
+    tracker_store.save(DialogueStateTracker.from_events(sender_id, events))
+    tracker_store.save(DialogueStateTracker.from_events("other", [SessionStarted()]))
+
+    retrieved = list(tracker_store.retrieve_events(sender_id, **filters))
+
+    assert [event.get("text") for event in retrieved] == expected_texts
+    assert all(Event.from_parameters(event) in events for event in retrieved)
+
+
+def test_tracker_store_retrieve_events_of_unknown_conversation(domain: Domain):
+    tracker_store = SQLTrackerStore(domain)
+
+    assert list(tracker_store.retrieve_events("unknown")) == []
+
+
+def test_fail_safe_tracker_store_with_retrieve_events_error():
+    def failing_events(*args, **kwargs):
+        yield {"event": "user"}
+        raise Exception()
+
+    mocked_tracker_store = Mock()
+    mocked_tracker_store.retrieve_events = failing_events
+    on_error_callback = Mock()
+
+    tracker_store = FailSafeTrackerStore(mocked_tracker_store, on_error_callback)
+
+    assert list(tracker_store.retrieve_events("sender_id")) == [{"event": "user"}]
+    on_error_callback.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "tracker_store_type,tracker_store_kwargs",
     [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
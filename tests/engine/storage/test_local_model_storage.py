@@ -3,11 +3,15 @@ from pathlib import Path
 
 import freezegun
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from _pytest.tmpdir import TempPathFactory
 
 import rasa.shared.utils.io
 from rasa.engine.graph import SchemaNode, GraphSchema
-from rasa.engine.storage.local_model_storage import LocalModelStorage
+from rasa.engine.storage.local_model_storage import (
+    LocalModelStorage,
+    MODEL_ARCHIVE_COMPRESSION_ENV,
+)
 from rasa.engine.storage.storage import ModelStorage
 from rasa.engine.storage.resource import Resource
 from rasa.shared.core.domain import Domain
@@ -133,3 +137,68 @@ def test_create_model_package_with_non_empty_model_storage(tmp_path: Path):
     with pytest.raises(ValueError):
         # Unpacking into an already filled `ModelStorage` raises an exception.
         _ = LocalModelStorage.from_model_archive(tmp_path, Path("does not matter"))
+
+
+def test_create_uncompressed_model_package_and_load_resources_lazily(
+    tmp_path_factory: TempPathFactory, domain: Domain, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv(MODEL_ARCHIVE_COMPRESSION_ENV, "none")
+
+    train_model_storage = LocalModelStorage(
+        tmp_path_factory.mktemp("train model storage")
+    )
+    for resource_name in ["resource1", "resource2"]:
+        with train_model_storage.write_to(Resource(resource_name)) as directory:
+            sub_directory = directory / "sub_directory"
+            sub_directory.mkdir()
+            (sub_directory / "file.txt").write_text(resource_name)
+
+    archive_path = tmp_path_factory.mktemp("persisted models") / "my-model.tar"
+    schema = GraphSchema({})
+    train_model_storage.create_model_package(archive_path, schema, schema, domain)
+
+    load_model_storage_dir = tmp_path_factory.mktemp("load model storage")
+    (load_model_storage, packaged_metadata,) = LocalModelStorage.from_model_archive(
+        load_model_storage_dir, archive_path
+    )
+
+    assert packaged_metadata.domain.as_dict() == domain.as_dict()
+
+    # Nothing was extracted yet
+    assert not list(load_model_storage_dir.glob("*"))
+
+    with load_model_storage.read_from(Resource("resource1")) as directory:
+        assert (directory / "sub_directory" / "file.txt").read_text() == "resource1"
+
+    # Only the requested resource was extracted
+    assert list(load_model_storage_dir.glob("*")) == [
+        load_model_storage_dir / "resource1"
+    ]
+
+    with pytest.raises(ValueError):
+        with load_model_storage.read_from(Resource("unknown resource")):
+            pass
+
+    # Packaging the model again includes the resource which wasn't extracted yet
+    repackaged_archive_path = archive_path.parent / "my-other-model.tar"
+    load_model_storage.create_model_package(
+        repackaged_archive_path, schema, schema, domain
+    )
+    assert sorted(load_model_storage_dir.glob("*")) == [
+        load_model_storage_dir / "resource1",
+        load_model_storage_dir / "resource2",
+    ]
+
+
+def test_create_model_package_with_invalid_compression(
+    default_model_storage: ModelStorage,
+    tmp_path: Path,
+    domain: Domain,
+    monkeypatch: MonkeyPatch,
+):
+    monkeypatch.setenv(MODEL_ARCHIVE_COMPRESSION_ENV, "lzma")
+
+    with pytest.raises(ValueError):
+        default_model_storage.create_model_package(
+            tmp_path / "model.tar", GraphSchema({}), GraphSchema({}), domain
+        )
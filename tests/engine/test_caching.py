@@ -13,6 +13,7 @@ from sqlalchemy.exc import OperationalError
 
 import rasa.shared.utils.io
 import rasa.shared.utils.common
+import rasa.utils.common
 from rasa.engine.caching import (
     LocalTrainingCache,
     CACHE_LOCATION_ENV,
@@ -20,6 +21,8 @@ from rasa.engine.caching import (
     CACHE_SIZE_ENV,
     CACHE_DB_NAME_ENV,
     TrainingCache,
+    SharedTrainingCache,
+    SHARED_CACHE_LOCATION_ENV,
 )
 import tests.conftest
 from rasa.engine.storage.local_model_storage import LocalModelStorage
@@ -536,3 +539,179 @@ def test_resource_with_model_storage(
             temporary_directory / test_filename
         )
         assert cached_content == test_content
+
+
+def test_cache_size_is_tracked_without_scanning_cache_directory(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    monkeypatch.setenv(CACHE_SIZE_ENV, "5")
+
+    cache = LocalTrainingCache()
+
+    size_calculation = Mock(wraps=rasa.utils.common.directory_size_in_mb)
+    monkeypatch.setattr(rasa.utils.common, "directory_size_in_mb", size_calculation)
+
+    output_fingerprints = []
+    for _ in range(4):
+        output_fingerprint = uuid.uuid4().hex
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}, size_in_mb=2),
+            output_fingerprint,
+            default_model_storage,
+        )
+        output_fingerprints.append(output_fingerprint)
+
+    # The size of the cache directory is only calculated once during the
+    # initialization. Afterwards only the size of the new results is calculated.
+    assert size_calculation.call_count == len(output_fingerprints)
+
+    # Only the two most recently cached results fit into the cache
+    assert 4 <= cache._cache_size <= 5
+    for output_fingerprint in output_fingerprints[:2]:
+        assert (
+            cache.get_cached_result(
+                output_fingerprint, "some_node", default_model_storage
+            )
+            is None
+        )
+    for output_fingerprint in output_fingerprints[2:]:
+        assert cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        )
+
+
+def test_reset_cache_created_without_size_tracking(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    import sqlalchemy as sa
+
+    database_name = "test.db"
+    monkeypatch.setenv(CACHE_LOCATION_ENV, str(tmp_path))
+    monkeypatch.setenv(CACHE_DB_NAME_ENV, database_name)
+
+    # Create a cache table in the format of previous Rasa versions
+    engine = sa.create_engine(f"sqlite:///{tmp_path / database_name}")
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text(
+                "CREATE TABLE cache_entry (fingerprint_key VARCHAR PRIMARY KEY, "
+                "output_fingerprint_key VARCHAR, last_used DATETIME, "
+                "rasa_version VARCHAR(255), result_location VARCHAR, "
+                "result_type VARCHAR)"
+            )
+        )
+    engine.dispose()
+    tests.conftest.create_test_file_with_size(tmp_path, 1)
+
+    cache = LocalTrainingCache()
+
+    assert list(tmp_path.glob("*")) == [tmp_path / database_name]
+    assert cache._cache_size == 0
+
+    fingerprint_key = uuid.uuid4().hex
+    output_fingerprint = uuid.uuid4().hex
+    cache.cache_output(
+        fingerprint_key,
+        TestCacheableOutput({"something to cache": "dasdaasda"}),
+        output_fingerprint,
+        default_model_storage,
+    )
+
+    assert cache.get_cached_output_fingerprint(fingerprint_key) == output_fingerprint
+
+
+def test_shared_cache_output(tmp_path: Path, default_model_storage: ModelStorage):
+    cache = SharedTrainingCache(tmp_path)
+
+    fingerprint_key = uuid.uuid4().hex
+    output = TestCacheableOutput({"something to cache": "dasdaasda"})
+    output_fingerprint = uuid.uuid4().hex
+    cache.cache_output(
+        fingerprint_key, output, output_fingerprint, default_model_storage
+    )
+
+    # A different cache instance (e.g. on a different machine) can use the result
+    other_cache = SharedTrainingCache(tmp_path)
+    assert other_cache.get_cached_output_fingerprint(fingerprint_key) == (
+        output_fingerprint
+    )
+    assert (
+        other_cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        )
+        == output
+    )
+
+    assert other_cache.get_cached_output_fingerprint(uuid.uuid4().hex) is None
+    assert (
+        other_cache.get_cached_result(
+            uuid.uuid4().hex, "some_node", default_model_storage
+        )
+        is None
+    )
+
+    # Nothing is left behind in the staging area
+    assert not list((tmp_path / SharedTrainingCache.STAGING_DIRECTORY).glob("*"))
+
+
+def test_shared_cache_deduplicates_identical_outputs(
+    tmp_path: Path, monkeypatch: MonkeyPatch, default_model_storage: ModelStorage
+):
+    monkeypatch.setenv(SHARED_CACHE_LOCATION_ENV, str(tmp_path))
+    cache = SharedTrainingCache()
+
+    output_fingerprints = [uuid.uuid4().hex, uuid.uuid4().hex]
+    for output_fingerprint in output_fingerprints:
+        cache.cache_output(
+            uuid.uuid4().hex,
+            TestCacheableOutput({"something to cache": "dasdaasda"}),
+            output_fingerprint,
+            default_model_storage,
+        )
+    cache.cache_output(
+        uuid.uuid4().hex,
+        TestCacheableOutput({"something else": "to cache"}),
+        uuid.uuid4().hex,
+        default_model_storage,
+    )
+
+    cached_objects = list((tmp_path / SharedTrainingCache.OBJECTS_DIRECTORY).iterdir())
+    assert len(cached_objects) == 2
+    for output_fingerprint in output_fingerprints:
+        assert cache.get_cached_result(
+            output_fingerprint, "some_node", default_model_storage
+        ) == TestCacheableOutput({"something to cache": "dasdaasda"})
+
+
+def test_shared_cache_without_location(monkeypatch: MonkeyPatch):
+    monkeypatch.delenv(SHARED_CACHE_LOCATION_ENV, raising=False)
+
+    with pytest.raises(ValueError):
+        SharedTrainingCache()
+
+
+def test_shared_cache_caching_fails(
+    tmp_path: Path, default_model_storage: ModelStorage
+):
+    cache = SharedTrainingCache(tmp_path / "cache")
+
+    # `tmp_path` is not a dict and will hence fail to be cached
+    # noinspection PyTypeChecker
+    output = TestCacheableOutput(tmp_path)
+    output_fingerprint = uuid.uuid4().hex
+    fingerprint_key = uuid.uuid4().hex
+    cache.cache_output(
+        fingerprint_key, output, output_fingerprint, default_model_storage
+    )
+
+    # The fingerprint is still cached
+    assert cache.get_cached_output_fingerprint(fingerprint_key) == output_fingerprint
+    assert (
+        cache.get_cached_result(output_fingerprint, "some_node", default_model_storage)
+        is None
+    )
+    cache_location = tmp_path / "cache"
+    assert not list((cache_location / SharedTrainingCache.OBJECTS_DIRECTORY).iterdir())
+    assert not list((cache_location / SharedTrainingCache.STAGING_DIRECTORY).iterdir())
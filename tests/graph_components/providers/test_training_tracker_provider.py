@@ -1,8 +1,11 @@
+from pathlib import Path
 from typing import Dict, Text, Any
 
 import pytest
+from rasa.engine.caching import Cacheable
 from rasa.graph_components.providers.training_tracker_provider import (
     TrainingTrackerProvider,
+    TrainingTrackers,
 )
 from rasa.engine.graph import ExecutionContext
 from rasa.engine.storage.resource import Resource
@@ -55,3 +58,35 @@ def test_generating_trackers(
 
     assert len(trackers) == expected_trackers
     assert all(isinstance(t, TrackerWithCachedStates) for t in trackers)
+
+
+def test_training_trackers_caching(
+    default_model_storage: ModelStorage,
+    default_execution_context: ExecutionContext,
+    tmp_path: Path,
+):
+    reader = YAMLStoryReader()
+    steps = reader.read_from_file("data/test_yaml_stories/stories.yml")
+    component = TrainingTrackerProvider.create(
+        TrainingTrackerProvider.get_default_config(),
+        default_model_storage,
+        Resource("xy"),
+        default_execution_context,
+    )
+    domain = Domain.empty()
+    trackers = component.generate_trackers(story_graph=StoryGraph(steps), domain=domain)
+
+    assert isinstance(trackers, Cacheable)
+
+    trackers.to_cache(tmp_path, default_model_storage)
+    restored_trackers = TrainingTrackers.from_cache(
+        "xy", tmp_path, default_model_storage
+    )
+
+    assert len(restored_trackers) == len(trackers)
+    for tracker, restored_tracker in zip(trackers, restored_trackers):
+        assert restored_tracker.fingerprint() == tracker.fingerprint()
+        assert restored_tracker.is_augmented == tracker.is_augmented
+        assert restored_tracker.is_rule_tracker == tracker.is_rule_tracker
+        assert restored_tracker.past_states(domain) == tracker.past_states(domain)
+        assert restored_tracker.domain is domain
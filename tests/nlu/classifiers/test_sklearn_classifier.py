@@ -1,7 +1,8 @@
 import copy
 import logging
-from typing import Text
+from typing import List, Text
 
+import numpy as np
 import pytest
 from _pytest.logging import LogCaptureFixture
 
@@ -14,6 +15,9 @@ from rasa.nlu.classifiers.sklearn_intent_classifier import (
     SklearnIntentClassifierGraphComponent,
 )
 from rasa.nlu.config import RasaNLUModelConfig
+from rasa.shared.nlu.constants import FEATURE_TYPE_SENTENCE, INTENT, TEXT
+from rasa.shared.nlu.training_data.features import Features
+from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.training_data import TrainingData
 
 
@@ -92,3 +96,46 @@ def test_loading_from_storage_fail(
     assert any(
         "Resource 'test' doesn't exist." in message for message in caplog.messages
     )
+
+
+def test_process_predicts_batch_like_single_messages(
+    default_sklearn_intent_classifier: SklearnIntentClassifierGraphComponent,
+):
+    def message(intent: Text, features: List[float]) -> Message:
+        message = Message(data={TEXT: intent, INTENT: intent})
+        message.add_features(
+            Features(
+                np.array([features]), FEATURE_TYPE_SENTENCE, TEXT, "test_featurizer"
+            )
+        )
+        return message
+
+    intents = ["greet", "goodbye", "affirm"]
+    training_examples = [
+        message(intent, np.eye(len(intents))[i] + noise)
+        for i, intent in enumerate(intents)
+        for noise in np.linspace(0, 0.2, 10)
+    ]
+    default_sklearn_intent_classifier.train(TrainingData(training_examples))
+
+    test_features = [[1.0, 0.1, 0.0], [0.0, 0.9, 0.2], [0.1, 0.2, 1.1]]
+    batch = default_sklearn_intent_classifier.process(
+        [message("", features) for features in test_features]
+    )
+    single = [
+        default_sklearn_intent_classifier.process([message("", features)])[0]
+        for features in test_features
+    ]
+
+    for expected_intent, batch_message, single_message in zip(intents, batch, single):
+        assert batch_message.get(INTENT)["name"] == expected_intent
+        assert batch_message.get(INTENT) == single_message.get(INTENT)
+        assert batch_message.get("intent_ranking") == single_message.get(
+            "intent_ranking"
+        )
+
+        confidences = [
+            ranking["confidence"] for ranking in batch_message.get("intent_ranking")
+        ]
+        assert confidences == sorted(confidences, reverse=True)
+        assert len(confidences) == len(intents)
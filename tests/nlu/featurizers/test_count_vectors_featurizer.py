@@ -1,4 +1,4 @@
-from typing import List, Any, Text
+from typing import Any, Dict, List, Text
 import numpy as np
 import pytest
 import scipy.sparse
@@ -733,3 +733,105 @@ def test_use_shared_vocab_exception(
         )
     else:
         new_cvf.train(data)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"max_ngram": 2},
+        {"analyzer": "char_wb", "min_ngram": 1, "max_ngram": 3},
+        {"hashing_n_features": 32},
+    ],
+)
+def test_count_vector_featurizer_batched_features_match_single_messages(
+    config: Dict[Text, Any]
+):
+    sentences = ["hello there", "hello hello hello", "", "what is up my friend"]
+
+    ftr = CountVectorsFeaturizer(config)
+    tk = WhitespaceTokenizer()
+    train_messages = [Message(data={TEXT: sentence}) for sentence in sentences]
+    data = TrainingData(train_messages)
+    tk.train(data)
+    ftr.train(data)
+
+    for sentence, train_message in zip(sentences, train_messages):
+        test_message = Message(data={TEXT: sentence})
+        tk.process(test_message)
+        ftr.process(test_message)
+
+        train_seq_vec, train_sen_vec = train_message.get_sparse_features(TEXT, [])
+        test_seq_vec, test_sen_vec = test_message.get_sparse_features(TEXT, [])
+
+        if not sentence:
+            assert train_seq_vec is None and test_seq_vec is None
+            assert train_sen_vec is None and test_sen_vec is None
+            continue
+
+        assert np.all(
+            train_seq_vec.features.toarray() == test_seq_vec.features.toarray()
+        )
+        assert np.all(
+            train_sen_vec.features.toarray() == test_sen_vec.features.toarray()
+        )
+        # the sentence features contain the counts of all words of the message
+        assert train_sen_vec.features.sum() == train_seq_vec.features.sum()
+
+
+def test_count_vector_featurizer_hashing_persist_load(tmp_path: Path):
+    train_ftr = CountVectorsFeaturizer({"hashing_n_features": 16})
+
+    sentence = "hello hello goodbye"
+    train_message = Message(data={TEXT: sentence, INTENT: "greet"})
+    data = TrainingData([train_message])
+    WhitespaceTokenizer().train(data)
+    train_ftr.train(data)
+
+    # vectorizers are only kept for attributes which are part of the training data
+    assert set(train_ftr.vectorizers.keys()) == {TEXT, INTENT}
+    assert not hasattr(train_ftr.vectorizers[TEXT], "vocabulary_")
+
+    seq_vec, sen_vec = train_message.get_sparse_features(TEXT, [])
+    assert seq_vec.features.shape == (3, 16)
+    assert sen_vec.features.shape == (1, 16)
+    assert sen_vec.features.sum() == 3
+
+    file_dict = train_ftr.persist("ftr", str(tmp_path))
+    meta = train_ftr.component_config.copy()
+    meta.update(file_dict)
+    test_ftr = CountVectorsFeaturizer.load(meta, str(tmp_path))
+
+    assert set(test_ftr.vectorizers.keys()) == {TEXT, INTENT}
+
+    test_message = Message(data={TEXT: sentence})
+    WhitespaceTokenizer().process(test_message)
+    test_ftr.process(test_message)
+
+    test_seq_vec, test_sen_vec = test_message.get_sparse_features(TEXT, [])
+    assert np.all(test_seq_vec.features.toarray() == seq_vec.features.toarray())
+    assert np.all(test_sen_vec.features.toarray() == sen_vec.features.toarray())
+
+
+def test_cvf_incremental_training_with_hashing(tmp_path: Path):
+    tk = WhitespaceTokenizer()
+    initial_cvf = CountVectorsFeaturizer({"hashing_n_features": 64})
+    train_message = Message(data={TEXT: "the coolest person"})
+    data = TrainingData([train_message])
+    tk.train(data)
+    initial_cvf.train(data)
+
+    file_dict = initial_cvf.persist("ftr", tmp_path)
+    meta = initial_cvf.component_config.copy()
+    meta.update(file_dict)
+    new_cvf = CountVectorsFeaturizer.load(meta, tmp_path, should_finetune=True)
+
+    additional_train_message = Message(data={TEXT: "a completely new sentence"})
+    data = TrainingData([train_message, additional_train_message])
+    tk.train(data)
+    new_cvf.train(data)
+
+    # the feature dimension doesn't change when new words are seen
+    seq_vec, sen_vec = additional_train_message.get_sparse_features(TEXT, [])
+    assert seq_vec.features.shape == (4, 64)
+    assert sen_vec.features.shape == (1, 64)
@@ -26,6 +26,11 @@ from rasa.utils.tensorflow.constants import (
     LOSS_TYPE,
     HIDDEN_LAYERS_SIZES,
     LABEL,
+    LABEL_INDEX,
+    LABEL_INDEX_NUM_PROBES,
+    USE_TEXT_AS_LABEL,
+    EXACT,
+    IVF,
 )
 from rasa.utils import train_utils
 from rasa.shared.nlu.constants import (
@@ -40,6 +45,7 @@ from rasa.shared.constants import DIAGNOSTIC_DATA
 from rasa.nlu.selectors.response_selector import ResponseSelector
 from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.training_data import TrainingData
+from rasa.shared.exceptions import InvalidConfigException
 
 
 def as_pipeline(*components):
@@ -454,6 +460,62 @@ async def test_softmax_ranking(
     assert len(response_ranking) == output_length
 
 
+@pytest.mark.parametrize(
+    "label_index_params",
+    [
+        {LABEL_INDEX: EXACT},
+        {LABEL_INDEX: EXACT, USE_TEXT_AS_LABEL: True},
+        {LABEL_INDEX: EXACT, RANKING_LENGTH: 2},
+        {LABEL_INDEX: EXACT, RANKING_LENGTH: 0},
+        # probing all clusters gives the exact results
+        {LABEL_INDEX: IVF, LABEL_INDEX_NUM_PROBES: 1000},
+    ],
+)
+async def test_label_index_gives_same_ranking(
+    component_builder: ComponentBuilder,
+    tmp_path: Path,
+    label_index_params: Dict[Text, Any],
+):
+    rankings = []
+    for params in [
+        {key: value for key, value in label_index_params.items() if key != LABEL_INDEX},
+        label_index_params,
+    ]:
+        pipeline = as_pipeline(
+            "WhitespaceTokenizer", "CountVectorsFeaturizer", "ResponseSelector"
+        )
+        pipeline[2].update({RANDOM_SEED: 42, EPOCHS: 1, **params})
+
+        _config = RasaNLUModelConfig({"pipeline": pipeline})
+        (_, _, persisted_path) = await rasa.nlu.train.train(
+            _config,
+            path=str(tmp_path / str(len(rankings))),
+            data="data/test_selectors",
+            component_builder=component_builder,
+        )
+        loaded = Interpreter.load(persisted_path, component_builder)
+
+        parse_data = loaded.parse("hello")
+        rankings.append(
+            parse_data.get("response_selector").get("default").get("ranking")
+        )
+
+    dense_ranking, indexed_ranking = rankings
+    assert [label["id"] for label in indexed_ranking] == [
+        label["id"] for label in dense_ranking
+    ]
+    assert np.allclose(
+        [label["confidence"] for label in indexed_ranking],
+        [label["confidence"] for label in dense_ranking],
+        atol=1e-5,
+    )
+
+
+def test_invalid_label_index():
+    with pytest.raises(InvalidConfigException):
+        ResponseSelector(component_config={LABEL_INDEX: "unknown"})
+
+
 @pytest.mark.parametrize(
     "config, should_raise_warning",
     [
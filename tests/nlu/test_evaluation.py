@@ -440,6 +440,45 @@ def test_run_cv_evaluation():
         assert all(key in extractor_evaluation for key in ["errors", "report"])
 
 
+@pytest.mark.timeout(
+    180, func_only=True
+)  # these can take a longer time than the default timeout
+def test_run_cv_evaluation_in_parallel():
+    td = rasa.shared.nlu.training_data.loading.load_data(
+        "data/test/demo-rasa-more-ents-and-multiplied.yml"
+    )
+
+    nlu_config = RasaNLUModelConfig(
+        {
+            "language": "en",
+            "pipeline": [
+                {"name": "WhitespaceTokenizer"},
+                {"name": "CountVectorsFeaturizer"},
+                {"name": "DIETClassifier", EPOCHS: 2},
+            ],
+        }
+    )
+
+    n_folds = 2
+    intent_results, entity_results, response_selection_results = cross_validate(
+        td,
+        n_folds,
+        nlu_config,
+        successes=False,
+        errors=False,
+        disable_plotting=True,
+        report_as_dict=True,
+        num_processes=2,
+        num_threads_per_process=1,
+    )
+
+    assert len(intent_results.train["Accuracy"]) == n_folds
+    assert len(intent_results.test["F1-score"]) == n_folds
+    assert all(key in intent_results.evaluation for key in ["errors", "report"])
+    assert len(entity_results.train["DIETClassifier"]["Accuracy"]) == n_folds
+    assert len(entity_results.test["DIETClassifier"]["F1-score"]) == n_folds
+
+
 @pytest.mark.timeout(
     180, func_only=True
 )  # these can take a longer time than the default timeout
@@ -1,4 +1,9 @@
+import pickle
+
 import rasa.shared.core.generator
+from rasa.shared.core.events import ActionExecuted, SlotSet, UserUttered
+from rasa.shared.core.generator import SharedPrefixSequence, TrackerWithCachedStates
+from rasa.shared.core.slots import TextSlot
 
 
 def test_subsample_array_read_only():
@@ -18,3 +23,56 @@ def test_subsample_array():
 
     assert len(r) == 5
     assert set(r).issubset(t)
+
+
+def test_shared_prefix_sequence():
+    sequence = SharedPrefixSequence([1, 2, 3])
+    duplicate = sequence.copy()
+
+    sequence.append(4)
+    duplicate.extend([5, 6])
+
+    assert list(sequence) == [1, 2, 3, 4]
+    assert list(duplicate) == [1, 2, 3, 5, 6]
+    assert list(reversed(duplicate)) == [6, 5, 3, 2, 1]
+    assert duplicate[-1] == 6
+    assert duplicate[1:3] == [2, 3]
+
+    assert duplicate.pop() == 6
+    assert duplicate == [1, 2, 3, 5]
+
+    restored = pickle.loads(pickle.dumps(duplicate))
+    assert restored == duplicate
+
+
+def test_shared_prefix_sequence_with_maxlen():
+    sequence = SharedPrefixSequence(range(10), maxlen=3)
+
+    assert len(sequence) == 3
+    assert list(sequence) == [7, 8, 9]
+    assert sequence[0] == 7
+
+
+def test_copy_tracker_with_cached_states():
+    slot = TextSlot("name")
+    tracker = TrackerWithCachedStates("", [slot])
+    for event in [
+        ActionExecuted("action_listen"),
+        UserUttered("hi"),
+        SlotSet("name", "Jane"),
+    ]:
+        tracker.update(event, skip_states=True)
+
+    duplicate = tracker.copy("other sender", "some source")
+    duplicate.update(SlotSet("name", "John"), skip_states=True)
+
+    assert duplicate.sender_id == "other sender"
+    assert duplicate.sender_source == "some source"
+    assert len(tracker.events) == 3
+    assert len(duplicate.events) == 4
+    assert list(duplicate.events)[:3] == list(tracker.events)
+
+    # The copy doesn't share the mutable state
+    assert tracker.get_slot("name") == "Jane"
+    assert duplicate.get_slot("name") == "John"
+    assert duplicate.latest_message == tracker.latest_message
@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import os
@@ -6,10 +7,12 @@ import time
 from pathlib import Path
 import tempfile
 from typing import List, Text, Dict, Any, Type
+from unittest.mock import Mock
 
 import fakeredis
 import freezegun
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 import rasa.shared.utils.io
 import rasa.utils.io
@@ -1171,6 +1174,119 @@ def test_applied_events_with_loop_unhappy_path(
     assert applied == expected_applied_events
 
 
+@pytest.mark.parametrize(
+    "events",
+    [
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            ActionReverted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("chitchat"),
+            UserUtteranceReverted(),
+            Restarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("bye"),
+        ],
+        [
+            # the loop action is executed before the loop is activated
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("fill slots"),
+            ActionExecuted("loop"),
+            ActiveLoop(None),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+    ],
+)
+def test_applied_events_are_updated_incrementally(events: List[Event]):
+    tracker = DialogueStateTracker.from_events("👋", [])
+
+    for number_of_events, event in enumerate(events, start=1):
+        tracker.update(event)
+        expected = DialogueStateTracker.from_events(
+            "👋", events[:number_of_events]
+        ).applied_events()
+
+        assert tracker.applied_events() == expected
+
+
+def test_applied_events_with_max_event_history():
+    events = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("greet"),
+        ActionExecuted("utter_greet"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("bye"),
+    ]
+    tracker = DialogueStateTracker.from_events("👋", events[:3], max_event_history=3)
+    assert tracker.applied_events() == events[:3]
+
+    for event in events[3:]:
+        tracker.update(event)
+
+    assert tracker.applied_events() == events[2:]
+
+
+def test_applied_events_of_tracker_copies_are_independent():
+    tracker = DialogueStateTracker.from_events(
+        "👋", [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")]
+    )
+    tracker.applied_events()
+
+    tracker_copy = copy.copy(tracker)
+    tracker_copy.events = tracker.events.copy()
+    tracker_copy.update(Restarted())
+
+    assert tracker_copy.applied_events() == []
+    assert tracker.applied_events() == [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        user_uttered("greet"),
+    ]
+
+
+def test_applied_events_are_reused_if_no_events_were_added(monkeypatch: MonkeyPatch):
+    events = [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")]
+    tracker = DialogueStateTracker.from_events("👋", events)
+
+    applied_events = tracker.applied_events()
+    monkeypatch.setattr(tracker, "_apply_events", Mock())
+    assert tracker.applied_events() == applied_events
+    tracker._apply_events.assert_not_called()
+
+    # modifying the returned events doesn't modify the cached events
+    applied_events.clear()
+    assert tracker.applied_events() == events
+
+
+def test_applied_events_of_tracker_copies_share_their_common_events():
+    events = [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")]
+    tracker = DialogueStateTracker.from_events("👋", events)
+    tracker.applied_events()
+    cached_applied_events = tracker._applied_events_cache.applied_events
+
+    tracker_copy = copy.copy(tracker)
+    tracker_copy.events = tracker.events.copy()
+    tracker_copy.update(ActionExecuted("utter_greet"))
+
+    assert tracker_copy.applied_events() == [*events, ActionExecuted("utter_greet")]
+    # the event was appended without copying the common events
+    assert tracker_copy._applied_events_cache.applied_events is cached_applied_events
+
+    tracker.update(ActionExecuted("utter_goodbye"))
+
+    assert tracker.applied_events() == [*events, ActionExecuted("utter_goodbye")]
+    assert tracker_copy.applied_events() == [*events, ActionExecuted("utter_greet")]
+
+
 def test_reading_of_trackers_with_legacy_form_events():
     loop_name1 = "my loop"
     loop_name2 = "my form"
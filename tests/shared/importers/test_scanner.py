@@ -0,0 +1,306 @@
+from pathlib import Path
+import os
+import textwrap
+from typing import Text
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.version
+import rasa.shared.data
+import rasa.shared.utils.io
+import rasa.shared.utils.validation
+from rasa.shared.constants import DEFAULT_DATA_PATH
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.training_data.story_reader.yaml_story_reader import (
+    YAMLStoryReader,
+)
+from rasa.shared.exceptions import YamlException
+from rasa.shared.importers import utils
+from rasa.shared.importers.rasa import RasaFileImporter
+from rasa.shared.nlu.training_data.formats.rasa_yaml import NLU_SCHEMA_FILE
+from rasa.shared.importers.scanner import (
+    PARSED_FILES_CACHE_ENV,
+    PARSED_FILES_CACHE_LOCATION_ENV,
+    ParsedFileCache,
+    ProjectScanner,
+)
+
+
+def _write_project(path: Path) -> None:
+    (path / "nlu.yml").write_text(
+        textwrap.dedent(
+            """
+            version: "2.0"
+            nlu:
+            - intent: greet
+              examples: |
+                - hi
+                - hello
+            """
+        )
+    )
+    (path / "stories.yml").write_text(
+        textwrap.dedent(
+            """
+            version: "2.0"
+            stories:
+            - story: greet
+              steps:
+              - intent: greet
+              - action: utter_greet
+            """
+        )
+    )
+    (path / "test_stories.yml").write_text(
+        textwrap.dedent(
+            """
+            version: "2.0"
+            stories:
+            - story: greet test
+              steps:
+              - user: hi
+                intent: greet
+              - action: utter_greet
+            """
+        )
+    )
+    (path / "notes.txt").write_text("nlu: not a training data file")
+
+
+def test_scanner_classifies_files(tmp_path: Path):
+    _write_project(tmp_path)
+
+    scanner = ProjectScanner(str(tmp_path), ParsedFileCache(tmp_path / "cache"))
+
+    assert [Path(f.path).name for f in scanner.nlu_files] == ["nlu.yml"]
+    assert [Path(f.path).name for f in scanner.story_files] == [
+        "stories.yml",
+        "test_stories.yml",
+    ]
+    assert [Path(f.path).name for f in scanner.conversation_test_files] == [
+        "test_stories.yml"
+    ]
+
+
+def test_scanner_matches_get_data_files(project: Text):
+    data_path = os.path.join(project, DEFAULT_DATA_PATH)
+
+    scanner = ProjectScanner([data_path], cache=None)
+
+    assert [f.path for f in scanner.nlu_files] == rasa.shared.data.get_data_files(
+        [data_path], rasa.shared.data.is_nlu_file
+    )
+    assert [f.path for f in scanner.story_files] == rasa.shared.data.get_data_files(
+        [data_path], YAMLStoryReader.is_stories_file
+    )
+
+
+def test_parsed_files_are_cached(tmp_path: Path, monkeypatch: MonkeyPatch):
+    _write_project(tmp_path)
+    cache = ParsedFileCache(tmp_path / "cache")
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    expected = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    expected_stories = utils.story_graph_from_scanned_files(
+        scanner.story_files, Domain.empty()
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Cached files must not be parsed or validated again.")
+
+    monkeypatch.setattr(rasa.shared.utils.io, "read_yaml", fail)
+    monkeypatch.setattr(rasa.shared.utils.validation, "validate_yaml_schema", fail)
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    actual = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    actual_stories = utils.story_graph_from_scanned_files(
+        scanner.story_files, Domain.empty()
+    )
+
+    assert actual.fingerprint() == expected.fingerprint()
+    assert actual_stories.fingerprint() == expected_stories.fingerprint()
+
+
+def test_cache_is_invalidated_if_file_changes(tmp_path: Path):
+    _write_project(tmp_path)
+    cache = ParsedFileCache(tmp_path / "cache")
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    training_data = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    assert len(training_data.intent_examples) == 2
+
+    nlu_file = tmp_path / "nlu.yml"
+    nlu_file.write_text(nlu_file.read_text() + "    - hey\n")
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    training_data = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    assert len(training_data.intent_examples) == 3
+
+
+def _set_modification_time(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(path.stat().st_atime_ns, mtime_ns))
+
+
+def test_files_are_not_read_again_if_unchanged(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    _write_project(tmp_path)
+    for path in tmp_path.glob("*.yml"):
+        _set_modification_time(path, 10 ** 9)
+    cache = ParsedFileCache(tmp_path / "cache")
+    expected = [f.parsed_content() for f in ProjectScanner(str(tmp_path), cache).files]
+
+    monkeypatch.setattr(
+        rasa.shared.utils.io,
+        "read_file",
+        lambda *args, **kwargs: pytest.fail("Unchanged file was read again."),
+    )
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    assert [f.parsed_content() for f in scanner.files] == expected
+
+
+def test_cache_detects_changes_which_keep_modification_time_and_size(tmp_path: Path,):
+    _write_project(tmp_path)
+    cache = ParsedFileCache(tmp_path / "cache")
+    scanner = ProjectScanner(str(tmp_path), cache)
+    training_data = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    assert training_data.intent_examples[0].get("text") == "hi"
+
+    nlu_file = tmp_path / "nlu.yml"
+    mtime_ns = nlu_file.stat().st_mtime_ns
+    nlu_file.write_text(nlu_file.read_text().replace("- hi\n", "- yo\n"))
+    _set_modification_time(nlu_file, mtime_ns)
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    training_data = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    assert training_data.intent_examples[0].get("text") == "yo"
+
+
+def test_cache_detects_replaced_files(tmp_path: Path):
+    _write_project(tmp_path)
+    nlu_file = tmp_path / "nlu.yml"
+    _set_modification_time(nlu_file, 10 ** 9)
+    cache = ParsedFileCache(tmp_path / "cache")
+    scanner = ProjectScanner(str(tmp_path), cache)
+    utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+
+    replacement = tmp_path / "replacement"
+    replacement.write_text(nlu_file.read_text().replace("- hi\n", "- yo\n"))
+    _set_modification_time(replacement, 10 ** 9)
+    os.replace(replacement, nlu_file)
+
+    scanner = ProjectScanner(str(tmp_path), cache)
+    training_data = utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    assert training_data.intent_examples[0].get("text") == "yo"
+
+
+def test_least_recently_used_entries_are_pruned(tmp_path: Path):
+    _write_project(tmp_path)
+    cache_location = tmp_path / "cache"
+    scanner = ProjectScanner(str(tmp_path), ParsedFileCache(cache_location))
+    utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+    utils.story_graph_from_scanned_files(scanner.story_files, Domain.empty())
+    assert len(list(cache_location.glob("*.pkl"))) == 3
+
+    entries = sorted(cache_location.glob("*.pkl"))
+    for mtime_ns, entry in enumerate(entries, start=1):
+        _set_modification_time(entry, mtime_ns * 10 ** 9)
+
+    ParsedFileCache(cache_location, max_entries=1)
+
+    assert list(cache_location.glob("*.pkl")) == [entries[-1]]
+
+
+def test_invalid_files_are_not_cached(tmp_path: Path):
+    invalid_file = tmp_path / "nlu.yml"
+    invalid_file.write_text("nlu: [\n- intent: greet\n")
+    cache = ParsedFileCache(tmp_path / "cache")
+
+    for _ in range(2):
+        scanner = ProjectScanner(str(tmp_path), cache)
+        with pytest.raises(YamlException) as error:
+            utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+
+        assert error.value.filename == str(invalid_file)
+
+
+def test_files_with_environment_variables_are_not_cached(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    (tmp_path / "nlu.yml").write_text(
+        "nlu:\n- intent: greet\n  examples: |\n    - hi ${NAME}\n"
+    )
+    cache = ParsedFileCache(tmp_path / "cache")
+
+    monkeypatch.setenv("NAME", "Ada")
+    scanner = ProjectScanner(str(tmp_path), cache)
+    utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+
+    assert not list((tmp_path / "cache").glob("*.pkl"))
+
+
+def test_cache_can_be_disabled(monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(PARSED_FILES_CACHE_ENV, "false")
+
+    assert ParsedFileCache.from_environment() is None
+
+
+def test_cache_is_not_stored_in_working_directory(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    monkeypatch.delenv(PARSED_FILES_CACHE_LOCATION_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    cache = ParsedFileCache.from_environment()
+
+    assert tmp_path not in cache._location.parents
+    assert cache._location.is_absolute()
+
+
+def test_cache_is_invalidated_by_rasa_version(tmp_path: Path, monkeypatch: MonkeyPatch):
+    _write_project(tmp_path)
+    cache = ParsedFileCache(tmp_path / "cache")
+    scanner = ProjectScanner(str(tmp_path), cache)
+    utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+
+    monkeypatch.setattr(rasa.version, "__version__", "100.0.0")
+    nlu_file = ProjectScanner(str(tmp_path), cache).nlu_files[0]
+
+    assert cache.get(nlu_file.path) is None
+    assert not nlu_file.is_validated(NLU_SCHEMA_FILE)
+
+
+def test_validation_is_invalidated_by_schema_change(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    _write_project(tmp_path)
+    cache = ParsedFileCache(tmp_path / "cache")
+    scanner = ProjectScanner(str(tmp_path), cache)
+    utils.training_data_from_scanned_files(scanner.nlu_files, "en")
+
+    nlu_file = ProjectScanner(str(tmp_path), cache).nlu_files[0]
+    assert nlu_file.is_validated(NLU_SCHEMA_FILE)
+
+    monkeypatch.setattr(
+        rasa.shared.utils.validation,
+        "schema_fingerprint",
+        lambda schema_path: "changed schema",
+    )
+    assert not nlu_file.is_validated(NLU_SCHEMA_FILE)
+
+
+def test_rasa_file_importer_loads_domain_once(project: Text, monkeypatch: MonkeyPatch):
+    importer = RasaFileImporter(
+        domain_path=os.path.join(project, "domain.yml"),
+        training_data_paths=[os.path.join(project, DEFAULT_DATA_PATH)],
+    )
+
+    domain = importer.get_domain()
+    monkeypatch.setattr(
+        Domain, "load", lambda *args, **kwargs: pytest.fail("Domain was reloaded.")
+    )
+
+    assert importer.get_domain() is domain
+    assert importer.get_stories().story_steps
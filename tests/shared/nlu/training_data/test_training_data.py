@@ -5,6 +5,7 @@ from _pytest.monkeypatch import MonkeyPatch
 
 import pytest
 import numpy as np
+import scipy.sparse
 
 import rasa.shared.utils.io
 from rasa.shared.core.constants import USER_INTENT_OUT_OF_SCOPE
@@ -19,7 +20,10 @@ from rasa.shared.nlu.constants import (
     INTENT,
     ACTION_NAME,
     FEATURE_TYPE_SENTENCE,
+    FEATURE_TYPE_SEQUENCE,
 )
+from rasa.engine.caching import Cacheable
+from rasa.engine.storage.storage import ModelStorage
 from rasa.nlu.convert import convert_training_data
 from rasa.nlu.extractors.mitie_entity_extractor import MitieEntityExtractor
 from rasa.nlu.tokenizers.whitespace_tokenizer import WhitespaceTokenizer
@@ -858,3 +862,48 @@ def test_training_data_fingerprint_incorporates_features():
     training_data.training_examples[0].add_features(f1)
     # training data fingerprint has changed
     assert fp1 != training_data.fingerprint()
+
+
+def test_training_data_caching(tmp_path: Path, default_model_storage: ModelStorage):
+    training_data = load_data("data/examples/rasa/demo-rasa.yml")
+    for i, message in enumerate(training_data.training_examples):
+        message.add_features(
+            Features(
+                scipy.sparse.coo_matrix(np.random.rand(i % 3 + 1, 5) * 2 // 1),
+                FEATURE_TYPE_SEQUENCE,
+                TEXT,
+                "sparse-featurizer",
+            )
+        )
+        message.add_features(
+            Features(
+                np.random.rand(1, 3).astype(np.float32),
+                FEATURE_TYPE_SENTENCE,
+                TEXT,
+                ["dense-featurizer", "other-dense-featurizer"],
+            )
+        )
+
+    assert isinstance(training_data, Cacheable)
+
+    training_data.to_cache(tmp_path, default_model_storage)
+    restored = TrainingData.from_cache("node", tmp_path, default_model_storage)
+
+    assert restored.fingerprint() == training_data.fingerprint()
+    assert restored.entity_synonyms == training_data.entity_synonyms
+    assert restored.regex_features == training_data.regex_features
+    assert restored.lookup_tables == training_data.lookup_tables
+    for message, restored_message in zip(
+        training_data.training_examples, restored.training_examples
+    ):
+        assert restored_message.data == message.data
+        assert len(restored_message.features) == 2
+        sparse, dense = message.features
+        restored_sparse, restored_dense = restored_message.features
+        assert scipy.sparse.isspmatrix_coo(restored_sparse.features)
+        assert (restored_sparse.features != sparse.features).nnz == 0
+        assert restored_sparse.origin == sparse.origin
+        np.testing.assert_array_equal(restored_dense.features, dense.features)
+        assert restored_dense.features.dtype == dense.features.dtype
+        assert restored_dense.origin == dense.origin
+        assert restored_dense.type == dense.type
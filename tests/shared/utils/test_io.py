@@ -9,6 +9,7 @@ import copy
 from pathlib import Path
 import numpy as np
 import pytest
+from ruamel.yaml import YAMLError
 
 import rasa.shared
 from rasa.shared.nlu.training_data.features import Features
@@ -260,6 +261,14 @@ def test_emojis_in_tmp_file():
     assert content["data"][1] == "two £ (?u)\\b\\w+\\b für"
 
 
+def test_read_yaml_after_syntax_error():
+    with pytest.raises(YAMLError):
+        rasa.shared.utils.io.read_yaml("key: [")
+
+    # parsers are re-used, but not if they failed to parse something
+    assert rasa.shared.utils.io.read_yaml("key: [value]") == {"key": ["value"]}
+
+
 def test_read_emojis_from_json():
     import json
 
@@ -1,10 +1,14 @@
-from typing import Text
+import copy
+from typing import Any, Dict, Text
 from threading import Thread
 
+import jsonschema
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 
 from pep440_version_utils import Version
 
+from rasa.core.actions.action import RemoteAction
 from rasa.shared.exceptions import YamlException, SchemaValidationError
 import rasa.shared.utils.io
 import rasa.shared.utils.validation as validation_utils
@@ -13,6 +17,7 @@ import rasa.shared.nlu.training_data.schemas.data_schema as schema
 from rasa.shared.constants import (
     CONFIG_SCHEMA_FILE,
     DOMAIN_SCHEMA_FILE,
+    ENV_NUM_YAML_PARSING_PROCESSES,
     LATEST_TRAINING_DATA_FORMAT_VERSION,
 )
 from rasa.shared.nlu.training_data.formats.rasa_yaml import NLU_SCHEMA_FILE
@@ -271,3 +276,112 @@ nlu:
         thread.join()
 
     assert len(successful_results) == len(threads)
+
+
+def test_compiled_json_schema_validator_is_reused():
+    json_schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+    validator = validation_utils.compiled_json_schema_validator(json_schema)
+
+    assert validation_utils.compiled_json_schema_validator(json_schema) is validator
+    # an equal schema which is a different object gets the same validator
+    assert (
+        validation_utils.compiled_json_schema_validator(copy.deepcopy(json_schema))
+        is validator
+    )
+
+
+def test_compiled_json_schema_validator_does_not_serialize_known_schema(
+    monkeypatch: MonkeyPatch,
+):
+    json_schema = {"type": "object", "properties": {"age": {"type": "integer"}}}
+    validator = validation_utils.compiled_json_schema_validator(json_schema)
+
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("The schema must not be serialized again.")
+
+    monkeypatch.setattr(validation_utils.json, "dumps", fail)
+
+    assert validation_utils.compiled_json_schema_validator(json_schema) is validator
+
+
+def test_compiled_json_schema_validators_are_bounded():
+    for maximum in range(validation_utils.MAX_CACHED_JSON_SCHEMA_VALIDATORS + 10):
+        validation_utils.compiled_json_schema_validator(
+            {"type": "integer", "maximum": maximum}
+        )
+
+    for cached_function in [
+        validation_utils._validator_for_schema_object,
+        validation_utils._validator_for_serialized_schema,
+    ]:
+        cache_info = cached_function.cache_info()
+        assert cache_info.currsize == validation_utils.MAX_CACHED_JSON_SCHEMA_VALIDATORS
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"events": [{"event": "unknown"}], "responses": []},
+        {"events": [], "responses": "not a list"},
+        {"events": [{"event": "slot", "name": 1}]},
+    ],
+)
+def test_validate_json_raises_same_error_as_jsonschema(data: Dict[Text, Any]):
+    json_schema = RemoteAction.action_response_format_spec()
+
+    with pytest.raises(jsonschema.ValidationError) as expected_error:
+        jsonschema.validate(data, json_schema)
+
+    with pytest.raises(jsonschema.ValidationError) as error:
+        validation_utils.validate_json(data, json_schema)
+
+    assert error.value.message == expected_error.value.message
+    assert list(error.value.path) == list(expected_error.value.path)
+
+
+def test_validate_json_with_valid_data():
+    validation_utils.validate_json(
+        {"events": [{"event": "restart"}], "responses": []},
+        RemoteAction.action_response_format_spec(),
+    )
+
+
+@pytest.mark.parametrize("num_processes", [1, 2])
+def test_parse_and_validate_yaml_files(num_processes: int, monkeypatch: MonkeyPatch):
+    monkeypatch.setenv(ENV_NUM_YAML_PARSING_PROCESSES, str(num_processes))
+    monkeypatch.setattr(validation_utils, "MIN_YAML_FILES_PER_PROCESS", 1)
+
+    files = [
+        (f"nlu_{i}.yml", f"nlu:\n- intent: intent_{i}\n  examples: |\n    - hi\n")
+        for i in range(4)
+    ]
+
+    parsed_files = validation_utils.parse_and_validate_yaml_files(
+        files, NLU_SCHEMA_FILE
+    )
+
+    assert parsed_files == [
+        rasa.shared.utils.io.read_yaml(content) for _, content in files
+    ]
+
+
+@pytest.mark.parametrize("num_processes", [1, 2])
+def test_parse_and_validate_yaml_files_raises_first_error(
+    num_processes: int, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv(ENV_NUM_YAML_PARSING_PROCESSES, str(num_processes))
+    monkeypatch.setattr(validation_utils, "MIN_YAML_FILES_PER_PROCESS", 1)
+
+    files = [
+        ("valid.yml", "nlu:\n- intent: greet\n  examples: |\n    - hi\n"),
+        ("invalid.yml", "nlu:\n- intent: greet\n  examples: 1\n"),
+        ("syntax_error.yml", "nlu: [\n"),
+    ]
+
+    with pytest.raises(validation_utils.YamlValidationException) as e:
+        validation_utils.parse_and_validate_yaml_files(files, NLU_SCHEMA_FILE)
+
+    assert e.value.filename == "invalid.yml"
+    # the error points to the line of the invalid value
+    assert "in invalid.yml:" in str(e.value)
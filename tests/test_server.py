@@ -1355,6 +1355,64 @@ async def _create_tracker_for_sender(app: SanicASGITestClient, sender_id: Text)
     assert response.status == HTTPStatus.OK
 
 
+async def test_get_events(rasa_app: SanicASGITestClient):
+    conversation_id = str(uuid.uuid1())
+    events = [e.as_dict() for e in test_events]
+    _, response = await rasa_app.post(
+        f"/conversations/{conversation_id}/tracker/events",
+        json=events,
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    assert response.status == HTTPStatus.OK
+
+    _, response = await rasa_app.get(
+        f"/conversations/{conversation_id}/tracker/events?type=user,bot&limit=2"
+    )
+    assert response.status == HTTPStatus.OK
+
+    content = response.json()
+    assert content["sender_id"] == conversation_id
+    assert content["offset"] == 0
+    assert content["limit"] == 2
+    expected_events = [e for e in test_events if e.type_name in ["user", "bot"]]
+    assert [
+        Event.from_parameters(event) for event in content["events"]
+    ] == expected_events[:2]
+
+
+async def test_stream_events(rasa_app: SanicASGITestClient):
+    conversation_id = str(uuid.uuid1())
+    events = [e.as_dict() for e in test_events]
+    _, response = await rasa_app.post(
+        f"/conversations/{conversation_id}/tracker/events",
+        json=events,
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    assert response.status == HTTPStatus.OK
+
+    _, response = await rasa_app.get(
+        f"/conversations/{conversation_id}/tracker/events?offset=3",
+        headers={"Accept": rasa.server.NDJSON_CONTENT_TYPE},
+    )
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"] == rasa.server.NDJSON_CONTENT_TYPE
+
+    streamed_events = [
+        Event.from_parameters(json.loads(line)) for line in response.text.splitlines()
+    ]
+    # the first three events are the initial session start sequence
+    assert streamed_events == test_events
+
+
+@pytest.mark.parametrize("params", ["offset=-1", "limit=ten"])
+async def test_get_events_with_invalid_pagination(
+    rasa_app: SanicASGITestClient, params: Text
+):
+    _, response = await rasa_app.get(f"/conversations/test/tracker/events?{params}")
+
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 async def test_get_tracker_with_jwt(rasa_secured_app: SanicASGITestClient):
     # token generated with secret "core" and algorithm HS256
     # on https://jwt.io/
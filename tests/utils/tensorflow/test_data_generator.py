@@ -1,4 +1,5 @@
 import pytest
+from typing import Text
 
 import scipy.sparse
 import numpy as np
@@ -7,6 +8,7 @@ from rasa.utils.tensorflow.model_data import FeatureArray, RasaModelData
 from rasa.utils.tensorflow.data_generator import (
     RasaDataGenerator,
     RasaBatchDataGenerator,
+    RasaDataPipeline,
 )
 
 
@@ -40,6 +42,66 @@ def test_data_generator_with_increasing_batch_size(model_data: RasaModelData):
         data_generator.on_epoch_end()
 
 
+@pytest.mark.parametrize("bucket_by_sequence_length", [True, False])
+def test_data_pipeline_batches_match_data_generator(
+    model_data: RasaModelData, bucket_by_sequence_length: bool
+):
+    data_pipeline = RasaDataPipeline(
+        model_data,
+        batch_size=2,
+        epochs=1,
+        batch_strategy="sequence",
+        shuffle=False,
+        bucket_by_sequence_length=bucket_by_sequence_length,
+    )
+
+    ids = np.array([3, 0, 4])
+    expected_batch = RasaDataGenerator.prepare_batch(
+        RasaModelData._data_for_ids(model_data.data, ids)
+    )
+    batch = data_pipeline.prepare_batch(ids)
+
+    assert len(batch) == len(expected_batch) == 11
+    for actual, expected in zip(batch, expected_batch):
+        np.testing.assert_array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("batch_strategy", ["sequence", "balanced"])
+def test_data_pipeline_with_increasing_batch_size(
+    model_data: RasaModelData, batch_strategy: Text
+):
+    epochs = 2
+    expected_batch_sizes = [[1, 1, 1, 1, 1], [2, 2, 1]]
+
+    dataset = RasaDataPipeline(
+        model_data, batch_size=[1, 2], epochs=epochs, batch_strategy=batch_strategy
+    ).as_dataset()
+
+    for _epoch in range(epochs):
+        batch_sizes = []
+        for (batch,) in dataset:
+            assert len(batch) == 11
+            batch_sizes.append(len(batch[0]))
+
+        assert batch_sizes == expected_batch_sizes[_epoch]
+
+
+def test_data_pipeline_buckets_by_sequence_length(model_data: RasaModelData):
+    data_pipeline = RasaDataPipeline(
+        model_data,
+        batch_size=2,
+        batch_strategy="sequence",
+        shuffle=False,
+        bucket_by_sequence_length=True,
+    )
+
+    batches = data_pipeline._bucketed_batches(np.arange(5), batch_size=2)
+    lengths = data_pipeline._sequence_lengths
+
+    assert sorted(np.concatenate(batches)) == list(range(5))
+    assert [list(lengths[batch]) for batch in batches] == [[3, 5], [5, 5], [7]]
+
+
 def test_data_generator_with_fixed_batch_size(model_data: RasaModelData):
     data_generator = RasaBatchDataGenerator(
         model_data, batch_size=2, epochs=1, batch_strategy="balanced", shuffle=True
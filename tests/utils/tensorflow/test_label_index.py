@@ -0,0 +1,102 @@
+from typing import Text
+
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from rasa.shared.exceptions import InvalidConfigException
+from rasa.utils.tensorflow.constants import (
+    AUTO,
+    COSINE,
+    EXACT,
+    INNER,
+    IVF,
+    LINEAR_NORM,
+    SOFTMAX,
+)
+from rasa.utils.tensorflow.label_index import IVFLabelIndex, LabelIndex
+from rasa.utils.tensorflow.layers import DotProductLoss
+
+
+def _dense_confidences(
+    query: np.ndarray,
+    label_embeddings: np.ndarray,
+    similarity_type: Text,
+    model_confidence: Text,
+) -> np.ndarray:
+    loss_layer = DotProductLoss(
+        num_candidates=1,
+        similarity_type=similarity_type,
+        model_confidence=model_confidence,
+    )
+    _, confidences = loss_layer.get_similarities_and_confidences_from_embeddings(
+        tf.constant(query[np.newaxis, np.newaxis, :]),
+        tf.constant(label_embeddings[np.newaxis, :, :]),
+    )
+    return confidences.numpy().flatten()
+
+
+@pytest.mark.parametrize(
+    "similarity_type, model_confidence",
+    [(INNER, SOFTMAX), (INNER, LINEAR_NORM), (COSINE, AUTO), (INNER, AUTO)],
+)
+@pytest.mark.parametrize("index_type", [EXACT, IVF])
+def test_search_matches_dense_confidences(
+    similarity_type: Text, model_confidence: Text, index_type: Text
+):
+    rng = np.random.RandomState(42)
+    label_embeddings = rng.randn(1000, 20).astype(np.float32)
+    query = rng.randn(20).astype(np.float32)
+
+    index = LabelIndex.create(
+        index_type,
+        label_embeddings,
+        similarity_type,
+        model_confidence,
+        # probing all clusters gives the exact results
+        num_clusters=10,
+        num_probes=10,
+        random_seed=42,
+    )
+    index.block_size = 64
+
+    label_ids, confidences = index.search(query, 5)
+
+    expected = _dense_confidences(
+        query, label_embeddings, similarity_type, model_confidence
+    )
+    assert np.array_equal(label_ids, np.argsort(-expected)[:5])
+    assert np.allclose(confidences, expected[label_ids], atol=1e-5)
+
+
+def test_ivf_index_searches_probed_clusters():
+    rng = np.random.RandomState(42)
+    label_embeddings = rng.randn(1000, 20).astype(np.float32)
+    query = rng.randn(20).astype(np.float32)
+
+    index = IVFLabelIndex(
+        label_embeddings, INNER, SOFTMAX, num_clusters=10, num_probes=2, random_seed=1
+    )
+    label_ids, confidences = index.search(query, 5)
+
+    assert len(label_ids) == 5
+    assert np.all(np.diff(confidences) <= 0)
+    # all returned labels are from the probed clusters
+    assert len(np.unique(index._closest_centroids(index.centroids)[label_ids])) <= 2
+
+
+def test_search_with_fewer_labels_than_requested():
+    label_embeddings = np.eye(3, dtype=np.float32)
+
+    label_ids, confidences = LabelIndex(label_embeddings, INNER, SOFTMAX).search(
+        np.array([0, 1, 0], dtype=np.float32), 10
+    )
+
+    assert label_ids.tolist()[0] == 1
+    assert len(label_ids) == 3
+    assert np.isclose(confidences.sum(), 1.0)
+
+
+def test_unknown_index_type():
+    with pytest.raises(InvalidConfigException):
+        LabelIndex.create("unknown", np.zeros((1, 1)), INNER, SOFTMAX)
@@ -3,7 +3,7 @@ import copy
 import pytest
 import numpy as np
 
-from rasa.utils.tensorflow.model_data import RasaModelData
+from rasa.utils.tensorflow.model_data import RasaModelData, FeatureArray
 
 
 def test_shuffle_session_data(model_data: RasaModelData):
@@ -24,21 +24,6 @@ def test_shuffle_session_data(model_data: RasaModelData):
     assert np.all(np.array(model_data.values()) != np.array(data.values()))
 
 
-def test_split_data_by_label(model_data: RasaModelData):
-    split_model_data = model_data._split_by_label_ids(
-        model_data.data, model_data.get("label", "ids")[0], np.array([0, 1])
-    )
-
-    assert len(split_model_data) == 2
-    for s in split_model_data:
-        assert len(set(s.get("label", "ids")[0])) == 1
-
-    for key, attribute_data in split_model_data[0].items():
-        for sub_key, features in attribute_data.items():
-            assert len(features) == len(model_data.data[key][sub_key])
-            assert len(features[0]) == 2
-
-
 def test_split_data_by_none_label(model_data: RasaModelData):
     model_data.label_key = None
     model_data.label_sub_key = None
@@ -134,6 +119,33 @@ def test_balance_model_data(model_data: RasaModelData):
     assert np.all(np.array(data["label"]["ids"][0]) == np.array([0, 1, 1, 0, 1]))
 
 
+@pytest.mark.parametrize("shuffle", [True, False])
+def test_balance_model_data_keeps_features_aligned(shuffle: bool):
+    label_ids = np.array([0] * 20 + [1] * 5 + [2])
+    model_data = RasaModelData(
+        label_key="label",
+        label_sub_key="ids",
+        data={
+            "label": {"ids": [FeatureArray(label_ids, number_of_dimensions=1)]},
+            "text": {
+                "ids": [FeatureArray(np.arange(len(label_ids)), number_of_dimensions=1)]
+            },
+        },
+    )
+
+    data = model_data.balanced_data(model_data.data, 4, shuffle)
+
+    balanced_ids = data["text"]["ids"][0]
+    # every data point is used at least once
+    assert set(balanced_ids) == set(range(len(label_ids)))
+    np.testing.assert_array_equal(
+        np.asarray(data["label"]["ids"][0]), label_ids[np.asarray(balanced_ids)]
+    )
+    assert isinstance(balanced_ids, FeatureArray)
+    # the rare labels are repeated
+    assert len(balanced_ids) > len(label_ids)
+
+
 def test_not_balance_model_data(model_data: RasaModelData):
     test_model_data = RasaModelData(
         label_key="entities", label_sub_key="tag_ids", data=model_data.data
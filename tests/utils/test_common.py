@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Any, Text, Type
+from typing import Any, Set, Text, Type
 
 import pytest
 
@@ -136,3 +136,31 @@ def test_find_unavailable_packages():
 )
 def test_module_path_from_class(clazz: Type, module_path: Text):
     assert rasa.utils.common.module_path_from_class(clazz) == module_path
+
+
+def _get_environment_variable(name: Text) -> Text:
+    import os
+
+    return os.environ.get(name)
+
+
+def _get_blas_thread_limits() -> Set[int]:
+    import numpy as np
+    import threadpoolctl
+
+    # make sure that the BLAS library of `numpy` is loaded
+    np.ones((2, 2)) @ np.ones((2, 2))
+
+    return {library["num_threads"] for library in threadpoolctl.threadpool_info()}
+
+
+def test_create_process_pool_limits_threads_per_process():
+    env_variables = rasa.utils.common.BLAS_THREADS_ENV_VARIABLES
+    with rasa.utils.common.create_process_pool(2, num_threads_per_process=1) as pool:
+        thread_limits = list(pool.map(_get_environment_variable, env_variables))
+        blas_thread_limits = pool.submit(_get_blas_thread_limits).result()
+
+    assert thread_limits == ["1"] * len(env_variables)
+    # the BLAS libraries can't use more threads than there are CPU cores, hence
+    # only a limit of a single thread is guaranteed to be in effect
+    assert blas_thread_limits == {1}